@@ -0,0 +1,167 @@
+"""
+aufloesung.py
+~~~~~~~~~~~~~
+
+Auflösung der FE-Berechnung: Elementdichte und Auswertungspunkte je Element.
+
+Beide FEEBB-Schnittstellen (Schnell- und EC-Modus) lesen die Einstellung
+`berechnungsmodus.aufloesung` aus dem Snapshot und übersetzen sie hier in ihre
+Diskretisierung. Erlaubt sind die Qualitätsstufen "entwurf" (Live-Eingabe),
+"standard" und "bericht" oder eine Zielanzahl Auswertungspunkte über die
+gesamte Trägerlänge.
+
+Die Schnittgrößen sind innerhalb der Elemente exakt (siehe
+Postprocessor.udl_correction), die Auflösung bestimmt daher nur, wie fein die
+Verläufe abgetastet werden – die Maxima bleiben bis auf die Abtastung gleich.
+
+Außerdem beschreibt das Modul das Punktlayout der Verläufe: welche Punkte zu
+welchem Feld gehören und an welcher Stelle x sie liegen (Ausnutzungsverläufe
+in nachweis_ec5), und liefert die Betragsmaxima je Feld (feldweise
+Durchbiegungsnachweise).
+"""
+import numpy as np
+
+
+AUFLOESUNG_ENTWURF = "entwurf"
+AUFLOESUNG_STANDARD = "standard"
+AUFLOESUNG_BERICHT = "bericht"
+
+# Qualitätsstufe → (Elemente je Meter, Auswertungspunkte je Element)
+AUFLOESUNGEN = {
+    AUFLOESUNG_ENTWURF: (4, 6),
+    AUFLOESUNG_STANDARD: (10, 20),
+    AUFLOESUNG_BERICHT: (20, 40),
+}
+
+# Grenzen je Element: mindestens drei Punkte (Anfang, Mitte, Ende), damit
+# Verläufe innerhalb eines Elements aus zwei inneren Punkten bestimmt sind
+MIN_PUNKTE_JE_ELEMENT = 3
+MAX_PUNKTE_JE_ELEMENT = 200
+
+# Zulässiger Bereich einer expliziten Zielanzahl Auswertungspunkte
+MIN_ZIELPUNKTE = 10
+MAX_ZIELPUNKTE = 100_000
+
+
+def aufloesung(snapshot: dict):
+    """Auflösung aus dem Snapshot (ohne Angabe: "standard")."""
+    wert = snapshot.get("berechnungsmodus", {}).get("aufloesung")
+    return AUFLOESUNG_STANDARD if wert is None else wert
+
+
+def ist_gueltige_aufloesung(wert) -> bool:
+    """Qualitätsstufe oder ganzzahlige Zielanzahl im zulässigen Bereich."""
+    if isinstance(wert, str):
+        return wert in AUFLOESUNGEN
+    return (isinstance(wert, (int, np.integer)) and not isinstance(wert, bool)
+            and MIN_ZIELPUNKTE <= wert <= MAX_ZIELPUNKTE)
+
+
+def diskretisierung(wert, gesamtlaenge_m: float, dichtefaktor: float = 1.0) -> tuple[float, int]:
+    """
+    Elementdichte und Auswertungspunkte je Element für eine Auflösung.
+
+    Bei einer Zielanzahl N bleibt die Elementdichte der Stufe "standard", die
+    Punkte je Element werden so gewählt, dass insgesamt etwa N Punkte
+    entstehen; reichen N Punkte dafür nicht aus, wird das Netz vergröbert.
+
+    Args:
+        wert (str | int): Qualitätsstufe oder Zielanzahl Auswertungspunkte
+        gesamtlaenge_m (float): Trägerlänge inkl. Kragarme [m]
+        dichtefaktor (float): Abminderung der Elementdichte (EC-Modus mit
+            vielen Feldern, die Anzahl der Belastungsmuster wächst mit 2^n)
+
+    Returns:
+        tuple[float, int]: (Elemente je Meter, Auswertungspunkte je Element)
+    """
+    if isinstance(wert, str):
+        elemente_pro_meter, punkte_je_element = AUFLOESUNGEN[wert]
+        return elemente_pro_meter * dichtefaktor, punkte_je_element
+
+    elemente_pro_meter = AUFLOESUNGEN[AUFLOESUNG_STANDARD][0] * dichtefaktor
+    n_elemente = max(1.0, gesamtlaenge_m * elemente_pro_meter)
+    punkte_je_element = int(round((wert - 1) / n_elemente)) + 1
+    if punkte_je_element < MIN_PUNKTE_JE_ELEMENT:
+        punkte_je_element = MIN_PUNKTE_JE_ELEMENT
+        elemente_pro_meter = (wert - 1) / (MIN_PUNKTE_JE_ELEMENT - 1) / gesamtlaenge_m
+    return elemente_pro_meter, min(punkte_je_element, MAX_PUNKTE_JE_ELEMENT)
+
+
+def feldfolge(spannweiten: dict) -> list[tuple[str, float]]:
+    """Felder und Kragarme in Trägerreihenfolge als (Schlüssel, Länge [m])."""
+    links = [("kragarm_links", float(spannweiten.get("kragarm_links", 0)))]
+    felder = [(k, float(v)) for k, v in spannweiten.items() if k.startswith("feld_")]
+    rechts = [("kragarm_rechts", float(spannweiten.get("kragarm_rechts", 0)))]
+    return [(k, l) for k, l in links + felder + rechts if l > 0]
+
+
+def feldabschnitte(felder, punkte_je_element: int) -> list[dict]:
+    """
+    Lage der Felder in den Verläufen der FE-Auswertung.
+
+    Punktlayout wie Postprocessor.interp: je Element punkte_je_element
+    Punkte, der gemeinsame Knoten zweier Elemente erscheint einmal. Ein Feld
+    mit n Elementen belegt damit n·(punkte_je_element − 1) + 1 Punkte, der
+    erste davon ist der letzte des vorigen Feldes.
+
+    Args:
+        felder: (Schlüssel, Länge [m], Anzahl Elemente) in Trägerreihenfolge
+        punkte_je_element (int): Auswertungspunkte je Element
+
+    Returns:
+        list[dict]: je Feld {"feld", "laenge" [m], "start", "ende"} mit den
+            Punktindizes von Anfang und Ende (beide inklusive)
+    """
+    abschnitte, start = [], 0
+    for feld, laenge, n_elemente in felder:
+        ende = start + n_elemente * (punkte_je_element - 1)
+        abschnitte.append({"feld": feld, "laenge": float(laenge), "start": start, "ende": ende})
+        start = ende
+    return abschnitte
+
+
+def feldmaxima(kurven, abschnitte) -> np.ndarray:
+    """
+    Betragsmaximum je Feld, vektorisiert über alle Verläufe.
+
+    Ein Segment reicht vom ersten Punkt eines Feldes bis vor den ersten Punkt
+    des nächsten; der gemeinsame Lagerpunkt zählt damit zum rechten Feld, der
+    letzte Punkt zum letzten Feld.
+
+    Args:
+        kurven (np.ndarray): Verlauf (n_punkte,) oder Verläufe (n_kurven, n_punkte)
+        abschnitte (list[dict]): Feldabschnitte wie feldabschnitte()
+
+    Returns:
+        np.ndarray: (n_felder,) bzw. (n_kurven, n_felder)
+    """
+    starts = [a["start"] for a in abschnitte]
+    return np.maximum.reduceat(np.abs(kurven), starts, axis=-1)
+
+
+def auswertungsstellen(schnittgroessen: dict, spannweiten: dict,
+                       n_punkte: int) -> tuple[np.ndarray, list[dict]]:
+    """
+    x-Koordinaten [m] der Verlaufspunkte und Feldabschnitte.
+
+    Die Feldabschnitte stammen aus der FE-Berechnung (schnittgroessen["felder"]);
+    innerhalb eines Feldes sind die Elemente gleich lang, die Punkte daher
+    gleichabständig. Fehlen sie (ältere Ergebnisse), werden die Punkte wie im
+    Frontend gleichmäßig über die Trägerlänge verteilt.
+
+    Returns:
+        tuple[np.ndarray, list[dict]]: (x je Punkt, Feldabschnitte wie feldabschnitte())
+    """
+    abschnitte = schnittgroessen.get("felder")
+    if not abschnitte or abschnitte[-1]["ende"] != n_punkte - 1:
+        folge = feldfolge(spannweiten)
+        x_grenzen = np.concatenate(([0.0], np.cumsum([l for _, l in folge])))
+        index = np.rint(x_grenzen / max(x_grenzen[-1], 1e-12) * (n_punkte - 1)).astype(int)
+        abschnitte = [{"feld": k, "laenge": l, "start": int(a), "ende": int(e)}
+                      for (k, l), a, e in zip(folge, index[:-1], index[1:])]
+        if not abschnitte:
+            return np.zeros(n_punkte), []
+
+    index = [a["start"] for a in abschnitte] + [abschnitte[-1]["ende"]]
+    x_grenzen = np.concatenate(([0.0], np.cumsum([a["laenge"] for a in abschnitte])))
+    return np.interp(np.arange(n_punkte), index, x_grenzen), abschnitte
@@ -131,7 +131,7 @@ class Element:
         v = [(w * d) / self.length ** 3 * ((2 * a + self.length) * b ** 2
                                            + (a - b) / 4 * d ** 2),
              (w * d) / self.length ** 3 * ((2 * b + self.length) * a ** 2
-                                           + (a - b) / 4 * d ** 2)]
+                                           + (b - a) / 4 * d ** 2)]
         m = [(w * d / self.length ** 2) * (a * b ** 2 + (a - 2 * b) * d ** 2 / 12),
              (w * d / self.length ** 2) * (a ** 2 * b + (b - 2 * a) * d ** 2 / 12)]
         load_vector = np.array([v[0], -m[0], v[1], m[1]])
@@ -307,6 +307,13 @@ class Beam():
             self.stiffness[a:b, a:b] += element.stiffness
             self.load[a:b] -= element.nodal_loads
 
+        # Keep the unconstrained rows of K and F for the constrained DOFs before
+        # the boundary conditions overwrite them. Support reactions follow from
+        # R = K·u − F on exactly these rows (see reactions()).
+        self.reaction_dofs = [i for i in range(self.num_dof) if self.supports[i] < 0]
+        self.reaction_stiffness = self.stiffness[self.reaction_dofs, :].copy()
+        self.reaction_load = self.load[self.reaction_dofs].copy()
+
         for i in range(self.num_dof):
             if self.supports[i] < 0:
                 self.stiffness[i, :] = 0
@@ -326,6 +333,28 @@ class Beam():
             # Batching across different K matrices produces silently wrong results.
             self.displacement = np.linalg.solve(self.stiffness, self.load)
 
+    def reactions(self, displacement=None, load=None):
+        """Support reactions R = K·u − F at the constrained DOFs.
+
+        Args:
+            displacement: Solution vector (n_dof,) or matrix (n_dof, n) with one
+                solution per column. Defaults to self.displacement.
+            load: Unconstrained load rows matching `displacement` – (n_reac,)
+                or (n_reac, n). Defaults to this beam's own load, which is only
+                correct if every column was solved for the same F.
+
+        Returns:
+            numpy.array: Reactions in the order of self.reaction_dofs, shape
+            (n_reac,) or (n_reac, n). Positive values act upwards.
+        """
+        if displacement is None:
+            displacement = self.displacement
+        if load is None:
+            load = self.reaction_load
+            if np.ndim(displacement) == 2:
+                load = load[:, np.newaxis]
+        return self.reaction_stiffness @ displacement - load
+
 
 class Postprocessor():
     """Class of Hermite cubic interpolation functions and their derivatives."""
@@ -419,3 +448,98 @@ class Postprocessor():
             # points.extend(np.sum(disp_nodes.reshape(4, 1) * phi, axis=0))
 
         return points
+
+    def interp_batch(self, action, displacements, udl=None):
+        """Vectorised interp() for several solution vectors at once.
+
+        All elements and all solution columns are evaluated in one array
+        expression instead of a Python loop per element and per solution.
+        Point layout is the same as in interp(): num_points per element, the
+        shared node between two elements appears once (value of the right
+        element).
+
+        Args:
+            action (str): 'displacement', 'slope', 'moment' or 'shear'.
+            displacements: Solution matrix (n_dof, n), one solution per column,
+                e.g. from a single np.linalg.solve(K, F_matrix) call.
+            udl: Optional uniform load per element and column (n_elements, n),
+                see udl_correction().
+
+        Returns:
+            numpy.array: (n, n_points) with one interpolated curve per column.
+        """
+        X = np.asarray(displacements, dtype=float)
+        if X.ndim == 1:
+            X = X[:, np.newaxis]
+
+        n_elements = self.beam.num_elements
+        length, x_bar = self._element_points()
+        a = x_bar / length
+        EI = (np.asarray(self.beam.E_elements, dtype=float)
+              * np.asarray(self.beam.I_elements, dtype=float))
+
+        if action == 'displacement':
+            phi = self.__phi_displacment(x_bar, a)
+        elif action == 'slope':
+            phi = self.__phi_slope(length, a)
+        elif action == 'moment':
+            phi = self.__phi_moment(length, x_bar)
+        elif action == 'shear':
+            phi = self.__phi_shear(length, x_bar)
+        else:
+            raise ValueError(f"Unknown action '{action}'")
+
+        # Element DOFs i*2 … i*2+3 for all elements: (n_el, 4, n)
+        dofs = 2 * np.arange(n_elements)[:, np.newaxis] + np.arange(4)
+        values = np.einsum('eks,kep->sep', X[dofs], phi)                  # (n, n_el, n_pts)
+        if action in ('moment', 'shear'):
+            values *= EI[np.newaxis, :, np.newaxis]
+
+        points = self._join_elements(values)
+        if udl is not None:
+            points += self.udl_correction(action, udl)
+        return points
+
+    def udl_correction(self, action, udl):
+        """Clamped-element part of a uniform load inside each element.
+
+        interp() builds moment and shear from the nodal displacements only,
+        which is exact at the nodes but misses the local response of a loaded
+        element (moment linear instead of parabolic, shear constant instead of
+        linear). Adding the moment/shear of the fixed-fixed element under its
+        own load makes both exact at every point, independent of the mesh.
+        The displacement part is of order (element/span length)^4 and is not
+        included.
+
+        Args:
+            action (str): 'moment' or 'shear'; other actions give zeros.
+            udl: Uniform load per element and column (n_elements, n), positive
+                like the 'udl' magnitude of Element.
+
+        Returns:
+            numpy.array: (n, n_points) correction in the layout of interp().
+        """
+        w = np.asarray(udl, dtype=float)
+        if w.ndim == 1:
+            w = w[:, np.newaxis]
+        length, x_bar = self._element_points()
+        if action == 'moment':
+            shape = -length ** 2 / 12 + length * x_bar / 2 - x_bar ** 2 / 2
+        elif action == 'shear':
+            shape = length / 2 - x_bar
+        else:
+            shape = np.zeros_like(x_bar)
+        return self._join_elements(w.T[:, :, np.newaxis] * shape[np.newaxis])
+
+    def _element_points(self):
+        """Element lengths (n_el, 1) and local evaluation points (n_el, num_points)."""
+        length = np.asarray(self.beam.len_elements, dtype=float)
+        x_bar = np.linspace(0, length, self.num_points, axis=-1)
+        return length[:, np.newaxis], x_bar
+
+    @staticmethod
+    def _join_elements(values):
+        """(n, n_el, n_pts) per element → (n, n_points), shared nodes once."""
+        n = values.shape[0]
+        return np.concatenate(
+            [values[:, :-1, :-1].reshape(n, -1), values[:, -1, :]], axis=1)
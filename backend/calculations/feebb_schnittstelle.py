@@ -1,13 +1,22 @@
 '''--- Datenaufbereitung der Dicts für feebb und Berechnung--- '''
 import numpy as np
 from backend.calculations.feebb import Element, Beam, Postprocessor
+from backend.calculations.aufloesung import aufloesung, diskretisierung, feldabschnitte
+from backend.calculations.kombinationsmatrix import eigenlast
 import tkinter as tk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 
 class FeebbBerechnung:
-    def __init__(self, snapshot):
+    def __init__(self, snapshot, db=None):
+        """
+        Args:
+            snapshot (dict): System-Snapshot mit Lasten, Querschnitt und Lastkombinationen
+            db: Datenbank für die Eigenlast des Querschnitts in den GZG-Lastfällen
+                (None: ohne Eigenlast)
+        """
         self.snapshot = snapshot
+        self.db = db
         self.system_memory = {}  # Ergebnis-Cache für GZT und GZG
 
     def compute(self) -> dict:
@@ -23,16 +32,16 @@ class FeebbBerechnung:
         """
         Compute support reactions [N] for the Schnell (full-load) calculation mode.
 
-        Uses the shear-jump method. NPTS_STRIDE = 99 because berechne_feebb_gzt_gzg
-        uses num_points=100 with shared-node deduplication (pop(-1) in Postprocessor),
-        so node k maps to array index k * 99.
+        Reactions are the constrained rows of K·u − F (Beam.reactions) for all
+        solution columns of berechne_feebb_gzt_gzg at once – independent of the
+        number of interpolation points. Node x-positions follow from the
+        element lengths of the solved beam.
 
-        GZT: reactions from the single governing ULS shear array.
+        GZT: reactions from the single governing ULS load case.
         GZG characteristic: sum of all individual characteristic load cases (G + Q_k).
         """
-        NPTS_STRIDE = 99  # num_points=100 → stride = 100 - 1 = 99
-
-        if not hasattr(self, '_supports') or not self._supports:
+        loesung = getattr(self, '_loesung', None)
+        if loesung is None or not getattr(self, '_supports', None):
             return {}
 
         auflager = sorted([k for k, s in enumerate(self._supports) if s[0] == -1])
@@ -42,80 +51,19 @@ class FeebbBerechnung:
 
         labels = [chr(65 + i) for i in range(n)]  # A, B, C, …
 
-        # x-positions [m] – reconstruct node positions from snapshot spannweiten
-        spannweiten = self.snapshot.get("spannweiten", {})
-        x = 0.0
-        node_x: dict[int, float] = {}
-        node_tracker = 0
+        beam = loesung["beam"]
+        knoten_x_m = np.concatenate(([0.0], np.cumsum(beam.len_elements))) / 1000
+        x_positionen = [round(float(knoten_x_m[k]), 4) for k in auflager]
 
-        l_krag_links = float(spannweiten.get("kragarm_links", 0))
-        if l_krag_links > 0:
-            node_x[node_tracker] = x
-            node_tracker += int(round(l_krag_links * 20))
-            x += l_krag_links
-            node_x[node_tracker] = x
-
-        normale = sorted(
-            [(k, float(v)) for k, v in spannweiten.items() if k.startswith("feld_")]
-        )
-        for _, laenge in normale:
-            node_x[node_tracker] = x
-            node_tracker += int(round(laenge * 20))
-            x += laenge
-            node_x[node_tracker] = x
-
-        l_krag_rechts = float(spannweiten.get("kragarm_rechts", 0))
-        if l_krag_rechts > 0:
-            node_x[node_tracker] = x
-            node_tracker += int(round(l_krag_rechts * 20))
-            x += l_krag_rechts
-            node_x[node_tracker] = x
-
-        x_positionen = [round(node_x.get(k, 0.0), 4) for k in auflager]
-
-        def _extract(querkraft: list) -> list[float]:
-            """Shear-jump reaction extraction for NPTS_STRIDE=99."""
-            n_total = len(querkraft)
-            result = []
-            for node in auflager:
-                idx = node * NPTS_STRIDE
-                if node == 0:
-                    R = querkraft[0]
-                elif idx >= n_total - 1:
-                    R = -querkraft[-1]
-                else:
-                    R = querkraft[idx] - querkraft[idx - 1]
-                result.append(abs(float(R)))
-            return result
-
-        # GZT: single governing ULS combination
-        gzt_max = [0.0] * n
-        qk_gzt = (
-            self.system_memory
-            .get("Schnittgroessen", {})
-            .get("GZT", {})
-            .get("querkraft", [])
-        )
-        if qk_gzt:
-            for i, r in enumerate(_extract(qk_gzt)):
-                gzt_max[i] = r
-
-        # GZG characteristic: sum all individual load-case reactions
-        # (characteristic combination = G + Q_1 + Q_2 + … at characteristic values)
-        gzg_sum = [0.0] * n
-        for ergebnis in (
-            self.system_memory.get("Schnittgroessen", {}).get("GZG", [])
-        ):
-            qk = ergebnis.get("querkraft", [])
-            if qk:
-                for i, r in enumerate(_extract(qk)):
-                    gzg_sum[i] += r
+        # (n_auflager, n_lastfaelle): Spalte 0 = GZT, danach je GZG-Einwirkung
+        zeilen = [beam.reaction_dofs.index(2 * k) for k in auflager]
+        R = np.abs(beam.reactions(loesung["U"], loesung["F_reaktion"])[zeilen])
 
         return {
             "labels": labels,
             "x_positionen": x_positionen,
-            "gzt_design": gzt_max,              # [N]
-            "gzg_charakteristisch": gzg_sum,   # [N]
+            "gzt_design": R[:, 0].tolist(),                 # [N]
+            "gzg_charakteristisch": R[:, 1:].sum(axis=1).tolist(),   # [N]
         }
 
     def update_feebb(self):
@@ -123,7 +71,12 @@ class FeebbBerechnung:
         try:
             print("📣 Update feebb gestartet")
             gzt, gzg = self.erstelle_feebb_dicts()
-            self.system_memory = berechne_feebb_gzt_gzg(gzt, gzg)
+            self._loesung = loese_feebb_gzt_gzg(gzt, gzg)
+            self.system_memory = berechne_feebb_gzt_gzg(
+                gzt, gzg, num_points=self._punkte_je_element, loesung=self._loesung)
+            # Lage der Felder in den Verläufen (Ausnutzungsverläufe in nachweis_ec5)
+            self.system_memory['Schnittgroessen']['felder'] = feldabschnitte(
+                self._feldelemente, self._punkte_je_element)
             maxwerte = self.system_memory['Schnittgroessen']['GZT']['max']
             self.max_moment_feebb = maxwerte['moment']/1e6
             self.max_querkraft_feebb = maxwerte['querkraft']/1e3
@@ -138,7 +91,7 @@ class FeebbBerechnung:
             self.querkraft = self.system_memory['Schnittgroessen']['GZT']['querkraft']
             self.durchbiegung = self.system_memory['Schnittgroessen']['GZT']['durchbiegung']
 
-            # Compute support reactions from the already-solved shear arrays
+            # Compute support reactions from the already-solved system
             self.system_memory['Auflagerkraefte'] = self._berechne_auflagerkraefte()
 
             # Schnittkräfte übergeben
@@ -168,13 +121,19 @@ class FeebbBerechnung:
         all_elements = []
         zwischenlager_knoten = []
         node_tracker = 0
+        self._feldelemente = []  # (Schlüssel, Länge [m], Anzahl Elemente)
 
-        # === Kragarm links ===
+        # === Netzdichte und Auswertungspunkte aus der Auflösung
         spannweiten = self.snapshot.get("spannweiten")
+        gesamtlaenge = sum(float(wert) for wert in spannweiten.values())
+        elemente_pro_meter, self._punkte_je_element = diskretisierung(
+            aufloesung(self.snapshot), gesamtlaenge)
+
+        # === Kragarm links ===
         l = float(spannweiten.get("kragarm_links", 0))
         print(float(spannweiten.get("kragarm_links", 0)))
         if l > 0:
-            n = int(round(l * 20))
+            n = max(1, int(round(l * elemente_pro_meter)))
             l_mm = l * 1000 / n
             for _ in range(n):
                 all_elements.append({
@@ -183,6 +142,7 @@ class FeebbBerechnung:
                     "moment_of_inertia": I,
                     "loads": [{"type": "udl", "magnitude": lastwert}]
                 })
+            self._feldelemente.append(("kragarm_links", l, n))
             node_tracker += n
             zwischenlager_knoten.append(node_tracker)
             print(node_tracker)
@@ -190,12 +150,12 @@ class FeebbBerechnung:
 
         # === Normale Felder ===
         normale_felder = [
-            wert for key, wert in self.snapshot["spannweiten"].items()
+            (key, wert) for key, wert in self.snapshot["spannweiten"].items()
             if key.startswith("feld_")
         ]
 
-        for idx, feld in enumerate(normale_felder):
-            n = int(round(feld * 20))
+        for idx, (key, feld) in enumerate(normale_felder):
+            n = max(1, int(round(feld * elemente_pro_meter)))
             l_mm = feld * 1000 / n
             for _ in range(n):
                 all_elements.append({
@@ -204,6 +164,7 @@ class FeebbBerechnung:
                     "moment_of_inertia": I,
                     "loads": [{"type": "udl", "magnitude": lastwert}]
                 })
+            self._feldelemente.append((key, feld, n))
             node_tracker += n
             if idx < len(normale_felder) - 1:
                 zwischenlager_knoten.append(node_tracker)
@@ -214,7 +175,7 @@ class FeebbBerechnung:
         ende_mormale_felder = node_tracker
         l = float(spannweiten.get("kragarm_rechts", 0))
         if l > 0:
-            n = int(round(l * 20))
+            n = max(1, int(round(l * elemente_pro_meter)))
             l_mm = l * 1000 / n
             for _ in range(n):
                 all_elements.append({
@@ -223,6 +184,7 @@ class FeebbBerechnung:
                     "moment_of_inertia": I,
                     "loads": [{"type": "udl", "magnitude": lastwert}]
                 })
+            self._feldelemente.append(("kragarm_rechts", l, n))
             node_tracker += n
 
         # === Knotenanzahl
@@ -266,7 +228,8 @@ class FeebbBerechnung:
         gzg = []
         sprungmass = self.snapshot["sprungmass"]
         for last in self.snapshot["lasten"]:
-            q_k = float(last["wert"]) * sprungmass
+            # Ständige Lasten mit "eigengewicht" führen die Eigenlast mit (wie in G_SUM)
+            q_k = float(last["wert"]) * sprungmass + eigenlast(self.db, qs, last)
             gzg_elements = [
                 {
                     "length": el["length"],
@@ -286,50 +249,109 @@ class FeebbBerechnung:
         return gzt, gzg
 
 
-def berechne_feebb_gzt_gzg(gzt_dict, gzg_dicts, num_points=100):
-    # GZT-Berechnung
+def _lastvektor(elemente, beam):
+    """
+    Knotenlastvektor eines Lastfalls auf der gemeinsamen Geometrie von `beam`.
+
+    Wie in Beam.__init__: F = −Σ Festeinspannkräfte; die gesperrten Zeilen
+    werden für den Solve null gesetzt, ihre ursprünglichen Werte werden für
+    die Auflagerkräfte (R = K·u − F) zurückgegeben.
+
+    Returns:
+        tuple: (F für den Solve (n_dof,), F an den gesperrten DOFs (n_reac,))
+    """
+    F = np.zeros(beam.num_dof)
+    for i, e in enumerate(elemente):
+        element = Element(e)
+        if (element.length, element.E, element.I) != (
+                beam.len_elements[i], beam.E_elements[i], beam.I_elements[i]):
+            raise ValueError("❌ Lastfälle mit abweichender Geometrie können nicht gemeinsam gelöst werden")
+        F[2 * i:2 * i + 4] -= element.nodal_loads
+    F_reaktion = F[beam.reaction_dofs].copy()
+    F[beam.reaction_dofs] = 0.0
+    return F, F_reaktion
+
+
+def _streckenlast(elemente):
+    """Summe der Streckenlasten ('udl') je Element [N/mm]."""
+    return np.array([sum(last["magnitude"] for last in e.get("loads", []) if last["type"] == "udl")
+                     for e in elemente], dtype=float)
+
+
+def loese_feebb_gzt_gzg(gzt_dict, gzg_dicts) -> dict:
+    """
+    GZT-Lastfall und alle GZG-Einwirkungen mit einer Faktorisierung lösen.
+
+    Alle Lastfälle teilen Geometrie und Lagerung und damit K: Der GZT-Lastfall
+    und jede Einwirkung sind je eine Spalte der rechten Seite, gelöst mit einem
+    np.linalg.solve.
+
+    Returns:
+        dict: "beam" (gemeinsame Geometrie), "U" (n_dof, 1 + n_gzg) und
+        "F_reaktion" (n_reac, 1 + n_gzg) für Beam.reactions; Spalte 0 = GZT
+    """
     gzt_elements = [Element(e) for e in gzt_dict["elements"]]
-    gzt_beam = Beam(gzt_elements, gzt_dict["supports"])
-    gzt_post = Postprocessor(gzt_beam, num_points)
-    # for e in gzt_dict["elements"]:
-    #     print(
-    #         f"📦 Eingabe für feebb: Länge = {e['length']} mm, Last = {e['loads']}")
-    gzt_m = gzt_post.interp("moment")
-    gzt_w = gzt_post.interp("displacement")
-    gzt_v = gzt_post.interp("shear")
-
-    # GZG-Berechnung je Einwirkung
-    gzg = []
-    for einwirkung in gzg_dicts:
-        gzg_elements = [Element(e) for e in einwirkung["elements"]]
-        gzg_beam = Beam(gzg_elements, einwirkung["supports"])
-        gzg_post = Postprocessor(gzg_beam, num_points)
+    beam = Beam(gzt_elements, gzt_dict["supports"], lazy_solve=True)
+
+    # Spalte 0: GZT, danach je GZG-Einwirkung eine Spalte
+    F_gzg = [_lastvektor(einwirkung["elements"], beam) for einwirkung in gzg_dicts]
+    F_matrix = np.column_stack([beam.load] + [F for F, _ in F_gzg])
+    F_reaktion = np.column_stack([beam.reaction_load] + [R for _, R in F_gzg])
+    U = np.linalg.solve(beam.stiffness, F_matrix)                       # eine LU-Zerlegung
+    return {"beam": beam, "U": U, "F_reaktion": F_reaktion}
+
 
-        gzg_m = gzg_post.interp("moment")
-        gzg_w = gzg_post.interp("displacement")
-        gzg_v = gzg_post.interp("shear")
+def berechne_feebb_gzt_gzg(gzt_dict, gzg_dicts, num_points=100, loesung=None):
+    """
+    Schnittgrößen für den GZT-Lastfall und alle GZG-Einwirkungen.
 
+    Die Verläufe aller Lastfälle entstehen gebündelt über
+    Postprocessor.interp_batch aus der gemeinsamen Lösung; Moment und
+    Querkraft enthalten den lokalen Anteil der Streckenlast je Element und
+    sind damit unabhängig von der Netzdichte exakt.
+
+    Args:
+        num_points (int): Auswertungspunkte je Element
+        loesung (dict | None): Ergebnis von loese_feebb_gzt_gzg; wird sonst hier gelöst
+
+    Returns:
+        dict: "Schnittgroessen" (GZT-Verläufe und Maxima, GZG je Einwirkung)
+    """
+    if loesung is None:
+        loesung = loese_feebb_gzt_gzg(gzt_dict, gzg_dicts)
+    beam, U = loesung["beam"], loesung["U"]
+
+    # Streckenlast je Element und Lastfall (n_elemente, 1 + n_gzg)
+    udl = np.column_stack([_streckenlast(fall["elements"]) for fall in [gzt_dict] + list(gzg_dicts)])
+
+    post = Postprocessor(beam, num_points)
+    momente = post.interp_batch("moment", U, udl=udl)
+    durchbiegungen = post.interp_batch("displacement", U)
+    querkraefte = post.interp_batch("shear", U, udl=udl)
+
+    gzg = []
+    for spalte, einwirkung in enumerate(gzg_dicts, start=1):
         gzg.append({
             "max": {
-                "durchbiegung": max(abs(w) for w in gzg_w)
+                "durchbiegung": float(np.abs(durchbiegungen[spalte]).max())
             },
             "lastfall": einwirkung["lastfall"],
             "kommentar": einwirkung["kommentar"],
-            "moment": gzg_m,
-            "querkraft": gzg_v,
-            "durchbiegung": gzg_w,
+            "moment": momente[spalte].tolist(),
+            "querkraft": querkraefte[spalte].tolist(),
+            "durchbiegung": durchbiegungen[spalte].tolist(),
         })
     return {
         "Schnittgroessen": {
             "GZT": {
                 "max": {
-                    "moment": max(abs(m) for m in gzt_m),
-                    "durchbiegung": max(abs(w) for w in gzt_w),
-                    "querkraft": max(abs(v) for v in gzt_v)
+                    "moment": float(np.abs(momente[0]).max()),
+                    "durchbiegung": float(np.abs(durchbiegungen[0]).max()),
+                    "querkraft": float(np.abs(querkraefte[0]).max())
                 },
-                "moment": gzt_m,
-                "durchbiegung": gzt_w,
-                "querkraft": gzt_v,
+                "moment": momente[0].tolist(),
+                "durchbiegung": durchbiegungen[0].tolist(),
+                "querkraft": querkraefte[0].tolist(),
             },
             "GZG": gzg
         }
@@ -16,13 +16,216 @@ Hauptunterschiede zur Standard-Schnittstelle:
 - Dokumentation der maßgebenden Kombination je Schnittgröße/Position
 """
 import logging
+import threading
+import types
+from collections import OrderedDict
+
 import numpy as np
 from backend.calculations.feebb import Element, Beam, Postprocessor
+from backend.calculations.kombinationsmatrix import (
+    kombinationsmatrix, lastart, LASTART_EINZEL, GAMMA_G, GAMMA_Q)
+from backend.calculations.aufloesung import (
+    aufloesung, diskretisierung, feldabschnitte, feldmaxima)
+from backend.calculations.latex_vorlagen import (
+    rendere, EC_GZT_NUR_G, EC_GZT_G_PLUS_Q, EC_GZT_VOLL,
+    EC_GZG_CHARAKTERISTISCH, EC_GZG_HAEUFIG, EC_GZG_QUASI)
 
 
 # Logger für dieses Modul
 logger = logging.getLogger(__name__)
 
+# Auswertungspunkte je Element im Postprocessing (Stufe "standard"; die
+# Berechnung verwendet die Punktzahl ihrer Auflösung, siehe aufloesung.py)
+NUM_POINTS_EC = 20
+
+# Spalten je Block beim Superponieren im Modus maxima_only: begrenzt die
+# Zwischenmatrix auf Block × n_punkte statt N_unique × n_punkte.
+MAXIMA_BLOCKGROESSE = 256
+
+# Geometrie-Cache: (spannweiten, E, I, Elemente/m) → Ergebnis der Geometrieanalyse.
+# Im Live-Edit ändern sich Lasten viel häufiger als Spannweiten; reine
+# Laständerungen überspringen die Analyse damit komplett.
+GEOMETRIE_CACHE_GROESSE = 32
+_geometrie_cache = OrderedDict()
+_geometrie_cache_lock = threading.Lock()
+
+# Einheitsantworten je Geometrie (gleicher Schlüssel wie der Geometrie-Cache):
+# Verschiebungen, Verläufe und Auflagerkräfte für 1 N/mm auf jedem Feld.
+EINHEITSANTWORTEN_CACHE_GROESSE = 32
+_einheitsantworten_cache = OrderedDict()
+_einheitsantworten_lock = threading.Lock()
+
+# Antworten der Einzel-/Teilstreckenlasten je (Geometrie, Lastart, Lage):
+# Größe 1, feldweise getrennt – Änderungen des Lastwerts treffen den Cache.
+LASTBAUSTEINE_CACHE_GROESSE = 128
+_lastbausteine_cache = OrderedDict()
+_lastbausteine_lock = threading.Lock()
+
+# Attribute, die _analysiere_systemgeometrie setzt (und der Cache ablegt).
+# Die gecachten Objekte werden zwischen Berechnungen geteilt – nur lesen!
+_GEOMETRIE_ATTRIBUTE = ("felder", "gesamt_elemente", "zwischenlager_knoten",
+                        "gesamt_knoten", "supports", "supports_flat", "element_laengen",
+                        "spiegel_felder")
+
+
+def _spiegel_felder(felder, element_laengen, supports):
+    """
+    Spiegelfeld je Feld, falls das System spiegelsymmetrisch ist.
+
+    Symmetrisch heißt: gleiche Feldlängen und Elementteilung von links und
+    rechts gelesen (gespiegelte Kragarme eingeschlossen) und gespiegelte
+    Lagerung. E·I ist im EC-Modus über die Trägerlänge konstant.
+
+    Returns:
+        np.ndarray | None: Index des Spiegelfelds je Eintrag in felder, sonst None
+    """
+    laengen = [(f["laenge"], f["anzahl_elemente"]) for f in felder]
+    if (laengen != laengen[::-1]
+            or not np.array_equal(element_laengen, element_laengen[::-1])
+            or supports != supports[::-1]):
+        return None
+    return np.arange(len(felder))[::-1]
+
+
+def _spiegle_verlaeufe(kurven: dict, n_elemente: int, punkte_je_element: int) -> dict:
+    """
+    Verläufe des gespiegelten Lastfalls durch Umkehren der Arrays.
+
+    Durchbiegung und Moment werden umgekehrt, die Querkraft (dM/dx) wechselt
+    zusätzlich das Vorzeichen. Die Querkraft ist je Element linear und springt
+    an Lagern; am Knoten hält der Verlauf den Wert des rechten Elements. Nach
+    dem Umkehren werden die inneren Knoten daher linear aus den beiden
+    folgenden Punkten dieses Elements extrapoliert. Das Moment ist stetig.
+
+    Args:
+        kurven (dict): je Schnittgröße (n_lastfaelle, n_punkte)
+        n_elemente (int): Anzahl Elemente (symmetrische Teilung)
+        punkte_je_element (int): Auswertungspunkte je Element
+
+    Returns:
+        dict: gespiegelte Verläufe, gleiche Form
+    """
+    knoten = np.arange(1, n_elemente) * (punkte_je_element - 1)
+    gespiegelt = {}
+    for groesse, werte in kurven.items():
+        neu = werte[:, ::-1] * (-1.0 if groesse == "querkraft" else 1.0)
+        if groesse == "querkraft":
+            neu[:, knoten] = 2 * neu[:, knoten + 1] - neu[:, knoten + 2]
+        gespiegelt[groesse] = neu
+    return gespiegelt
+
+
+def _lastort(last: dict) -> tuple:
+    """Lastart und Lage [mm] einer Einzel- oder Teilstreckenlast (Cache-Schlüssel)."""
+    art = lastart(last)
+    if art == LASTART_EINZEL:
+        x = float(last["position"]) * 1000
+        return art, x, x
+    von, bis = sorted((float(last["von"]) * 1000, float(last["bis"]) * 1000))
+    return art, von, bis
+
+
+def _lastabschnitte(element_laengen, ort):
+    """
+    Elemente unter einer Einzel- oder Teilstreckenlast mit lokalen Koordinaten.
+
+    Args:
+        element_laengen (np.ndarray): Elementlängen [mm]
+        ort (tuple): (lastart, von, bis) aus _lastort
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Elementindizes, lokaler
+        Lastbeginn und lokales Lastende [mm] (Einzellast: Beginn = Ende)
+    """
+    art, von, bis = ort
+    x_knoten = np.concatenate(([0.0], np.cumsum(element_laengen)))
+    if art == LASTART_EINZEL:
+        e = int(np.clip(np.searchsorted(x_knoten, von, side="right") - 1,
+                        0, len(element_laengen) - 1))
+        a = np.array([von - x_knoten[e]])
+        return np.array([e]), a, a
+    start = np.clip(von - x_knoten[:-1], 0.0, element_laengen)
+    ende = np.clip(bis - x_knoten[:-1], 0.0, element_laengen)
+    elemente = np.nonzero(ende > start)[0]
+    return elemente, start[elemente], ende[elemente]
+
+
+def _lastbaustein_vektoren(element_laengen, feld_je_element, n_felder, ort,
+                           punkte_je_element=NUM_POINTS_EC):
+    """
+    Knotenlasten und Verlaufskorrekturen einer Last der Größe 1, getrennt nach Feldern.
+
+    Die Volleinspanngrößen entsprechen Element.fer_point / Element.fer_patch,
+    werden aber für alle berührten Elemente auf einmal gebildet. Weil das
+    Postprocessing Schnittgrößen nur aus den Knotenverschiebungen interpoliert,
+    fehlt innerhalb belasteter Elemente der Verlauf des beidseitig eingespannten
+    Elements; er wird für Moment und Querkraft hier mitgeliefert (der
+    Durchbiegungsanteil ist bei Elementlängen im dm-Bereich vernachlässigbar).
+
+    Args:
+        element_laengen (np.ndarray): Elementlängen [mm]
+        feld_je_element (np.ndarray): Feldindex (Reihenfolge self.felder) je Element
+        n_felder (int): Anzahl der Felder inkl. Kragarme
+        ort (tuple): (lastart, von, bis) aus _lastort
+        punkte_je_element (int): Auswertungspunkte je Element
+
+    Returns:
+        tuple: F (n_dof, n_felder) im Vorzeichen von Beam.load und je Schnittgröße
+        ("moment", "querkraft") eine Korrektur (n_felder, n_punkte)
+    """
+    elemente, start, ende = _lastabschnitte(element_laengen, ort)
+    L = element_laengen[elemente]
+    felder = feld_je_element[elemente]
+    n_el = len(element_laengen)
+
+    if ort[0] == LASTART_EINZEL:
+        a, b = start, L - start
+        v0 = b ** 2 * (3 * a + b) / L ** 3
+        v1 = a ** 2 * (a + 3 * b) / L ** 3
+        m0 = a * b ** 2 / L ** 2
+        m1 = a ** 2 * b / L ** 2
+    else:
+        d = ende - start
+        a = start + d / 2
+        b = L - a
+        v0 = d / L ** 3 * ((2 * a + L) * b ** 2 + (a - b) / 4 * d ** 2)
+        v1 = d / L ** 3 * ((2 * b + L) * a ** 2 + (b - a) / 4 * d ** 2)
+        m0 = d / L ** 2 * (a * b ** 2 + (a - 2 * b) * d ** 2 / 12)
+        m1 = d / L ** 2 * (a ** 2 * b + (b - 2 * a) * d ** 2 / 12)
+    fer = np.column_stack([v0, -m0, v1, m1])
+
+    F = np.zeros((2 * (n_el + 1), n_felder))
+    zeilen = 2 * elemente[:, None] + np.arange(4)
+    np.add.at(F, (zeilen, np.broadcast_to(felder[:, None], zeilen.shape)), -fer)
+
+    # Verläufe des eingespannten Elements (Moment positiv im Feld, V = dM/dx)
+    x = np.linspace(0.0, L, punkte_je_element, axis=1)                  # (n, punkte)
+    if ort[0] == LASTART_EINZEL:
+        # Last ab x = a wirksam; liegt sie auf dem Endknoten, wirkt sie nur dort
+        belastet = (x >= a[:, None]) & (a[:, None] < L[:, None])
+        lastanteil = belastet.astype(float)
+        hebel = x - a[:, None]
+    else:
+        c = np.clip(x, start[:, None], ende[:, None])
+        lastanteil = c - start[:, None]
+        hebel = x - (start[:, None] + c) / 2
+    moment = -m0[:, None] + v0[:, None] * x - lastanteil * hebel
+    querkraft = v0[:, None] - lastanteil
+
+    # Globale Punktindizes wie Postprocessor.interp: der Endpunkt eines Elements
+    # wird vom Anfangspunkt des folgenden ersetzt (außer beim letzten Element)
+    n_punkte = n_el * (punkte_je_element - 1) + 1
+    index = elemente[:, None] * (punkte_je_element - 1) + np.arange(punkte_je_element)
+    gueltig = ((np.arange(punkte_je_element) < punkte_je_element - 1)
+               | (elemente[:, None] == n_el - 1))
+    zeilen = np.broadcast_to(felder[:, None], index.shape)[gueltig]
+    korrektur = {}
+    for groesse, verlauf in (("moment", moment), ("querkraft", querkraft)):
+        werte = np.zeros((n_felder, n_punkte))
+        np.add.at(werte, (zeilen, index[gueltig]), verlauf[gueltig])
+        korrektur[groesse] = werte
+    return F, korrektur
+
 
 class FeebbBerechnungEC:
     """
@@ -45,18 +248,31 @@ class FeebbBerechnungEC:
         self.db = db
         self.system_memory = {}  # Ergebnis-Cache für GZT und GZG
 
+        # Lazy erzeugte Artefakte (siehe latex_formeln())
+        self._massgebend_je_typ = None
+        self._latex_formeln = None
+
         # EC-spezifische Parameter (γ aus NA-DE, aktuell als Standardwerte; ψ aus Datenbank)
-        self.gamma_g = 1.35  # Teilsicherheitsbeiwert für ständige Lasten (GZT)
+        self.gamma_g = GAMMA_G  # Teilsicherheitsbeiwert für ständige Lasten (GZT)
         # Teilsicherheitsbeiwert für veränderliche Lasten (GZT)
-        self.gamma_q = 1.5
+        self.gamma_q = GAMMA_Q
         # Hinweis: ψ0/ψ1/ψ2 werden je Last über die Datenbank ermittelt
 
         logger.info("🏗️ EC-konforme FEEBB-Berechnung initialisiert")
 
-    def compute(self) -> dict:
+    def compute(self, latex_formeln: bool = False, maxima_only: bool = False) -> dict:
         """
         Hauptberechnungsmethode - führt die komplette EC-konforme Analyse durch.
 
+        Args:
+            latex_formeln (bool): LaTeX-Formeln sofort mit erzeugen. Standardmäßig
+                aus – Batch- und Live-Berechnungen brauchen sie nicht; bei Bedarf
+                liefert latex_formeln() sie nachträglich aus diesem Objekt.
+            maxima_only (bool): Nur Bemessungswerte (max |M|, max |V|, max w,
+                w_quasi) und Auflagerkräfte – keine Verläufe, Envelopes oder
+                Detailergebnisse; die Verläufe werden nur blockweise zur
+                Reduktion gebildet. Für Screening- und Variantenrechnungen.
+
         Returns:
             dict: Vollständige Ergebnisstruktur mit GZT/GZG-Resultaten und maßgebenden Kombinationen
         """
@@ -69,45 +285,21 @@ class FeebbBerechnungEC:
         self._generiere_lastkombinationen()
 
         # 3. FEEBB-Berechnungen für alle Kombinationen durchführen
-        self._berechne_alle_kombinationen()
+        self._berechne_alle_kombinationen(maxima_only=maxima_only)
 
         # 4. Envelope-Bildung und maßgebende Kombinationen ermitteln
-        self._erstelle_envelopes()
+        if maxima_only:
+            self._erstelle_maxima()
+        else:
+            self._erstelle_envelopes()
+
+        # 5. Optional: LaTeX-Formeln (sonst lazy über latex_formeln())
+        if latex_formeln:
+            self.system_memory["LaTeX_Formeln"] = self.latex_formeln()
 
         logger.info("✅ EC-konforme FEEBB-Berechnung abgeschlossen")
         return self.system_memory
 
-    # ===== Hilfsfunktionen für ψ-Werte aus der Datenbank =====
-    def _get_si(self, last: dict):
-        """Liest Si-Beiwerte für die Lastkategorie aus der Datenbank."""
-        try:
-            kat = last.get("kategorie")
-            return self.db.get_si_beiwerte(kat) if kat else None
-        except Exception:
-            return None
-
-    def _psi0(self, last: dict, fallback_lastfall: str | None = None) -> float:
-        si = self._get_si(last)
-        if si and si.psi0 is not None:
-            return float(si.psi0)
-        lf = (fallback_lastfall or last.get("lastfall", "")).lower()
-        return {"s": 0.7, "w": 0.6, "p": 0.7}.get(lf, 0.7)
-
-    def _psi1(self, last: dict, fallback_lastfall: str | None = None) -> float:
-        si = self._get_si(last)
-        if si and si.psi1 is not None:
-            return float(si.psi1)
-        lf = (fallback_lastfall or last.get("lastfall", "")).lower()
-        # konservative Defaults
-        return {"p": 0.5, "s": 0.2, "w": 0.2}.get(lf, 0.5)
-
-    def _psi2(self, last: dict, fallback_lastfall: str | None = None) -> float:
-        si = self._get_si(last)
-        if si and si.psi2 is not None:
-            return float(si.psi2)
-        lf = (fallback_lastfall or last.get("lastfall", "")).lower()
-        return {"p": 0.3, "s": 0.2, "w": 0.0}.get(lf, 0.3)
-
     def _extrahiere_systemdaten(self):
         """
         Extrahiert Systemgeometrie, Materialdaten und Lastdaten aus dem Snapshot.
@@ -135,35 +327,73 @@ class FeebbBerechnungEC:
     def _analysiere_systemgeometrie(self):
         """
         Analysiert die Systemgeometrie und erstellt die Feldstruktur.
-        """
-        self.felder = []
-        self.gesamt_elemente = []
-        self.zwischenlager_knoten = []
-        node_tracker = 0
 
+        Das Ergebnis (Feldtabelle, Elemente, Lager-DOFs) hängt nur von Spannweiten,
+        E, I und der Diskretisierung ab und wird in einem begrenzten LRU-Cache
+        abgelegt. Bei reinen Laständerungen entfällt die Analyse.
+        """
         # Adaptive element density based on number of inner fields.
         # Euler-Bernoulli FEM yields exact nodal displacements for UDL loads
-        # regardless of element count; reducing density only affects the visual
-        # smoothness of the interpolated diagram curves.
+        # regardless of element count, and the clamped-element correction makes
+        # moment and shear exact inside the elements; the density only affects
+        # the sampling of the diagram curves.
         # For EC mode the number of load patterns scales as 2^n_felder – 1, so
         # the postprocessing cost grows exponentially with field count. Fewer
         # elements reduce both stiffness-matrix assembly and Hermite-interpolation
-        # work proportionally.
+        # work proportionally. The base density comes from the resolution
+        # setting (aufloesung.py); "standard" gives 10/8/6/5 elements per metre.
         n_felder = sum(1 for k in self.spannweiten if k.startswith("feld_"))
         if n_felder <= 2:
-            elemente_pro_meter = 10   # ≤ 2 fields: fine resolution
+            dichtefaktor = 1.0    # ≤ 2 fields: fine resolution
         elif n_felder <= 4:
-            elemente_pro_meter = 8    # 3–4 fields
+            dichtefaktor = 0.8    # 3–4 fields
         elif n_felder <= 6:
-            elemente_pro_meter = 6    # 5–6 fields
+            dichtefaktor = 0.6    # 5–6 fields
         else:
-            elemente_pro_meter = 5    # 7+ fields: still smooth on screen
+            dichtefaktor = 0.5    # 7+ fields: still smooth on screen
+        gesamtlaenge = sum(float(v) for v in self.spannweiten.values())
+        elemente_pro_meter, self.punkte_je_element = diskretisierung(
+            aufloesung(self.snapshot), gesamtlaenge, dichtefaktor)
         self._elemente_pro_meter = elemente_pro_meter   # stored for logging
         logger.debug(
             f"🔧 Adaptive Diskretisierung: {n_felder} Felder → "
-            f"{elemente_pro_meter} Elemente/m"
+            f"{elemente_pro_meter:g} Elemente/m, {self.punkte_je_element} Punkte/Element"
         )
 
+        schluessel = (
+            tuple((k, float(v)) for k, v in self.spannweiten.items()),
+            float(self.E), float(self.I), elemente_pro_meter, self.punkte_je_element
+        )
+        self._geometrie_schluessel = schluessel
+        with _geometrie_cache_lock:
+            geometrie = _geometrie_cache.get(schluessel)
+            if geometrie is not None:
+                _geometrie_cache.move_to_end(schluessel)
+
+        if geometrie is None:
+            self._baue_systemgeometrie(elemente_pro_meter)
+            geometrie = {name: getattr(self, name) for name in _GEOMETRIE_ATTRIBUTE}
+            with _geometrie_cache_lock:
+                _geometrie_cache[schluessel] = geometrie
+                while len(_geometrie_cache) > GEOMETRIE_CACHE_GROESSE:
+                    _geometrie_cache.popitem(last=False)
+        else:
+            logger.debug("♻️ Systemgeometrie aus Cache übernommen")
+            for name, wert in geometrie.items():
+                setattr(self, name, wert)
+
+    def _baue_systemgeometrie(self, elemente_pro_meter):
+        """
+        Erstellt Feldtabelle, Elementliste und Lagerungsbedingungen.
+
+        Args:
+            elemente_pro_meter (float): Elementdichte der Diskretisierung
+        """
+        self.felder = []
+        self.gesamt_elemente = []
+        self.zwischenlager_knoten = []
+        node_tracker = 0
+
         # === Kragarm links ===
         l_krag_links = float(self.spannweiten.get("kragarm_links", 0))
         if l_krag_links > 0:
@@ -269,38 +499,56 @@ class FeebbBerechnungEC:
             self.supports[ende_normale_felder] = [-1, 0]
             self.supports[node_tracker] = [0, 0]  # Ende freigeben
 
+        # Flache Lagerliste (FEEBB-Format) und Elementlängen [mm] als Array
+        self.supports_flat = [v for pair in self.supports for v in pair]
+        self.element_laengen = np.array([e["length"] for e in self.gesamt_elemente])
+        self.spiegel_felder = _spiegel_felder(self.felder, self.element_laengen, self.supports)
+
     def _generiere_belastungsmuster(self):
         """
         Generiert alle relevanten Belastungsmuster für Mehrfeldträger nach Eurocode.
 
         Für jeden Feldtyp (normale Felder, keine Kragarme) werden verschiedene
         Belastungsmuster erzeugt, um die ungünstigste Konstellation zu finden.
+        Ein Muster ist eine Bitmaske (int): Bit i gesetzt = normales Feld i
+        belastet. Reihenfolge wie bisher: nach Anzahl belasteter Felder, innerhalb
+        gleicher Anzahl lexikographisch nach Feldindizes.
         """
         # Normale Felder (ohne Kragarme) extrahieren
         self.normale_felder = [
             f for f in self.felder if f["typ"].startswith("feld_")]
 
+        # Bit je Eintrag in self.felder (-1 = Kragarm, immer belastet)
+        bit = 0
+        self._muster_bit_je_feld = []
+        for feld in self.felder:
+            if feld["typ"].startswith("feld_"):
+                self._muster_bit_je_feld.append(bit)
+                bit += 1
+            else:
+                self._muster_bit_je_feld.append(-1)
+        self._muster_bit_je_feld = np.array(self._muster_bit_je_feld)
+
         # Debug-Logging
         logger.info(f"🔍 Normale Felder: {len(self.normale_felder)}")
         for fidx, feld in enumerate(self.normale_felder):
             logger.info(
                 f"   Feld {fidx}: {feld['typ']}, Elemente {feld['start_element']}-{feld['start_element'] + feld['anzahl_elemente'] - 1}, Länge {feld['laenge']}m")
 
-        if len(self.normale_felder) <= 1:
+        n = len(self.normale_felder)
+        if n <= 1:
             # Bei einem Feld oder nur Kragarmen: nur ein Muster (alle belastet)
-            self.belastungsmuster = [[True] * len(self.normale_felder)]
+            self.belastungsmuster = [(1 << n) - 1]
             logger.info("📊 Einfeldträger: 1 Belastungsmuster")
         else:
-            # Bei Mehrfeldträgern: alle möglichen Kombinationen generieren
-            import itertools
-            n = len(self.normale_felder)
-            # Alle Kombinationen von belastet/unbelastet
-            # Mindestens ein Feld muss belastet sein
-            self.belastungsmuster = []
-            for r in range(1, n + 1):
-                for kombi in itertools.combinations(range(n), r):
-                    muster = [i in kombi for i in range(n)]
-                    self.belastungsmuster.append(muster)
+            # Bei Mehrfeldträgern: alle Kombinationen belastet/unbelastet,
+            # mindestens ein Feld belastet. Lexikographische Reihenfolge der
+            # Feldindizes = absteigende Maske mit gespiegelten Bits.
+            masken = np.arange(1, 1 << n)
+            bits = (masken[:, None] >> np.arange(n)) & 1                 # (n_muster, n)
+            gespiegelt = bits @ (1 << np.arange(n - 1, -1, -1))
+            reihenfolge = np.lexsort((-gespiegelt, bits.sum(axis=1)))
+            self.belastungsmuster = masken[reihenfolge].tolist()
 
             logger.info(
                 f"📊 Mehrfeldträger: {len(self.belastungsmuster)} Belastungsmuster generiert")
@@ -321,184 +569,47 @@ class FeebbBerechnungEC:
         # Belastungsmuster für Mehrfeldträger generieren
         self._generiere_belastungsmuster()
 
-        # Lastdaten aufbereiten
-        g_lasten = [l for l in self.lasten if l["lastfall"].lower() == "g"]
-        q_lasten = [l for l in self.lasten if l["lastfall"].lower() != "g"]
-
-        # === GZT-Kombinationen (mit Teilsicherheitsbeiwerten) ===
-
-        # 1. Nur ständige Lasten: γ_G · G
-        if g_lasten:
-            # Alle G-Lasten summieren (verhindert Key-Kollision bei mehreren G mit gleichem lastfall)
-            g_sum = sum(self.gamma_g *
-                        float(l["wert"]) * self.sprungmass for l in g_lasten)
-            self.kombinationen_gzt.append({
-                "name": "GZT: γ_G · G",
-                "beschreibung": "Nur ständige Lasten mit Teilsicherheitsbeiwert",
-                "lasten": {"G_SUM": g_sum},
-                "typ": "nur_g"
-            })
-
-        # 2. G + einzelne veränderliche Last: γ_G · G + γ_Q · Q_i
-        for q_last in q_lasten:
-            lasten_dict = {}
-            # Ständige Lasten (summiert als G_SUM)
-            g_sum = sum(self.gamma_g *
-                        float(l["wert"]) * self.sprungmass for l in g_lasten)
-            lasten_dict["G_SUM"] = g_sum
-            # Eine veränderliche Last
-            lasten_dict[q_last["lastfall"]] = self.gamma_q * \
-                float(q_last["wert"]) * self.sprungmass
-
-            self.kombinationen_gzt.append({
-                "name": f"GZT: γ_G · G + γ_Q · {q_last['lastfall'].upper()}",
-                "beschreibung": f"Ständige + {q_last['lastfall'].upper()} als Leiteinwirkung",
-                "lasten": lasten_dict,
-                "typ": "g_plus_q",
-                "leiteinwirkung": q_last["lastfall"]
-            })
-
-        # 3. G + alle veränderlichen Lasten mit Kombinationsbeiwerten
-        if len(q_lasten) > 1:
-            for leit_q in q_lasten:
-                lasten_dict = {}
-                # Ständige Lasten (summiert als G_SUM)
-                g_sum = sum(
-                    self.gamma_g * float(l["wert"]) * self.sprungmass for l in g_lasten)
-                lasten_dict["G_SUM"] = g_sum
-
-                # Leiteinwirkung
-                lasten_dict[leit_q["lastfall"]] = self.gamma_q * \
-                    float(leit_q["wert"]) * self.sprungmass
-
-                # Begleitende Einwirkungen mit ψ₀
-                for neben_q in q_lasten:
-                    if neben_q != leit_q:
-                        psi = self._psi0(neben_q)
-                        lasten_dict[neben_q["lastfall"]] = psi * \
-                            self.gamma_q * \
-                            float(neben_q["wert"]) * self.sprungmass
-
-                self.kombinationen_gzt.append({
-                    "name": f"GZT: γ_G · G + γ_Q · {leit_q['lastfall'].upper()} + Σψ₀ · γ_Q · Q_i",
-                    "beschreibung": f"Vollkombination mit {leit_q['lastfall'].upper()} als Leiteinwirkung",
-                    "lasten": lasten_dict,
-                    "typ": "vollkombination",
-                    "leiteinwirkung": leit_q["lastfall"]
-                })
-
-        # === GZG-Kombinationen (charakteristische Werte) ===
-
-        # 1. Charakteristische Kombination: G + Q_1 + Σψ₀ · Q_i
-        if q_lasten:
-            for leit_q in q_lasten:
-                lasten_dict = {}
-                # Ständige Lasten (ohne γ, summiert als G_SUM)
-                g_sum = sum(float(l["wert"]) *
-                            self.sprungmass for l in g_lasten)
-                lasten_dict["G_SUM"] = g_sum
-
-                # Leiteinwirkung (ohne γ)
-                lasten_dict[leit_q["lastfall"]] = float(
-                    leit_q["wert"]) * self.sprungmass
-
-                # Begleitende Einwirkungen mit ψ₀ (ohne γ)
-                for neben_q in q_lasten:
-                    if neben_q != leit_q:
-                        psi = self._psi0(neben_q)
-                        lasten_dict[neben_q["lastfall"]] = psi * \
-                            float(neben_q["wert"]) * self.sprungmass
-
-                self.kombinationen_gzg.append({
-                    "name": f"GZG-Char: G + {leit_q['lastfall'].upper()} + Σψ₀ · Q_i",
-                    "beschreibung": f"Charakteristische Kombination mit {leit_q['lastfall'].upper()} als Leiteinwirkung",
-                    "lasten": lasten_dict,
-                    "typ": "charakteristisch",
-                    "leiteinwirkung": leit_q["lastfall"]
-                })
-
-        # 2. Häufige Kombination: G + ψ₁ · Q_1 + Σψ₂ · Q_i
-        if q_lasten:
-            for leit_q in q_lasten:
-                lasten_dict = {}
-                # Ständige Lasten (ohne γ, summiert als G_SUM)
-                g_sum = sum(float(l["wert"]) *
-                            self.sprungmass for l in g_lasten)
-                lasten_dict["G_SUM"] = g_sum
-
-                # Leiteinwirkung mit ψ1
-                psi1 = self._psi1(leit_q)
-                lasten_dict[leit_q["lastfall"]] = psi1 * \
-                    float(leit_q["wert"]) * self.sprungmass
-
-                # Begleitende Einwirkungen mit ψ2
-                for neben_q in q_lasten:
-                    if neben_q != leit_q:
-                        psi2 = self._psi2(neben_q)
-                        lasten_dict[neben_q["lastfall"]] = psi2 * \
-                            float(neben_q["wert"]) * self.sprungmass
-
-                self.kombinationen_gzg.append({
-                    "name": f"GZG-Haeufig: G + ψ1 · {leit_q['lastfall'].upper()} + Σψ2 · Q_i",
-                    "beschreibung": f"Häufige Kombination mit {leit_q['lastfall'].upper()} als Leiteinwirkung",
-                    "lasten": lasten_dict,
-                    "typ": "haeufig",
-                    "leiteinwirkung": leit_q["lastfall"]
-                })
-
-        # 3. Quasi-ständige Kombination: G + Σψ₂ · Q_i
-        if q_lasten:
-            lasten_dict = {}
-            # Ständige Lasten (summiert als G_SUM)
-            g_sum = sum(float(l["wert"]) * self.sprungmass for l in g_lasten)
-            lasten_dict["G_SUM"] = g_sum
-
-            # Alle veränderlichen Lasten mit ψ₂
-            for q_last in q_lasten:
-                psi2 = self._psi2(q_last)
-                lasten_dict[q_last["lastfall"]] = psi2 * \
-                    float(q_last["wert"]) * self.sprungmass
-
-            self.kombinationen_gzg.append({
-                "name": "GZG-Quasi: G + Σψ₂ · Q_i",
-                "beschreibung": "Quasi-ständige Kombination",
-                "lasten": lasten_dict,
-                "typ": "quasi_staendig"
-            })
+        # Lastliste in einem Schritt in Koeffizientenmatrizen übersetzen
+        # (Kombinationen × Einwirkungen); FE-Stufe und Formelgenerator lesen daraus.
+        # Dieselbe Instanz nutzen MethodeLastkombi und MethodeLastkombiGZG.
+        self.kombinationsmatrix = kombinationsmatrix(
+            self.snapshot, self.db, self.gamma_g, self.gamma_q)
+        # Eigene Kopien: die Dicts landen in Ergebnissen und Ergebnis-Handles
+        self.kombinationen_gzt = self.kombinationsmatrix.kombinationen("GZT")
+        self.kombinationen_gzg = self.kombinationsmatrix.kombinationen("GZG")
 
-        # Fallback: Falls keine Q-Lasten vorhanden, erstelle mindestens eine GZG-Kombination (nur G)
-        # Dies ist wichtig für Durchbiegungsnachweise, die GZG-Werte benötigen
-        if not q_lasten and g_lasten:
-            lasten_dict = {}
-            g_sum = sum(float(l["wert"]) * self.sprungmass for l in g_lasten)
-            lasten_dict["G_SUM"] = g_sum
-
-            self.kombinationen_gzg.append({
-                "name": "GZG: G (nur ständige Lasten)",
-                "beschreibung": "Charakteristische Kombination ohne veränderliche Lasten",
-                "lasten": lasten_dict,
-                "typ": "nur_g"
-            })
+        if self.kombinationsmatrix.hat_g and not self.kombinationsmatrix.q_spalten:
             logger.info(
                 "⚠️ Keine veränderlichen Lasten → GZG-Fallback erstellt (nur G)")
 
         logger.info(
             f"📋 {len(self.kombinationen_gzt)} GZT-Kombinationen und {len(self.kombinationen_gzg)} GZG-Kombinationen generiert")
 
-    def _berechne_alle_kombinationen(self):
+    def _berechne_alle_kombinationen(self, maxima_only: bool = False):
         """
-        Führt alle FEEBB-Berechnungen durch – optimiert durch einen einzigen
-        gebündelten numpy-Solve statt N separater LU-Faktorisierungen.
+        Führt alle FEEBB-Berechnungen durch – über Einheitslastfälle je Feld.
+
+        Das System ist linear in den Lasten: Jede (Kombi × Muster)-Aufgabe belastet
+        die Felder mit konstanten Streckenlasten w_f, Verschiebungen, Verläufe und
+        Auflagerkräfte sind daher Σ w_f · (Antwort auf w_f = 1 N/mm). Die
+        Einheitsantworten (ein Lastfall je Feld inkl. Kragarme) hängen nur von der
+        Geometrie ab und werden in einem begrenzten Cache gehalten (siehe
+        _einheitsantworten()). Bei reinen Laständerungen entfallen damit
+        Steifigkeitsaufbau, Solve und Postprocessing komplett; alle Verläufe
+        entstehen durch ein Matrixprodukt.
 
-        Die Steifigkeitsmatrix K ist identisch für alle (Kombi × Muster)-Paare,
-        da sie nur von Geometrie und Material abhängt. Nur der Lastvektor F ändert
-        sich. Ein einziger Aufruf np.linalg.solve(K, F_matrix) mit allen
-        Lastvektoren als Spalten von F_matrix führt eine LU-Faktorisierung durch
-        und löst alle rechten Seiten mit effizienter Rückwärtssubstitution.
+        Einzel- und Teilstreckenlasten gehen als zusätzliche Bausteine (je
+        Einwirkung und Feld, siehe _lastbausteine()) in dieselbe Basis ein.
 
-        Speedup: ~50× für 4 Felder (90 Solves → 1 Solve).
+        Identische Feldlastvektoren werden vor der Kombination zusammengefasst;
+        jede eindeutige Spalte wird nur einmal gebildet und auf alle Aufgaben verteilt.
+
+        Args:
+            maxima_only (bool): Verläufe nur blockweise für die Betragsmaxima
+                auswerten (MAXIMA_BLOCKGROESSE Spalten je Block) und ohne
+                Verschiebungsmatrix; die Ergebnisse enthalten dann nur "max".
         """
-        logger.info("🔢 Berechne alle Lastkombinationen (gebündelter Batch-Solve)")
+        logger.info("🔢 Berechne alle Lastkombinationen (Einheitslastfälle je Feld)")
 
         # ── Step 1: collect all (grenzzustand, kombi, muster, muster_id) tasks ──
         # muster_id is captured here (O(1)) to avoid an O(N²) .index() lookup later.
@@ -515,149 +626,384 @@ class FeebbBerechnungEC:
             self.ergebnisse_gzg = []
             return
 
-        # ── Step 2: assemble all Beam objects (lazy – K and F built, no solve) ──
-        # K is identical for every task; F differs per (kombi, muster).
-        beams = []
-        for (_, kombi, muster, _muster_id) in tasks:
-            feebb_dict = self._erstelle_feebb_dict_fuer_kombination(kombi, muster)
-            elements   = [Element(e) for e in feebb_dict["elements"]]
-            beam       = Beam(elements, feebb_dict["supports"], lazy_solve=True)
-            beams.append(beam)
-
-        # ── Safety assertion: all beams must share an identical stiffness matrix K.
-        # K depends on geometry (element lengths) and material (E·I) only – never on loads.
-        # If K diverges across beams, the batched solve would produce silently wrong results.
-        # Checking only the diagonal is O(N · n_dof) and sufficient for catching most divergences.
-        K_diag = beams[0].stiffness.diagonal()
-        for check_idx, b in enumerate(beams[1:], start=1):
-            if not np.allclose(b.stiffness.diagonal(), K_diag, rtol=1e-12):
-                raise RuntimeError(
-                    f"Batched solve precondition violated: beam[{check_idx}] has a different "
-                    f"stiffness diagonal than beam[0]. All beams in a batch must share the "
-                    f"same K (identical geometry, E·I, and support conditions)."
-                )
-
-        # ── Step 3: one batched solve ────────────────────────────────────────
-        # K taken from the first beam – all beams share identical K
-        # (same geometry, same E·I, same support conditions).
-        K        = beams[0].stiffness                              # (n_dof, n_dof)
-        F_matrix = np.column_stack([b.load for b in beams])       # (n_dof, N_total)
-        X_matrix = np.linalg.solve(K, F_matrix)                   # single LU + N back-subs
-
-        # ── Step 4: distribute solutions + postprocess ───────────────────────
+        # ── Step 2: load vector per task in the basis of unit responses ──────
+        # Basis: one unit UDL per field (cached per geometry), followed by the
+        # point/patch load blocks (one per action and field, see _lastbausteine).
+        # Straight from the compiled coefficient matrix: UDL actions split into
+        # a part on all fields and a part following the pattern,
+        # w = fest + feldweise · B[muster] (B: pattern × field, cantilevers = 1);
+        # every block is scaled by its coefficient and, for pattern-following
+        # actions, by the pattern factor of its field.
+        einheit = self._einheitsantworten()
+        bausteine = self._lastbausteine()
+        km = self.kombinationsmatrix
+        B = self._lastverteilung(self.belastungsmuster)                # (n_muster, n_felder)
+        bloecke = []
+        for gs in ("GZT", "GZG"):
+            fest, feldweise = km.lastanteile(gs, km.streckenlast)
+            block = fest[:, None, None] + feldweise[:, None, None] * B[None]
+            if bausteine is not None:
+                koeff, leit = km.koeffizienten(gs)
+                j, f = bausteine["spalten"], bausteine["felder"]
+                faktor = koeff[:, j] * km.werte[j]                         # (n_kombi, n_bausteine)
+                muster = np.where(leit[:, j][:, None, :], B[:, f][None], 1.0)
+                block = np.concatenate([block, faktor[:, None, :] * muster], axis=2)
+            bloecke.append(block.reshape(-1, block.shape[2]))
+        W_tasks = np.vstack(bloecke).T                                  # (n_basis, n_tasks)
+
+        if bausteine is not None:
+            einheit = {
+                "U": np.hstack([einheit["U"], bausteine["U"]]),
+                "kurven": {groesse: np.vstack([kurven, bausteine["kurven"][groesse]])
+                           for groesse, kurven in einheit["kurven"].items()},
+                "reaktionen": np.hstack([einheit["reaktionen"], bausteine["reaktionen"]]),
+                "beam": einheit["beam"],
+            }
+
+        # ── Step 3: deduplicate identical load vectors ───────────────────────
+        # Many tasks share exactly the same loading: "nur_g" against every
+        # pattern, single-field systems, and combinations whose accompanying
+        # loads vanish because ψ₀ = 0. Hashing the raw column bytes groups them
+        # in O(N). First-occurrence order is kept, so the envelope tie-breaking
+        # (first result with a strictly larger value wins) is unchanged.
+        eindeutige_spalten = {}                    # column bytes → unique column index
+        spalten_index      = []                    # task index  → unique column index
+        erste_tasks        = []                    # unique column → first task index
+        for task_idx in range(len(tasks)):
+            schluessel = W_tasks[:, task_idx].tobytes()
+            spalte = eindeutige_spalten.get(schluessel)
+            if spalte is None:
+                spalte = len(erste_tasks)
+                eindeutige_spalten[schluessel] = spalte
+                erste_tasks.append(task_idx)
+            spalten_index.append(spalte)
+        self._spalten_index = spalten_index
+        W = W_tasks[:, erste_tasks]                                     # (n_basis, N_unique)
+        self._W_matrix = W
+
+        # ── Step 4: superpose the cached unit responses ──────────────────────
+        # maxima_only reduces block by block: only the maxima are kept, never
+        # the full (N_unique × n_punkte) curve matrices or the displacements.
+        self._einheit = einheit
+        if not maxima_only:
+            self._X_matrix = einheit["U"] @ W                          # (n_dof, N_unique)
+        blockgroesse = MAXIMA_BLOCKGROESSE if maxima_only else W.shape[1]
+        abschnitte = self.abschnitte()
+        self._kurven = {}
+        maxima = {"moment": [], "querkraft": [], "durchbiegung": []}
+        durchbiegung_felder = []
+        for start in range(0, W.shape[1], blockgroesse):
+            W_block = W[:, start:start + blockgroesse]
+            for groesse in maxima:
+                kurven = W_block.T @ einheit["kurven"][groesse]        # (Block, n_punkte)
+                maxima[groesse].append(np.abs(kurven).max(axis=1))
+                if groesse == "durchbiegung":
+                    # Betragsmaxima der Durchbiegung je Feld (Block, n_felder)
+                    durchbiegung_felder.append(feldmaxima(kurven, abschnitte))
+                if not maxima_only:
+                    self._kurven[groesse] = kurven
+        maxima = {groesse: np.concatenate(werte).tolist() for groesse, werte in maxima.items()}
+        self._durchbiegung_felder = np.vstack(durchbiegung_felder)     # (N_unique, n_felder)
+
+        # ── Step 5: fan the unique results back out to all tasks ─────────────
+        # Curve rows are shared (read-only views) between tasks with identical
+        # load vectors; only the per-task metadata lives in the result dict.
         self.ergebnisse_gzt = []
         self.ergebnisse_gzg = []
 
-        for col_idx, ((gs, kombi, muster, muster_id), beam) in enumerate(zip(tasks, beams)):
-            beam.displacement = X_matrix[:, col_idx]              # inject solution vector
-            try:
-                ergebnis = self._fuehre_postprocessing(beam)
-            except Exception as exc:
-                kombi_name = kombi.get("name", str(kombi)) if isinstance(kombi, dict) else str(kombi)
-                raise RuntimeError(
-                    f"Postprocessing failed for task {col_idx}/{len(tasks)} "
-                    f"({gs}, {kombi_name}): {exc}"
-                ) from exc
-            ergebnis["kombination"]      = kombi
-            ergebnis["belastungsmuster"] = muster
-            ergebnis["muster_id"]        = muster_id   # from task tuple, not from .index()
-
-            if gs == "GZT":
-                self.ergebnisse_gzt.append(ergebnis)
-            else:
-                self.ergebnisse_gzg.append(ergebnis)
+        for (gs, kombi, muster, muster_id), spalte in zip(tasks, spalten_index):
+            ergebnisse = self.ergebnisse_gzt if gs == "GZT" else self.ergebnisse_gzg
+            ergebnisse.append({
+                **{groesse: kurven[spalte] for groesse, kurven in self._kurven.items()},
+                "max": {
+                    "moment":       maxima["moment"][spalte],
+                    "querkraft":    maxima["querkraft"][spalte],
+                    "durchbiegung": maxima["durchbiegung"][spalte],
+                },
+                "spalte":           spalte,
+                "id":               len(ergebnisse),
+                "kombination":      kombi,
+                "belastungsmuster": muster,
+                "muster_id":        muster_id,   # from task tuple, not from .index()
+            })
 
         logger.info(
-            f"✅ Batch-Solve abgeschlossen: {len(tasks)} Solves in einem numpy-Aufruf. "
+            f"✅ Superposition abgeschlossen: {len(tasks)} Lastfälle, davon "
+            f"{len(erste_tasks)} eindeutige Lastvektoren aus {W.shape[0]} Einheitslastfällen. "
             f"{len(self.ergebnisse_gzt)} GZT + {len(self.ergebnisse_gzg)} GZG Ergebnisse."
         )
 
+    def _einheitsantworten(self) -> dict:
+        """
+        Antworten auf eine Einheits-Streckenlast (1 N/mm) je Feld, gecacht je Geometrie.
+
+        Ein Lastfall je Eintrag in self.felder (Kragarme eingeschlossen), alle mit
+        einem gebündelten Solve gelöst. Der Cache-Schlüssel ist derselbe wie beim
+        Geometrie-Cache (Spannweiten, E, I, Elementdichte).
+
+        Bei spiegelsymmetrischen Systemen (siehe _spiegel_felder) wird nur die
+        linke Hälfte der Felder nachbearbeitet; die Verläufe der Spiegelfelder
+        entstehen durch Umkehren der Arrays. Da jede Muster-Antwort aus diesen
+        Einheitsantworten überlagert wird, sind damit auch gespiegelte Muster
+        exakt gespiegelt.
+
+        Returns:
+            dict: "U" (n_dof, n_felder) Verschiebungen, "kurven" je Schnittgröße
+            (n_felder, n_punkte), "reaktionen" (n_reac, n_felder) und "beam"
+            (Beam mit gemeinsamer Geometrie, nur lesen)
+        """
+        schluessel = self._geometrie_schluessel
+        with _einheitsantworten_lock:
+            einheit = _einheitsantworten_cache.get(schluessel)
+            if einheit is not None:
+                _einheitsantworten_cache.move_to_end(schluessel)
+                logger.debug("♻️ Einheitsantworten aus Cache übernommen")
+                return einheit
+
+        # One beam per unit load case (lazy – K and F built, no solve).
+        # K depends on geometry (element lengths) and material (E·I) only.
+        beams = []
+        for feld in self.felder:
+            start = feld["start_element"]
+            ende = start + feld["anzahl_elemente"]
+            elements = [
+                Element({
+                    "length": e["length"],
+                    "youngs_mod": e["youngs_mod"],
+                    "moment_of_inertia": e["moment_of_inertia"],
+                    "loads": [{"type": "udl", "magnitude": 1.0}] if start <= idx < ende else []
+                })
+                for idx, e in enumerate(self.gesamt_elemente)
+            ]
+            beams.append(Beam(elements, list(self.supports_flat), lazy_solve=True))
+
+        beam = beams[0]
+        F_einheit = np.column_stack([b.load for b in beams])             # (n_dof, n_felder)
+        U = np.linalg.solve(beam.stiffness, F_einheit)                   # single LU + n back-subs
+
+        # Unconstrained rows of K and F at the support DOFs → R = K·u − F
+        F_reaktion = np.column_stack([b.reaction_load for b in beams])  # (n_reac, n_felder)
+
+        # Postprocessing nur für die kanonischen Felder (Feld ≤ Spiegelfeld)
+        spiegel = self.spiegel_felder
+        kanonisch = np.arange(U.shape[1]) if spiegel is None else \
+            np.flatnonzero(np.arange(U.shape[1]) <= spiegel)
+        U_kanonisch = U[:, kanonisch]
+        kurven = self._fuehre_postprocessing(U_kanonisch, beam)
+
+        # Lokaler Anteil der Streckenlast in den belasteten Elementen: Moment und
+        # Querkraft sind damit in jedem Auswertungspunkt exakt
+        feld_je_element = np.repeat(np.arange(len(self.felder)),
+                                    [feld["anzahl_elemente"] for feld in self.felder])
+        udl = (feld_je_element[:, None] == kanonisch[None, :]).astype(float)
+        post = Postprocessor(beam, self.punkte_je_element)
+        kurven["moment"] = kurven["moment"] + post.udl_correction("moment", udl)
+        kurven["querkraft"] = kurven["querkraft"] + post.udl_correction("shear", udl)
+
+        if len(kanonisch) < U.shape[1]:
+            abgeleitet = np.flatnonzero(np.arange(U.shape[1]) > spiegel)
+            gespiegelt = _spiegle_verlaeufe(
+                {g: k[np.searchsorted(kanonisch, spiegel[abgeleitet])] for g, k in kurven.items()},
+                len(self.gesamt_elemente), self.punkte_je_element)
+            for groesse, teil in kurven.items():
+                alle = np.empty((U.shape[1], teil.shape[1]))
+                alle[kanonisch] = teil
+                alle[abgeleitet] = gespiegelt[groesse]
+                kurven[groesse] = alle
+            logger.debug(f"🪞 Symmetrisches System: {len(abgeleitet)} Einheitslastfälle gespiegelt")
+
+        einheit = {
+            "U": U,
+            "kurven": kurven,
+            "reaktionen": beam.reactions(U, F_reaktion),
+            "beam": beam,
+        }
+        with _einheitsantworten_lock:
+            _einheitsantworten_cache[schluessel] = einheit
+            while len(_einheitsantworten_cache) > EINHEITSANTWORTEN_CACHE_GROESSE:
+                _einheitsantworten_cache.popitem(last=False)
+        return einheit
+
+    def _lastbausteine(self) -> dict | None:
+        """
+        Antworten der Einzel- und Teilstreckenlasten, je Einwirkung und Feld ein Baustein.
+
+        Jede solche Last wird feldweise zerlegt (das Belastungsmuster wirkt je
+        Feld); je Teil entsteht ein konsistenter Knotenlastvektor der Größe 1,
+        der einmal gelöst und nachbearbeitet wird. Die Antworten sind je
+        Geometrie und Lastlage gecacht, Änderungen des Lastwerts lösen nichts neu.
+
+        Returns:
+            dict | None: None ohne solche Lasten, sonst "spalten" (Einwirkung je
+            Baustein), "felder" (Feldindex je Baustein), "U" (n_dof, n_bausteine),
+            "kurven" je Schnittgröße (n_bausteine, n_punkte) und "reaktionen"
+            (n_reac, n_bausteine)
+        """
+        km = self.kombinationsmatrix
+        orte = {j: _lastort(km.lasten[j])
+                for j in range(len(km.lasten)) if not km.streckenlast[j]}
+        if not orte:
+            return None
+
+        antworten = {}
+        with _lastbausteine_lock:
+            for ort in orte.values():
+                antwort = _lastbausteine_cache.get((self._geometrie_schluessel, ort))
+                if antwort is not None:
+                    _lastbausteine_cache.move_to_end((self._geometrie_schluessel, ort))
+                    antworten[ort] = antwort
+
+        fehlend = [ort for ort in dict.fromkeys(orte.values()) if ort not in antworten]
+        if fehlend:
+            neu = self._berechne_lastbausteine(fehlend)
+            antworten.update(neu)
+            with _lastbausteine_lock:
+                for ort, antwort in neu.items():
+                    _lastbausteine_cache[(self._geometrie_schluessel, ort)] = antwort
+                while len(_lastbausteine_cache) > LASTBAUSTEINE_CACHE_GROESSE:
+                    _lastbausteine_cache.popitem(last=False)
+
+        teile = [(j, antworten[ort]) for j, ort in orte.items()]
+        return {
+            "spalten": np.concatenate([np.full(len(a["felder"]), j) for j, a in teile]),
+            "felder": np.concatenate([a["felder"] for _, a in teile]),
+            "U": np.hstack([a["U"] for _, a in teile]),
+            "kurven": {groesse: np.vstack([a["kurven"][groesse] for _, a in teile])
+                       for groesse in ("moment", "querkraft", "durchbiegung")},
+            "reaktionen": np.hstack([a["reaktionen"] for _, a in teile]),
+        }
+
+    def _berechne_lastbausteine(self, orte) -> dict:
+        """
+        Löst die Lastbausteine der angegebenen Lastlagen in einem Schritt.
+
+        Args:
+            orte (list[tuple]): Lastlagen aus _lastort
+
+        Returns:
+            dict: Lastlage → {"felder", "U", "kurven", "reaktionen"} (nur belastete Felder)
+        """
+        beam = self._einheitsantworten()["beam"]
+        feld_je_element = np.repeat(np.arange(len(self.felder)),
+                                    [feld["anzahl_elemente"] for feld in self.felder])
+
+        F_teile, korrekturen, felder_je_ort = [], [], []
+        for ort in orte:
+            F, korrektur = _lastbaustein_vektoren(
+                self.element_laengen, feld_je_element, len(self.felder), ort,
+                self.punkte_je_element)
+            felder = np.nonzero(np.any(F != 0.0, axis=0))[0]
+            F_teile.append(F[:, felder])
+            korrekturen.append({g: k[felder] for g, k in korrektur.items()})
+            felder_je_ort.append(felder)
+        F_alle = np.hstack(F_teile)
+
+        # Randbedingungen wie in Beam: gesperrte Zeilen von F sind null
+        F_solve = F_alle.copy()
+        F_solve[beam.reaction_dofs] = 0.0
+        U = np.linalg.solve(beam.stiffness, F_solve)
+
+        # Eigenes Geometrieobjekt: der gecachte Beam wird nicht verändert
+        geometrie = types.SimpleNamespace(
+            num_elements=beam.num_elements, len_elements=beam.len_elements,
+            E_elements=beam.E_elements, I_elements=beam.I_elements)
+        kurven = self._fuehre_postprocessing(U, geometrie)
+        reaktionen = beam.reactions(U, F_alle[beam.reaction_dofs])
+
+        ergebnis = {}
+        grenzen = np.cumsum([0] + [len(f) for f in felder_je_ort])
+        for ort, felder, korrektur, a, b in zip(orte, felder_je_ort, korrekturen,
+                                                grenzen[:-1], grenzen[1:]):
+            ergebnis[ort] = {
+                "felder": felder,
+                "U": U[:, a:b],
+                "kurven": {
+                    "moment": kurven["moment"][a:b] + korrektur["moment"],
+                    "querkraft": kurven["querkraft"][a:b] + korrektur["querkraft"],
+                    "durchbiegung": kurven["durchbiegung"][a:b],
+                },
+                "reaktionen": reaktionen[:, a:b],
+            }
+        logger.debug(f"🧱 {F_alle.shape[1]} Lastbausteine für {len(orte)} Lastlagen gelöst")
+        return ergebnis
+
+    def _lastverteilung(self, belastungsmuster) -> np.ndarray:
+        """
+        Faktor der feldweisen Lastanteile je Feld (Reihenfolge wie self.felder).
+
+        Normale Felder sind laut Belastungsmuster belastet (1) oder nicht (0),
+        Kragarme sind immer voll belastet.
+
+        Args:
+            belastungsmuster (int | np.ndarray): Bitmaske(n) der belasteten normalen Felder
+
+        Returns:
+            np.ndarray: 0/1 je Feld, bei mehreren Mustern (n_muster, n_felder)
+        """
+        bit = self._muster_bit_je_feld
+        masken = np.asarray(belastungsmuster)[..., None]
+        return np.where(bit >= 0, (masken >> np.maximum(bit, 0)) & 1, 1).astype(float)
+
+    def _feldlasten(self, kombination, belastungsmuster) -> list[float]:
+        """
+        Streckenlast je Feld (Reihenfolge wie self.felder) für eine Kombination.
+
+        Enthält nur Streckenlasten über die ganze Länge; Einzel- und
+        Teilstreckenlasten sind eigene Bausteine. Ständige Last und
+        Begleitlasten wirken auf alle Felder, die Leitlast nur auf die laut
+        Belastungsmuster belasteten normalen Felder; Kragarme sind immer voll
+        belastet. Ohne Leiteinwirkung (z.B. nur G, quasi-ständig) folgen alle
+        Q-Lasten dem Muster.
+
+        Args:
+            kombination (dict): Lastkombination (Zeile der Kombinationsmatrix)
+            belastungsmuster (int): Bitmaske der mit veränderlicher Last belasteten Felder
+
+        Returns:
+            list[float]: Lastgröße [N/mm] je Feld
+        """
+        km = self.kombinationsmatrix
+        fest, feldweise = km.lastanteile(kombination["grenzzustand"], km.streckenlast)
+        i = kombination["index"]
+        return (fest[i] + feldweise[i] * self._lastverteilung(belastungsmuster)).tolist()
+
+    def _fuehre_postprocessing(self, X_matrix, beam) -> dict:
+        """
+        Postprocessing aller Lösungsspalten (Einheitslastfälle bzw. Lastbausteine).
+
+        Returns:
+            dict: je Schnittgröße ein (n_spalten, n_punkte)-Array
+        """
+        post = Postprocessor(beam, self.punkte_je_element)
+        zeilen = {"moment": [], "querkraft": [], "durchbiegung": []}
+        for col_idx in range(X_matrix.shape[1]):
+            beam.displacement = X_matrix[:, col_idx]              # inject solution vector
+            zeilen["moment"].append(post.interp("moment"))
+            zeilen["querkraft"].append(post.interp("shear"))
+            zeilen["durchbiegung"].append(post.interp("displacement"))
+        return {groesse: np.array(werte) for groesse, werte in zeilen.items()}
+
     def _erstelle_feebb_dict_fuer_kombination(self, kombination, belastungsmuster):
         """
         Erstellt ein FEEBB-Dictionary für eine spezifische Lastkombination mit feldspezifischer Lastverteilung.
 
+        Wird von der Superposition in _berechne_alle_kombinationen nicht benötigt;
+        dient der sequentiellen Referenzrechnung (_fuehre_feebb_berechnung_durch).
+
         Args:
             kombination (dict): Lastkombination mit Lastfällen und Werten
-            belastungsmuster (list): Boolean-Liste, welche Felder mit veränderlicher Last belastet sind
+            belastungsmuster (int): Bitmaske der mit veränderlicher Last belasteten Felder
 
         Returns:
             dict: FEEBB-Dictionary mit elements und supports
         """
-        # Ständige Last (auf alle Felder) - direkt aus G_SUM lesen
-        g_last_gesamt = kombination["lasten"].get("G_SUM", 0.0)
-
-        # Veränderliche Lasten auftrennen nach Leit- und Begleitlasten
-        leiteinwirkung = kombination.get("leiteinwirkung", None)
-
-        # Leitlast (wird feldweise nach Muster aufgebracht)
-        q_leit_wert = 0.0
-        if leiteinwirkung:
-            q_leit_wert = kombination["lasten"].get(leiteinwirkung, 0.0)
-
-        # Begleitlesten (werden auf ALLE Felder aufgebracht)
-        q_begleit_gesamt = 0.0
-        for lastfall, wert in kombination["lasten"].items():
-            # Alle Lasten außer G_SUM und Leitlast
-            if lastfall != "G_SUM" and lastfall != leiteinwirkung:
-                q_begleit_gesamt += wert
-
-        # Falls keine Leiteinwirkung definiert (z.B. nur G), alle Q-Lasten als Leitlast behandeln
-        if not leiteinwirkung:
-            q_leit_wert = sum(wert for lastfall, wert in kombination["lasten"].items()
-                              if lastfall != "G_SUM")
-
-        # Erstelle Lastverteilung pro Feld (wichtig für konsistente Belastung!)
-        # Key: start_element bis end_element, Value: Lastgröße
-        feld_lasten = {}
+        feldlasten = self._feldlasten(kombination, belastungsmuster)
+        logger.debug(f"🎯 Belastungsmuster: {belastungsmuster} → Feldlasten {feldlasten} N/mm")
 
-        # Debug: Zeige Belastungsmuster (nur für erste paar Muster, sonst zu viel Output)
-        if hasattr(self, '_debug_counter'):
-            self._debug_counter += 1
-        else:
-            self._debug_counter = 0
-
-        if self._debug_counter < 3:  # Nur erste 3 Kombinationen debuggen
-            logger.info(f"🎯 Belastungsmuster: {belastungsmuster}")
-            logger.info(f"   G-Last: {g_last_gesamt:.2f} N/mm")
-            logger.info(f"   Q-Leitlast: {q_leit_wert:.2f} N/mm (feldweise)")
-            logger.info(
-                f"   Q-Begleitlesten: {q_begleit_gesamt:.2f} N/mm (auf alle Felder)")
-
-        for feld in self.felder:
-            start_elem = feld["start_element"]
-            end_elem = feld["start_element"] + feld["anzahl_elemente"]
-            feld_typ = feld["typ"]
-
-            # Ständige Last + Begleitlesten (auf alle Felder)
-            last_wert = g_last_gesamt + q_begleit_gesamt
-
-            # Leitlast hinzufügen (feldweise nach Muster)
-            if feld_typ.startswith("feld_"):
-                # Normales Feld - prüfe Belastungsmuster für Leitlast
-                feld_idx = None
-                for fidx, norm_feld in enumerate(self.normale_felder):
-                    if norm_feld["typ"] == feld_typ:
-                        feld_idx = fidx
-                        break
-
-                if feld_idx is not None and feld_idx < len(belastungsmuster) and belastungsmuster[feld_idx]:
-                    last_wert += q_leit_wert
-                    if self._debug_counter < 3:
-                        logger.info(
-                            f"   {feld_typ} (Elem {start_elem}-{end_elem-1}): {last_wert:.2f} N/mm (G+Begleit+Leit)")
-                else:
-                    if self._debug_counter < 3:
-                        logger.info(
-                            f"   {feld_typ} (Elem {start_elem}-{end_elem-1}): {last_wert:.2f} N/mm (G+Begleit)")
-            else:
-                # Kragarme werden immer mit Leitlast belastet
-                last_wert += q_leit_wert
-                if self._debug_counter < 3:
-                    logger.info(
-                        f"   {feld_typ} (Elem {start_elem}-{end_elem-1}): {last_wert:.2f} N/mm (Kragarm, G+Begleit+Leit)")
-
-            # Speichere Lastgröße für diesen Elementbereich
-            for elem_idx in range(start_elem, end_elem):
+        # Lastgröße je Element aus der Feldlast
+        feld_lasten = {}
+        for feld, last_wert in zip(self.felder, feldlasten):
+            for elem_idx in range(feld["start_element"], feld["start_element"] + feld["anzahl_elemente"]):
                 feld_lasten[elem_idx] = last_wert
 
         # Jetzt Elemente mit Lasten erstellen
@@ -682,144 +1028,127 @@ class FeebbBerechnungEC:
 
             elements_mit_lasten.append(element)
 
-        # Lagerungsbedingungen (flach für FEEBB)
-        supports_flat = [v for pair in self.supports for v in pair]
+        # Einzel- und Teilstreckenlasten direkt als Elementlasten (feebb.Element)
+        km = self.kombinationsmatrix
+        koeff, leit = km.koeffizienten(kombination["grenzzustand"])
+        verteilung = self._lastverteilung(belastungsmuster)
+        feld_je_element = np.repeat(np.arange(len(self.felder)),
+                                    [feld["anzahl_elemente"] for feld in self.felder])
+        for j in np.nonzero(~km.streckenlast)[0]:
+            faktor = koeff[kombination["index"], j] * km.werte[j]
+            ort = _lastort(km.lasten[j])
+            for e, start, ende in zip(*_lastabschnitte(self.element_laengen, ort)):
+                wert = faktor * (verteilung[feld_je_element[e]]
+                                 if leit[kombination["index"], j] else 1.0)
+                if wert == 0:
+                    continue
+                if ort[0] == LASTART_EINZEL:
+                    last = {"type": "point", "magnitude": wert, "location": start}
+                else:
+                    last = {"type": "patch", "magnitude": wert, "start": start, "end": ende}
+                elements_mit_lasten[e]["loads"].append(last)
 
+        # Lagerungsbedingungen (flach für FEEBB); Kopie, da die Geometrie gecacht ist
         return {
             "elements": elements_mit_lasten,
-            "supports": supports_flat
+            "supports": list(self.supports_flat)
         }
 
-    # ===== Support reaction extraction =====
+    # ===== Support reaction engine =====
 
     def _get_auflager_knoten(self) -> list[int]:
         """Return sorted list of node indices with vertical DOF fixed (s[0] == -1)."""
         return sorted([k for k, s in enumerate(self.supports) if s[0] == -1])
 
-    def _extrahiere_reaktionen_aus_querkraft(self, querkraft: list) -> list[float]:
+    def _berechne_reaktionsmatrix(self) -> np.ndarray:
         """
-        Extract support reactions [N] from shear-force array.
+        Support reactions [N] for every task as one matrix product.
 
-        Uses the shear-jump method: R_k = V_after - V_before at each support node.
-        Postprocessor produces 20 pts/element with shared-node deduplication (pop(-1)),
-        so node k maps to array index k * (20-1) = k * 19.
+        Reactions are the constrained rows of K·u − F. They are linear in the
+        loads, so the cached unit-load reactions times the field load matrix give
+        all unique columns at once; the deduplication index fans them out to the
+        tasks. Independent of the evaluation-point density.
 
-        Sign convention: reactions are returned as positive values (upward forces).
+        Returns:
+            np.ndarray: (n_auflager, n_tasks), GZT tasks first, then GZG tasks
+            (same order as ergebnisse_gzt + ergebnisse_gzg). Positive = upward.
         """
-        NPTS_STRIDE = 19  # = num_points - 1 = 20 - 1
-        auflager = self._get_auflager_knoten()
-        n_total = len(querkraft)
-        reactions = []
-        for node in auflager:
-            idx = node * NPTS_STRIDE
-            if node == 0:
-                # Left end: no element to the left; R = V_after_support
-                R = querkraft[0]
-            elif idx >= n_total - 1:
-                # Right end: no element to the right; R = -V_before_support
-                R = -querkraft[-1]
-            else:
-                # Intermediate: shear jump across support node
-                R = querkraft[idx] - querkraft[idx - 1]
-            reactions.append(abs(float(R)))  # [N], always positive (upward)
-        return reactions
+        beam = self._einheit["beam"]
+        R_eindeutig = self._einheit["reaktionen"] @ self._W_matrix        # (n_reac, N_unique)
+        zeilen = [beam.reaction_dofs.index(2 * k) for k in self._get_auflager_knoten()]
+        return R_eindeutig[zeilen][:, self._spalten_index]
+
+    @staticmethod
+    def _reaktions_envelope(R: np.ndarray, ids: list[int]) -> dict:
+        """Max/min envelope of reactions (n_auflager, n) with governing result ids."""
+        if R.shape[1] == 0:
+            n = R.shape[0]
+            return {"max": [0.0] * n, "min": [0.0] * n, "max_id": [None] * n, "min_id": [None] * n}
+        idx_max = np.argmax(R, axis=1)
+        idx_min = np.argmin(R, axis=1)
+        zeilen = np.arange(R.shape[0])
+        return {
+            "max": R[zeilen, idx_max].tolist(),
+            "min": R[zeilen, idx_min].tolist(),
+            "max_id": [ids[i] for i in idx_max],
+            "min_id": [ids[i] for i in idx_min],
+        }
 
     def _berechne_auflagerkraefte(self) -> dict:
         """
-        Compute max support reactions [N] from FEM results.
+        Compute support reaction envelopes [N] from the batched FEM solution.
 
-        GZT: max reaction per support across ALL GZT results (all combos × all patterns).
-        GZG characteristic: max per support from GZG results with
+        GZT: max/min per support across ALL GZT results (all combos × all patterns).
+        GZG characteristic: max/min per support from GZG results with
             kombination["typ"] == "charakteristisch" (plus "nur_g" if no live loads).
 
+        Minimum values capture uplift (negative = downward support force), e.g. at
+        the last inner support next to a loaded cantilever. The *_id entries are the
+        "id" of the governing result in ergebnisse_gzt / ergebnisse_gzg.
+
         Returns a dict ready for system_memory["Auflagerkraefte"].
         """
         auflager = self._get_auflager_knoten()
         n = len(auflager)
-        if n == 0:
+        if n == 0 or not hasattr(self, "_W_matrix"):
             return {}
 
         # Support labels A, B, C, …
         labels = [chr(65 + i) for i in range(n)]  # A=65 in ASCII
 
-        # x-positions [m] from cumulative field lengths
-        # feld["laenge"] is already in metres (confirmed: l_element = laenge * 1000 / n_elemente)
-        node_x_m: dict[int, float] = {}
-        x = 0.0
-        for feld in self.felder:
-            node_x_m[feld["start_knoten"]] = x
-            x += feld["laenge"]  # [m] – already in metres
-            node_x_m[feld["end_knoten"]] = x
-        x_positionen = [round(node_x_m.get(k, 0.0), 4) for k in auflager]
-
-        # GZT: max reaction per support across ALL ULS results
-        gzt_max = [0.0] * n
-        for ergebnis in self.ergebnisse_gzt:
-            qk = ergebnis.get("querkraft", [])
-            if not qk:
-                continue
-            reactions = self._extrahiere_reaktionen_aus_querkraft(qk)
-            for i, r in enumerate(reactions):
-                if r > gzt_max[i]:
-                    gzt_max[i] = r
+        # x-positions [m] from cumulative element lengths [mm]
+        knoten_x_m = np.concatenate(
+            ([0.0], np.cumsum(self.element_laengen))) / 1000
+        x_positionen = [round(float(knoten_x_m[k]), 4) for k in auflager]
+
+        R = self._berechne_reaktionsmatrix()
+        n_gzt = len(self.ergebnisse_gzt)
+
+        # GZT: envelope across ALL ULS results
+        gzt = self._reaktions_envelope(
+            R[:, :n_gzt], [e["id"] for e in self.ergebnisse_gzt])
 
         # GZG characteristic: filter by typ == "charakteristisch" (or "nur_g" as fallback)
-        gzg_max = [0.0] * n
         char_types = {"charakteristisch", "nur_g"}
-        for ergebnis in self.ergebnisse_gzg:
-            if ergebnis.get("kombination", {}).get("typ") not in char_types:
-                continue
-            qk = ergebnis.get("querkraft", [])
-            if not qk:
-                continue
-            reactions = self._extrahiere_reaktionen_aus_querkraft(qk)
-            for i, r in enumerate(reactions):
-                if r > gzg_max[i]:
-                    gzg_max[i] = r
+        char_ergebnisse = [
+            (n_gzt + i, e["id"]) for i, e in enumerate(self.ergebnisse_gzg)
+            if e.get("kombination", {}).get("typ") in char_types
+        ]
+        gzg = self._reaktions_envelope(
+            R[:, [spalte for spalte, _ in char_ergebnisse]],
+            [erg_id for _, erg_id in char_ergebnisse])
 
         return {
             "labels": labels,
-            "x_positionen": x_positionen,      # [m]
-            "gzt_design": gzt_max,              # [N]
-            "gzg_charakteristisch": gzg_max,   # [N]
-        }
-
-    def _fuehre_postprocessing(self, beam) -> dict:
-        """Run Postprocessor on a Beam that already has .displacement set.
-
-        PRECONDITION: beam.displacement must be set before calling this method.
-        Use lazy_solve=True on Beam and assign displacement from the batched solve result.
-
-        Separates the interpolation step from the solve step, enabling
-        the batched solve optimisation in _berechne_alle_kombinationen.
-
-        Args:
-            beam: Beam instance with .displacement already set externally.
-
-        Returns:
-            dict with keys:
-                "moment"       – list of bending moments at evaluation points
-                "querkraft"    – list of shear forces
-                "durchbiegung" – list of deflections
-                "max"          – {"moment": float, "querkraft": float, "durchbiegung": float}
-                                  absolute maximum of each quantity; required by
-                                  _erstelle_detaillierte_kombinationsergebnisse.
-        """
-        post = Postprocessor(beam, 20)  # 20 evaluation points per element (reduced for performance)
-        moment       = post.interp("moment")
-        querkraft    = post.interp("shear")
-        durchbiegung = post.interp("displacement")
-        return {
-            "moment":       moment,
-            "querkraft":    querkraft,
-            "durchbiegung": durchbiegung,
-            # Absolute maxima – identical computation to _fuehre_feebb_berechnung_durch.
-            # Required downstream by _erstelle_detaillierte_kombinationsergebnisse.
-            "max": {
-                "moment":       max(abs(m) for m in moment),
-                "querkraft":    max(abs(v) for v in querkraft),
-                "durchbiegung": max(abs(w) for w in durchbiegung),
-            },
+            "x_positionen": x_positionen,                   # [m]
+            "gzt_design": gzt["max"],                       # [N]
+            "gzt_min": gzt["min"],                          # [N], < 0 → Abheben
+            "gzt_design_id": gzt["max_id"],
+            "gzt_min_id": gzt["min_id"],
+            "gzg_charakteristisch": gzg["max"],             # [N]
+            "gzg_charakteristisch_min": gzg["min"],         # [N]
+            "gzg_charakteristisch_id": gzg["max_id"],
+            "gzg_charakteristisch_min_id": gzg["min_id"],
         }
 
     def _fuehre_feebb_berechnung_durch(self, feebb_dict):
@@ -828,7 +1157,7 @@ class FeebbBerechnungEC:
         NOTE: This method is the sequential reference implementation retained for:
           1. Regression testing (tests/test_batched_fem_solve.py uses it as ground truth)
           2. Documentation of the original per-combination flow
-        It is NOT called from _berechne_alle_kombinationen (which now uses the batched path).
+        It is NOT called from _berechne_alle_kombinationen (which superposes unit responses).
         Do not remove without updating the regression tests.
 
         Args:
@@ -841,11 +1170,13 @@ class FeebbBerechnungEC:
             # FEEBB-Objekte erstellen
             elements = [Element(e) for e in feebb_dict["elements"]]
             beam = Beam(elements, feebb_dict["supports"])
-            post = Postprocessor(beam, 20)  # 20 Auswertungspunkte pro Element (reduziert für Performance)
+            post = Postprocessor(beam, self.punkte_je_element)
+            udl = [sum(last["magnitude"] for last in e.get("loads", []) if last["type"] == "udl")
+                   for e in feebb_dict["elements"]]
 
-            # Schnittgrößen berechnen
-            moment = post.interp("moment")
-            querkraft = post.interp("shear")
+            # Schnittgrößen berechnen (Streckenlast innerhalb der Elemente exakt)
+            moment = np.asarray(post.interp("moment")) + post.udl_correction("moment", udl)[0]
+            querkraft = np.asarray(post.interp("shear")) + post.udl_correction("shear", udl)[0]
             durchbiegung = post.interp("displacement")
 
             return {
@@ -881,25 +1212,8 @@ class FeebbBerechnungEC:
         # === GZG-Envelopes ===
         gzg_envelope = self._berechne_envelope(self.ergebnisse_gzg, "GZG")
 
-        # EC5 §2.2.3: w_fin must be based on the quasi-permanent combination, not the
-        # characteristic one. Store the max absolute deflection from quasi-permanent
-        # (and G-only) results separately so nachweis_ec5.py can apply kdef correctly.
-        # Without this, (1+kdef) would be applied to the characteristic deflection,
-        # overestimating creep on the variable-load portion.
-        quasi_typen = ("quasi_staendig", "nur_g")
-        quasi_ergebnisse = [
-            e for e in self.ergebnisse_gzg
-            if e["kombination"]["typ"] in quasi_typen
-        ]
-        if quasi_ergebnisse and gzg_envelope:
-            gzg_envelope["max"]["durchbiegung_quasi"] = max(
-                e["max"]["durchbiegung"] for e in quasi_ergebnisse
-            )
-            logger.debug(
-                f"📐 GZG quasi-permanent max deflection: "
-                f"{gzg_envelope['max']['durchbiegung_quasi']:.3f} mm "
-                f"(characteristic max: {gzg_envelope['max']['durchbiegung']:.3f} mm)"
-            )
+        if gzg_envelope:
+            self._ergaenze_durchbiegungen(gzg_envelope["max"])
 
         # === Detaillierte Kombinationsergebnisse erstellen ===
         gzt_detail = self._erstelle_detaillierte_kombinationsergebnisse(
@@ -907,9 +1221,6 @@ class FeebbBerechnungEC:
         gzg_detail = self._erstelle_detaillierte_kombinationsergebnisse(
             self.ergebnisse_gzg, "GZG")
 
-        # === LaTeX-Formeln generieren ===
-        latex_formeln = self._generiere_latex_formeln()
-
         # === Auflagerkräfte berechnen ===
         auflagerkraefte = self._berechne_auflagerkraefte()
 
@@ -917,31 +1228,109 @@ class FeebbBerechnungEC:
         self.system_memory = {
             "Schnittgroessen": {
                 "GZT": gzt_envelope,
-                "GZG": gzg_envelope
+                "GZG": gzg_envelope,
+                # Lage der Felder in den Verläufen (Ausnutzungsverläufe in nachweis_ec5)
+                "felder": self.abschnitte()
             },
             "Kombinationen": {
                 "GZT": self.kombinationen_gzt,
                 "GZG": self.kombinationen_gzg
             },
+            # Kompakt (nur Maxima + ids); Verläufe über kombinationsverlauf()
             "Einzelergebnisse": {
-                "GZT": self.ergebnisse_gzt,
-                "GZG": self.ergebnisse_gzg
+                "GZT": [self._kompaktes_ergebnis(e) for e in self.ergebnisse_gzt],
+                "GZG": [self._kompaktes_ergebnis(e) for e in self.ergebnisse_gzg]
             },
             "Detaillierte_Kombinationen": {
                 "GZT": gzt_detail,
                 "GZG": gzg_detail
             },
-            "LaTeX_Formeln": latex_formeln,
             "Auflagerkraefte": auflagerkraefte
         }
 
         logger.info(
             "✅ Envelopes erstellt und maßgebende Kombinationen ermittelt")
 
+    def _ergaenze_durchbiegungen(self, gzg_max):
+        """
+        Ergänzt gzg_max um "durchbiegung_quasi" (max |w| der quasi-ständigen
+        Ergebnisse) und die Betragsmaxima je Feld und Kragarm für die
+        feldweisen Nachweise: "durchbiegung_felder" (alle GZG-Ergebnisse) und
+        "durchbiegung_quasi_felder" (quasi-ständig), je {Feldschlüssel: mm}.
+        """
+        # EC5 §2.2.3: w_fin must be based on the quasi-permanent combination, not the
+        # characteristic one. Store the max absolute deflection from quasi-permanent
+        # (and G-only) results separately so nachweis_ec5.py can apply kdef correctly.
+        # Without this, (1+kdef) would be applied to the characteristic deflection,
+        # overestimating creep on the variable-load portion.
+        quasi_typen = ("quasi_staendig", "nur_g")
+        quasi_ergebnisse = [
+            e for e in self.ergebnisse_gzg
+            if e["kombination"]["typ"] in quasi_typen
+        ]
+        if quasi_ergebnisse:
+            gzg_max["durchbiegung_quasi"] = max(
+                e["max"]["durchbiegung"] for e in quasi_ergebnisse
+            )
+            logger.debug(
+                f"📐 GZG quasi-permanent max deflection: "
+                f"{gzg_max['durchbiegung_quasi']:.3f} mm "
+                f"(characteristic max: {gzg_max['durchbiegung']:.3f} mm)"
+            )
+
+        # Envelope-Maximum je Feld = Maximum der Feldmaxima aller Ergebnisse
+        namen = [a["feld"] for a in self.abschnitte()]
+
+        def je_feld(ergebnisse):
+            zeilen = self._durchbiegung_felder[[e["spalte"] for e in ergebnisse]]
+            return dict(zip(namen, zeilen.max(axis=0).tolist()))
+
+        gzg_max["durchbiegung_felder"] = je_feld(self.ergebnisse_gzg)
+        if quasi_ergebnisse:
+            gzg_max["durchbiegung_quasi_felder"] = je_feld(quasi_ergebnisse)
+
+    def _erstelle_maxima(self):
+        """
+        Nur maßgebende Bemessungswerte und Auflagerkräfte (Modus maxima_only).
+
+        Das Betragsmaximum der Envelope ist das Maximum der Einzelmaxima, daher
+        genügt je Grenzzustand eine Reduktion über die bereits vektoriell
+        ermittelten "max"-Werte der Ergebnisse. Die Struktur entspricht dem
+        "max"-Eintrag der Envelopes, den nachweis_ec5 liest.
+        """
+        logger.info("📊 Ermittle maßgebende Bemessungswerte (ohne Verläufe)")
+
+        schnittgroessen = {}
+        for grenzzustand, ergebnisse in (("GZT", self.ergebnisse_gzt),
+                                         ("GZG", self.ergebnisse_gzg)):
+            if not ergebnisse:
+                schnittgroessen[grenzzustand] = {}
+                continue
+            max_werte = {}
+            for groesse in ("moment", "querkraft", "durchbiegung"):
+                werte = np.array([e["max"][groesse] for e in ergebnisse])
+                massgebend = ergebnisse[int(np.argmax(werte))]
+                max_werte[groesse] = float(werte.max())
+                max_werte[f"{groesse}_kombi"] = massgebend["kombination"]["name"]
+                max_werte[f"{groesse}_muster"] = massgebend["belastungsmuster"]
+            schnittgroessen[grenzzustand] = {"max": max_werte}
+
+        if schnittgroessen["GZG"]:
+            self._ergaenze_durchbiegungen(schnittgroessen["GZG"]["max"])
+
+        self.system_memory = {
+            "Schnittgroessen": schnittgroessen,
+            "Auflagerkraefte": self._berechne_auflagerkraefte()
+        }
+
     def _berechne_envelope(self, ergebnisse, grenzzustand):
         """
         Berechnet Envelope-Kurven für eine Gruppe von Ergebnissen.
 
+        Vektorisiert über alle Ergebnisse: np.argmax/np.argmin liefern je Punkt das
+        erste Ergebnis mit dem Extremwert – dieselbe Zuordnung wie ein Vergleich
+        mit striktem ">" in Ergebnisreihenfolge.
+
         Args:
             ergebnisse (list): Liste von Berechnungsergebnissen
             grenzzustand (str): "GZT" oder "GZG"
@@ -952,174 +1341,87 @@ class FeebbBerechnungEC:
         if not ergebnisse:
             return {}
 
-        # Anzahl Auswertungspunkte (sollte bei allen gleich sein)
-        n_punkte = len(ergebnisse[0]["moment"])
-
-        # Envelope-Arrays initialisieren
-        moment_max = np.full(n_punkte, -np.inf)
-        moment_min = np.full(n_punkte, np.inf)
-        querkraft_max = np.full(n_punkte, -np.inf)
-        querkraft_min = np.full(n_punkte, np.inf)
-        durchbiegung_max = np.full(n_punkte, -np.inf)
-        durchbiegung_min = np.full(n_punkte, np.inf)
-
-        # Maßgebende Kombinationen je Punkt (mit Belastungsmuster)
-        moment_max_kombi = [""] * n_punkte
-        moment_min_kombi = [""] * n_punkte
-        querkraft_max_kombi = [""] * n_punkte
-        querkraft_min_kombi = [""] * n_punkte
-        durchbiegung_max_kombi = [""] * n_punkte
-        durchbiegung_min_kombi = [""] * n_punkte
-
-        # Maßgebende Belastungsmuster je Punkt
-        moment_max_muster = [None] * n_punkte
-        moment_min_muster = [None] * n_punkte
-        querkraft_max_muster = [None] * n_punkte
-        querkraft_min_muster = [None] * n_punkte
-        durchbiegung_max_muster = [None] * n_punkte
-        durchbiegung_min_muster = [None] * n_punkte
-
-        # Envelope-Bildung
-        for erg in ergebnisse:
-            kombi_name = erg["kombination"]["name"]
-            belastungsmuster = erg.get("belastungsmuster", None)
-
-            for i in range(n_punkte):
-                # Moment
-                if erg["moment"][i] > moment_max[i]:
-                    moment_max[i] = erg["moment"][i]
-                    moment_max_kombi[i] = kombi_name
-                    moment_max_muster[i] = belastungsmuster
-                if erg["moment"][i] < moment_min[i]:
-                    moment_min[i] = erg["moment"][i]
-                    moment_min_kombi[i] = kombi_name
-                    moment_min_muster[i] = belastungsmuster
-
-                # Querkraft
-                if erg["querkraft"][i] > querkraft_max[i]:
-                    querkraft_max[i] = erg["querkraft"][i]
-                    querkraft_max_kombi[i] = kombi_name
-                    querkraft_max_muster[i] = belastungsmuster
-                if erg["querkraft"][i] < querkraft_min[i]:
-                    querkraft_min[i] = erg["querkraft"][i]
-                    querkraft_min_kombi[i] = kombi_name
-                    querkraft_min_muster[i] = belastungsmuster
-
-                # Durchbiegung
-                if erg["durchbiegung"][i] > durchbiegung_max[i]:
-                    durchbiegung_max[i] = erg["durchbiegung"][i]
-                    durchbiegung_max_kombi[i] = kombi_name
-                    durchbiegung_max_muster[i] = belastungsmuster
-                if erg["durchbiegung"][i] < durchbiegung_min[i]:
-                    durchbiegung_min[i] = erg["durchbiegung"][i]
-                    durchbiegung_min_kombi[i] = kombi_name
-                    durchbiegung_min_muster[i] = belastungsmuster
-
-        # Absolute Maximalwerte ermitteln
-        abs_max_moment = max(max(abs(m) for m in moment_max),
-                             max(abs(m) for m in moment_min))
-        abs_max_querkraft = max(max(abs(v) for v in querkraft_max), max(
-            abs(v) for v in querkraft_min))
-        abs_max_durchbiegung = max(max(abs(w) for w in durchbiegung_max), max(
-            abs(w) for w in durchbiegung_min))
-
-        # Maßgebende Kombination für absolute Maxima ermitteln
-        moment_abs_max_idx = np.argmax([abs(m) for m in moment_max])
-        moment_abs_min_idx = np.argmax([abs(m) for m in moment_min])
-
-        if max(abs(m) for m in moment_max) >= max(abs(m) for m in moment_min):
-            moment_abs_kombi = moment_max_kombi[moment_abs_max_idx]
-            moment_abs_muster = moment_max_muster[moment_abs_max_idx]
-        else:
-            moment_abs_kombi = moment_min_kombi[moment_abs_min_idx]
-            moment_abs_muster = moment_min_muster[moment_abs_min_idx]
-
-        querkraft_abs_max_idx = np.argmax([abs(v) for v in querkraft_max])
-        querkraft_abs_min_idx = np.argmax([abs(v) for v in querkraft_min])
-
-        if max(abs(v) for v in querkraft_max) >= max(abs(v) for v in querkraft_min):
-            querkraft_abs_kombi = querkraft_max_kombi[querkraft_abs_max_idx]
-            querkraft_abs_muster = querkraft_max_muster[querkraft_abs_max_idx]
-        else:
-            querkraft_abs_kombi = querkraft_min_kombi[querkraft_abs_min_idx]
-            querkraft_abs_muster = querkraft_min_muster[querkraft_abs_min_idx]
-
-        durchbiegung_abs_max_idx = np.argmax(
-            [abs(w) for w in durchbiegung_max])
-        durchbiegung_abs_min_idx = np.argmax(
-            [abs(w) for w in durchbiegung_min])
-
-        if max(abs(w) for w in durchbiegung_max) >= max(abs(w) for w in durchbiegung_min):
-            durchbiegung_abs_kombi = durchbiegung_max_kombi[durchbiegung_abs_max_idx]
-            durchbiegung_abs_muster = durchbiegung_max_muster[durchbiegung_abs_max_idx]
-        else:
-            durchbiegung_abs_kombi = durchbiegung_min_kombi[durchbiegung_abs_min_idx]
-            durchbiegung_abs_muster = durchbiegung_min_muster[durchbiegung_abs_min_idx]
+        # Herkunft je Ergebnis als Ganzzahlen: Kombinations-id (Zeile der
+        # Kombinationsmatrix) und Belastungsmuster als Bitmaske (Bit i = Feld i)
+        kombi_ids = np.array([erg["kombination"]["index"] for erg in ergebnisse])
+        muster_masken = np.array([erg["belastungsmuster"] for erg in ergebnisse])
+
+        envelope = {}
+        massgebende_kombinationen = {}
+        massgebende_muster = {}
+        max_werte = {}
+        abs_ergebnis = {}
+        verlaeufe = {}
+
+        for groesse in ("moment", "querkraft", "durchbiegung"):
+            werte = np.array([erg[groesse] for erg in ergebnisse])   # (n_ergebnisse, n_punkte)
+            punkte = np.arange(werte.shape[1])
+
+            # Envelope-Bildung und maßgebendes Ergebnis je Punkt
+            idx_max = np.argmax(werte, axis=0)
+            idx_min = np.argmin(werte, axis=0)
+            kurve_max = werte[idx_max, punkte]
+            kurve_min = werte[idx_min, punkte]
+
+            envelope[f"{groesse}_max"] = kurve_max.tolist()
+            envelope[f"{groesse}_min"] = kurve_min.tolist()
+            massgebende_kombinationen[f"{groesse}_max"] = kombi_ids[idx_max].tolist()
+            massgebende_kombinationen[f"{groesse}_min"] = kombi_ids[idx_min].tolist()
+            massgebende_muster[f"{groesse}_max"] = muster_masken[idx_max].tolist()
+            massgebende_muster[f"{groesse}_min"] = muster_masken[idx_min].tolist()
+
+            # Absoluter Maximalwert und maßgebendes Ergebnis dafür
+            betrag_max = np.abs(kurve_max)
+            betrag_min = np.abs(kurve_min)
+            max_werte[groesse] = float(max(betrag_max.max(), betrag_min.max()))
+            if betrag_max.max() >= betrag_min.max():
+                massgebend_idx = idx_max[np.argmax(betrag_max)]
+            else:
+                massgebend_idx = idx_min[np.argmax(betrag_min)]
+            abs_ergebnis[groesse] = ergebnisse[massgebend_idx]
 
-        # Finde die vollständigen Verläufe der maßgebenden Kombinationen
-        # (für GUI-Darstellung mit korrektem Belastungsmuster)
-        moment_massgebend_verlauf = None
-        querkraft_massgebend_verlauf = None
-        durchbiegung_massgebend_verlauf = None
+            # Vollständiger Verlauf der maßgebenden Kombination
+            # (für GUI-Darstellung mit korrektem Belastungsmuster)
+            verlaeufe[groesse] = np.asarray(abs_ergebnis[groesse][groesse]).tolist()
 
-        for erg in ergebnisse:
-            if erg["kombination"]["name"] == moment_abs_kombi and erg.get("belastungsmuster") == moment_abs_muster:
-                moment_massgebend_verlauf = erg
-            if erg["kombination"]["name"] == querkraft_abs_kombi and erg.get("belastungsmuster") == querkraft_abs_muster:
-                querkraft_massgebend_verlauf = erg
-            if erg["kombination"]["name"] == durchbiegung_abs_kombi and erg.get("belastungsmuster") == durchbiegung_abs_muster:
-                durchbiegung_massgebend_verlauf = erg
+        # Namen erst hier aus der Kombinationstabelle auflösen (nur für die Maxima)
+        abs_kombi = {g: erg["kombination"]["name"] for g, erg in abs_ergebnis.items()}
+        abs_muster = {g: erg["belastungsmuster"] for g, erg in abs_ergebnis.items()}
 
         # Terminal-Ausgabe der maßgebenden Kombinationen
-        self._zeige_massgebende_kombination_terminal(
-            grenzzustand, "Moment", moment_abs_kombi, moment_abs_muster, abs_max_moment)
-        self._zeige_massgebende_kombination_terminal(
-            grenzzustand, "Querkraft", querkraft_abs_kombi, querkraft_abs_muster, abs_max_querkraft)
-        self._zeige_massgebende_kombination_terminal(
-            grenzzustand, "Durchbiegung", durchbiegung_abs_kombi, durchbiegung_abs_muster, abs_max_durchbiegung)
+        for groesse, bezeichnung in (("moment", "Moment"), ("querkraft", "Querkraft"),
+                                     ("durchbiegung", "Durchbiegung")):
+            self._zeige_massgebende_kombination_terminal(
+                grenzzustand, bezeichnung, abs_kombi[groesse], abs_muster[groesse], max_werte[groesse])
 
         return {
-            "envelope": {
-                "moment_max": moment_max.tolist(),
-                "moment_min": moment_min.tolist(),
-                "querkraft_max": querkraft_max.tolist(),
-                "querkraft_min": querkraft_min.tolist(),
-                "durchbiegung_max": durchbiegung_max.tolist(),
-                "durchbiegung_min": durchbiegung_min.tolist()
-            },
-            "massgebende_kombinationen": {
-                "moment_max": moment_max_kombi,
-                "moment_min": moment_min_kombi,
-                "querkraft_max": querkraft_max_kombi,
-                "querkraft_min": querkraft_min_kombi,
-                "durchbiegung_max": durchbiegung_max_kombi,
-                "durchbiegung_min": durchbiegung_min_kombi
-            },
-            "massgebende_muster": {
-                "moment_max": moment_max_muster,
-                "moment_min": moment_min_muster,
-                "querkraft_max": querkraft_max_muster,
-                "querkraft_min": querkraft_min_muster,
-                "durchbiegung_max": durchbiegung_max_muster,
-                "durchbiegung_min": durchbiegung_min_muster
-            },
+            "envelope": envelope,
+            # Je Auswertungspunkt: Kombinations-id und Muster-Bitmaske;
+            # Namen/Beschreibungen über "kombinationstabelle"
+            "massgebende_kombinationen": massgebende_kombinationen,
+            "massgebende_muster": massgebende_muster,
+            "kombinationstabelle": self._kombinationstabelle(grenzzustand),
             "max": {
-                "moment": abs_max_moment,
-                "querkraft": abs_max_querkraft,
-                "durchbiegung": abs_max_durchbiegung,
-                "moment_kombi": moment_abs_kombi,
-                "querkraft_kombi": querkraft_abs_kombi,
-                "durchbiegung_kombi": durchbiegung_abs_kombi,
-                "moment_muster": moment_abs_muster,
-                "querkraft_muster": querkraft_abs_muster,
-                "durchbiegung_muster": durchbiegung_abs_muster
+                **max_werte,
+                **{f"{groesse}_kombi": kombi for groesse, kombi in abs_kombi.items()},
+                **{f"{groesse}_muster": m for groesse, m in abs_muster.items()},
             },
             # Für GUI-Darstellung: Verläufe der maßgebenden Kombinationen (nicht Envelope!)
-            "moment": moment_massgebend_verlauf["moment"] if moment_massgebend_verlauf else moment_max.tolist(),
-            "querkraft": querkraft_massgebend_verlauf["querkraft"] if querkraft_massgebend_verlauf else querkraft_max.tolist(),
-            "durchbiegung": durchbiegung_massgebend_verlauf["durchbiegung"] if durchbiegung_massgebend_verlauf else durchbiegung_max.tolist()
+            **verlaeufe
         }
 
+    def _kombinationstabelle(self, grenzzustand: str) -> list[dict]:
+        """Lookup-Tabelle id → Name/Beschreibung/Typ der Kombinationen eines Grenzzustands."""
+        kombinationen = (self.kombinationen_gzt if grenzzustand == "GZT"
+                         else self.kombinationen_gzg)
+        return [{
+            "id": kombi["index"],
+            "name": kombi["name"],
+            "beschreibung": kombi["beschreibung"],
+            "typ": kombi["typ"],
+            "leiteinwirkung": kombi.get("leiteinwirkung"),
+        } for kombi in kombinationen]
+
     def _zeige_massgebende_kombination_terminal(self, grenzzustand, schnittgroesse, kombi_name, belastungsmuster, max_wert):
         """
         Zeigt die maßgebende Kombination im Terminal an.
@@ -1128,7 +1430,7 @@ class FeebbBerechnungEC:
             grenzzustand (str): "GZT" oder "GZG"
             schnittgroesse (str): "Moment", "Querkraft" oder "Durchbiegung"
             kombi_name (str): Name der Kombination
-            belastungsmuster (list): Boolean-Liste der belasteten Felder
+            belastungsmuster (int): Bitmaske der belasteten Felder
             max_wert (float): Maximalwert der Schnittgröße
         """
         if belastungsmuster is None:
@@ -1139,9 +1441,9 @@ class FeebbBerechnungEC:
         belastete_felder = []
         unbelastete_felder = []
 
-        for idx, ist_belastet in enumerate(belastungsmuster):
+        for idx in range(len(self.normale_felder)):
             feld_name = f"Feld {idx + 1}"
-            if ist_belastet:
+            if belastungsmuster >> idx & 1:
                 belastete_felder.append(feld_name)
             else:
                 unbelastete_felder.append(feld_name)
@@ -1171,9 +1473,30 @@ class FeebbBerechnungEC:
         logger.info(f"   ✗ Unbelastete Felder: {unbelastet_str}")
         logger.info(f"")
 
+    @staticmethod
+    def _kompaktes_ergebnis(erg) -> dict:
+        """
+        Kompakte Darstellung eines Einzelergebnisses ohne Verläufe.
+
+        Die Nutzlast wächst damit nur mit der Anzahl der Kombinationen, nicht mit
+        Kombinationen × Auswertungspunkte. Die Verläufe selbst liefert
+        kombinationsverlauf() über die id nach.
+        """
+        return {
+            "id": erg["id"],
+            "kombination": erg["kombination"]["name"],
+            "typ": erg["kombination"]["typ"],
+            "muster_id": erg["muster_id"],
+            "belastungsmuster": erg["belastungsmuster"],
+            "max": erg["max"]
+        }
+
     def _erstelle_detaillierte_kombinationsergebnisse(self, ergebnisse, grenzzustand):
         """
-        Erstellt detaillierte Ergebnisse für jeden Kombinationstyp.
+        Erstellt kompakte Ergebnisse für jeden Kombinationstyp.
+
+        Je Typ werden nur die maßgebende Kombination (Name + id), deren Maxima und
+        die ids aller zugehörigen Einzelergebnisse abgelegt – keine Verläufe.
 
         Args:
             ergebnisse (list): Liste von Berechnungsergebnissen
@@ -1182,64 +1505,128 @@ class FeebbBerechnungEC:
         Returns:
             dict: Detaillierte Ergebnisse nach Kombinationstypen gruppiert
         """
-        detail_ergebnisse = {}
-
         if grenzzustand == "GZT":
-            # GZT-Kombinationstypen gruppieren
             typen = {
-                "nur_g": {"name": "Nur ständige Lasten", "ergebnisse": []},
-                "g_plus_q": {"name": "Ständige + einzelne veränderliche Lasten", "ergebnisse": []},
-                "vollkombination": {"name": "Vollkombinationen", "ergebnisse": []}
+                "nur_g": "Nur ständige Lasten",
+                "g_plus_q": "Ständige + einzelne veränderliche Lasten",
+                "vollkombination": "Vollkombinationen"
             }
-
-            for erg in ergebnisse:
-                typ = erg["kombination"]["typ"]
-                if typ in typen:
-                    typen[typ]["ergebnisse"].append(erg)
-
-            # Für jeden Typ die maßgebende Kombination ermitteln
-            for typ_key, typ_data in typen.items():
-                if typ_data["ergebnisse"]:
-                    # Maßgebende Kombination für diesen Typ finden
-                    massgebend = max(typ_data["ergebnisse"],
-                                     key=lambda x: x["max"]["moment"])
-
-                    detail_ergebnisse[typ_key] = {
-                        "name": typ_data["name"],
-                        "massgebende_kombination": massgebend["kombination"]["name"],
-                        "max_werte": massgebend["max"],
-                        "alle_kombinationen": typ_data["ergebnisse"]
-                    }
-
-        elif grenzzustand == "GZG":
-            # GZG-Kombinationstypen gruppieren
+        else:
             typen = {
-                "charakteristisch": {"name": "Charakteristische Kombination", "ergebnisse": []},
-                "haeufig": {"name": "Häufige Kombination", "ergebnisse": []},
-                "quasi_staendig": {"name": "Quasi-ständige Kombination", "ergebnisse": []}
+                "charakteristisch": "Charakteristische Kombination",
+                "haeufig": "Häufige Kombination",
+                "quasi_staendig": "Quasi-ständige Kombination"
             }
 
-            for erg in ergebnisse:
-                typ = erg["kombination"]["typ"]
-                if typ in typen:
-                    typen[typ]["ergebnisse"].append(erg)
-
-            # Für jeden Typ die maßgebende Kombination ermitteln
-            for typ_key, typ_data in typen.items():
-                if typ_data["ergebnisse"]:
-                    # Maßgebende Kombination für diesen Typ finden (bei GZG: max Durchbiegung)
-                    massgebend = max(typ_data["ergebnisse"],
-                                     key=lambda x: x["max"]["durchbiegung"])
-
-                    detail_ergebnisse[typ_key] = {
-                        "name": typ_data["name"],
-                        "massgebende_kombination": massgebend["kombination"]["name"],
-                        "max_werte": massgebend["max"],
-                        "alle_kombinationen": typ_data["ergebnisse"]
-                    }
+        ids_je_typ = {typ: [] for typ in typen}
+        for erg in ergebnisse:
+            typ = erg["kombination"]["typ"]
+            if typ in ids_je_typ:
+                ids_je_typ[typ].append(erg["id"])
+
+        # Maßgebend je Typ: GZT max. Moment, GZG max. Durchbiegung
+        detail_ergebnisse = {}
+        for typ_key, name in typen.items():
+            massgebend = self._massgebendes_ergebnis(grenzzustand, typ_key)
+            if massgebend is None:
+                continue
+            detail_ergebnisse[typ_key] = {
+                "name": name,
+                "massgebende_kombination": massgebend["kombination"]["name"],
+                "massgebende_id": massgebend["id"],
+                "max_werte": massgebend["max"],
+                "kombination_ids": ids_je_typ[typ_key]
+            }
 
         return detail_ergebnisse
 
+    def kombinationsverlauf(self, grenzzustand: str, ergebnis_id: int) -> dict:
+        """
+        Verläufe eines einzelnen Kombinationsergebnisses (Abruf nach id).
+
+        Args:
+            grenzzustand (str): "GZT" oder "GZG"
+            ergebnis_id (int): id aus Einzelergebnisse/Detaillierte_Kombinationen
+
+        Returns:
+            dict: Kompaktes Ergebnis plus moment/querkraft/durchbiegung-Verläufe
+
+        Raises:
+            KeyError: unbekannter Grenzzustand oder id außerhalb des Bereichs
+        """
+        ergebnisse = {"GZT": self.ergebnisse_gzt, "GZG": self.ergebnisse_gzg}.get(grenzzustand)
+        if ergebnisse is None:
+            raise KeyError(f"Unbekannter Grenzzustand: {grenzzustand}")
+        if not 0 <= ergebnis_id < len(ergebnisse):
+            raise KeyError(f"Unbekannte Ergebnis-id {ergebnis_id} für {grenzzustand}")
+
+        erg = ergebnisse[ergebnis_id]
+        if "moment" not in erg:
+            raise KeyError("Keine Verläufe vorhanden (Berechnung mit maxima_only)")
+        verlauf = self._kompaktes_ergebnis(erg)
+        verlauf["moment"] = erg["moment"].tolist()
+        verlauf["querkraft"] = erg["querkraft"].tolist()
+        verlauf["durchbiegung"] = erg["durchbiegung"].tolist()
+        return verlauf
+
+    def abschnitte(self) -> list[dict]:
+        """Lage der Felder und Kragarme in den Verläufen (siehe aufloesung.feldabschnitte)."""
+        return feldabschnitte(
+            [(f["typ"], f["laenge"], f["anzahl_elemente"]) for f in self.felder],
+            self.punkte_je_element)
+
+    def vollast_einheitsverlaeufe(self) -> dict:
+        """
+        Verläufe für eine Einheits-Streckenlast (1 N/mm) auf allen Feldern und Kragarmen.
+
+        Summe der gecachten Einheitsantworten je Feld, ohne weiteren Solve
+        (z. B. für die Eigenlast von Querschnittsvarianten). Erst nach compute().
+
+        Returns:
+            dict: je Schnittgröße ein Array (n_punkte,), bei E·I des Snapshots
+        """
+        kurven = self._einheitsantworten()["kurven"]
+        n_felder = len(self.felder)
+        return {groesse: k[:n_felder].sum(axis=0) for groesse, k in kurven.items()}
+
+    def latex_formeln(self) -> dict:
+        """
+        LaTeX-Formeln der maßgebenden Kombinationen – erst bei Bedarf erzeugt.
+
+        Nicht Teil von compute(): der Client braucht die Formeln erst beim Öffnen
+        der Detailansicht oder beim Berichtsexport. Das Ergebnis wird am Objekt
+        gecacht, wiederholte Aufrufe (z.B. über den Ergebnis-Handle) sind kostenlos.
+
+        Returns:
+            dict: LaTeX-Formeln nach Grenzzustand und Typ gruppiert
+        """
+        if self._latex_formeln is None:
+            self._latex_formeln = rendere(self._generiere_latex_formeln())
+        return self._latex_formeln
+
+    def _massgebendes_ergebnis(self, grenzzustand, typ):
+        """
+        Maßgebendes Ergebnis eines Kombinationstyps (GZT: max. Moment, GZG: max. Durchbiegung).
+
+        Alle Typen werden beim ersten Aufruf in einem einzigen Durchlauf über
+        ergebnisse_gzt/ergebnisse_gzg ermittelt und gecacht. Bei Gleichstand
+        gewinnt das erste Ergebnis (wie bei max()).
+
+        Returns:
+            dict | None: Ergebnis oder None, falls der Typ nicht vorkommt
+        """
+        if self._massgebend_je_typ is None:
+            massgebend = {}
+            for gz, ergebnisse, kriterium in (("GZT", self.ergebnisse_gzt, "moment"),
+                                              ("GZG", self.ergebnisse_gzg, "durchbiegung")):
+                for erg in ergebnisse:
+                    schluessel = (gz, erg["kombination"]["typ"])
+                    bisher = massgebend.get(schluessel)
+                    if bisher is None or erg["max"][kriterium] > bisher["max"][kriterium]:
+                        massgebend[schluessel] = erg
+            self._massgebend_je_typ = massgebend
+        return self._massgebend_je_typ.get((grenzzustand, typ))
+
     def _generiere_latex_formeln(self):
         """
         Generiert LaTeX-Formeln für alle Kombinationstypen im Format der bestehenden Module.
@@ -1252,23 +1639,20 @@ class FeebbBerechnungEC:
             "GZG": {}
         }
 
-        # Lastdaten für Formeln extrahieren
-        g_lasten = [l for l in self.lasten if l["lastfall"].lower() == "g"]
-        q_lasten = [l for l in self.lasten if l["lastfall"].lower() != "g"]
-
-        # Sprungmaß für Berechnung
-        sprungmass = self.sprungmass
+        # Lastwerte, ψ und Koeffizienten aus der kompilierten Kombinationsmatrix
+        km = self.kombinationsmatrix
+        g_lasten = km.hat_g
+        q_lasten = km.q_lasten
+        g_wert = km.werte[0]
 
         # === GZT-Formeln ===
 
         # 1. Nur ständige Lasten: γ_G · G
         if g_lasten:
-            g_wert = sum(float(l["wert"]) for l in g_lasten) * sprungmass
             qd_nur_g = self.gamma_g * g_wert
 
             # Maßgebende Kombination für nur_g finden
-            nur_g_ergebnis = next((erg for erg in self.ergebnisse_gzt
-                                   if erg["kombination"]["typ"] == "nur_g"), None)
+            nur_g_ergebnis = self._massgebendes_ergebnis("GZT", "nur_g")
 
             if nur_g_ergebnis:
                 max_moment = nur_g_ergebnis["max"]["moment"] / 1e6  # kNm
@@ -1277,9 +1661,8 @@ class FeebbBerechnungEC:
 
                 latex_formeln["GZT"]["nur_g"] = {
                     "name": "Nur ständige Lasten",
-                    "latex": (f"$\\gamma_G \\cdot G: \\quad "
-                              f"{self.gamma_g:.2f} \\cdot g = {qd_nur_g:.2f} \\,\\text{{kN/m}} \\quad "
-                              f"M_{{Ed,max}} = {max_moment:.2f} \\,\\text{{kNm}}$"),
+                    "latex": EC_GZT_NUR_G.formel(
+                        gamma_g=self.gamma_g, qd=qd_nur_g, moment=max_moment),
                     "beschreibung": "Nur ständige Lasten mit Teilsicherheitsbeiwert",
                     "max_werte": {
                         "moment": max_moment,
@@ -1291,19 +1674,11 @@ class FeebbBerechnungEC:
         # 2. Ständige + einzelne veränderliche Lasten: γ_G · G + γ_Q · Q_i
         if q_lasten:
             # Maßgebende Einzelkombination ermitteln
-            g_plus_q_ergebnisse = [erg for erg in self.ergebnisse_gzt
-                                   if erg["kombination"]["typ"] == "g_plus_q"]
+            massgebend = self._massgebendes_ergebnis("GZT", "g_plus_q")
 
-            if g_plus_q_ergebnisse:
-                massgebend = max(g_plus_q_ergebnisse,
-                                 key=lambda x: x["max"]["moment"])
+            if massgebend:
                 leiteinwirkung = massgebend["kombination"]["leiteinwirkung"]
-
-                # Werte berechnen
-                g_wert = sum(float(l["wert"]) for l in g_lasten) * sprungmass
-                q_wert = next(float(
-                    l["wert"]) for l in q_lasten if l["lastfall"] == leiteinwirkung) * sprungmass
-                qd_kombi = self.gamma_g * g_wert + self.gamma_q * q_wert
+                qd_kombi = km.bemessungslast(massgebend["kombination"])
 
                 max_moment = massgebend["max"]["moment"] / 1e6  # kNm
                 max_querkraft = massgebend["max"]["querkraft"] / 1e3  # kN
@@ -1311,9 +1686,9 @@ class FeebbBerechnungEC:
 
                 latex_formeln["GZT"]["g_plus_q"] = {
                     "name": "Ständige + einzelne veränderliche Lasten",
-                    "latex": (f"$\\gamma_G \\cdot G + \\gamma_Q \\cdot \\mathbf{{{leiteinwirkung.upper()}}}: \\quad "
-                              f"{self.gamma_g:.2f} \\cdot g + {self.gamma_q:.2f} \\cdot {leiteinwirkung} = {qd_kombi:.2f} \\,\\text{{kN/m}} \\quad "
-                              f"M_{{Ed,max}} = {max_moment:.2f} \\,\\text{{kNm}}$"),
+                    "latex": EC_GZT_G_PLUS_Q.formel(
+                        LEIT=leiteinwirkung.upper(), leit=leiteinwirkung, gamma_g=self.gamma_g,
+                        gamma_q=self.gamma_q, qd=qd_kombi, moment=max_moment),
                     "beschreibung": f"Maßgebende Einzelkombination mit {leiteinwirkung.upper()}",
                     "max_werte": {
                         "moment": max_moment,
@@ -1324,31 +1699,16 @@ class FeebbBerechnungEC:
 
         # 3. Vollkombinationen: γ_G · G + γ_Q · Q_leit + Σψ₀ · γ_Q · Q_i
         if len(q_lasten) > 1:
-            vollkombi_ergebnisse = [erg for erg in self.ergebnisse_gzt
-                                    if erg["kombination"]["typ"] == "vollkombination"]
+            massgebend = self._massgebendes_ergebnis("GZT", "vollkombination")
 
-            if vollkombi_ergebnisse:
-                massgebend = max(vollkombi_ergebnisse,
-                                 key=lambda x: x["max"]["moment"])
+            if massgebend:
                 leiteinwirkung = massgebend["kombination"]["leiteinwirkung"]
 
-                # Werte berechnen
-                g_wert = sum(float(l["wert"]) for l in g_lasten) * sprungmass
-                leit_wert = next(float(
-                    l["wert"]) for l in q_lasten if l["lastfall"] == leiteinwirkung) * sprungmass
-
                 # Begleitende Einwirkungen
-                begleitend_terme = []
-                qd_begleitend = 0
-                for q in q_lasten:
-                    if q["lastfall"] != leiteinwirkung:
-                        psi = self._psi0(q)
-                        q_wert = float(q["wert"]) * sprungmass
-                        qd_begleitend += psi * self.gamma_q * q_wert
-                        begleitend_terme.append(
-                            f"{psi:.2f} \\cdot {self.gamma_q:.2f} \\cdot {q['lastfall']}")
-
-                qd_gesamt = self.gamma_g * g_wert + self.gamma_q * leit_wert + qd_begleitend
+                begleitend_terme = [
+                    f"{km.psi0[j]:.2f} \\cdot {self.gamma_q:.2f} \\cdot {km.einwirkungen[j]}"
+                    for j in self._begleiteinwirkungen(massgebend["kombination"])]
+                qd_gesamt = km.bemessungslast(massgebend["kombination"])
 
                 max_moment = massgebend["max"]["moment"] / 1e6  # kNm
                 max_querkraft = massgebend["max"]["querkraft"] / 1e3  # kN
@@ -1359,9 +1719,10 @@ class FeebbBerechnungEC:
 
                 latex_formeln["GZT"]["vollkombination"] = {
                     "name": "Vollkombinationen",
-                    "latex": (f"$\\gamma_G \\cdot G + \\gamma_Q \\cdot \\mathbf{{{leiteinwirkung.upper()}}} + \\Sigma\\psi_0 \\cdot \\gamma_Q \\cdot Q_i: \\quad "
-                              f"{self.gamma_g:.2f} \\cdot g + {self.gamma_q:.2f} \\cdot {leiteinwirkung}{begleitend_str} = {qd_gesamt:.2f} \\,\\text{{kN/m}} \\quad "
-                              f"M_{{Ed,max}} = {max_moment:.2f} \\,\\text{{kNm}}$"),
+                    "latex": EC_GZT_VOLL.formel(
+                        LEIT=leiteinwirkung.upper(), leit=leiteinwirkung, begleitend=begleitend_str,
+                        gamma_g=self.gamma_g, gamma_q=self.gamma_q, qd=qd_gesamt,
+                        moment=max_moment),
                     "beschreibung": f"Vollkombination mit {leiteinwirkung.upper()} als Leiteinwirkung",
                     "max_werte": {
                         "moment": max_moment,
@@ -1374,30 +1735,16 @@ class FeebbBerechnungEC:
 
         # 1. Charakteristische Kombination: G + Q_1 + Σψ₀ · Q_i
         if q_lasten:
-            char_ergebnisse = [erg for erg in self.ergebnisse_gzg
-                               if erg["kombination"]["typ"] == "charakteristisch"]
+            massgebend = self._massgebendes_ergebnis("GZG", "charakteristisch")
 
-            if char_ergebnisse:
-                massgebend = max(
-                    char_ergebnisse, key=lambda x: x["max"]["durchbiegung"])
+            if massgebend:
                 leiteinwirkung = massgebend["kombination"]["leiteinwirkung"]
 
-                # Werte berechnen (ohne γ-Faktoren)
-                g_wert = sum(float(l["wert"]) for l in g_lasten) * sprungmass
-                leit_wert = next(float(
-                    l["wert"]) for l in q_lasten if l["lastfall"] == leiteinwirkung) * sprungmass
-
-                begleitend_terme = []
-                qd_begleitend = 0
-                for q in q_lasten:
-                    if q["lastfall"] != leiteinwirkung:
-                        psi = self._psi0(q)
-                        q_wert = float(q["wert"]) * sprungmass
-                        qd_begleitend += psi * q_wert
-                        begleitend_terme.append(
-                            f"{psi:.2f} \\cdot {q['lastfall']}")
-
-                qd_gesamt = g_wert + leit_wert + qd_begleitend
+                # Werte ohne γ-Faktoren
+                begleitend_terme = [
+                    f"{km.psi0[j]:.2f} \\cdot {km.einwirkungen[j]}"
+                    for j in self._begleiteinwirkungen(massgebend["kombination"])]
+                qd_gesamt = km.bemessungslast(massgebend["kombination"])
 
                 max_durchbiegung = massgebend["max"]["durchbiegung"]  # mm
 
@@ -1406,9 +1753,9 @@ class FeebbBerechnungEC:
 
                 latex_formeln["GZG"]["charakteristisch"] = {
                     "name": "Charakteristische Kombination",
-                    "latex": (f"$G + \\mathbf{{{leiteinwirkung.upper()}}} + \\Sigma\\psi_0 \\cdot Q_i: \\quad "
-                              f"g + {leiteinwirkung}{begleitend_str} = {qd_gesamt:.2f} \\,\\text{{kN/m}} \\quad "
-                              f"w_{{max}} = {max_durchbiegung:.2f} \\,\\text{{mm}}$"),
+                    "latex": EC_GZG_CHARAKTERISTISCH.formel(
+                        LEIT=leiteinwirkung.upper(), leit=leiteinwirkung, begleitend=begleitend_str,
+                        qd=qd_gesamt, w=max_durchbiegung),
                     "beschreibung": f"Charakteristische Kombination mit {leiteinwirkung.upper()} als Leiteinwirkung",
                     "max_werte": {
                         "durchbiegung": max_durchbiegung
@@ -1417,38 +1764,21 @@ class FeebbBerechnungEC:
 
         # 2. Häufige Kombination: G + ψ₁ · Q_1 + Σψ₂ · Q_i
         if q_lasten:
-            haeufig_ergebnisse = [erg for erg in self.ergebnisse_gzg
-                                  if erg["kombination"]["typ"] == "haeufig"]
+            massgebend = self._massgebendes_ergebnis("GZG", "haeufig")
 
-            if haeufig_ergebnisse:
-                massgebend = max(haeufig_ergebnisse,
-                                 key=lambda x: x["max"]["durchbiegung"])
-                leiteinwirkung = massgebend["kombination"]["leiteinwirkung"]
+            if massgebend:
+                kombi = massgebend["kombination"]
+                leiteinwirkung = kombi["leiteinwirkung"]
+
+                begleitend_terme = [
+                    f"{km.psi2[j]:.2f} \\cdot {km.einwirkungen[j]}"
+                    for j in self._begleiteinwirkungen(kombi)]
+
+                # ψ1 der Leiteinwirkung = deren Koeffizient in der Matrixzeile
+                koeff, leit = km.koeffizienten("GZG")
+                psi1 = float(koeff[kombi["index"]][leit[kombi["index"]]][0])
 
-                g_wert = sum(float(l["wert"]) for l in g_lasten) * sprungmass
-                leit_wert = next(float(
-                    l["wert"]) for l in q_lasten if l["lastfall"] == leiteinwirkung) * sprungmass
-
-                begleitend_terme = []
-                qd_begleitend = 0
-                for q in q_lasten:
-                    if q["lastfall"] != leiteinwirkung:
-                        psi2 = self._psi2(q)
-                        q_wert = float(q["wert"]) * sprungmass
-                        qd_begleitend += psi2 * q_wert
-                        begleitend_terme.append(
-                            f"{psi2:.2f} \\cdot {q['lastfall']}")
-
-                psi1 = None
-                # leiteinwirkung-Objekt finden um ψ1 zu bestimmen
-                for q in q_lasten:
-                    if q["lastfall"] == leiteinwirkung:
-                        psi1 = self._psi1(q)
-                        break
-                if psi1 is None:
-                    psi1 = 0.5
-
-                qd_gesamt = g_wert + psi1 * leit_wert + qd_begleitend
+                qd_gesamt = km.bemessungslast(kombi)
                 max_durchbiegung = massgebend["max"]["durchbiegung"]
 
                 begleitend_str = " + " + \
@@ -1456,9 +1786,9 @@ class FeebbBerechnungEC:
 
                 latex_formeln["GZG"]["haeufig"] = {
                     "name": "Häufige Kombination",
-                    "latex": (f"$G + \\psi_1 \\cdot \\mathbf{{{leiteinwirkung.upper()}}} + \\Sigma\\psi_2 \\cdot Q_i: \\quad "
-                              f"g + {psi1:.2f} \\cdot {leiteinwirkung}{begleitend_str} = {qd_gesamt:.2f} \\,\\text{{kN/m}} \\quad "
-                              f"w_{{max}} = {max_durchbiegung:.2f} \\,\\text{{mm}}$"),
+                    "latex": EC_GZG_HAEUFIG.formel(
+                        LEIT=leiteinwirkung.upper(), leit=leiteinwirkung, begleitend=begleitend_str,
+                        psi1=psi1, qd=qd_gesamt, w=max_durchbiegung),
                     "beschreibung": f"Häufige Kombination mit {leiteinwirkung.upper()} als Leiteinwirkung",
                     "max_werte": {
                         "durchbiegung": max_durchbiegung
@@ -1467,33 +1797,21 @@ class FeebbBerechnungEC:
 
         # 3. Quasi-ständige Kombination: G + Σψ₂ · Q_i
         if q_lasten:
-            quasi_ergebnisse = [erg for erg in self.ergebnisse_gzg
-                                if erg["kombination"]["typ"] == "quasi_staendig"]
-
-            if quasi_ergebnisse:
-                # Nur eine quasi-ständige Kombination
-                massgebend = quasi_ergebnisse[0]
-
-                g_wert = sum(float(l["wert"]) for l in g_lasten) * sprungmass
+            # Nur eine quasi-ständige Kombination, maßgebend ist das ungünstigste Belastungsmuster
+            massgebend = self._massgebendes_ergebnis("GZG", "quasi_staendig")
 
-                q_terme = []
-                qd_q_gesamt = 0
-                for q in q_lasten:
-                    q_wert = float(q["wert"]) * sprungmass
-                    psi2 = self._psi2(q)
-                    qd_q_gesamt += psi2 * q_wert
-                    q_terme.append(f"{psi2:.2f} \\cdot {q['lastfall']}")
+            if massgebend:
 
-                qd_gesamt = g_wert + qd_q_gesamt
+                q_terme = [f"{km.psi2[j]:.2f} \\cdot {km.einwirkungen[j]}"
+                           for j in massgebend["kombination"]["einwirkungen"]]
+                qd_gesamt = km.bemessungslast(massgebend["kombination"])
                 max_durchbiegung = massgebend["max"]["durchbiegung"]
 
                 q_str = " + ".join(q_terme)
 
                 latex_formeln["GZG"]["quasi_staendig"] = {
                     "name": "Quasi-ständige Kombination",
-                    "latex": (f"$G + \\Sigma\\psi_2 \\cdot Q_i: \\quad "
-                              f"g + {q_str} = {qd_gesamt:.2f} \\,\\text{{kN/m}} \\quad "
-                              f"w_{{max}} = {max_durchbiegung:.2f} \\,\\text{{mm}}$"),
+                    "latex": EC_GZG_QUASI.formel(terme=q_str, qd=qd_gesamt, w=max_durchbiegung),
                     "beschreibung": "Quasi-ständige Kombination aller veränderlichen Lasten",
                     "max_werte": {
                         "durchbiegung": max_durchbiegung
@@ -1502,56 +1820,10 @@ class FeebbBerechnungEC:
 
         return latex_formeln
 
-    def _ermittle_massgebenden_einzellastfall(self):
-        """
-        Ermittelt den maßgebenden Einzellastfall für GZT g_plus_q Kombinationen.
-        """
-        g_plus_q_ergebnisse = [erg for erg in self.ergebnisse_gzt
-                               if erg["kombination"]["typ"] == "g_plus_q"]
-
-        if g_plus_q_ergebnisse:
-            massgebend = max(g_plus_q_ergebnisse,
-                             key=lambda x: x["max"]["moment"])
-            return massgebend["kombination"]["leiteinwirkung"].upper()
-        return "Q"
-
-    def _ermittle_massgebende_vollkombination(self):
-        """
-        Ermittelt die maßgebende Leiteinwirkung für Vollkombinationen.
-        """
-        vollkombi_ergebnisse = [erg for erg in self.ergebnisse_gzt
-                                if erg["kombination"]["typ"] == "vollkombination"]
-
-        if vollkombi_ergebnisse:
-            massgebend = max(vollkombi_ergebnisse,
-                             key=lambda x: x["max"]["moment"])
-            return massgebend["kombination"]["leiteinwirkung"].upper()
-        return "Q"
-
-    def _ermittle_massgebende_charakteristische(self):
-        """Ermittelt die maßgebende Leiteinwirkung für charakteristische Kombinationen."""
-        char_ergebnisse = [erg for erg in self.ergebnisse_gzg
-                           if erg["kombination"]["typ"] == "charakteristisch"]
-
-        if char_ergebnisse:
-            massgebend = max(
-                char_ergebnisse, key=lambda x: x["max"]["durchbiegung"])
-            return massgebend["kombination"]["leiteinwirkung"].upper()
-        return "Q"
-
-    def _ermittle_massgebende_haeufige(self):
-        """
-        Ermittelt die maßgebende Leiteinwirkung für häufige Kombinationen.
-        """
-        haeufig_ergebnisse = [erg for erg in self.ergebnisse_gzg
-                              if erg["kombination"]["typ"] == "haeufig"]
-
-        if haeufig_ergebnisse:
-            massgebend = max(haeufig_ergebnisse,
-                             key=lambda x: x["max"]["durchbiegung"])
-            return massgebend["kombination"]["leiteinwirkung"].upper()
-        return "Q"
-# Hilfsfunktion für Kompatibilität mit bestehender Schnittstelle
+    def _begleiteinwirkungen(self, kombination) -> list[int]:
+        """Spalten der Begleiteinwirkungen einer Kombination (ohne Leiteinwirkung)."""
+        _, leit = self.kombinationsmatrix.koeffizienten(kombination["grenzzustand"])
+        return [j for j in kombination["einwirkungen"] if not leit[kombination["index"], j]]
 
 
 # Hilfsfunktion für Kompatibilität mit bestehender Schnittstelle
@@ -1562,7 +1834,8 @@ def berechne_feebb_gzt_gzg_ec(snapshot, db):
     Args:
         snapshot (dict): System-Snapshot mit allen Eingabedaten
         db: Datenbankverbindung für Materialparameter
-        (num_points wurde entfernt – die Auswertungspunkte sind intern fest auf 50 gesetzt)
+        (num_points wurde entfernt – Netzdichte und Auswertungspunkte folgen aus
+        snapshot["berechnungsmodus"]["aufloesung"], siehe aufloesung.py)
 
     Returns:
         dict: Berechnungsergebnisse im Format der bestehenden Schnittstelle
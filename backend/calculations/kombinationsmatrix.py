@@ -0,0 +1,565 @@
+"""
+kombinationsmatrix.py
+~~~~~~~~~~~~~~~~~~~~~
+
+Kompiliert die Lastliste eines Snapshots in einem Schritt in dichte
+Koeffizientenmatrizen (Kombinationen × Einwirkungen) für GZT und GZG.
+
+Spalte 0 ist die Summe aller ständigen Streckenlasten ("G_SUM"), danach folgen
+ständige Einzel-/Teilstreckenlasten und die veränderlichen Lasten mit je einer
+Spalte. Der Bemessungswert einer Kombination k ist
+    q_k = Σ_j C[k, j] · werte[j]
+mit den charakteristischen Werten `werte` (Strecken- und Teilstreckenlasten
+inkl. Sprungmaß in N/mm, Einzellasten in N). Die Maske `leit` markiert die
+Einwirkungen, die feldweise nach Belastungsmuster aufgebracht werden; alle
+anderen wirken auf allen Feldern.
+
+Die FE-Stufe und der LaTeX-Formelgenerator von FeebbBerechnungEC lesen beide
+aus dieser Matrix; die Kombinations-Dicts (`kombinationen_gzt/gzg`) bleiben als
+Metadaten mit Verweis auf ihre Matrixzeile erhalten.
+
+Die Matrix ist die gemeinsame Kombinationsgrundlage aller Berechnungsstufen:
+MethodeLastkombi (GZT, maßgebendes Ed/kmod), MethodeLastkombiGZG (quasi-ständig,
+kdef) und FeebbBerechnungEC holen sich über kombinationsmatrix() dieselbe
+Instanz je Snapshot – Koeffizienten, ψ, KLED, kmod und kdef werden damit
+einmal aus der Datenbank gelesen und sind in allen Stufen identisch.
+"""
+import copy
+import threading
+import weakref
+from collections import Counter, OrderedDict
+
+import numpy as np
+
+
+# Lastarten: über die ganze Trägerlänge, Einzellast an "position" [m],
+# Teilstreckenlast von "von" bis "bis" [m] (gemessen ab linkem Trägerende)
+LASTART_STRECKE = "strecke"
+LASTART_EINZEL = "einzel"
+LASTART_TEILSTRECKE = "teilstrecke"
+LASTARTEN = (LASTART_STRECKE, LASTART_EINZEL, LASTART_TEILSTRECKE)
+
+
+def lastart(last: dict) -> str:
+    """Lastart einer Last (ohne Angabe: Streckenlast über die ganze Länge)."""
+    return (last.get("lastart") or LASTART_STRECKE).lower()
+
+
+# Teilsicherheitsbeiwerte (NA-DE, aktuell als Standardwerte)
+GAMMA_G = 1.35
+GAMMA_Q = 1.5
+
+# Kombinationsmatrizen je Snapshot-Inhalt: Lastkombination, GZG-Kombination und
+# EC-Schnittstelle einer Berechnung teilen sich eine Instanz – nur lesen!
+# Die Datenbank steht nur als id() im Schlüssel und schwach referenziert im
+# Eintrag, der Cache hält sie damit nicht am Leben.
+KOMBINATIONSMATRIX_CACHE_GROESSE = 32
+_kombinationsmatrix_cache = OrderedDict()
+_kombinationsmatrix_lock = threading.Lock()
+
+# Eingabefelder, von denen die Kombinationen abhängen (Cache-Schlüssel)
+_LAST_FELDER = ("lastfall", "wert", "kategorie", "nkl", "lastart", "position", "von", "bis",
+                "eigengewicht")
+_QUERSCHNITT_FELDER = ("materialgruppe", "typ", "festigkeitsklasse", "breite_qs", "hoehe_qs")
+
+
+# Default-ψ je Lastfall, falls die Kategorie nicht in der Datenbank steht
+PSI_DEFAULTS = {
+    "psi0": ({"s": 0.7, "w": 0.6, "p": 0.7}, 0.7),
+    "psi1": ({"p": 0.5, "s": 0.2, "w": 0.2}, 0.5),   # konservative Defaults
+    "psi2": ({"p": 0.3, "s": 0.2, "w": 0.0}, 0.3),
+}
+
+
+def _si_beiwerte(db, kategorie):
+    """Si-Beiwerte einer Lastkategorie (None ohne Datenbank oder Eintrag)."""
+    if db is None or not kategorie:
+        return None
+    return db.get_si_beiwerte(kategorie)
+
+
+def _kmod_eintrag(db, typ, nkl):
+    """kmod-Tabelle und kdef eines Holztyps in einer Nutzungsklasse (None ohne Eintrag)."""
+    if db is None or not typ:
+        return None
+    return db.get_kmod(typ, nkl)
+
+
+def _eigenlast(db, gruppe, typ, klasse, nkl, breite_mm, hoehe_mm):
+    """Eigenlast des Querschnitts aus der mittleren Rohdichte."""
+    roh_mean = db.get_bemessungsdaten(gruppe, typ, klasse, nkl).get("roh_mean")
+    return (roh_mean * (breite_mm / 1000) * (hoehe_mm / 1000)) / 1000
+
+
+def eigenlast(db, querschnitt: dict, last: dict) -> float:
+    """
+    Eigenlast des Querschnitts [N/mm], die eine ständige Last mit "eigengewicht" mitführt.
+
+    0 für andere Lasten, ohne Datenbank oder ohne vollständigen Querschnitt.
+    """
+    felder = ("materialgruppe", "typ", "festigkeitsklasse")
+    if (db is None or last.get("lastfall", "").lower() != "g" or not last.get("eigengewicht")
+            or not all(querschnitt.get(f) for f in felder + ("breite_qs", "hoehe_qs"))):
+        return 0.0
+    gruppe, typ, klasse = (querschnitt[f] for f in felder)
+    return _eigenlast(db, gruppe, typ, klasse, last.get("nkl"),
+                      float(querschnitt["breite_qs"]), float(querschnitt["hoehe_qs"]))
+
+
+class _Abfragecache:
+    """
+    Datenbank mit memoisierten Abfragen für den Aufbau einer Kombinationsmatrix.
+
+    Jede Abfrage (ψ/KLED je Kategorie, kmod/kdef je Holztyp und NKL,
+    Rohdichte) läuft einmal je Schlüssel. Der Cache lebt nur während des
+    Aufbaus und hält die Datenbank danach nicht fest; fehlende Einträge
+    liefert die Datenbank als None.
+    """
+
+    def __init__(self, db):
+        self._db = db
+        self._werte = {}
+
+    def _abfrage(self, methode, *args):
+        schluessel = (methode, *args)
+        if schluessel not in self._werte:
+            self._werte[schluessel] = getattr(self._db, methode)(*args)
+        return self._werte[schluessel]
+
+    def get_si_beiwerte(self, kategorie):
+        return self._abfrage("get_si_beiwerte", kategorie)
+
+    def get_kmod(self, typ, nkl):
+        return self._abfrage("get_kmod", typ, nkl)
+
+    def get_bemessungsdaten(self, gruppe, typ, klasse, nkl):
+        return self._abfrage("get_bemessungsdaten", gruppe, typ, klasse, nkl)
+
+
+def bemessungsbeiwerte(db, last: dict, typ: str | None) -> tuple[str | None, float, float]:
+    """
+    Klasse der Lasteinwirkungsdauer, kmod und kdef einer Last.
+
+    Args:
+        db: Datenbankinstanz (oder None)
+        last (dict): Last mit "kategorie" und "nkl"
+        typ (str): Holztyp des Querschnitts (z. B. "Nadelholz")
+
+    Returns:
+        tuple: (KLED, kmod, kdef); nicht ermittelbare Werte als None bzw. NaN
+    """
+    si = _si_beiwerte(db, last.get("kategorie"))
+    kled = si.kled if si else None
+    eintrag = _kmod_eintrag(db, typ, last.get("nkl"))
+    if eintrag is None:
+        return kled, np.nan, np.nan
+    kmod = eintrag.kmod_typ.get(kled) if kled else None
+    return (kled, np.nan if kmod is None else float(kmod),
+            float(getattr(eintrag, "kdef", 0.8)))
+
+
+def psi_beiwert(db, last: dict, art: str, fallback_lastfall: str | None = None) -> float:
+    """
+    Kombinationsbeiwert ψ0/ψ1/ψ2 einer Last (Datenbank, sonst Default je Lastfall).
+
+    Args:
+        db: Datenbankinstanz (oder None)
+        last (dict): Last mit "kategorie" und "lastfall"
+        art (str): "psi0", "psi1" oder "psi2"
+        fallback_lastfall (str): Lastfall für den Default, falls abweichend
+
+    Returns:
+        float: Beiwert
+    """
+    si = _si_beiwerte(db, last.get("kategorie"))
+    wert = getattr(si, art, None) if si else None
+    if wert is not None:
+        return float(wert)
+    defaults, standard = PSI_DEFAULTS[art]
+    lf = (fallback_lastfall or last.get("lastfall", "")).lower()
+    return defaults.get(lf, standard)
+
+
+def einwirkungsgruppen(lasten) -> tuple[np.ndarray, list[str]]:
+    """
+    Fasst Lasten derselben Einwirkung (Lastfall und Kategorie) zusammen.
+
+    Lasten einer Gruppe sind eine Einwirkung im Sinne der Kombinationsregeln:
+    Sie sind gemeinsam Leit- oder Begleiteinwirkung. Die Bezeichnung ist der
+    Lastfall; teilen sich mehrere Gruppen einen Lastfall (z. B. Nutzlasten
+    verschiedener Kategorien), wird sie durchnummeriert ("p1", "p2").
+
+    Args:
+        lasten (list[dict]): Lasten mit "lastfall" und optional "kategorie"
+
+    Returns:
+        tuple[np.ndarray, list[str]]: (Gruppe je Last, Bezeichnung je Gruppe)
+    """
+    schluessel = [(l["lastfall"].lower(), l.get("kategorie")) for l in lasten]
+    gruppen = list(dict.fromkeys(schluessel))
+    index = {k: i for i, k in enumerate(gruppen)}
+    gruppe = np.array([index[k] for k in schluessel], dtype=int)
+
+    anzahl = Counter(lf for lf, _ in gruppen)
+    nummer = Counter()
+    bezeichnungen = []
+    for lf, _ in gruppen:
+        nummer[lf] += 1
+        bezeichnungen.append(lf if anzahl[lf] == 1 else f"{lf}{nummer[lf]}")
+    return gruppe, bezeichnungen
+
+
+class Kombinationsmatrix:
+    """
+    Kompilierte EC-Lastkombinationen.
+
+    Attributes:
+        einwirkungen (list[str]): Bezeichnung je Spalte ("G_SUM", dann Lastfälle)
+        lasten (list[dict | None]): Last je Spalte (None für "G_SUM")
+        werte (np.ndarray): Charakteristischer Wert je Einwirkung [N/mm bzw. N];
+            "G_SUM" enthält die Eigenlast des Querschnitts (Lasten mit "eigengewicht")
+        vollastwerte (np.ndarray): werte als Streckenlast über die ganze Länge –
+            Einzellasten 0, Teilstreckenlasten mit ihrer Intensität (Ansatz der
+            Vollast-Kombinationen von MethodeLastkombi/MethodeLastkombiGZG)
+        streckenlast (np.ndarray): bool je Spalte – Streckenlast über die ganze Länge
+        g_spalten, q_spalten (list[int]): Spalten der ständigen/veränderlichen Lasten
+        gruppe (np.ndarray): Einwirkungsgruppe je Spalte (−1 für ständige Lasten),
+            siehe einwirkungsgruppen
+        gruppen (list[str]): Bezeichnung je Einwirkungsgruppe (Leiteinwirkung)
+        gruppen_spalte (np.ndarray): erste Spalte je Einwirkungsgruppe
+        psi0, psi1, psi2 (np.ndarray): Kombinationsbeiwerte je Einwirkung (G: 1.0)
+        kled (list[str | None]): Klasse der Lasteinwirkungsdauer je Einwirkung
+        kmod, kdef (np.ndarray): Beiwerte je Einwirkung für Holztyp und NKL
+            (NaN ohne Datenbank/Holztyp); "G_SUM" mit dem größten kmod bzw.
+            kdef aller ständigen Lasten
+        gzt, gzg (np.ndarray): Koeffizienten (n_kombinationen, n_einwirkungen)
+        leit_gzt, leit_gzg (np.ndarray): bool-Masken gleicher Form – feldweise
+            nach Belastungsmuster wirkende Einwirkungen
+        beteiligt_gzt, beteiligt_gzg (np.ndarray): bool-Masken gleicher Form –
+            an der Kombination beteiligte Einwirkungen (für kmod/kdef)
+        kombinationen_gzt, kombinationen_gzg (list[dict]): Metadaten je Zeile
+            ("index" = Matrixzeile, "einwirkungen" = beteiligte Q-Spalten,
+            "leiteinwirkung" = Bezeichnung der Einwirkungsgruppe)
+    """
+
+    def __init__(self, lasten, sprungmass, gamma_g, gamma_q, db=None, querschnitt=None):
+        """
+        Args:
+            lasten (list[dict]): Lastliste aus dem Snapshot
+            sprungmass (float): Einflussbreite [m]
+            gamma_g (float): Teilsicherheitsbeiwert ständige Lasten
+            gamma_q (float): Teilsicherheitsbeiwert veränderliche Lasten
+            db: Datenbank für ψ-, kmod- und kdef-Beiwerte (None → ψ-Defaults)
+            querschnitt (dict): Querschnitt aus dem Snapshot (Holztyp für
+                kmod/kdef, Abmessungen und Material für die Eigenlast)
+        """
+        e = float(sprungmass)
+        db = None if db is None else _Abfragecache(db)
+        self.gamma_g = gamma_g
+        self.gamma_q = gamma_q
+
+        g_lasten = [l for l in lasten if l["lastfall"].lower() == "g"]
+        g_strecke = [l for l in g_lasten if lastart(l) == LASTART_STRECKE]
+        g_lokal = [l for l in g_lasten if lastart(l) != LASTART_STRECKE]
+        self.q_lasten = [l for l in lasten if l["lastfall"].lower() != "g"]
+        self.hat_g = bool(g_lasten)
+
+        # Einwirkungen: Spalte 0 = Σ G (Streckenlasten), dann ständige Einzel-/
+        # Teilstreckenlasten, danach je veränderliche Last eine Spalte
+        self.lasten = [None] + g_lokal + self.q_lasten
+        self.einwirkungen = ["G_SUM"] + [l["lastfall"] for l in self.lasten[1:]]
+        self.g_spalten = list(range(1 + len(g_lokal)))
+        self.q_spalten = list(range(1 + len(g_lokal), len(self.lasten)))
+        qs = querschnitt or {}
+        self.werte = np.array(
+            [sum(float(l["wert"]) for l in g_strecke) * e + self._eigenlast(db, qs, g_lasten)]
+            + [self._charakteristischer_wert(l, e) for l in self.lasten[1:]])
+        self.streckenlast = np.array(
+            [True] + [lastart(l) == LASTART_STRECKE for l in self.lasten[1:]])
+        einzellast = np.array(
+            [False] + [lastart(l) == LASTART_EINZEL for l in self.lasten[1:]])
+        self.vollastwerte = np.where(einzellast, 0.0, self.werte)
+
+        # Veränderliche Lasten gleicher Einwirkung bilden eine Gruppe
+        self.gruppe = np.full(len(self.lasten), -1)
+        self.gruppe[self.q_spalten], self.gruppen = einwirkungsgruppen(self.q_lasten)
+        self.gruppen_spalte = np.array(self.q_spalten, dtype=int)[
+            np.unique(self.gruppe[self.q_spalten], return_index=True)[1]]
+
+        # KLED, kmod und kdef je Einwirkung; "G_SUM" fasst alle ständigen
+        # Lasten zusammen und trägt die kürzeste Einwirkungsdauer (größtes kmod)
+        typ = qs.get("typ")
+        beiwerte = [self._massgebende_beiwerte([bemessungsbeiwerte(db, l, typ) for l in g_lasten])]
+        beiwerte += [bemessungsbeiwerte(db, l, typ) for l in self.lasten[1:]]
+        self.kled = [b[0] for b in beiwerte]
+        self.kmod = np.array([b[1] for b in beiwerte])
+        self.kdef = np.array([b[2] for b in beiwerte])
+
+        # ψ je Einwirkung – eine (memoisierte) Abfrage je Kategorie statt je Paar
+        self.psi0, self.psi1, self.psi2 = (
+            np.array([psi_beiwert(db, l, art) if j in self.q_spalten else 1.0
+                      for j, l in enumerate(self.lasten)])
+            for art in ("psi0", "psi1", "psi2"))
+
+        self._kompiliere()
+
+        # Die Instanz wird zwischen Berechnungsstufen geteilt (kombinationsmatrix())
+        for name, wert in vars(self).items():
+            if isinstance(wert, np.ndarray):
+                wert.flags.writeable = False
+
+    @staticmethod
+    def _eigenlast(db, querschnitt, g_lasten) -> float:
+        """Eigenlast des Querschnitts je ständiger Last mit "eigengewicht" [N/mm]."""
+        return sum(eigenlast(db, querschnitt, l) for l in g_lasten)
+
+    @staticmethod
+    def _massgebende_beiwerte(beiwerte) -> tuple[str | None, float, float]:
+        """Beiwerte mehrerer gemeinsam wirkender Lasten: größtes kmod und kdef."""
+        if not beiwerte:
+            return None, np.nan, np.nan
+        kled, kmod, _ = max(beiwerte, key=lambda b: -np.inf if np.isnan(b[1]) else b[1])
+        return kled, kmod, max(b[2] for b in beiwerte)
+
+    @staticmethod
+    def _charakteristischer_wert(last, sprungmass):
+        """Einzellast [kN] → N, Strecken-/Teilstreckenlast [kN/m²] · e → N/mm."""
+        if lastart(last) == LASTART_EINZEL:
+            return float(last["wert"]) * 1000
+        return float(last["wert"]) * sprungmass
+
+    def _kompiliere(self):
+        """
+        Erstellt die Koeffizientenzeilen für GZT und GZG.
+
+        Leiteinwirkung ist je eine Einwirkungsgruppe; die Zeilen aller
+        Leiteinwirkungen einer Kombinationsart entstehen als ein Block
+        (Gruppen × Q-Spalten), Begleitwerte per np.where statt verschachtelter
+        Schleifen über Leit- und Begleiteinwirkungen.
+        """
+        n = len(self.einwirkungen)
+        q_idx = np.array(self.q_spalten, dtype=int)
+        gamma_g, gamma_q = self.gamma_g, self.gamma_q
+        n_gruppen = len(self.gruppen)
+
+        # (Gruppen, Q-Spalten): Spalte gehört zur Leiteinwirkung der Zeile
+        ist_leit = self.gruppe[q_idx][None, :] == np.arange(n_gruppen)[:, None]
+        psi0, psi1, psi2 = self.psi0[q_idx], self.psi1[q_idx], self.psi2[q_idx]
+
+        gzt, gzg = [], []
+
+        def zeilen(liste, g, koeff_q, leit_q, beteiligt, texte, typ):
+            """Hängt einen Block Kombinationen an (eine Zeile je Eintrag in texte)."""
+            koeff = np.zeros((len(texte), n))
+            koeff[:, self.g_spalten] = g
+            koeff[:, q_idx] = koeff_q
+            leit = np.zeros((len(texte), n), dtype=bool)
+            leit[:, q_idx] = leit_q
+            mit = np.zeros((len(texte), n), dtype=bool)
+            mit[:, self.g_spalten] = self.hat_g
+            mit[:, q_idx] = beteiligt
+            for k, (name, beschreibung, leit_label) in enumerate(texte):
+                kombi = {"name": name, "beschreibung": beschreibung, "typ": typ}
+                if leit_label is not None:
+                    kombi["leiteinwirkung"] = leit_label
+                kombi["einwirkungen"] = q_idx[mit[k, q_idx]].tolist()
+                liste.append((koeff[k], leit[k], mit[k], kombi))
+
+        alle = np.ones_like(ist_leit)
+        keine = np.zeros((1, len(q_idx)), dtype=bool)
+
+        def je_gruppe(name, beschreibung):
+            return [(name.format(lf=lf.upper()), beschreibung.format(lf=lf.upper()), lf)
+                    for lf in self.gruppen]
+
+        # === GZT-Kombinationen (mit Teilsicherheitsbeiwerten) ===
+
+        # 1. Nur ständige Lasten: γ_G · G
+        if self.hat_g:
+            zeilen(gzt, gamma_g, 0.0, True, keine,
+                   [("GZT: γ_G · G", "Nur ständige Lasten mit Teilsicherheitsbeiwert", None)],
+                   "nur_g")
+
+        # 2. G + einzelne veränderliche Einwirkung: γ_G · G + γ_Q · Q_i
+        zeilen(gzt, gamma_g, np.where(ist_leit, gamma_q, 0.0), ist_leit, ist_leit,
+               je_gruppe("GZT: γ_G · G + γ_Q · {lf}", "Ständige + {lf} als Leiteinwirkung"),
+               "g_plus_q")
+
+        # 3. G + alle veränderlichen Einwirkungen mit Kombinationsbeiwerten
+        if n_gruppen > 1:
+            zeilen(gzt, gamma_g, np.where(ist_leit, gamma_q, psi0 * gamma_q), ist_leit, alle,
+                   je_gruppe("GZT: γ_G · G + γ_Q · {lf} + Σψ₀ · γ_Q · Q_i",
+                             "Vollkombination mit {lf} als Leiteinwirkung"),
+                   "vollkombination")
+
+        # === GZG-Kombinationen (charakteristische Werte) ===
+        if n_gruppen:
+            # 1. Charakteristische Kombination: G + Q_1 + Σψ₀ · Q_i
+            zeilen(gzg, 1.0, np.where(ist_leit, 1.0, psi0), ist_leit, alle,
+                   je_gruppe("GZG-Char: G + {lf} + Σψ₀ · Q_i",
+                             "Charakteristische Kombination mit {lf} als Leiteinwirkung"),
+                   "charakteristisch")
+
+            # 2. Häufige Kombination: G + ψ₁ · Q_1 + Σψ₂ · Q_i
+            zeilen(gzg, 1.0, np.where(ist_leit, psi1, psi2), ist_leit, alle,
+                   je_gruppe("GZG-Haeufig: G + ψ1 · {lf} + Σψ2 · Q_i",
+                             "Häufige Kombination mit {lf} als Leiteinwirkung"),
+                   "haeufig")
+
+            # 3. Quasi-ständige Kombination: G + Σψ₂ · Q_i (alle Q nach Muster)
+            zeilen(gzg, 1.0, psi2, True, alle[:1],
+                   [("GZG-Quasi: G + Σψ₂ · Q_i", "Quasi-ständige Kombination", None)],
+                   "quasi_staendig")
+
+        elif self.hat_g:
+            # Fallback: mindestens eine GZG-Kombination (nur G) für die Durchbiegungsnachweise
+            zeilen(gzg, 1.0, 0.0, True, keine,
+                   [("GZG: G (nur ständige Lasten)",
+                     "Charakteristische Kombination ohne veränderliche Lasten", None)],
+                   "nur_g")
+
+        (self.gzt, self.leit_gzt, self.beteiligt_gzt,
+         self.kombinationen_gzt) = self._stapeln(gzt, "GZT")
+        (self.gzg, self.leit_gzg, self.beteiligt_gzg,
+         self.kombinationen_gzg) = self._stapeln(gzg, "GZG")
+
+    def _stapeln(self, zeilen, grenzzustand):
+        """Stapelt Koeffizientenzeilen zu Matrizen und ergänzt die Kombinations-Dicts."""
+        n = len(self.einwirkungen)
+        if not zeilen:
+            leer = np.zeros((0, n), dtype=bool)
+            return np.zeros((0, n)), leer, leer, []
+
+        koeff = np.array([z[0] for z in zeilen])
+        leit = np.array([z[1] for z in zeilen])
+        beteiligt = np.array([z[2] for z in zeilen])
+        kombinationen = []
+        for index, (k, _, _, kombi) in enumerate(zeilen):
+            kombi["grenzzustand"] = grenzzustand
+            kombi["index"] = index
+            # Bemessungswerte je Lastfall (wie bisher als "lasten"-Dict)
+            lasten = {"G_SUM": k[0] * self.werte[0]}
+            for j in self.g_spalten[1:] + kombi["einwirkungen"]:
+                lf = self.einwirkungen[j]
+                lasten[lf] = lasten.get(lf, 0.0) + k[j] * self.werte[j]
+            kombi["lasten"] = lasten
+            kombinationen.append(kombi)
+        return koeff, leit, beteiligt, kombinationen
+
+    def kombinationen(self, grenzzustand: str) -> list[dict]:
+        """
+        Kopie der Kombinations-Dicts eines Grenzzustands.
+
+        Für Ergebnisse, die die Kombinationen weitergeben oder ergänzen – die
+        Dicts der geteilten Instanz bleiben damit unverändert.
+        """
+        return copy.deepcopy(
+            self.kombinationen_gzt if grenzzustand == "GZT" else self.kombinationen_gzg)
+
+    def koeffizienten(self, grenzzustand: str):
+        """(Koeffizientenmatrix, Leitmaske) des Grenzzustands."""
+        if grenzzustand == "GZT":
+            return self.gzt, self.leit_gzt
+        return self.gzg, self.leit_gzg
+
+    def beiwert_je_kombination(self, grenzzustand: str, art: str = "kmod") -> np.ndarray:
+        """
+        kmod bzw. kdef je Kombination: Maximum über die beteiligten Einwirkungen.
+
+        Args:
+            grenzzustand (str): "GZT" oder "GZG"
+            art (str): "kmod" oder "kdef"
+
+        Returns:
+            np.ndarray: Beiwert je Kombinationszeile (NaN ohne Datenbankwerte)
+        """
+        beteiligt = self.beteiligt_gzt if grenzzustand == "GZT" else self.beteiligt_gzg
+        return np.where(beteiligt, getattr(self, art), -np.inf).max(axis=1, initial=-np.inf)
+
+    def je_gruppe(self, werte: np.ndarray, reduktion=np.add) -> np.ndarray:
+        """
+        Fasst Spaltenwerte der veränderlichen Lasten je Einwirkungsgruppe zusammen.
+
+        Args:
+            werte (np.ndarray): Wert je Spalte
+            reduktion (np.ufunc): np.add (Summe) oder np.maximum
+
+        Returns:
+            np.ndarray: Wert je Einwirkungsgruppe
+        """
+        q_idx = np.array(self.q_spalten, dtype=int)
+        ergebnis = np.full(len(self.gruppen), 0.0 if reduktion is np.add else -np.inf)
+        reduktion.at(ergebnis, self.gruppe[q_idx], werte[q_idx])
+        return ergebnis
+
+    def lastanteile(self, grenzzustand: str, spalten=None):
+        """
+        Aufteilung jeder Kombination in festen und feldweisen Lastanteil.
+
+        Args:
+            grenzzustand (str): "GZT" oder "GZG"
+            spalten (np.ndarray): optionale bool-Maske der berücksichtigten Einwirkungen
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (fest, feldweise) je Kombination [N/mm];
+            fest wirkt auf allen Feldern, feldweise nur auf belasteten Feldern
+        """
+        koeff, leit = self.koeffizienten(grenzzustand)
+        beitraege = koeff * self.werte
+        if spalten is not None:
+            beitraege = np.where(spalten, beitraege, 0.0)
+        return (np.where(leit, 0.0, beitraege).sum(axis=1),
+                np.where(leit, beitraege, 0.0).sum(axis=1))
+
+    def bemessungslast(self, kombination: dict) -> float:
+        """
+        Gesamte Streckenlast [N/mm] einer Kombination (alle Felder belastet).
+
+        Einzel- und Teilstreckenlasten sind nicht enthalten – sie haben keine
+        über die Trägerlänge konstante Bemessungsstreckenlast.
+        """
+        koeff, _ = self.koeffizienten(kombination["grenzzustand"])
+        zeile = koeff[kombination["index"]]
+        return float(zeile[self.streckenlast] @ self.werte[self.streckenlast])
+
+
+def kombinationsmatrix(snapshot: dict, db, gamma_g: float = GAMMA_G,
+                       gamma_q: float = GAMMA_Q) -> Kombinationsmatrix:
+    """
+    Gemeinsame Kombinationsmatrix eines Snapshots (gecacht je Eingabe).
+
+    Alle Berechnungsstufen eines Snapshots erhalten dieselbe Instanz; die
+    Datenbankabfragen (ψ, KLED, kmod, kdef, Rohdichte) laufen damit einmal je
+    Snapshot statt einmal je Stufe. Der Schlüssel enthält nur die Eingabefelder
+    der Lasten und des Querschnitts, Ergebnisfelder im Snapshot stören nicht.
+
+    Args:
+        snapshot (dict): Snapshot mit "lasten", "sprungmass" und "querschnitt"
+        db: Datenbankinstanz (oder None)
+        gamma_g (float): Teilsicherheitsbeiwert ständige Lasten
+        gamma_q (float): Teilsicherheitsbeiwert veränderliche Lasten
+
+    Returns:
+        Kombinationsmatrix: geteilte Instanz (Arrays schreibgeschützt; Kombinations-
+            Dicts für Ergebnisse über kombinationen() kopieren)
+    """
+    lasten = snapshot.get("lasten", [])
+    querschnitt = snapshot.get("querschnitt") or {}
+    schluessel = (id(db), snapshot.get("sprungmass"), gamma_g, gamma_q,
+                  tuple(querschnitt.get(f) for f in _QUERSCHNITT_FELDER),
+                  tuple(tuple(l.get(f) for f in _LAST_FELDER) for l in lasten))
+    with _kombinationsmatrix_lock:
+        eintrag = _kombinationsmatrix_cache.get(schluessel)
+        # id() kann nach dem Freigeben einer Datenbank neu vergeben werden
+        if eintrag is not None and (eintrag[0] and eintrag[0]()) is db:
+            _kombinationsmatrix_cache.move_to_end(schluessel)
+            return eintrag[1]
+
+    km = Kombinationsmatrix(lasten, snapshot.get("sprungmass"), gamma_g, gamma_q, db, querschnitt)
+    db_ref = None if db is None else weakref.ref(db)
+    with _kombinationsmatrix_lock:
+        _kombinationsmatrix_cache[schluessel] = (db_ref, km)
+        _kombinationsmatrix_cache.move_to_end(schluessel)
+        while len(_kombinationsmatrix_cache) > KOMBINATIONSMATRIX_CACHE_GROESSE:
+            _kombinationsmatrix_cache.popitem(last=False)
+    return km
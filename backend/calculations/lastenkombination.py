@@ -2,6 +2,9 @@ from PIL import Image
 from io import BytesIO
 import logging
 
+from backend.calculations.kombinationsmatrix import kombinationsmatrix
+from backend.calculations.latex_vorlagen import kombination_gzt
+
 # Root-Logger-Verhalten
 logging.basicConfig(
     level=logging.DEBUG,                      # ab welcher Wichtigkeit geloggt wird
@@ -11,7 +14,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)          # logger für dieses Modul
 
 
+def _latex_symbol(bezeichnung: str, lastfall: str) -> str:
+    """Formelzeichen einer Einwirkung: "p" bzw. "p_{1}" für durchnummerierte Gruppen."""
+    nummer = bezeichnung[len(lastfall):]
+    return f"{lastfall}_{{{nummer}}}" if nummer else lastfall
+
+
 class MethodeLastkombi:
+    # Reihenfolge der veränderlichen Lastfälle in den LaTeX-Headern
+    REIHENFOLGE = ["s", "w", "p"]
+
     def __init__(self, snapshot, db):
         self.snapshot = snapshot
         self.db = db
@@ -24,7 +36,7 @@ class MethodeLastkombi:
 
     def kombi_header_latex(self, leit_q=None, q_lasten=None):
         teile = [r"\gamma_{g} \cdot g"]
-        reihenfolge = ["s", "w", "p"]
+        reihenfolge = self.REIHENFOLGE
 
         if leit_q:
             leit_label = r"\mathbf{" + leit_q["lastfall"] + "}"
@@ -46,136 +58,71 @@ class MethodeLastkombi:
         # Debug: starte dynamische Lastkombination
         lasten = self.snapshot.get("lasten", [])
         e = self.snapshot.get("sprungmass")
-        typ = self.snapshot.get("querschnitt", {}).get("typ")
-        breite = self.snapshot.get("querschnitt", {}).get("breite_qs")
-        hoehe = self.snapshot.get("querschnitt", {}).get("hoehe_qs")
-        gruppe = self.snapshot.get("querschnitt", {}).get("materialgruppe")
-        klasse = self.snapshot.get("querschnitt", {}).get("festigkeitsklasse")
 
         if not lasten or e is None:
             logger.error(
                 "Lastkombination: Fehlende Lasten oder ungültiges Sprungmaß.")
             return {}
 
-        gamma = {"g": 1.35, "s": 1.5, "w": 1.5, "p": 1.5}
-        g_summe = 0.0
-        q_lasten = []
-
-        for last in lasten:
-            nkl = last.get("nkl")
-            breite = float(breite)/1000
-            hoehe = float(hoehe)/1000
-
-            bemessungsdaten = self.db.get_bemessungsdaten(
-                gruppe, typ, klasse, nkl)
-            roh_mean = bemessungsdaten.get("roh_mean")
-            eigenlast = (roh_mean * breite * hoehe)/1000
-
-            lastfall = last["lastfall"].lower()
-            wert = float(last["wert"]) * e
-            kategorie = last["kategorie"]
-            kmod_typ = self.db.get_si_beiwerte(kategorie).kled
-            kmod_entry = self.db.get_kmod(typ, nkl)
-            kmod = kmod_entry.kmod_typ.get(kmod_typ, None)
-
-            if lastfall == "g":
-                if last.get("eigengewicht") == True:
-                    g_summe += wert + eigenlast
-                else:
-                    g_summe += wert
-                kmod_g = kmod
-                last.update({
-                    "wert_e": wert,
-                    "gamma": gamma["g"],
-                    "gamma_label": r"\gamma" + self.tiefgestellt("g"),
-                    "kmod": kmod_g,
-                })
-            else:
-                si = self.db.get_si_beiwerte(kategorie)
-
-                last.update({
-                    "wert_e": wert,
-                    "psi0": si.psi0,
-                    "gamma": gamma.get(lastfall, 1.5),
-                    "gamma_label": r"\gamma" + self.tiefgestellt(lastfall),
-                    "psi_label": r"\psi" + self.tiefgestellt("0"),
-                    "kmod": kmod,
-                })
-                q_lasten.append(last)
+        # Gemeinsame Kombinationsmatrix des Snapshots (auch GZG- und EC-Stufe):
+        # Koeffizienten, ψ0 und kmod je Einwirkung, Eigenlast in G_SUM. Einzellasten
+        # [kN] haben keinen Streckenlastwert; sie gehen nur über die EC-Schnittstelle
+        # ein (Teilstreckenlasten mit ihrer Intensität, siehe vollastwerte)
+        km = kombinationsmatrix(self.snapshot, self.db)
+        ed = km.gzt @ km.vollastwerte
+        kmod = km.beiwert_je_kombination("GZT", "kmod")
+
+        # LaTeX-Bausteine je Einwirkungsgruppe, Header-Reihenfolge (s, w, p) einmal sortiert
+        g_teil = rf"{km.gamma_g:.2f} \cdot g"
+        lf = [km.lasten[j]["lastfall"] for j in km.gruppen_spalte]
+        sym = [_latex_symbol(b, l) for b, l in zip(km.gruppen, lf)]
+        q_psi0 = km.psi0[km.gruppen_spalte]
+        reihenfolge = sorted(range(len(lf)), key=lambda i: self.REIHENFOLGE.index(lf[i]))
+        header_einzel = [rf"\gamma_{{{l}}} \cdot {s}" for l, s in zip(lf, sym)]
+        header_neben = [rf"\psi_0 \cdot \gamma_{{{l}}} \cdot {s}" for l, s in zip(lf, sym)]
+        formel_einzel = [rf"{km.gamma_q:.2f} \cdot {s}" for s in sym]
+        formel_leit = [rf"{km.gamma_q:.2f} \cdot \mathbf{{{s}}}" for s in sym]
+        formel_neben = [rf"{p:.2f} \cdot {km.gamma_q:.2f} \cdot {s}" for p, s in zip(q_psi0, sym)]
 
         kombis = {}
-
-        # 1. Nur G
-        qd = gamma["g"] * g_summe
-        qd_komb = qd / kmod_g
-
-        header = self.kombi_header_latex()
-        formel = rf"\frac{{{gamma['g']:.2f} \cdot g}}{{{kmod_g:.2f}}}"
-        formel_ed = rf"{gamma['g']:.2f} \cdot g"
-        kombis[header] = {
-            "latex": rf"${header}: \quad {formel} = {qd_komb:.2f} \,\text{{kN/m}}$",
-            "latex_ed": rf"${header}: \quad {formel_ed} = {qd:.2f} \,\text{{kN/m}}$",
-            "wert": qd_komb,
-            "Ed": qd,
-            "kmod": kmod_g,
-            "massgebend": True
-        }
-
-        # 2. G + einzelne Q
-        for q in q_lasten:
-            kmod_max = max(kmod_g, q["kmod"])
-            qd = gamma["g"] * g_summe + q["gamma"] * q["wert_e"]
+        for kombi in km.kombinationen_gzt:
+            k = kombi["index"]
+            qd, kmod_max = float(ed[k]), float(kmod[k])
             qd_komb = qd / kmod_max
 
-            header = self.kombi_header_latex(q_lasten=[q])
-            formel = rf"\frac{{{gamma['g']:.2f} \cdot g + {q['gamma']:.2f} \cdot {q['lastfall']}}}{{{kmod_max:.2f}}}"
-            formel_ed = rf"{gamma['g']:.2f} \cdot g + {q['gamma']:.2f} \cdot {q['lastfall']}"
+            if kombi["typ"] == "nur_g":
+                # 1. Nur G
+                header = self.kombi_header_latex()
+                formel_ed = g_teil
+            elif kombi["typ"] == "g_plus_q":
+                # 2. G + einzelne Q
+                i = km.gruppen.index(kombi["leiteinwirkung"])
+                header = r"\gamma_{g} \cdot g + " + header_einzel[i]
+                formel_ed = f"{g_teil} + {formel_einzel[i]}"
+            else:
+                # 3. G + alle Q mit je einer als Leiteinwirkung (nur wenn mehr als 1 Q)
+                i = km.gruppen.index(kombi["leiteinwirkung"])
+                formel_ed = " + ".join([g_teil, formel_leit[i]] + [
+                    formel_neben[j] for j in range(len(sym)) if j != i])
+                header = " + ".join(
+                    [r"\gamma_{g} \cdot g", rf"\gamma_{{{lf[i]}}} \cdot \mathbf{{{sym[i]}}}"]
+                    + [header_neben[j] for j in reihenfolge if j != i])
+
+            # Aufbau je (Header, Formel) als Vorlage gecacht, Text erst beim Rendern
+            vorlage, vorlage_ed = kombination_gzt(header, formel_ed)
             kombis[header] = {
-                "latex": rf"${header}: \quad {formel} = {qd_komb:.2f} \,\text{{kN/m}}$",
-                "latex_ed": rf"${header}: \quad {formel_ed} = {qd:.2f} \,\text{{kN/m}}$",
+                "latex": vorlage.formel(kmod=kmod_max, wert=qd_komb),
+                "latex_ed": vorlage_ed.formel(ed=qd),
                 "wert": qd_komb,
                 "Ed": qd,
                 "kmod": kmod_max,
             }
 
-        # 3. G + alle Q mit je einer als Leiteinwirkung (nur wenn mehr als 1 Q)
-        if len(q_lasten) > 1:
-            for leit_q in q_lasten:
-                leit_gamma = leit_q["gamma"]
-                leit_label = r"\mathbf{" + leit_q["lastfall"] + "}"
-                leit_wert = leit_q["wert_e"]
-
-                kmod_max = max([leit_q["kmod"]] + [q["kmod"]
-                               for q in q_lasten if q != leit_q] + [kmod_g])
-                qd_summe = gamma["g"] * g_summe + leit_gamma * leit_wert
-
-                latex_parts = [rf"{gamma['g']:.2f} \cdot g",
-                               rf"{leit_gamma:.2f} \cdot {leit_label}"]
-
-                for neb_q in q_lasten:
-                    if neb_q == leit_q:
-                        continue
-                    psi = neb_q["psi0"]
-                    gamma_ = neb_q["gamma"]
-                    neb_label = neb_q["lastfall"]
-                    wert = neb_q["wert_e"]
-
-                    latex_parts.append(
-                        rf"{psi:.2f} \cdot {gamma_:.2f} \cdot {neb_label}")
-                    qd_summe += psi * gamma_ * wert
-                qd_komb = qd_summe / kmod_max
-                formel = rf"\frac{{{' + '.join(latex_parts)}}}{{{kmod_max:.2f}}}"
-                formel_ed = ' + '.join(latex_parts)
-                header = self.kombi_header_latex(
-                    leit_q=leit_q, q_lasten=q_lasten)
-                kombis[header] = {
-                    "latex": rf"${header}: \quad {formel} = {qd_komb:.2f} \,\text{{kN/m}}$",
-                    "latex_ed": rf"${header}: \quad {formel_ed} = {qd_summe:.2f} \,\text{{kN/m}}$",
-                    "wert": qd_komb,
-                    "Ed": qd_summe,
-                    "kmod": kmod_max,
-                }
+        return self._massgebende_kombination(kombis)
 
+    @staticmethod
+    def _massgebende_kombination(kombis: dict) -> dict:
+        """Markiert die Kombination mit dem größten Wert Ed/kmod als maßgebend."""
         # print("\n\U0001F4D0 Lastkombinationen (LaTeX-ready):\n")
         # for name, k in kombis.items():
         #     print(rf"{name}: {k['latex']}")
@@ -2,6 +2,11 @@ from PIL import Image
 from io import BytesIO
 import logging
 
+import numpy as np
+
+from backend.calculations.kombinationsmatrix import kombinationsmatrix
+from backend.calculations.latex_vorlagen import GZG_NUR_G, GZG_EINZEL, gzg_vollstaendig
+
 # Root-Logger-Verhalten
 logging.basicConfig(
     level=logging.DEBUG,
@@ -11,6 +16,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _formelzeichen(bezeichnung: str) -> str:
+    """Charakteristischer Wert einer Einwirkung: "P_k" bzw. "P_{1,k}" für "p1"."""
+    lastfall, nummer = bezeichnung[0].upper(), bezeichnung[1:]
+    return f"{lastfall}_{{{nummer},k}}" if nummer else f"{lastfall}_k"
+
+
 class MethodeLastkombiGZG:
     """
     Quasi-permanente Lastkombinationen für Gebrauchstauglichkeit (GZG)
@@ -47,107 +58,78 @@ class MethodeLastkombiGZG:
                 "GZG-Lastkombination: Fehlende Lasten oder ungültiges Sprungmaß.")
             return {}
 
-        # ψ₂-Faktoren für quasi-permanente Kombination (EC5 §7.3.2)
-        psi2_faktoren = {"g": 1.0, "s": 0.0, "w": 0.0, "p": 0.3}
-
-        g_summe = 0.0
-        q_lasten = []
-
-        # Lastfälle organisieren
-        for last in lasten:
-            lastfall = last["lastfall"].lower()
-            wert = float(last["wert"]) * e
-            kategorie = last["kategorie"]
-
-            # kdef aus Datenbank für GZG-Berechnung
-            kmod_typ = self.db.get_si_beiwerte(kategorie).kled
-            kmod_entry = self.db.get_kmod(typ, last.get("nkl"))
-            kdef = kmod_entry.kdef if hasattr(
-                kmod_entry, 'kdef') else 0.8  # Fallback
-
-            if lastfall == "g":
-                g_summe += wert
-                kdef_g = kdef
-                last.update({
-                    "wert_e": wert,
-                    "psi2": psi2_faktoren["g"],
-                    "kdef": kdef_g,
-                })
-            else:
-                psi2 = psi2_faktoren.get(lastfall, 0.0)
-                last.update({
-                    "wert_e": wert,
-                    "psi2": psi2,
-                    "kdef": kdef,
-                })
-                q_lasten.append(last)
+        # Gemeinsame Kombinationsmatrix des Snapshots (auch GZT- und EC-Stufe):
+        # ψ₂ und kdef je Einwirkung aus der Datenbank, Eigenlast in G_SUM.
+        # Einzellasten [kN] haben keinen Streckenlastwert; sie gehen nur über
+        # die EC-Schnittstelle ein (Teilstreckenlasten mit ihrer Intensität)
+        km = kombinationsmatrix(self.snapshot, self.db)
+        g_summe = float(km.vollastwerte[km.g_spalten].sum())
+        kdef_g = float(km.kdef[km.g_spalten].max())
 
         # GZG-Kombinationen berechnen
         gzg_kombis = {}
 
         # Debug-Ausgaben
         logger.debug(f"GZG Debug: g_summe = {g_summe}")
-        logger.debug(f"GZG Debug: q_lasten = {q_lasten}")
+        logger.debug(f"GZG Debug: Einwirkungen = {km.gruppen}")
 
         # 1. Nur G (quasi-permanent)
         if g_summe > 0:
             qd_gzg = g_summe  # Keine Teilsicherheitsbeiwerte bei GZG
 
             header = "G_k"
-            formel = f"G_k = {g_summe:.2f} \,\text{{kN/m}}"
 
             gzg_kombis[header] = {
-                "latex": f"${header}: \quad {formel}$",
+                "latex": GZG_NUR_G.formel(g=g_summe),
                 "wert": qd_gzg,
                 "kdef": kdef_g,
-                "massgebend": len(q_lasten) == 0,  # Maßgebend wenn nur G
+                "massgebend": len(km.q_spalten) == 0,  # Maßgebend wenn nur G
                 "typ": "nur_g"
             }
             logger.debug(
                 f"GZG Debug: Erstellt G-Kombination: {gzg_kombis[header]}")
 
+        # Veränderliche Einwirkungen: Lasten gleichen Lastfalls und gleicher
+        # Kategorie bilden eine Einwirkung (eigene Zeile, eigener Header)
+        aktiv = km.psi2[km.gruppen_spalte] > 0  # Nur Einwirkungen mit ψ₂ > 0 berücksichtigen
+        psi2 = km.psi2[km.gruppen_spalte][aktiv]
+        wert_e = km.je_gruppe(km.vollastwerte)[aktiv]
+        kdef = km.je_gruppe(km.kdef, np.maximum)[aktiv]
+        zeichen = [_formelzeichen(b) for b, a in zip(km.gruppen, aktiv) if a]
+        n_gruppen = len(zeichen)
+        anteil = psi2 * wert_e
+
         # 2. G + quasi-permanente Q-Anteile (ψ₂ · Q)
-        if q_lasten:
-            for q in q_lasten:
-                if q["psi2"] > 0:  # Nur Lasten mit ψ₂ > 0 berücksichtigen
-                    qd_gzg = g_summe + q["psi2"] * q["wert_e"]
-                    kdef_max = max(kdef_g, q["kdef"])
-
-                    header = f"G_k + \\psi_2 \\cdot {q['lastfall'].upper()}_k"
-                    formel = f"G_k + {q['psi2']:.1f} \\cdot {q['lastfall'].upper()}_k = {g_summe:.2f} + {q['psi2']:.1f} \\cdot {q['wert_e']:.2f} = {qd_gzg:.2f} \\,\\text{{kN/m}}"
-
-                    gzg_kombis[header] = {
-                        "latex": f"${header}: \\quad {formel}$",
-                        "wert": qd_gzg,
-                        "kdef": kdef_max,
-                        "massgebend": False,
-                        "typ": "g_plus_q"
-                    }
+        for i in range(n_gruppen):
+            qd_gzg = g_summe + anteil[i]
+            kdef_max = max(kdef_g, kdef[i])
+
+            header = f"G_k + \\psi_2 \\cdot {zeichen[i]}"
+
+            gzg_kombis[header] = {
+                "latex": GZG_EINZEL.formel(header=header, zeichen=zeichen[i], psi2=psi2[i],
+                                           g=g_summe, q=wert_e[i], wert=qd_gzg),
+                "wert": float(qd_gzg),
+                "kdef": float(kdef_max),
+                "massgebend": False,
+                "typ": "g_plus_q"
+            }
 
         # 3. Vollständige quasi-permanente Kombination (alle ψ₂ > 0)
-        if len([q for q in q_lasten if q["psi2"] > 0]) > 1:
-            qd_gesamt = g_summe
-            kdef_max = kdef_g
-            formel_teile = [f"G_k = {g_summe:.2f}"]
-            header_teile = ["G_k"]
-
-            for q in q_lasten:
-                if q["psi2"] > 0:
-                    qd_gesamt += q["psi2"] * q["wert_e"]
-                    kdef_max = max(kdef_max, q["kdef"])
-                    formel_teile.append(
-                        f"{q['psi2']:.1f} \\cdot {q['lastfall'].upper()}_k = {q['psi2'] * q['wert_e']:.2f}")
-                    header_teile.append(
-                        f"\\psi_2 \\cdot {q['lastfall'].upper()}_k")
+        if n_gruppen > 1:
+            qd_gesamt = g_summe + anteil.sum()
+            kdef_max = max(kdef_g, kdef.max())
+            header_teile = ["G_k"] + [f"\\psi_2 \\cdot {z}" for z in zeichen]
 
             header = " + ".join(header_teile)
-            formel = " + ".join(formel_teile) + \
-                f" = {qd_gesamt:.2f} \\,\\text{{kN/m}}"
+            werte = {f"psi2_{i}": psi2[i] for i in range(n_gruppen)}
+            werte.update({f"anteil_{i}": anteil[i] for i in range(n_gruppen)})
 
             gzg_kombis[header] = {
-                "latex": f"${header}: \\quad {formel}$",
-                "wert": qd_gesamt,
-                "kdef": kdef_max,
+                "latex": gzg_vollstaendig(header, tuple(zeichen)).formel(
+                    g=g_summe, wert=qd_gesamt, **werte),
+                "wert": float(qd_gesamt),
+                "kdef": float(kdef_max),
                 "massgebend": False,
                 "typ": "vollstaendig"
             }
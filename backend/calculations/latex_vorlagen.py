@@ -0,0 +1,223 @@
+"""
+latex_vorlagen.py
+~~~~~~~~~~~~~~~~~
+
+Vorkompilierte LaTeX-Vorlagen für Lastkombinationen, EC5-Nachweise und die
+Formeln der EC-Schnittstelle.
+
+Der Aufbau der Formeln ist statisch, je Berechnung ändern sich nur die
+Zahlenwerte. Jede Vorlage wird einmal beim Import übersetzt; beim Rendern
+werden nur die Platzhalter (Zahlen, Symbole) eingesetzt. Vorlagen, deren Aufbau
+von der Lastsituation abhängt (Header einer Lastkombination), entstehen je
+Aufbau einmal und werden gecacht.
+
+Gerendert wird aufgeschoben: Die Berechnungsmodule legen LatexFormel-Objekte
+(Vorlage + Werte) in ihre Ergebnisse, der Text entsteht erst mit rendere().
+Ohne Formelbedarf (berechnungsmodus.latex = False, z. B. Live-Eingabe) wird
+kein Text erzeugt; die Formeln bleiben über LatexFormeln abrufbar.
+"""
+import string
+from functools import lru_cache
+
+
+class Vorlage:
+    """
+    Vorkompilierte Formatvorlage (Syntax wie str.format, nur benannte Platzhalter).
+
+    Attributes:
+        text (str): Vorlagentext
+        felder (frozenset[str]): Namen der Platzhalter
+    """
+    __slots__ = ("text", "felder")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.felder = frozenset(
+            feld for _, feld, _, _ in string.Formatter().parse(text) if feld)
+
+    def rendere(self, werte: dict) -> str:
+        """Setzt die Werte in die Platzhalter ein."""
+        return self.text.format_map(werte)
+
+    def formel(self, **werte) -> "LatexFormel":
+        """Aufgeschobene Formel mit diesen Werten (noch kein Text)."""
+        return LatexFormel(self, werte)
+
+
+class LatexFormel:
+    """
+    Aufgeschobene LaTeX-Formel: Vorlage und Werte, Text erst bei str().
+
+    Der gerenderte Text wird gemerkt; Formeln gleichen Textes sind gleich,
+    auch im Vergleich mit einem str.
+    """
+    __slots__ = ("vorlage", "werte", "_text")
+
+    def __init__(self, vorlage: Vorlage, werte: dict):
+        self.vorlage = vorlage
+        self.werte = werte
+        self._text = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self.vorlage.rendere(self.werte)
+        return self._text
+
+    def __repr__(self) -> str:
+        return f"LatexFormel({str(self)!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, (str, LatexFormel)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+
+def rendere(objekt):
+    """
+    Kopie von objekt mit allen LatexFormel-Einträgen als Text.
+
+    Durchläuft dicts, Listen und Tupel; alle anderen Werte bleiben unverändert.
+    """
+    if isinstance(objekt, LatexFormel):
+        return str(objekt)
+    if isinstance(objekt, dict):
+        return {k: rendere(v) for k, v in objekt.items()}
+    if isinstance(objekt, (list, tuple)):
+        return type(objekt)(rendere(v) for v in objekt)
+    return objekt
+
+
+def ohne_formeln(objekt):
+    """Kopie von objekt ohne LatexFormel-Einträge (dict-Schlüssel entfallen)."""
+    if isinstance(objekt, dict):
+        return {k: ohne_formeln(v) for k, v in objekt.items()
+                if not isinstance(v, LatexFormel)}
+    if isinstance(objekt, (list, tuple)):
+        return type(objekt)(ohne_formeln(v) for v in objekt)
+    return objekt
+
+
+def formeln(objekt) -> dict | None:
+    """Nur die LatexFormel-Einträge von objekt, mit ihren dict-Pfaden (sonst None)."""
+    if not isinstance(objekt, dict):
+        return None
+    auszug = {}
+    for k, v in objekt.items():
+        if isinstance(v, LatexFormel):
+            auszug[k] = v
+        elif (teil := formeln(v)):
+            auszug[k] = teil
+    return auszug or None
+
+
+class LatexFormeln:
+    """
+    Aufgeschobene Formeln eines Berechnungsergebnisses.
+
+    Gleiche Schnittstelle wie FeebbBerechnungEC.latex_formeln(), damit beide
+    über den Ergebnis-Cache (Handle) abgerufen werden können.
+    """
+
+    def __init__(self, formeln: dict):
+        self._formeln = formeln
+
+    def latex_formeln(self) -> dict:
+        return rendere(self._formeln)
+
+
+# === Lastkombinationen GZT (MethodeLastkombi) ===
+
+@lru_cache(maxsize=512)
+def kombination_gzt(header: str, formel_ed: str) -> tuple[Vorlage, Vorlage]:
+    """
+    Vorlagen einer GZT-Kombination für Header und Formel (je Aufbau gecacht).
+
+    Platzhalter: kmod, wert (Ed/kmod), ed – alle in kN/m.
+
+    Returns:
+        tuple[Vorlage, Vorlage]: ("latex" mit Division durch kmod, "latex_ed")
+    """
+    header, formel_ed = _literal(header), _literal(formel_ed)
+    return (Vorlage("$" + header + r": \quad \frac{{" + formel_ed
+                    + r"}}{{{kmod:.2f}}} = {wert:.2f} \,\text{{kN/m}}$"),
+            Vorlage("$" + header + r": \quad " + formel_ed + r" = {ed:.2f} \,\text{{kN/m}}$"))
+
+
+# === Lastkombinationen GZG (MethodeLastkombiGZG) ===
+
+GZG_NUR_G = Vorlage(r"$G_k: \quad G_k = {g:.2f} \,\text{{kN/m}}$")
+GZG_EINZEL = Vorlage(
+    r"${header}: \quad G_k + {psi2:.1f} \cdot {zeichen} = {g:.2f} + {psi2:.1f} \cdot "
+    r"{q:.2f} = {wert:.2f} \,\text{{kN/m}}$")
+
+
+@lru_cache(maxsize=256)
+def gzg_vollstaendig(header: str, zeichen: tuple[str, ...]) -> Vorlage:
+    """
+    Vorlage der vollständigen quasi-ständigen Kombination (je Aufbau gecacht).
+
+    Platzhalter: g, wert sowie psi2_i und anteil_i je Einwirkung i (kN/m).
+    """
+    teile = ["G_k = {g:.2f}"] + [
+        rf"{{psi2_{i}:.1f}} \cdot {_literal(z)} = {{anteil_{i}:.2f}}"
+        for i, z in enumerate(zeichen)]
+    return Vorlage("$" + _literal(header) + r": \quad " + " + ".join(teile)
+                   + r" = {wert:.2f} \,\text{{kN/m}}$")
+
+
+# === EC5-Nachweise (MethodeNachweisEC5) ===
+
+NACHWEIS_BIEGUNG = Vorlage(
+    r"$\sigma_{{m,d}} = \frac{{M_{{Ed}}}}{{W_y}} = "
+    r"\frac{{{m_ed:.1f}\cdot{{10^6}}}}{{{w_y:.0f}}} = {sigma:.2f} \,\text{{N/mm²}} "
+    r"\leq {f_d:.2f} \,\text{{N/mm²}} \quad "
+    r"\eta = {eta:.2f} {zeichen}$")
+NACHWEIS_SCHUB = Vorlage(
+    r"$\tau_d = 1.5 \cdot \frac{{V_{{Ed}}}}{{b \cdot h}} = "
+    r"1.5 \cdot \frac{{{v_ed:.1f}\cdot{{10^3}}}}{{{b:.0f} \cdot {h:.0f}}} = {tau:.0f} \,\text{{N/mm²}} "
+    r"\leq {f_d:.2f} \,\text{{N/mm²}} \quad "
+    r"\eta = {eta:.2f} {zeichen}$")
+NACHWEIS_DURCHBIEGUNG = Vorlage(
+    r"${symbol} = {w:.2f} \,\text{{mm}} \leq "
+    r"{symbol_grenz} = \frac{{L}}{{{faktor:.0f}}} = {w_grenz:.2f} \,\text{{mm}} \quad "
+    r"\eta = {eta:.2f} {zeichen}$")
+
+
+def erfuellt_zeichen(erfuellt: bool) -> str:
+    """Häkchen bzw. Kreuz hinter der Ausnutzung."""
+    return r"\checkmark" if erfuellt else r"\times"
+
+
+# === Formeln der EC-Schnittstelle (FeebbBerechnungEC.latex_formeln) ===
+
+EC_GZT_NUR_G = Vorlage(
+    r"$\gamma_G \cdot G: \quad {gamma_g:.2f} \cdot g = {qd:.2f} \,\text{{kN/m}} \quad "
+    r"M_{{Ed,max}} = {moment:.2f} \,\text{{kNm}}$")
+EC_GZT_G_PLUS_Q = Vorlage(
+    r"$\gamma_G \cdot G + \gamma_Q \cdot \mathbf{{{LEIT}}}: \quad "
+    r"{gamma_g:.2f} \cdot g + {gamma_q:.2f} \cdot {leit} = {qd:.2f} \,\text{{kN/m}} \quad "
+    r"M_{{Ed,max}} = {moment:.2f} \,\text{{kNm}}$")
+EC_GZT_VOLL = Vorlage(
+    r"$\gamma_G \cdot G + \gamma_Q \cdot \mathbf{{{LEIT}}} + \Sigma\psi_0 \cdot \gamma_Q \cdot Q_i: \quad "
+    r"{gamma_g:.2f} \cdot g + {gamma_q:.2f} \cdot {leit}{begleitend} = {qd:.2f} \,\text{{kN/m}} \quad "
+    r"M_{{Ed,max}} = {moment:.2f} \,\text{{kNm}}$")
+EC_GZG_CHARAKTERISTISCH = Vorlage(
+    r"$G + \mathbf{{{LEIT}}} + \Sigma\psi_0 \cdot Q_i: \quad "
+    r"g + {leit}{begleitend} = {qd:.2f} \,\text{{kN/m}} \quad "
+    r"w_{{max}} = {w:.2f} \,\text{{mm}}$")
+EC_GZG_HAEUFIG = Vorlage(
+    r"$G + \psi_1 \cdot \mathbf{{{LEIT}}} + \Sigma\psi_2 \cdot Q_i: \quad "
+    r"g + {psi1:.2f} \cdot {leit}{begleitend} = {qd:.2f} \,\text{{kN/m}} \quad "
+    r"w_{{max}} = {w:.2f} \,\text{{mm}}$")
+EC_GZG_QUASI = Vorlage(
+    r"$G + \Sigma\psi_2 \cdot Q_i: \quad "
+    r"g + {terme} = {qd:.2f} \,\text{{kN/m}} \quad "
+    r"w_{{max}} = {w:.2f} \,\text{{mm}}$")
+
+
+def _literal(text: str) -> str:
+    """Maskiert geschweifte Klammern, damit text in einer Vorlage wörtlich bleibt."""
+    return text.replace("{", "{{").replace("}", "}}")
@@ -0,0 +1,123 @@
+"""
+materialvergleich.py
+~~~~~~~~~~~~~~~~~~~~
+
+Material- und Festigkeitsklassenvergleich mit einer einzigen FE-Berechnung.
+
+Eine Materialvariante (Materialgruppe, Typ, Festigkeitsklasse, NKL) ändert bei
+gleichem Querschnitt nur fm,k, fv,k, E, kdef, γ_M, die Rohdichte (Eigenlast)
+sowie kmod/kdef der Lastkombinationen. Die Schnittgrößen der Referenz-
+berechnung (querschnittsoptimierung.referenzberechnung) werden daher für alle
+Varianten wiederverwendet, die Durchbiegungen mit E skaliert. Die Last-
+kombinationen je Variante kommen aus der gecachten Kombinationsmatrix und
+kosten keine FE-Berechnung.
+
+Eigenlast und Genauigkeit wie in der Querschnittsoptimierung: exakt im
+Schnell-Modus, obere Schranke im EC-Modus.
+"""
+import copy
+import logging
+
+import numpy as np
+
+from backend.calculations.lastenkombination import MethodeLastkombi
+from backend.calculations.lastkombination_gzg import MethodeLastkombiGZG
+from backend.calculations.querschnittsoptimierung import (
+    NACHWEISE, materialwerte, kombinationswerte, massgebende_kombination, referenzberechnung,
+    ausnutzungen)
+
+logger = logging.getLogger(__name__)
+
+# Schlüssel einer Materialvariante (wie im Snapshot-Querschnitt)
+VARIANTEN_FELDER = ("materialgruppe", "typ", "festigkeitsklasse", "nkl")
+
+
+class MethodeMaterialvergleich:
+    """
+    Ausnutzungstabelle eines Querschnitts für mehrere Materialvarianten.
+
+    Breite und Höhe stammen aus dem Snapshot-Querschnitt, E und I_y aus dem
+    Snapshot sind die Referenzsteifigkeit der FE-Berechnung.
+    """
+
+    def __init__(self, snapshot, db):
+        self.snapshot = snapshot
+        self.db = db
+
+    def compute(self, varianten) -> dict:
+        """
+        Weist den Querschnitt für alle Materialvarianten nach.
+
+        Args:
+            varianten (list[dict]): je Variante materialgruppe, typ,
+                festigkeitsklasse und nkl
+
+        Returns:
+            dict: "Varianten" (Reihenfolge wie Eingabe, je Variante Material,
+                Beiwerte, Ausnutzungen, maßgebender Nachweis) und "Anzahl_erfuellt"
+
+        Raises:
+            ValueError: keine Varianten, unvollständige Variante oder
+                unbekannte Festigkeitsklasse
+        """
+        if not varianten:
+            raise ValueError("Keine Materialvarianten angegeben")
+        for variante in varianten:
+            fehlend = [f for f in VARIANTEN_FELDER if variante.get(f) in (None, "")]
+            if fehlend:
+                raise ValueError(f"Materialvariante ohne {', '.join(fehlend)}: {variante}")
+
+        material = materialwerte(
+            self.db, [tuple(v[f] for f in VARIANTEN_FELDER) for v in varianten])
+        referenz = referenzberechnung(self.snapshot, self.db)
+
+        qs = self.snapshot["querschnitt"]
+        n = len(varianten)
+        b = np.full(n, float(qs["breite_qs"]))
+        h = np.full(n, float(qs["hoehe_qs"]))
+        g_eigen = referenz["anzahl_eigengewicht"] * material["roh_mean"] * b * h / 1e9
+        einwirkungen = self._einwirkungen(varianten)
+        ausnutzung = ausnutzungen(self.snapshot, referenz, b, h, material, g_eigen, einwirkungen)
+
+        eta_max = np.max(np.column_stack([ausnutzung[name] for name in NACHWEISE]), axis=1)
+        i_kmod = massgebende_kombination(einwirkungen["ed"], einwirkungen["kmod"])
+        tabelle = [{
+            **{f: variante[f] for f in VARIANTEN_FELDER},
+            "E": float(material["E"][i]),
+            "kmod": float(einwirkungen["kmod"][i, i_kmod[i]]),
+            "kdef": float(material["kdef"][i]),
+            "eigenlast": float(g_eigen[i]),                          # [kN/m]
+            "ausnutzung": {name: float(ausnutzung[name][i]) for name in NACHWEISE},
+            "max_ausnutzung": float(eta_max[i]),
+            "massgebend": max(NACHWEISE, key=lambda name: ausnutzung[name][i]),
+            "erfuellt": bool(eta_max[i] <= 1.0),
+        } for i, variante in enumerate(varianten)]
+
+        anzahl_erfuellt = sum(zeile["erfuellt"] for zeile in tabelle)
+        logger.info(f"🧪 Materialvergleich: {anzahl_erfuellt} von {n} Varianten erfüllt")
+        return {"Varianten": tabelle, "Anzahl_erfuellt": anzahl_erfuellt}
+
+    def _einwirkungen(self, varianten) -> dict:
+        """
+        Kombinationswerte je Variante (kmod, kdef und Eigenlast hängen von
+        Typ, NKL und Rohdichte ab), gestapelt als Arrays für ausnutzungen().
+        """
+        werte = []
+        for variante in varianten:
+            snapshot = copy.deepcopy(self.snapshot)
+            snapshot["querschnitt"].update({f: variante[f] for f in VARIANTEN_FELDER})
+            for last in snapshot.get("lasten", []):
+                last["nkl"] = variante["nkl"]
+            kombis = MethodeLastkombi(snapshot, self.db).compute()["Lastfallkombinationen"]
+            snapshot["Lastfallkombinationen"] = kombis
+            gzg_kombis = MethodeLastkombiGZG(
+                snapshot, self.db).compute()["GZG_Lastfallkombinationen"]
+            werte.append(kombinationswerte(kombis, gzg_kombis))
+
+        hat_gzg = all(w["gzg_wert"] is not None for w in werte)
+        return {
+            "ed": np.array([w["ed"] for w in werte]),
+            "kmod": np.array([w["kmod"] for w in werte]),
+            "gzg_wert": np.array([w["gzg_wert"] for w in werte]) if hat_gzg else None,
+            "gzg_kdef": np.array([w["gzg_kdef"] for w in werte]),
+        }
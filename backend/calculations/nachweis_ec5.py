@@ -2,6 +2,12 @@ from PIL import Image
 from io import BytesIO
 import logging
 import math
+import numpy as np
+
+from backend.calculations.aufloesung import auswertungsstellen, feldfolge, feldmaxima
+from backend.calculations.kombinationsmatrix import psi_beiwert
+from backend.calculations.latex_vorlagen import (
+    NACHWEIS_BIEGUNG, NACHWEIS_SCHUB, NACHWEIS_DURCHBIEGUNG, erfuellt_zeichen)
 
 # Root-Logger-Verhalten
 logging.basicConfig(
@@ -11,6 +17,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Durchbiegungsnachweise, die je Feld und Kragarm geführt werden
+DURCHBIEGUNGSNACHWEISE = ("durchbiegung_inst", "durchbiegung_fin", "durchbiegung_net_fin")
+
 
 class MethodeNachweisEC5:
     def __init__(self, snapshot, db):
@@ -49,25 +58,14 @@ class MethodeNachweisEC5:
         nkl = querschnitt.get("nkl", 1)
         gruppe = querschnitt.get("materialgruppe", "")
 
-        # Governing span for L/n deflection limit.
-        # Use the longest inner field (feld_*) because the governing deflection check
-        # is always for the field with the largest span. Cantilevers (kragarm_*) are
-        # excluded – they have separate limit conventions not handled here.
-        # For a single-span beam this always equals the only span.
-        l = 1000  # fallback in mm
-        if spannweiten:
-            feld_laengen = [v for k, v in spannweiten.items() if k.startswith("feld_")]
-            if feld_laengen:
-                l = max(feld_laengen) * 1000  # m → mm
-            else:
-                l = next(iter(spannweiten.values()), 1.0) * 1000
+        # Felder und Kragarme der Durchbiegungsnachweise (Grenzwerte l/n bzw. 2·l_k/n)
+        felder = self.durchbiegungsfelder(spannweiten)
 
         # Materialwerte aus DB
         bemessungsdaten = self.db.get_bemessungsdaten(gruppe, typ, klasse, nkl)
 
         fm_k = bemessungsdaten.get("fmyk")  # N/mm²
         fv_k = bemessungsdaten.get("fvk")  # N/mm²
-        E_mean = bemessungsdaten.get("E")  # N/mm²
         gamma_m = bemessungsdaten.get("gamma_m")  # Teilsicherheitsbeiwert
 
         # Kmod aus Lastkombination
@@ -81,12 +79,8 @@ class MethodeNachweisEC5:
         max_med = gzt_data.get("moment")
         max_ved = gzt_data.get("querkraft")
 
-        # EC5-konforme Durchbiegungsberechnung mit GZG-Lastkombinationen
-        durchbiegungen = self._berechne_ec5_durchbiegungen(l, E_mean)
-
-        # Durchbiegungsgrenzwerte dynamisch aus Snapshot
-        grenzwerte = self._get_durchbiegungsgrenzwerte(
-            gebrauchstauglichkeit, l)
+        # EC5-konforme Durchbiegungsberechnung mit GZG-Lastkombinationen je Feld
+        durchbiegungen = self._berechne_ec5_durchbiegungen(felder)
 
         # Nachweise durchführen
         nachweise = {}
@@ -99,19 +93,133 @@ class MethodeNachweisEC5:
         nachweise["schub"] = self._nachweis_schub(
             max_ved, b, h, fv_d, fv_k, kmod, gamma_m)
 
-        # 3. EC5-konforme Durchbiegungsnachweise (drei separate Nachweise)
-        nachweise["durchbiegung_inst"] = self._nachweis_durchbiegung(
-            durchbiegungen["delta_inst"], grenzwerte["w_inst"], l, "Sofort-Durchbiegung", "\\delta_{inst,max}")
-
-        nachweise["durchbiegung_fin"] = self._nachweis_durchbiegung(
-            durchbiegungen["delta_end"], grenzwerte["w_fin"], l, "End-Durchbiegung", "\\delta_{end,max}")
+        # 3. EC5-konforme Durchbiegungsnachweise (drei separate Nachweise) je Feld
+        #    und Kragarm; maßgebend je Nachweis das Feld mit der größten Ausnutzung
+        feldnachweise, w_inst_grenzen = {}, {}
+        for feld, werte in durchbiegungen["felder"].items():
+            l = felder[feld]["bezugslaenge"]
+            grenzwerte = self._get_durchbiegungsgrenzwerte(gebrauchstauglichkeit, l)
+            w_inst_grenzen[feld] = grenzwerte["w_inst"]
+            feldnachweise[feld] = {
+                "durchbiegung_inst": self._nachweis_durchbiegung(
+                    werte["delta_inst"], grenzwerte["w_inst"], l, "Sofort-Durchbiegung",
+                    "\\delta_{inst,max}", feld),
+                "durchbiegung_fin": self._nachweis_durchbiegung(
+                    werte["delta_end"], grenzwerte["w_fin"], l, "End-Durchbiegung",
+                    "\\delta_{end,max}", feld),
+                "durchbiegung_net_fin": self._nachweis_durchbiegung(
+                    werte["delta_netto"], grenzwerte["w_net_fin"], l, "Netto-End-Durchbiegung",
+                    "\\delta_{netto,max}", feld),
+            }
+        for art in DURCHBIEGUNGSNACHWEISE:
+            nachweise[art] = max((f[art] for f in feldnachweise.values()),
+                                 key=lambda nachweis: nachweis["ausnutzung"])
+        nachweise["durchbiegung_felder"] = feldnachweise
 
-        nachweise["durchbiegung_net_fin"] = self._nachweis_durchbiegung(
-            durchbiegungen["delta_netto"], grenzwerte["w_net_fin"], l, "Netto-End-Durchbiegung", "\\delta_{netto,max}")
+        # 4. Ausnutzungsverläufe η(x) entlang des Trägers
+        verlaeufe = self._ausnutzungsverlaeufe(b, h, fm_d, fv_d, w_inst_grenzen)
+        if verlaeufe:
+            nachweise["ausnutzungsverlauf"] = verlaeufe
 
         logger.info("EC5-Nachweisberechnung abgeschlossen")
         return nachweise
 
+    @staticmethod
+    def durchbiegungsfelder(spannweiten) -> dict:
+        """
+        Felder und Kragarme der Durchbiegungsnachweise in Trägerreihenfolge.
+
+        Jedes Feld wird mit seiner Länge l, jeder Kragarm mit 2·l_k als
+        Bezugslänge der Grenzwerte L/n nachgewiesen. Ohne Spannweiten ein
+        Feld mit 1 m.
+
+        Returns:
+            dict: Feldschlüssel → {"laenge", "bezugslaenge" [mm], "kragarm": bool}
+        """
+        felder = {}
+        for feld, laenge in feldfolge(spannweiten or {}):
+            kragarm = feld.startswith("kragarm")
+            felder[feld] = {"laenge": laenge * 1000,  # m → mm
+                            "bezugslaenge": laenge * 1000 * (2 if kragarm else 1),
+                            "kragarm": kragarm}
+        return felder or {"feld_1": {"laenge": 1000, "bezugslaenge": 1000, "kragarm": False}}
+
+    @staticmethod
+    def schnellmodus_durchbiegungen(gzg, lasten, db) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Charakteristische und quasi-ständige Durchbiegung w(x) [mm] im Schnell-Modus.
+
+        Die GZG-Verläufe liegen je Last vor (Reihenfolge wie lasten, Vollast auf
+        allen Feldern). Charakteristisch ist ihre Summe, quasi-ständig die Summe
+        mit ψ₂ der veränderlichen Lasten (G + Σψ₂·Q_i wie die maßgebende
+        Kombination in MethodeLastkombiGZG).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: (w_char(x), w_quasi(x))
+        """
+        kurven = np.array([e["durchbiegung"] for e in gzg], dtype=float)
+        psi2 = np.array([1.0 if last["lastfall"].lower() == "g" else psi_beiwert(db, last, "psi2")
+                         for last in lasten[:len(kurven)]])
+        return kurven.sum(axis=0), psi2 @ kurven
+
+    def _ausnutzungsverlaeufe(self, b, h, fm_d, fv_d, w_inst_grenz) -> dict:
+        """
+        Ausnutzungen η(x) für Biegung, Schub und Sofort-Durchbiegung entlang des Trägers.
+
+        Biegung und Schub aus den GZT-Verläufen, die Durchbiegung als
+        w_inst(x) / w_inst,grenz aus den charakteristischen GZG-Verläufen mit
+        dem Grenzwert des jeweiligen Feldes bzw. Kragarms
+        (w_inst_grenz: Feldschlüssel → mm). Im
+        EC-Modus zählt je Stelle der größere Betrag von max- und min-Envelope,
+        im Schnell-Modus die Summe der Einzellastfälle. Alle Verläufe werden
+        als Arrays berechnet; je Verlauf Maximum und Stelle x [m].
+
+        Returns:
+            dict: {"x": [...], "biegung"|"schub"|"durchbiegung_inst":
+                {"eta": [...], "max": float, "x_max": float}} oder {} ohne Verläufe
+                (z. B. maxima_only)
+        """
+        schnittgroessen = self.snapshot.get("Schnittgroessen", {})
+        gzt, gzg = schnittgroessen.get("GZT", {}), schnittgroessen.get("GZG", {})
+
+        def betrag(daten, groesse):
+            if isinstance(daten, list):  # Schnell-Modus GZG: je Einwirkung ein Verlauf
+                if not daten:
+                    return None
+                return np.abs(np.sum([e[groesse] for e in daten], axis=0))
+            if "envelope" in daten:
+                env = daten["envelope"]
+                return np.maximum(np.abs(env[f"{groesse}_max"]), np.abs(env[f"{groesse}_min"]))
+            return np.abs(daten[groesse]) if groesse in daten else None
+
+        moment, querkraft = betrag(gzt, "moment"), betrag(gzt, "querkraft")
+        if moment is None or querkraft is None or b <= 0 or h <= 0:
+            return {}
+
+        w_y = (b * h**2) / 6  # mm³
+        etas = {
+            "biegung": moment / w_y / fm_d,
+            "schub": 1.5 * querkraft / (b * h) / fv_d,
+        }
+        x, abschnitte = auswertungsstellen(
+            schnittgroessen, self.snapshot.get("spannweiten", {}), len(moment))
+
+        # Grenzwert je Stelle aus dem Feld bzw. Kragarm, in dem sie liegt
+        # (der gemeinsame Knoten zählt zum folgenden Feld wie in feldmaxima)
+        durchbiegung = betrag(gzg, "durchbiegung")
+        grenzen = [w_inst_grenz.get(a["feld"], 0) for a in abschnitte]
+        if durchbiegung is not None and grenzen and min(grenzen) > 0:
+            starts = np.array([a["start"] for a in abschnitte])
+            feld_je_punkt = np.searchsorted(starts, np.arange(len(durchbiegung)), side="right") - 1
+            etas["durchbiegung_inst"] = durchbiegung / np.asarray(grenzen)[np.maximum(feld_je_punkt, 0)]
+
+        verlaeufe = {"x": x.tolist()}
+        for name, eta in etas.items():
+            i_max = int(np.argmax(eta))
+            verlaeufe[name] = {"eta": eta.tolist(), "max": float(eta[i_max]),
+                               "x_max": float(x[i_max])}
+        return verlaeufe
+
     def _get_kmod_from_kombination(self):
         """Extrahiert kmod aus der maßgebenden Lastkombination direkt aus dem Snapshot"""
         try:
@@ -144,28 +252,70 @@ class MethodeNachweisEC5:
 
         return 0.9  # Fallback-Wert
 
-    def _berechne_ec5_durchbiegungen(self, l, E_mean):
-        """Berechnet EC5-konforme Durchbiegungen: δinst, δend, δnetto mit GZG-Lastkombinationen"""
+    def _berechne_ec5_durchbiegungen(self, felder):
+        """
+        Berechnet EC5-konforme Durchbiegungen δinst, δend, δnetto je Feld und
+        Kragarm aus den GZG-Verläufen der FE-Berechnung.
+
+        Args:
+            felder (dict): Felder und Kragarme wie durchbiegungsfelder()
+
+        Returns:
+            dict: "felder" (Feldschlüssel → delta_inst, delta_end, delta_netto [mm]),
+                "qd_gzg", "kdef", "delta_0"
+        """
+        def ohne_durchbiegung():
+            return {"felder": {feld: {"delta_inst": 0, "delta_end": 0, "delta_netto": 0}
+                               for feld in felder}}
+
+        def je_feld(werte, kdef, delta_0):
+            # EC5 §2.2.3: w_fin = w_inst,quasi · (1 + kdef)
+            # Using the quasi-permanent deflection as base ensures creep is only
+            # applied to (G + ψ₂·Q), not to the full characteristic (G + Q).
+            ergebnis = {}
+            for feld, (delta_inst, delta_quasi) in werte.items():
+                delta_end = (1 + kdef) * delta_quasi
+                # δnetto = δend - Δ₀ (Netto-Enddurchbiegung)
+                ergebnis[feld] = {"delta_inst": delta_inst, "delta_end": delta_end,
+                                  "delta_netto": delta_end - delta_0}
+                logger.info(
+                    f"EC5-Durchbiegungen {feld}: δinst = {delta_inst:.2f} mm, "
+                    f"δquasi = {delta_quasi:.2f} mm, δend = {delta_end:.2f} mm "
+                    f"(kdef = {kdef:.2f}), δnetto = {delta_end - delta_0:.2f} mm")
+            return ergebnis
+
         try:
+            gebrauchstauglichkeit = self.snapshot.get("gebrauchstauglichkeit", {})
+            delta_0 = gebrauchstauglichkeit.get("w_c", 0)  # Anfangsüberhöhung
+
             # Prüfe, ob EC-Modus aktiv ist und EC-FEEBB-Durchbiegungen verfügbar sind
             ec_modus = self.snapshot.get(
                 'berechnungsmodus', {}).get('ec_modus', False)
-            gzg_schnittgroessen = self.snapshot.get(
-                "Schnittgroessen", {}).get("GZG", {})
+            schnittgroessen = self.snapshot.get("Schnittgroessen", {})
+            gzg_schnittgroessen = schnittgroessen.get("GZG", {})
 
             if ec_modus and gzg_schnittgroessen and "max" in gzg_schnittgroessen:
                 # EC-Modus: Verwende bereits berechnete Durchbiegungen aus FEEBB-EC
                 logger.info("🔬 EC-Modus: Verwende FEEBB-EC Durchbiegungen")
+                gzg_max = gzg_schnittgroessen["max"]
 
                 # w_inst: max absolute deflection across ALL GZG combinations
                 # (characteristic combination governs – EC5 Table 7.2 row 1).
-                delta_inst = gzg_schnittgroessen["max"].get("durchbiegung", 0)  # mm
-
                 # w_fin base: quasi-permanent deflection only (EC5 §2.2.3, Table 7.2 row 2+3).
                 # If the quasi-permanent max was not stored (e.g. old snapshot), fall back to
                 # delta_inst (conservative).
-                delta_quasi = gzg_schnittgroessen["max"].get(
-                    "durchbiegung_quasi", delta_inst)  # mm
+                if "durchbiegung_felder" in gzg_max:
+                    # Betragsmaxima je Feld aus den Envelopes (FeebbBerechnungEC)
+                    inst = gzg_max["durchbiegung_felder"]
+                    quasi = gzg_max.get("durchbiegung_quasi_felder", inst)
+                    werte = {feld: (inst.get(feld, 0), quasi.get(feld, inst.get(feld, 0)))
+                             for feld in felder}
+                else:
+                    # Ältere Ergebnisse ohne Feldmaxima: globales Maximum im längsten Feld
+                    delta_inst = gzg_max.get("durchbiegung", 0)  # mm
+                    delta_quasi = gzg_max.get("durchbiegung_quasi", delta_inst)  # mm
+                    feld = max(felder, key=lambda f: (not felder[f]["kragarm"], felder[f]["laenge"]))
+                    werte = {feld: (delta_inst, delta_quasi)}
 
                 # kdef aus Materialdatenbank
                 querschnitt = self.snapshot.get("querschnitt", {})
@@ -177,42 +327,23 @@ class MethodeNachweisEC5:
                     gruppe, typ, klasse, nkl)
                 kdef = bemessungsdaten.get("kdef", 0.8)
 
-                # EC5 §2.2.3: w_fin = w_inst,quasi · (1 + kdef)
-                # Using the quasi-permanent deflection as base ensures creep is only
-                # applied to (G + ψ₂·Q), not to the full characteristic (G + Q).
-                delta_end = (1 + kdef) * delta_quasi
-                gebrauchstauglichkeit = self.snapshot.get(
-                    "gebrauchstauglichkeit", {})
-                delta_0 = gebrauchstauglichkeit.get("w_c", 0)
-                delta_netto = delta_end - delta_0
-
-                logger.info(f"EC-FEEBB Durchbiegungen:")
-                logger.info(f"  - δinst (aus FEEBB-EC, charakteristisch) = {delta_inst:.2f} mm")
-                logger.info(f"  - δquasi (quasi-ständig) = {delta_quasi:.2f} mm")
-                logger.info(
-                    f"  - δend = (1+kdef) · δquasi = {delta_end:.2f} mm (kdef = {kdef:.2f})")
-                logger.info(
-                    f"  - δnetto = {delta_netto:.2f} mm (Δ₀ = {delta_0:.2f} mm)")
-
                 return {
-                    "delta_inst": delta_inst,
-                    "delta_end": delta_end,
-                    "delta_netto": delta_netto,
+                    "felder": je_feld(werte, kdef, delta_0),
                     "qd_gzg": 0,  # Nicht direkt verfügbar im EC-Modus
                     "kdef": kdef,
                     "delta_0": delta_0
                 }
 
-            # Fallback: Alte Methode (Schnell-Modus)
+            # Schnell-Modus: GZG-Verläufe je Last (Vollast auf allen Feldern)
             logger.info(
-                "⚡ Schnell-Modus: Berechne Durchbiegungen aus GZG-Lastkombinationen")
+                "⚡ Schnell-Modus: Berechne Durchbiegungen aus den GZG-Verläufen je Last")
 
-            # Maßgebende GZG-Lastkombination aus Snapshot
+            # Maßgebende GZG-Lastkombination aus Snapshot (kdef)
             gzg_kombis = self.snapshot.get("GZG_Lastfallkombinationen", {})
-            if not gzg_kombis:
+            if not gzg_kombis or not isinstance(gzg_schnittgroessen, list) or not gzg_schnittgroessen:
                 logger.warning(
-                    "Keine GZG-Lastkombinationen für Durchbiegungsberechnung gefunden")
-                return {"delta_inst": 0, "delta_end": 0, "delta_netto": 0}
+                    "Keine GZG-Lastkombinationen oder -Verläufe für Durchbiegungsberechnung gefunden")
+                return ohne_durchbiegung()
 
             # Maßgebende GZG-Kombination finden
             massgebende_gzg = None
@@ -227,56 +358,22 @@ class MethodeNachweisEC5:
                     gzg_kombis.values(), key=lambda x: x.get("wert", 0))
 
             # Quasi-permanente Last und kdef
-            qd_gzg = massgebende_gzg.get("wert", 0)  # kN/m
+            qd_gzg = massgebende_gzg.get("wert", 0)  # kN/m = N/mm
             kdef = massgebende_gzg.get("kdef", 0.8)  # Aus Datenbank
 
-            # Querschnittswerte
-            querschnitt = self.snapshot.get("querschnitt", {})
-            I_y = querschnitt.get("I_y", 0) / 1e12  # mm⁴ → m⁴
-
-            if I_y <= 0:
-                logger.error("Ungültiges Flächenträgheitsmoment")
-                return {"delta_inst": 0, "delta_end": 0, "delta_netto": 0}
-
-            # Debug-Ausgaben für Durchbiegungsberechnung
-            logger.debug(f"Durchbiegung Debug: qd_gzg = {qd_gzg} kN/m")
-            logger.debug(f"Durchbiegung Debug: l = {l} mm")
-            logger.debug(f"Durchbiegung Debug: E_mean = {E_mean} N/mm²")
-            logger.debug(
-                f"Durchbiegung Debug: I_y = {I_y} m⁴ (original: {querschnitt.get('I_y', 0)} mm⁴)")
-            logger.debug(f"Durchbiegung Debug: kdef = {kdef}")
-
-            # EC5-Durchbiegungsberechnung für Gleichlast auf einfachem Balken
-            # δinst = (5 * q * L⁴) / (384 * E * I)
-            delta_inst = (5 * qd_gzg * 1000 * (l/1000)**4) / \
-                (384 * E_mean * 1e6 * I_y) * 1000  # mm
-
-            logger.debug(
-                f"Durchbiegung Debug: delta_inst berechnet = {delta_inst} mm")
-
-            # EC5 §2.2.3: w_fin = (1 + kdef) · w_inst
-            # NOTE: kdef alone would give only the creep increment (delta_end < delta_inst),
-            # which is physically impossible. The factor must include the instantaneous part.
-            delta_end = (1 + kdef) * delta_inst
-
-            # δnetto = δend - Δ₀ (Netto-Enddurchbiegung)
-            # Δ₀ = Anfangsüberhöhung (aus Gebrauchstauglichkeit)
-            gebrauchstauglichkeit = self.snapshot.get(
-                "gebrauchstauglichkeit", {})
-            delta_0 = gebrauchstauglichkeit.get("w_c", 0)  # Anfangsüberhöhung
-            delta_netto = delta_end - delta_0
-
-            logger.info(f"EC5-Durchbiegungen berechnet:")
+            # Betragsmaxima je Feld und Kragarm aus den Verläufen (wie im EC-Modus)
+            w_char, w_quasi = self.schnellmodus_durchbiegungen(
+                gzg_schnittgroessen, self.snapshot.get("lasten", []), self.db)
+            _, abschnitte = auswertungsstellen(
+                schnittgroessen, self.snapshot.get("spannweiten", {}), len(w_char))
+            namen = [a["feld"] for a in abschnitte]
+            inst = dict(zip(namen, feldmaxima(w_char, abschnitte).tolist()))
+            quasi = dict(zip(namen, feldmaxima(w_quasi, abschnitte).tolist()))
+            werte = {feld: (inst.get(feld, 0), quasi.get(feld, 0)) for feld in felder}
             logger.info(f"  - qd,GZG = {qd_gzg:.2f} kN/m, kdef = {kdef:.2f}")
-            logger.info(f"  - δinst = {delta_inst:.2f} mm")
-            logger.info(f"  - δend = {delta_end:.2f} mm")
-            logger.info(
-                f"  - δnetto = {delta_netto:.2f} mm (Δ₀ = {delta_0:.2f} mm)")
 
             return {
-                "delta_inst": delta_inst,
-                "delta_end": delta_end,
-                "delta_netto": delta_netto,
+                "felder": je_feld(werte, kdef, delta_0),
                 "qd_gzg": qd_gzg,
                 "kdef": kdef,
                 "delta_0": delta_0
@@ -284,7 +381,7 @@ class MethodeNachweisEC5:
 
         except Exception as e:
             logger.error(f"Fehler bei EC5-Durchbiegungsberechnung: {e}")
-            return {"delta_inst": 0, "delta_end": 0, "delta_netto": 0}
+            return ohne_durchbiegung()
 
     def _nachweis_biegung(self, max_med, b, h, fm_d, fm_k, kmod, gamma_m):
         """Biegungsnachweis nach EC5 - analog zur Lastenkombination"""
@@ -298,14 +395,13 @@ class MethodeNachweisEC5:
         eta = sigma_m_d / fm_d
         erfuellt = eta <= 1.0
 
-        # LaTeX-String direkt erstellen (analog zur Lastenkombination)
-        latex_str = (f"$\\sigma_{{m,d}} = \\frac{{M_{{Ed}}}}{{W_y}} = "
-                     f"\\frac{{{max_med/1000000:.1f}\\cdot{{10^6}}}}{{{w_y:.0f}}} = {sigma_m_d:.2f} \\,\\text{{N/mm²}} "
-                     f"\\leq {fm_d:.2f} \\,\\text{{N/mm²}} \\quad "
-                     f"\\eta = {eta:.2f} {'\\checkmark' if erfuellt else '\\times'}$")
+        # LaTeX aus vorkompilierter Vorlage, gerendert erst bei Bedarf
+        latex = NACHWEIS_BIEGUNG.formel(
+            m_ed=max_med / 1000000, w_y=w_y, sigma=sigma_m_d, f_d=fm_d, eta=eta,
+            zeichen=erfuellt_zeichen(erfuellt))
 
         return {
-            "latex": latex_str,
+            "latex": latex,
             "erfuellt": erfuellt,
             "ausnutzung": eta,
             "sigma_m_d": sigma_m_d,
@@ -322,14 +418,13 @@ class MethodeNachweisEC5:
         eta = tau_d / fv_d
         erfuellt = eta <= 1.0
 
-        # LaTeX-String direkt erstellen (analog zur Lastenkombination)
-        latex_str = (f"$\\tau_d = 1.5 \\cdot \\frac{{V_{{Ed}}}}{{b \\cdot h}} = "
-                     f"1.5 \\cdot \\frac{{{max_ved/1000:.1f}\\cdot{{10^3}}}}{{{b:.0f} \\cdot {h:.0f}}} = {tau_d:.0f} \\,\\text{{N/mm²}} "
-                     f"\\leq {fv_d:.2f} \\,\\text{{N/mm²}} \\quad "
-                     f"\\eta = {eta:.2f} {'\\checkmark' if erfuellt else '\\times'}$")
+        # LaTeX aus vorkompilierter Vorlage, gerendert erst bei Bedarf
+        latex = NACHWEIS_SCHUB.formel(
+            v_ed=max_ved / 1000, b=b, h=h, tau=tau_d, f_d=fv_d, eta=eta,
+            zeichen=erfuellt_zeichen(erfuellt))
 
         return {
-            "latex": latex_str,
+            "latex": latex,
             "erfuellt": erfuellt,
             "ausnutzung": eta,
             "tau_d": tau_d,
@@ -354,8 +449,9 @@ class MethodeNachweisEC5:
             }
         }
 
-    def _nachweis_durchbiegung(self, max_w, w_grenz, l, bezeichnung="Durchbiegung", symbol="w"):
-        """Durchbiegungsnachweis nach EC5 - analog zur Lastenkombination"""
+    def _nachweis_durchbiegung(self, max_w, w_grenz, l, bezeichnung="Durchbiegung", symbol="w",
+                               feld=None):
+        """Durchbiegungsnachweis nach EC5 - analog zur Lastenkombination (je Feld/Kragarm)"""
         # Ausnutzung
         eta = max_w / w_grenz
         erfuellt = eta <= 1.0
@@ -363,16 +459,17 @@ class MethodeNachweisEC5:
         # Grenzfaktor berechnen
         grenz_faktor = l / w_grenz if w_grenz > 0 else 0
 
-        # LaTeX-String direkt erstellen (analog zur Lastenkombination)
-        latex_str = (f"${symbol} = {max_w:.2f} \\,\\text{{mm}} \\leq "
-                     f"{symbol.replace(',max', '_{{grenz}}')} = \\frac{{L}}{{{grenz_faktor:.0f}}} = {w_grenz:.2f} \\,\\text{{mm}} \\quad "
-                     f"\\eta = {eta:.2f} {'\\checkmark' if erfuellt else '\\times'}$")
+        # LaTeX aus vorkompilierter Vorlage, gerendert erst bei Bedarf
+        latex = NACHWEIS_DURCHBIEGUNG.formel(
+            symbol=symbol, w=max_w, symbol_grenz=symbol.replace(',max', '_{{grenz}}'),
+            faktor=grenz_faktor, w_grenz=w_grenz, eta=eta, zeichen=erfuellt_zeichen(erfuellt))
 
         return {
-            "latex": latex_str,
+            "latex": latex,
             "erfuellt": erfuellt,
             "ausnutzung": eta,
             "w_max": max_w,
             "w_grenz": w_grenz,
-            "bezeichnung": bezeichnung
+            "bezeichnung": bezeichnung,
+            "feld": feld
         }
@@ -0,0 +1,333 @@
+"""
+querschnittsoptimierung.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Querschnittsoptimierung mit einer einzigen FE-Berechnung.
+
+Bei konstantem E·I hängen die Schnittgrößen eines Durchlaufträgers nicht von
+der Steifigkeit ab, die Durchbiegungen skalieren exakt mit 1/(E·I). Die
+FE-Berechnung (Schnell- oder EC-Modus) läuft daher einmal mit der
+Referenzsteifigkeit des Snapshots und ohne Eigenlast; danach werden alle
+Kandidaten (Breite × Höhe × Festigkeitsklasse) als Arrays nachgewiesen, mit
+denselben Formeln wie in MethodeNachweisEC5.
+
+Die Eigenlast eines Kandidaten ist eine Streckenlast auf allen Feldern und geht
+in jede Kombination mit γ_G (GZT) bzw. 1,0 (GZG) ein:
+- Schnell-Modus: Alle Verläufe haben die Form der Einheitslast, die
+  Schnittgrößen skalieren mit Ed der maßgebenden Kombination – exakt. Die
+  Durchbiegungen je Feld sind die Feldmaxima der GZG-Verläufe plus die der
+  Einheitslast (als zusätzlicher GZG-Lastfall berechnet).
+- EC-Modus: Das Betragsmaximum der Einheitslast (gecachte Einheitsantworten)
+  wird zu dem der Kombinationen addiert. Das ist eine obere Schranke, die
+  Nachweise liegen auf der sicheren Seite.
+
+Referenzberechnung und Nachweise je Kandidat stehen als Funktionen bereit;
+der Materialvergleich (materialvergleich.py) verwendet sie ebenfalls.
+"""
+import copy
+import logging
+
+import numpy as np
+
+from backend.calculations.aufloesung import auswertungsstellen, feldmaxima
+from backend.calculations.feebb_schnittstelle import FeebbBerechnung
+from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+from backend.calculations.kombinationsmatrix import GAMMA_G
+from backend.calculations.lastenkombination import MethodeLastkombi
+from backend.calculations.lastkombination_gzg import MethodeLastkombiGZG
+from backend.calculations.nachweis_ec5 import DURCHBIEGUNGSNACHWEISE, MethodeNachweisEC5
+
+logger = logging.getLogger(__name__)
+
+# Nachweise je Kandidat (Schlüssel wie in MethodeNachweisEC5)
+NACHWEISE = ("biegung", "schub", "durchbiegung_inst", "durchbiegung_fin",
+             "durchbiegung_net_fin")
+
+
+class MethodeQuerschnittsoptimierung:
+    """
+    Leichtester Querschnitt, der alle EC5-Nachweise erfüllt.
+
+    Materialgruppe, Typ und Nutzungsklasse stammen aus dem Snapshot-Querschnitt,
+    E und I_y aus dem Snapshot sind die Referenzsteifigkeit der FE-Berechnung.
+    """
+
+    def __init__(self, snapshot, db):
+        self.snapshot = snapshot
+        self.db = db
+
+    def compute(self, breiten, hoehen, festigkeitsklassen=None,
+                anzahl_varianten: int = 10) -> dict:
+        """
+        Weist alle Kandidaten nach und wählt den leichtesten erfüllten.
+
+        Args:
+            breiten (list[float]): Kandidatenbreiten b [mm]
+            hoehen (list[float]): Kandidatenhöhen h [mm]
+            festigkeitsklassen (list[str] | None): Klassen des Snapshot-Typs
+                (None: alle Klassen aus der Datenbank)
+            anzahl_varianten (int): Anzahl der zurückgegebenen erfüllten
+                Varianten (nach Eigenlast aufsteigend)
+
+        Returns:
+            dict: "Optimum" (Variante oder None), "Varianten", "Anzahl_Kandidaten",
+                "Anzahl_erfuellt"
+
+        Raises:
+            ValueError: keine Kandidaten, unbekannte Festigkeitsklasse oder
+                keine Schnittgrößen aus der Referenzberechnung
+        """
+        qs = self.snapshot["querschnitt"]
+        gruppe, typ, nkl = qs["materialgruppe"], qs["typ"], qs.get("nkl", 1)
+        klassen = list(festigkeitsklassen or self.db.get_festigkeitsklassen(gruppe, typ))
+        breiten = np.asarray(breiten, dtype=float)
+        hoehen = np.asarray(hoehen, dtype=float)
+        if not klassen or breiten.size == 0 or hoehen.size == 0:
+            raise ValueError("Keine Querschnittskandidaten angegeben")
+        if np.any(breiten <= 0) or np.any(hoehen <= 0):
+            raise ValueError("Breiten und Höhen müssen > 0 sein")
+
+        material = materialwerte(self.db, [(gruppe, typ, klasse, nkl) for klasse in klassen])
+        referenz = referenzberechnung(self.snapshot, self.db)
+
+        # Kandidaten: alle Kombinationen Klasse × b × h, als flache Arrays
+        k, b, h = (a.ravel() for a in np.meshgrid(
+            np.arange(len(klassen)), breiten, hoehen, indexing="ij"))
+        eigenlast = material["roh_mean"][k] * b * h / 1e9          # [N/mm] je Eigengewichts-Last
+        g_eigen = referenz["anzahl_eigengewicht"] * eigenlast
+
+        # Eigenlast geht mit γ_G in jede GZT- und mit 1,0 in die GZG-Kombination ein
+        einwirkungen = {
+            "ed": referenz["ed"][None, :] + GAMMA_G * g_eigen[:, None],
+            "kmod": np.broadcast_to(referenz["kmod"], (len(b), len(referenz["kmod"]))),
+            "gzg_wert": None if referenz["gzg_wert"] is None else referenz["gzg_wert"] + g_eigen,
+            "gzg_kdef": referenz["gzg_kdef"],
+        }
+        ausnutzung = ausnutzungen(
+            self.snapshot, referenz, b, h,
+            {name: werte[k] for name, werte in material.items()}, g_eigen, einwirkungen)
+
+        eta_max = np.max(np.column_stack([ausnutzung[n] for n in NACHWEISE]), axis=1)
+        erfuellt = np.flatnonzero(eta_max <= 1.0)
+        # Leichteste zuerst, bei gleicher Eigenlast die geringere Ausnutzung
+        reihenfolge = erfuellt[np.lexsort((eta_max[erfuellt], eigenlast[erfuellt]))]
+
+        varianten = [{
+            "festigkeitsklasse": klassen[k[i]],
+            "breite_qs": float(b[i]),
+            "hoehe_qs": float(h[i]),
+            "eigenlast": float(eigenlast[i]),                        # [kN/m] je Last
+            "ausnutzung": {n: float(ausnutzung[n][i]) for n in NACHWEISE},
+            "max_ausnutzung": float(eta_max[i]),
+            "massgebend": max(NACHWEISE, key=lambda n: ausnutzung[n][i]),
+        } for i in reihenfolge[:max(1, anzahl_varianten)]]
+
+        logger.info(f"📐 Querschnittsoptimierung: {len(erfuellt)} von {len(b)} Kandidaten erfüllt")
+        return {
+            "Optimum": varianten[0] if varianten else None,
+            "Varianten": varianten,
+            "Anzahl_Kandidaten": int(len(b)),
+            "Anzahl_erfuellt": int(len(erfuellt)),
+        }
+
+
+def materialwerte(db, varianten) -> dict:
+    """
+    Bemessungsdaten je Materialvariante als Arrays (Reihenfolge wie varianten).
+
+    Args:
+        varianten (list[tuple]): (materialgruppe, typ, festigkeitsklasse, nkl)
+
+    Raises:
+        ValueError: Festigkeitsklasse nicht in der Datenbank
+    """
+    daten = []
+    for gruppe, typ, klasse, nkl in varianten:
+        werte = db.get_bemessungsdaten(gruppe, typ, klasse, nkl)
+        if werte.get("fmyk") is None:
+            raise ValueError(f"Unbekannte Festigkeitsklasse '{klasse}' für {gruppe}/{typ}")
+        daten.append(werte)
+    return {name: np.array([float(d[name]) for d in daten])
+            for name in ("fmyk", "fvk", "E", "roh_mean", "gamma_m", "kdef")}
+
+
+def kombinationswerte(kombis: dict, gzg_kombis: dict) -> dict:
+    """
+    Ed und kmod je GZT-Kombination sowie Wert und kdef der maßgebenden
+    GZG-Kombination (None ohne GZG-Kombinationen).
+    """
+    gzg_massgebend = [k for k in gzg_kombis.values() if k.get("massgebend")]
+    gzg = gzg_massgebend[0] if gzg_massgebend else None
+    return {
+        "ed": np.array([k["Ed"] for k in kombis.values()]),
+        "kmod": np.array([k["kmod"] for k in kombis.values()]),
+        "gzg_wert": gzg["wert"] if gzg else None,
+        "gzg_kdef": gzg.get("kdef", 0.8) if gzg else 0.0,
+    }
+
+
+def massgebende_kombination(ed, kmod) -> np.ndarray:
+    """Index der GZT-Kombination mit dem größten Ed/kmod je Kandidat (Zeile)."""
+    return np.argmax(np.nan_to_num(ed / kmod, nan=-np.inf), axis=1)
+
+
+def referenzberechnung(snapshot, db) -> dict:
+    """
+    Lastkombinationen und FE-Berechnung des Snapshots ohne Eigenlast.
+
+    Returns:
+        dict: Schnittgrößen, Kombinationswerte (siehe kombinationswerte()),
+            Anzahl der Eigengewichts-Lasten, Durchbiegungen je Feld
+            ("inst", "quasi") und Betragsmaxima der Einheits-Streckenlast
+            (EC-Modus; Durchbiegung je Feld in beiden Modi)
+
+    Raises:
+        ValueError: keine Schnittgrößen aus der FE-Berechnung
+    """
+    snapshot = copy.deepcopy(snapshot)
+    anzahl_eigengewicht = 0
+    for last in snapshot.get("lasten", []):
+        if last.get("lastfall", "").lower() == "g" and last.get("eigengewicht") == True:
+            anzahl_eigengewicht += 1
+        last["eigengewicht"] = False
+
+    kombis = MethodeLastkombi(snapshot, db).compute()["Lastfallkombinationen"]
+    snapshot["Lastfallkombinationen"] = kombis
+    gzg_kombis = MethodeLastkombiGZG(snapshot, db).compute()["GZG_Lastfallkombinationen"]
+
+    ec_modus = snapshot.get("berechnungsmodus", {}).get("ec_modus", False)
+    if ec_modus:
+        feb = FeebbBerechnungEC(snapshot, db)
+        schnittgroessen = feb.compute(maxima_only=True).get("Schnittgroessen")
+        verlaeufe = feb.vollast_einheitsverlaeufe()
+        einheit = {groesse: float(np.abs(kurve).max()) for groesse, kurve in verlaeufe.items()}
+        # Durchbiegung der Einheitslast je Feld/Kragarm für die feldweisen Nachweise
+        einheit["durchbiegung_felder"] = dict(zip(
+            [a["feld"] for a in feb.abschnitte()],
+            feldmaxima(verlaeufe["durchbiegung"], feb.abschnitte()).tolist()))
+        gzg_max = (schnittgroessen or {}).get("GZG", {}).get("max", {})
+        durchbiegung_felder = {
+            "inst": gzg_max.get("durchbiegung_felder", {}),
+            "quasi": gzg_max.get("durchbiegung_quasi_felder", gzg_max.get("durchbiegung_felder", {})),
+        }
+    else:
+        # Einheits-Streckenlast als zusätzlicher GZG-Lastfall (gleiche Faktorisierung)
+        lasten = snapshot.get("lasten", [])
+        lasten.append({"lastfall": "g", "wert": 1.0 / float(snapshot["sprungmass"]),
+                       "kommentar": "Einheitslast"})
+        schnittgroessen = FeebbBerechnung(snapshot, db).compute().get("Schnittgroessen")
+        lasten.pop()
+        einheit, durchbiegung_felder = None, {}
+        if schnittgroessen and schnittgroessen.get("GZT") and schnittgroessen.get("GZG"):
+            gzg = schnittgroessen["GZG"]
+            w_einheit = np.asarray(gzg.pop()["durchbiegung"], dtype=float)
+            w_char, w_quasi = MethodeNachweisEC5.schnellmodus_durchbiegungen(gzg, lasten, db)
+            _, abschnitte = auswertungsstellen(
+                schnittgroessen, snapshot.get("spannweiten", {}), len(w_einheit))
+            namen = [a["feld"] for a in abschnitte]
+            # Durchbiegungen je Feld/Kragarm: Lastfälle (charakteristisch,
+            # quasi-ständig) und Einheitslast für die feldweisen Nachweise
+            einheit = {"durchbiegung_felder": dict(zip(
+                namen, feldmaxima(w_einheit, abschnitte).tolist()))}
+            durchbiegung_felder = {
+                "inst": dict(zip(namen, feldmaxima(w_char, abschnitte).tolist())),
+                "quasi": dict(zip(namen, feldmaxima(w_quasi, abschnitte).tolist())),
+            }
+    if not schnittgroessen or not schnittgroessen.get("GZT"):
+        raise ValueError("Referenzberechnung lieferte keine Schnittgrößen")
+
+    massgebend = [k for k in kombis.values() if k.get("massgebend")]
+    return {
+        "ec_modus": ec_modus,
+        "anzahl_eigengewicht": anzahl_eigengewicht,
+        "schnittgroessen": schnittgroessen,
+        "einheit": einheit,
+        "durchbiegung_felder": durchbiegung_felder,
+        "ed_massgebend": massgebend[0]["Ed"] if massgebend else 0.0,
+        **kombinationswerte(kombis, gzg_kombis),
+    }
+
+
+def ausnutzungen(snapshot, referenz, b, h, material, g_eigen, einwirkungen) -> dict:
+    """
+    Ausnutzungen aller Kandidaten (Formeln wie MethodeNachweisEC5).
+
+    Args:
+        snapshot (dict): Snapshot der Referenzberechnung (Steifigkeit, Grenzwerte)
+        referenz (dict): Ergebnis von referenzberechnung()
+        b, h (np.ndarray): Querschnittsabmessungen je Kandidat [mm]
+        material (dict): Bemessungsdaten je Kandidat (Arrays)
+        g_eigen (np.ndarray): Eigenlast je Kandidat [N/mm]
+        einwirkungen (dict): "ed", "kmod" (Kandidaten × GZT-Kombinationen),
+            "gzg_wert", "gzg_kdef" der maßgebenden GZG-Kombination je
+            Kandidat (gzg_wert None ohne GZG-Kombinationen)
+
+    Returns:
+        dict: Nachweisname → Ausnutzung je Kandidat
+    """
+    gzt_max = referenz["schnittgroessen"]["GZT"]["max"]
+
+    # Maßgebende GZT-Kombination je Kandidat (höchstes Ed/kmod) → kmod;
+    # Kombinationen ohne kmod (NaN) werden wie in MethodeLastkombi übergangen
+    ed = einwirkungen["ed"]
+    i_massgebend = massgebende_kombination(ed, einwirkungen["kmod"])
+    zeilen = np.arange(len(b))
+    kmod = einwirkungen["kmod"][zeilen, i_massgebend]
+
+    if referenz["ec_modus"]:
+        # Envelope-Maxima plus Betragsmaximum der Eigenlast (obere Schranke)
+        einheit = referenz["einheit"]
+        moment = gzt_max["moment"] + GAMMA_G * g_eigen * einheit["moment"]
+        querkraft = gzt_max["querkraft"] + GAMMA_G * g_eigen * einheit["querkraft"]
+    else:
+        # Vollast: Verläufe = Ed der maßgebenden Kombination · Einheitsverlauf
+        if referenz["ed_massgebend"] <= 0:
+            raise ValueError("Referenzberechnung ohne maßgebende Lastkombination")
+        faktor = ed[zeilen, i_massgebend] / referenz["ed_massgebend"]
+        moment = gzt_max["moment"] * faktor
+        querkraft = gzt_max["querkraft"] * faktor
+
+    fm_d = kmod * material["fmyk"] / material["gamma_m"]
+    fv_d = kmod * material["fvk"] / material["gamma_m"]
+    ausnutzung = {
+        "biegung": moment / (b * h**2 / 6) / fm_d,
+        "schub": 1.5 * querkraft / (b * h) / fv_d,
+    }
+
+    # Durchbiegungen [mm] je Feld und Kragarm, Grenzwerte mit l bzw. 2·l_k;
+    # maßgebend je Nachweis das Feld mit der größten Ausnutzung
+    E, I = material["E"], b * h**3 / 12
+    felder = MethodeNachweisEC5.durchbiegungsfelder(snapshot.get("spannweiten", {}))
+    grenz = snapshot.get("gebrauchstauglichkeit", {})
+    w_c = grenz.get("w_c", 0)
+    qs = snapshot["querschnitt"]
+    skalierung = float(qs["E"]) * float(qs["I_y"]) / (E * I)
+    inst = referenz["durchbiegung_felder"].get("inst", {})
+    quasi = referenz["durchbiegung_felder"].get("quasi", inst)
+    if referenz["ec_modus"]:
+        kdef = material["kdef"]
+    elif einwirkungen["gzg_wert"] is not None:
+        kdef = einwirkungen["gzg_kdef"]
+    else:
+        kdef = 0.0
+    w_einheit = (referenz["einheit"] or {}).get("durchbiegung_felder", {})
+
+    for name in DURCHBIEGUNGSNACHWEISE:
+        ausnutzung[name] = np.full(len(b), -np.inf)
+    for feld, daten in felder.items():
+        if referenz["ec_modus"] or einwirkungen["gzg_wert"] is not None:
+            # Referenz-Feldmaxima plus Eigenlast, skaliert mit E_ref·I_ref/(E·I)
+            w_inst = (inst.get(feld, 0.0) + g_eigen * w_einheit.get(feld, 0.0)) * skalierung
+            w_quasi = (quasi.get(feld, inst.get(feld, 0.0))
+                       + g_eigen * w_einheit.get(feld, 0.0)) * skalierung
+        else:
+            w_inst = w_quasi = np.zeros(len(b))
+        w_end = (1 + kdef) * w_quasi
+
+        l = daten["bezugslaenge"]
+        for name, eta in (
+                ("durchbiegung_inst", w_inst / (l / grenz.get("w_inst_grenz"))),
+                ("durchbiegung_fin", w_end / (l / grenz.get("w_fin_grenz"))),
+                ("durchbiegung_net_fin", (w_end - w_c) / (l / grenz.get("w_net_fin_grenz")))):
+            ausnutzung[name] = np.maximum(ausnutzung[name], eta)
+    return ausnutzung
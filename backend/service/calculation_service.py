@@ -6,6 +6,9 @@ from backend.database.datenbank_holz import datenbank_holz_class
 from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
 from backend.calculations.feebb_schnittstelle import FeebbBerechnung
 from backend.calculations.nachweis_ec5 import MethodeNachweisEC5
+from backend.calculations.querschnittsoptimierung import MethodeQuerschnittsoptimierung
+from backend.calculations.materialvergleich import MethodeMaterialvergleich
+from backend.service.result_cache_service import store_result, get_result
 
 # Logger für dieses Modul
 logger = logging.getLogger(__name__)
@@ -34,6 +37,9 @@ def add_section_forces(snapshot: dict) -> dict:
     
     Übergabe kompletter Snapshots und Rückgabe
     der Schnittgrößen (inkl. Envelopes und Details).
+
+    Im EC-Modus wird das Berechnungsobjekt zwischengespeichert; das Handle
+    ('Ergebnis_Handle') erlaubt später das Nachladen der LaTeX-Formeln.
     """
     try:
         # Berechnungsmodus aus Snapshot lesen (default: Schnell-Modus)
@@ -42,12 +48,16 @@ def add_section_forces(snapshot: dict) -> dict:
         if ec_modus:
             logger.info("🔬 EC-konforme FEEBB-Berechnung gestartet (mit Belastungsmustern)")
             # EC-konforme FE-Berechnung mit Datenbankparametern
+            # maxima_only: nur Bemessungswerte, keine Verläufe (Screening/Batch)
+            maxima_only = snapshot.get('berechnungsmodus', {}).get('maxima_only', False)
             feb = FeebbBerechnungEC(snapshot, db)
-            return feb.compute()
+            result = feb.compute(maxima_only=maxima_only)
+            result['Ergebnis_Handle'] = store_result(feb)
+            return result
         else:
             logger.info("⚡ Schnelle Vollast-FEEBB-Berechnung gestartet")
             # Alte schnelle Berechnung (alle Felder belastet)
-            feb = FeebbBerechnung(snapshot)
+            feb = FeebbBerechnung(snapshot, db)
             return feb.compute()
             
     except Exception as e:
@@ -55,6 +65,32 @@ def add_section_forces(snapshot: dict) -> dict:
         return {'Schnittgroessen': {}}
 
 
+def get_latex_formulas(handle: str):
+    """
+    LaTeX-Formeln einer zwischengespeicherten Berechnung (lazy erzeugt): EC-
+    Berechnung (Ergebnis_Handle) oder zurückgestellte Formeln (Latex_Handle).
+    Gibt None zurück, wenn das Handle unbekannt oder bereits verdrängt ist.
+    """
+    feb = get_result(handle)
+    if feb is None:
+        return None
+    return feb.latex_formeln()
+
+
+def get_combination_curves(handle: str, grenzzustand: str, ergebnis_id: int):
+    """
+    Verläufe eines einzelnen Kombinationsergebnisses einer zwischengespeicherten
+    EC-Berechnung. Gibt None zurück, wenn Handle oder id unbekannt sind.
+    """
+    feb = get_result(handle)
+    if feb is None:
+        return None
+    try:
+        return feb.kombinationsverlauf(grenzzustand, ergebnis_id)
+    except KeyError:
+        return None
+
+
 def add_gzg_load_combinations(snapshot: dict) -> dict:
     """Wrapper für GZG-Lastkombinationen (quasi-permanent)"""
     try:
@@ -75,3 +111,24 @@ def add_ec5_verification(snapshot: dict) -> dict:
     # Erstelle MethodeNachweisEC5 mit Snapshot und globaler DB-Instanz
     ec5 = MethodeNachweisEC5(snapshot, db)
     return ec5.compute()
+
+
+def optimize_cross_section(snapshot: dict, breiten, hoehen,
+                           festigkeitsklassen=None, anzahl_varianten: int = 10) -> dict:
+    """
+    Wrapper für die Querschnittsoptimierung.
+    Eine FE-Berechnung mit der Referenzsteifigkeit des Snapshots, danach
+    werden alle Kandidaten (b × h × Festigkeitsklasse) analytisch nachgewiesen.
+    """
+    optimierung = MethodeQuerschnittsoptimierung(snapshot, db)
+    return optimierung.compute(breiten, hoehen, festigkeitsklassen, anzahl_varianten)
+
+
+def compare_materials(snapshot: dict, varianten: list[dict]) -> dict:
+    """
+    Wrapper für den Materialvergleich.
+    Eine FE-Berechnung für den Snapshot-Querschnitt, danach Ausnutzungs-
+    tabelle aller Materialvarianten (Gruppe, Typ, Festigkeitsklasse, NKL).
+    """
+    vergleich = MethodeMaterialvergleich(snapshot, db)
+    return vergleich.compute(varianten)
@@ -1,10 +1,18 @@
 from backend.service.memory_service import save_snapshot
 from backend.service.validation_service import validate_input
 from backend.service.calculation_service import add_load_cases, add_section_forces, add_gzg_load_combinations, add_ec5_verification
+from backend.service.result_cache_service import store_result
 import json
 import hashlib
 import threading
 import time
+import traceback
+
+from backend.calculations.kombinationsmatrix import lastart, LASTART_STRECKE
+from backend.calculations.latex_vorlagen import LatexFormeln, rendere, ohne_formeln, formeln
+
+# Ergebnisteile mit LaTeX-Formeln (aufgeschoben bis _latex_ausgabe)
+LATEX_TEILE = ('Lastfallkombinationen', 'GZG_Lastfallkombinationen', 'EC5_Nachweise')
 
 
 class OrchestratorService:
@@ -83,31 +91,14 @@ class OrchestratorService:
                         'Schnittgroessen': snapshot.get('Schnittgroessen', {}),
                         'EC5_Nachweise': ec5_result
                     }
+                    result = self._latex_ausgabe(snapshot, result)
                 else:
                     # Vollständige Berechnung (Standard)
                     print("🚀 Orchestrator: Vollständige Berechnung")
-                    
-                    # Berechnung ausführen
-                    kombi_result = add_load_cases(snapshot)
-                    snapshot['Lastfallkombinationen'] = kombi_result['Lastfallkombinationen']
-
-                    # GZG-Lastkombinationen für Durchbiegungsnachweise
-                    gzg_result = add_gzg_load_combinations(snapshot)
-                    snapshot['GZG_Lastfallkombinationen'] = gzg_result['GZG_Lastfallkombinationen']
-
-                    feebb_result = add_section_forces(snapshot)
-                    snapshot['Schnittgroessen'] = feebb_result['Schnittgroessen']
-
-                    ec5_result = add_ec5_verification(snapshot)
-                    snapshot['EC5_Nachweise'] = ec5_result
-
-                    result = {
-                        'Lastfallkombinationen': kombi_result['Lastfallkombinationen'],
-                        'GZG_Lastfallkombinationen': gzg_result['GZG_Lastfallkombinationen'],
-                        'Schnittgroessen': feebb_result['Schnittgroessen'],
-                        'EC5_Nachweise': ec5_result,
-                        'Auflagerkraefte': feebb_result.get('Auflagerkraefte'),
-                    }
+                    kombi_result, gzg_result = self._berechne_lastkombinationen(snapshot)
+                    result = self._berechne_schnittgroessen_und_nachweise(
+                        snapshot, kombi_result, gzg_result)
+                    result = self._latex_ausgabe(snapshot, result)
                 # Debug-Ausgabe vor Callback
                 # print(
                 #     f"🚀 Orchestrator: Rufe Callback auf mit result keys: {list(result.keys())}")
@@ -130,3 +121,109 @@ class OrchestratorService:
                 self._running = False
 
         threading.Thread(target=worker, daemon=True).start()
+
+    def process_snapshot_progressive(self, snapshot: dict, callback):
+        """
+        Progressive Berechnung: zuerst das Ergebnis des Schnell-Modus (Vollast)
+        mit EC5-Nachweisen, danach die EC-Umhüllende mit Belastungsmustern.
+
+        Anders als process_snapshot ohne Debounce und Hash-Vergleich – jeder
+        Aufruf rechnet (zustandslose HTTP-Anfragen). callback wird je Stufe
+        aufgerufen mit stufe ("schnell" | "ec"), result, errors und final;
+        nach final=True folgt kein weiterer Aufruf.
+
+        Ohne EC-Modus ist die Schnell-Stufe bereits das Endergebnis. Mit
+        Einzel- oder Teilstreckenlasten, die nur der EC-Modus abbildet,
+        entfällt sie.
+        """
+        errors = validate_input(snapshot)
+        if errors:
+            callback(stufe=None, result=None, errors=errors, final=True)
+            return
+
+        modus = snapshot.get('berechnungsmodus', {})
+        ec_modus = modus.get('ec_modus', False)
+        nur_strecken = all(lastart(last) == LASTART_STRECKE for last in snapshot.get('lasten', []))
+
+        def worker():
+            stufe = None
+            try:
+                kombi_result, gzg_result = self._berechne_lastkombinationen(snapshot)
+
+                if not ec_modus or nur_strecken:
+                    stufe = 'schnell'
+                    schnell = dict(snapshot, berechnungsmodus=dict(modus, ec_modus=False))
+                    result = self._latex_ausgabe(snapshot, self._berechne_schnittgroessen_und_nachweise(
+                        schnell, kombi_result, gzg_result))
+                    callback(stufe=stufe, result=result, errors=None, final=not ec_modus)
+                    print("⚡ Orchestrator: Schnell-Ergebnis übergeben")
+
+                if ec_modus:
+                    stufe = 'ec'
+                    result = self._latex_ausgabe(snapshot, self._berechne_schnittgroessen_und_nachweise(
+                        snapshot, kombi_result, gzg_result))
+                    callback(stufe=stufe, result=result, errors=None, final=True)
+                    print("✅ Orchestrator: EC-Ergebnis übergeben")
+            except Exception as e:
+                print(f"❌ Orchestrator Exception ({stufe}): {e}")
+                print(f"❌ Traceback: {traceback.format_exc()}")
+                callback(stufe=stufe, result=None, errors=[str(e)], final=True)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    @staticmethod
+    def _berechne_lastkombinationen(snapshot: dict):
+        """GZT- und GZG-Lastkombinationen; beide werden in den Snapshot übernommen."""
+        kombi_result = add_load_cases(snapshot)
+        snapshot['Lastfallkombinationen'] = kombi_result['Lastfallkombinationen']
+
+        # GZG-Lastkombinationen für Durchbiegungsnachweise
+        gzg_result = add_gzg_load_combinations(snapshot)
+        snapshot['GZG_Lastfallkombinationen'] = gzg_result['GZG_Lastfallkombinationen']
+        return kombi_result, gzg_result
+
+    @staticmethod
+    def _latex_ausgabe(snapshot: dict, result: dict) -> dict:
+        """
+        LaTeX-Formeln des Ergebnisses rendern oder zurückstellen.
+
+        Die Berechnungsmodule liefern aufgeschobene Formeln (LatexFormel). Mit
+        berechnungsmodus.latex (Standard) werden sie hier als Text eingesetzt;
+        ohne entfallen sie im Ergebnis (Live-Eingabe) und sind über
+        'Latex_Handle' nachträglich abrufbar.
+        """
+        result = dict(result)
+        if snapshot.get('berechnungsmodus', {}).get('latex', True):
+            for teil in LATEX_TEILE:
+                result[teil] = rendere(result.get(teil))
+            return result
+
+        zurueckgestellt = {teil: formeln(result.get(teil)) for teil in LATEX_TEILE}
+        for teil in LATEX_TEILE:
+            result[teil] = ohne_formeln(result.get(teil))
+        result['Latex_Handle'] = store_result(LatexFormeln(zurueckgestellt))
+        return result
+
+    @staticmethod
+    def _berechne_schnittgroessen_und_nachweise(snapshot: dict, kombi_result: dict,
+                                                gzg_result: dict) -> dict:
+        """Schnittgrößen (Modus laut Snapshot) und EC5-Nachweise, als Ergebnis-Dict."""
+        feebb_result = add_section_forces(snapshot)
+        snapshot['Schnittgroessen'] = feebb_result['Schnittgroessen']
+
+        ec5_result = add_ec5_verification(snapshot)
+        snapshot['EC5_Nachweise'] = ec5_result
+
+        return {
+            'Lastfallkombinationen': kombi_result['Lastfallkombinationen'],
+            'GZG_Lastfallkombinationen': gzg_result['GZG_Lastfallkombinationen'],
+            'Schnittgroessen': feebb_result['Schnittgroessen'],
+            'EC5_Nachweise': ec5_result,
+            'Auflagerkraefte': feebb_result.get('Auflagerkraefte'),
+            'Ergebnis_Handle': feebb_result.get('Ergebnis_Handle'),
+            # Kompakte Kombinationsergebnisse (nur EC-Modus; Verläufe per Handle)
+            'Kombinationsergebnisse': {
+                'Einzelergebnisse': feebb_result['Einzelergebnisse'],
+                'Detaillierte_Kombinationen': feebb_result['Detaillierte_Kombinationen'],
+            } if 'Einzelergebnisse' in feebb_result else None,
+        }
@@ -0,0 +1,60 @@
+# backend/service/result_cache_service.py
+"""
+Prozessweiter Zwischenspeicher für Berechnungsobjekte.
+
+Teure Zusatzausgaben (z.B. LaTeX-Formeln der EC-Berechnung) werden nicht mehr
+bei jeder Berechnung erzeugt, sondern erst auf Anfrage. Dazu wird das
+Berechnungsobjekt unter einem Handle abgelegt, das mit dem Ergebnis an den
+Client geht. Der Speicher ist begrenzt (LRU), alte Einträge fallen heraus.
+"""
+import threading
+import uuid
+from collections import OrderedDict
+
+# Anzahl gleichzeitig gehaltener Berechnungen (Live-Edit erzeugt viele,
+# die Detailansicht braucht aber nur die jüngsten)
+MAX_EINTRAEGE = 8
+
+
+class ErgebnisCache:
+    """Threadsicherer LRU-Speicher: Handle (str) -> Berechnungsobjekt."""
+
+    def __init__(self, max_eintraege: int = MAX_EINTRAEGE):
+        self.max_eintraege = max_eintraege
+        self._eintraege = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ablegen(self, objekt) -> str:
+        """Legt ein Objekt ab und gibt das neue Handle zurück."""
+        handle = uuid.uuid4().hex
+        with self._lock:
+            self._eintraege[handle] = objekt
+            while len(self._eintraege) > self.max_eintraege:
+                self._eintraege.popitem(last=False)
+        return handle
+
+    def holen(self, handle: str):
+        """Liefert das Objekt zum Handle oder None (unbekannt/verdrängt)."""
+        with self._lock:
+            objekt = self._eintraege.get(handle)
+            if objekt is not None:
+                self._eintraege.move_to_end(handle)
+            return objekt
+
+    def __len__(self):
+        with self._lock:
+            return len(self._eintraege)
+
+
+# Globale Instanz (wie die DB-Instanz im calculation_service)
+_cache = ErgebnisCache()
+
+
+def store_result(objekt) -> str:
+    """Legt ein Berechnungsobjekt im globalen Cache ab."""
+    return _cache.ablegen(objekt)
+
+
+def get_result(handle: str):
+    """Holt ein Berechnungsobjekt aus dem globalen Cache (None wenn unbekannt)."""
+    return _cache.holen(handle)
@@ -1,5 +1,10 @@
 from typing import List, Dict
 
+from backend.calculations.aufloesung import (
+    ist_gueltige_aufloesung, AUFLOESUNGEN, MIN_ZIELPUNKTE, MAX_ZIELPUNKTE)
+from backend.calculations.kombinationsmatrix import (
+    lastart, LASTARTEN, LASTART_STRECKE, LASTART_EINZEL)
+
 
 def validate_input(snapshot: Dict) -> List[str]:
     """
@@ -28,6 +33,41 @@ def validate_input(snapshot: Dict) -> List[str]:
             except (TypeError, ValueError):
                 errors.append(f"Wert für Lastfall {i} ist ungültig.")
 
+    # Prüfe Lastart und Lage von Einzel-/Teilstreckenlasten
+    ec_modus = snapshot.get("berechnungsmodus", {}).get("ec_modus", False)
+    try:
+        gesamtlaenge = sum(float(l) for l in snapshot.get("spannweiten", {}).values())
+    except (TypeError, ValueError):
+        gesamtlaenge = None
+    for i, lf in enumerate(snapshot.get("lasten", []), start=1):
+        art = lastart(lf)
+        if art not in LASTARTEN:
+            errors.append(f"Lastart für Lastfall {i} ist ungültig.")
+            continue
+        if art == LASTART_STRECKE:
+            continue
+        if not ec_modus:
+            errors.append(
+                f"Einzel- und Teilstreckenlasten sind nur im EC-Modus möglich (Lastfall {i}).")
+            continue
+        schluessel = ("position",) if art == LASTART_EINZEL else ("von", "bis")
+        try:
+            lage = [float(lf[k]) for k in schluessel]
+        except (KeyError, TypeError, ValueError):
+            errors.append(f"Lage der Last in Lastfall {i} fehlt oder ist ungültig.")
+            continue
+        if gesamtlaenge is not None and any(x < 0 or x > gesamtlaenge for x in lage):
+            errors.append(f"Last in Lastfall {i} liegt außerhalb des Trägers.")
+        elif art != LASTART_EINZEL and lage[0] >= lage[1]:
+            errors.append(f"Teilstreckenlast in Lastfall {i}: 'von' muss kleiner als 'bis' sein.")
+
+    # Prüfe Auflösung (Qualitätsstufe oder Zielanzahl Auswertungspunkte)
+    aufloesung = snapshot.get("berechnungsmodus", {}).get("aufloesung")
+    if aufloesung is not None and not ist_gueltige_aufloesung(aufloesung):
+        errors.append(
+            f"Auflösung ist ungültig: erlaubt sind {', '.join(AUFLOESUNGEN)} oder "
+            f"eine Punktanzahl von {MIN_ZIELPUNKTE} bis {MAX_ZIELPUNKTE}.")
+
     # # Prüfe Querschnitt
     # qs = snapshot.get("querschnitt")
     # if not qs or not qs.get("E"):
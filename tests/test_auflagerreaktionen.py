@@ -0,0 +1,106 @@
+"""
+Tests for the support reaction engine (R = K·u − F on the constrained DOFs).
+
+The reactions must be exact for uniformly distributed loads – independent of
+the number of evaluation points – and must expose uplift as negative minima.
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pytest
+from backend.calculations.feebb import Element, Beam
+from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+
+
+def _snapshot(spannweiten, lasten):
+    return {
+        "querschnitt": {"E": 11_000, "I_y": 138_240_000},
+        "spannweiten": spannweiten,
+        "sprungmass": 1.0,
+        "lasten": lasten,
+    }
+
+
+G_7 = {"lastfall": "g", "wert": "7.0", "kommentar": "Eigengewicht"}
+Q_2 = {"lastfall": "p", "wert": "2.0", "kommentar": "Nutzlast"}
+
+
+def _run(snapshot):
+    calc = FeebbBerechnungEC(snapshot, db=None)
+    calc._extrahiere_systemdaten()
+    calc._generiere_lastkombinationen()
+    calc._berechne_alle_kombinationen()
+    return calc, calc._berechne_auflagerkraefte()
+
+
+class TestBeamReactions:
+
+    def test_reactions_balance_total_load(self):
+        """Sum of reactions equals the applied UDL, for one and many columns."""
+        elements = [Element({"length": 250, "youngs_mod": 11_000,
+                             "moment_of_inertia": 1e8,
+                             "loads": [{"type": "udl", "magnitude": 3.0}]})
+                    for _ in range(16)]
+        supports = [0] * 34
+        supports[0] = supports[16] = supports[32] = -1
+        beam = Beam(elements, supports)
+
+        R = beam.reactions()
+        assert R.shape == (3,)
+        assert R.sum() == pytest.approx(3.0 * 4000, rel=1e-9)
+
+        X = np.column_stack([beam.displacement, 2 * beam.displacement])
+        F = np.column_stack([beam.reaction_load, 2 * beam.reaction_load])
+        np.testing.assert_allclose(beam.reactions(X, F)[:, 1], 2 * R, rtol=1e-12)
+
+
+class TestEcReactionEngine:
+
+    def test_two_equal_spans_match_analytic_values(self):
+        """G only, two spans L: R_A = R_C = 3/8·wL, R_B = 10/8·wL (GZT with γ_G)."""
+        calc, reak = _run(_snapshot({"feld_1": 5.0, "feld_2": 5.0}, [G_7]))
+        wL = 7.0 * 5000
+
+        assert reak["labels"] == ["A", "B", "C"]
+        assert reak["x_positionen"] == [0.0, 5.0, 10.0]
+        np.testing.assert_allclose(
+            reak["gzt_design"], np.array([3, 10, 3]) / 8 * wL * calc.gamma_g, rtol=1e-8)
+        np.testing.assert_allclose(
+            reak["gzg_charakteristisch"], np.array([3, 10, 3]) / 8 * wL, rtol=1e-8)
+
+    def test_governing_ids_point_to_results(self):
+        """Governing ids reference results whose reactions equal the envelope value."""
+        calc, reak = _run(_snapshot({"feld_1": 5.0, "feld_2": 4.0}, [G_7, Q_2]))
+        R = calc._berechne_reaktionsmatrix()
+
+        for k, erg_id in enumerate(reak["gzt_design_id"]):
+            assert calc.ergebnisse_gzt[erg_id]["id"] == erg_id
+            assert R[k, erg_id] == pytest.approx(reak["gzt_design"][k])
+        assert all(lo <= hi for lo, hi in zip(reak["gzt_min"], reak["gzt_design"]))
+
+    def test_long_cantilever_produces_uplift(self):
+        """Cantilever longer than the back span lifts the end support (min < 0)."""
+        _, reak = _run(_snapshot({"feld_1": 4.0, "kragarm_rechts": 5.0}, [G_7]))
+
+        # R_A = w·(L² − a²) / (2L) < 0 for a > L
+        expected = 7.0 * (4000**2 - 5000**2) / (2 * 4000)
+        assert reak["gzg_charakteristisch_min"][0] == pytest.approx(expected, rel=1e-8)
+        assert reak["gzt_min"][0] < 0
+
+
+class TestSchnellmodusReactions:
+
+    def test_two_equal_spans_match_analytic_values(self):
+        from backend.calculations.feebb_schnittstelle import FeebbBerechnung
+        snapshot = _snapshot({"feld_1": 4.0, "feld_2": 4.0}, [G_7, Q_2])
+        snapshot["Lastfallkombinationen"] = {"LK 1": {"Ed": 12.45, "massgebend": True}}
+
+        reaktionen = FeebbBerechnung(snapshot).compute()["Auflagerkraefte"]
+
+        L = 4000.0
+        faktoren = np.array([3 / 8, 10 / 8, 3 / 8]) * L
+        assert reaktionen["labels"] == ["A", "B", "C"]
+        assert reaktionen["x_positionen"] == [0.0, 4.0, 8.0]
+        np.testing.assert_allclose(reaktionen["gzt_design"], 12.45 * faktoren, rtol=1e-9)
+        np.testing.assert_allclose(reaktionen["gzg_charakteristisch"], 9.0 * faktoren, rtol=1e-9)
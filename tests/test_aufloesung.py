@@ -0,0 +1,102 @@
+"""
+Tests for the resolution setting (berechnungsmodus.aufloesung).
+
+Moment and shear are exact inside the elements, so the presets only change
+how densely the curves are sampled: the governing values agree across
+presets in both engines, and an explicit point count yields about that many
+evaluation points.
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import copy
+import pytest
+import backend.calculations.feebb_schnittstelle_ec as modul
+from backend.calculations.aufloesung import diskretisierung, MIN_PUNKTE_JE_ELEMENT
+from backend.calculations.feebb_schnittstelle import FeebbBerechnung
+from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+from backend.service.validation_service import validate_input
+
+
+SNAPSHOT = {
+    "querschnitt": {"E": 11_000, "I_y": 138_240_000},
+    "spannweiten": {"feld_1": 4.0, "feld_2": 5.0, "kragarm_rechts": 1.2},
+    "sprungmass": 1.0,
+    "lasten": [
+        {"lastfall": "g", "wert": "3.0", "kommentar": "Eigengewicht"},
+        {"lastfall": "p", "wert": "2.0", "kommentar": "Nutzlast"},
+    ],
+    "berechnungsmodus": {"ec_modus": True},
+}
+
+GROESSEN = ("moment", "querkraft", "durchbiegung")
+
+
+@pytest.fixture(autouse=True)
+def leerer_cache(monkeypatch):
+    monkeypatch.setattr(modul, "_geometrie_cache", modul.OrderedDict())
+    monkeypatch.setattr(modul, "_einheitsantworten_cache", modul.OrderedDict())
+    monkeypatch.setattr(modul, "_lastbausteine_cache", modul.OrderedDict())
+
+
+def _mit_aufloesung(aufloesung, schnellmodus=False):
+    snapshot = copy.deepcopy(SNAPSHOT)
+    snapshot["berechnungsmodus"]["aufloesung"] = aufloesung
+    if schnellmodus:
+        snapshot["berechnungsmodus"]["ec_modus"] = False
+        snapshot["Lastfallkombinationen"] = {"LK 1": {"Ed": 7.05, "massgebend": True}}
+    return snapshot
+
+
+class TestPresets:
+
+    @pytest.mark.parametrize("aufloesung", ["entwurf", "bericht", 2500])
+    def test_ec_maxima_independent_of_preset(self, aufloesung):
+        standard = FeebbBerechnungEC(_mit_aufloesung("standard"), db=None).compute()
+        ergebnis = FeebbBerechnungEC(_mit_aufloesung(aufloesung), db=None).compute()
+        for gz in ("GZT", "GZG"):
+            for groesse in GROESSEN:
+                assert ergebnis["Schnittgroessen"][gz]["max"][groesse] == pytest.approx(
+                    standard["Schnittgroessen"][gz]["max"][groesse], rel=1e-3)
+
+    @pytest.mark.parametrize("aufloesung", ["entwurf", "bericht", 2500])
+    def test_fast_mode_maxima_independent_of_preset(self, aufloesung):
+        standard = FeebbBerechnung(_mit_aufloesung("standard", True)).compute()
+        ergebnis = FeebbBerechnung(_mit_aufloesung(aufloesung, True)).compute()
+        for groesse in GROESSEN:
+            assert ergebnis["Schnittgroessen"]["GZT"]["max"][groesse] == pytest.approx(
+                standard["Schnittgroessen"]["GZT"]["max"][groesse], rel=1e-3)
+
+    def test_entwurf_is_coarser_than_bericht(self):
+        punkte = {}
+        for aufloesung in ("entwurf", "standard", "bericht"):
+            gzt = FeebbBerechnungEC(_mit_aufloesung(aufloesung), db=None).compute()
+            punkte[aufloesung] = len(gzt["Schnittgroessen"]["GZT"]["envelope"]["moment_max"])
+        assert punkte["entwurf"] < punkte["standard"] < punkte["bericht"]
+
+
+class TestZielpunktanzahl:
+
+    @pytest.mark.parametrize("ziel", [50, 400, 3000])
+    def test_point_count_follows_target(self, ziel):
+        ec = FeebbBerechnungEC(_mit_aufloesung(ziel), db=None).compute()
+        schnell = FeebbBerechnung(_mit_aufloesung(ziel, True)).compute()
+        for verlauf in (ec["Schnittgroessen"]["GZT"]["envelope"]["moment_max"],
+                        schnell["Schnittgroessen"]["GZT"]["moment"]):
+            assert len(verlauf) == pytest.approx(ziel, rel=0.1)
+
+    def test_small_target_coarsens_mesh(self):
+        elemente_pro_meter, punkte = diskretisierung(20, 10.0)
+        assert punkte == MIN_PUNKTE_JE_ELEMENT
+        assert 10.0 * elemente_pro_meter * (punkte - 1) + 1 == pytest.approx(20)
+
+
+class TestValidierung:
+
+    @pytest.mark.parametrize("aufloesung", ["entwurf", "bericht", 2500])
+    def test_valid_values_pass(self, aufloesung):
+        assert validate_input(_mit_aufloesung(aufloesung)) == []
+
+    @pytest.mark.parametrize("aufloesung", ["fein", 5, 10**6, 2.5, True])
+    def test_invalid_values_are_rejected(self, aufloesung):
+        assert any("Auflösung" in f for f in validate_input(_mit_aufloesung(aufloesung)))
@@ -0,0 +1,98 @@
+"""
+Tests for the utilization curves η(x) of MethodeNachweisEC5.
+
+The maxima of the curves must equal the global bending and shear checks in
+both engines, and the x positions must follow the field layout of the FE
+evaluation points (field boundaries exactly at the supports).
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import copy
+import numpy as np
+import pytest
+from backend.calculations.aufloesung import auswertungsstellen
+from backend.calculations.feebb_schnittstelle import FeebbBerechnung
+from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+from backend.calculations.lastenkombination import MethodeLastkombi
+from backend.calculations.lastkombination_gzg import MethodeLastkombiGZG
+from backend.calculations.nachweis_ec5 import MethodeNachweisEC5
+from backend.database.datenbank_holz import datenbank_holz_class
+
+
+SNAPSHOT = {
+    "sprungmass": 1.0,
+    "spannweiten": {"kragarm_links": 1.3, "feld_1": 4.3, "feld_2": 3.7},
+    "lasten": [
+        {"lastfall": "g", "wert": "3.0", "kategorie": "Eigengewicht", "kommentar": "",
+         "nkl": 1, "eigengewicht": True},
+        {"lastfall": "p", "wert": "2.0", "kategorie": "Nutzlast Kat. A: Wohnraum",
+         "kommentar": "", "nkl": 1},
+    ],
+    "querschnitt": {"materialgruppe": "Balken", "typ": "Nadelholz", "festigkeitsklasse": "C24",
+                    "nkl": 1, "breite_qs": 120, "hoehe_qs": 240,
+                    "I_y": 120 * 240**3 / 12, "W_y": 120 * 240**2 / 6, "E": 11_000},
+    "gebrauchstauglichkeit": {"w_inst_grenz": 300, "w_fin_grenz": 200,
+                              "w_net_fin_grenz": 300, "w_c": 0},
+    "berechnungsmodus": {"ec_modus": False, "aufloesung": "entwurf"},
+}
+
+
+@pytest.fixture(scope="module")
+def db():
+    return datenbank_holz_class()
+
+
+def _nachweise(db, ec_modus, maxima_only=False):
+    snapshot = copy.deepcopy(SNAPSHOT)
+    snapshot["berechnungsmodus"]["ec_modus"] = ec_modus
+    snapshot["Lastfallkombinationen"] = MethodeLastkombi(snapshot, db).compute()["Lastfallkombinationen"]
+    snapshot["GZG_Lastfallkombinationen"] = MethodeLastkombiGZG(
+        snapshot, db).compute()["GZG_Lastfallkombinationen"]
+    if ec_modus:
+        ergebnis = FeebbBerechnungEC(snapshot, db).compute(maxima_only=maxima_only)
+    else:
+        ergebnis = FeebbBerechnung(snapshot, db).compute()
+    snapshot["Schnittgroessen"] = ergebnis["Schnittgroessen"]
+    return snapshot, MethodeNachweisEC5(snapshot, db).compute()
+
+
+class TestAusnutzungsverlauf:
+
+    @pytest.mark.parametrize("ec_modus", [False, True])
+    def test_maxima_match_global_checks(self, db, ec_modus):
+        _, nachweise = _nachweise(db, ec_modus)
+        verlauf = nachweise["ausnutzungsverlauf"]
+        for name in ("biegung", "schub"):
+            assert verlauf[name]["max"] == pytest.approx(nachweise[name]["ausnutzung"], rel=1e-9)
+            assert len(verlauf[name]["eta"]) == len(verlauf["x"])
+        # Biegung maßgebend über dem Innenlager, Schub am Innenlager
+        assert verlauf["biegung"]["x_max"] == pytest.approx(1.3 + 4.3, abs=0.05)
+
+    def test_ec_deflection_ratio_matches_inst_check(self, db):
+        _, nachweise = _nachweise(db, ec_modus=True)
+        assert nachweise["ausnutzungsverlauf"]["durchbiegung_inst"]["max"] == pytest.approx(
+            nachweise["durchbiegung_inst"]["ausnutzung"], rel=1e-9)
+
+    def test_maxima_only_has_no_curves(self, db):
+        _, nachweise = _nachweise(db, ec_modus=True, maxima_only=True)
+        assert "ausnutzungsverlauf" not in nachweise
+        assert "biegung" in nachweise
+
+
+class TestAuswertungsstellen:
+
+    @pytest.mark.parametrize("ec_modus", [False, True])
+    def test_field_boundaries_at_supports(self, db, ec_modus):
+        snapshot, nachweise = _nachweise(db, ec_modus)
+        x = np.array(nachweise["ausnutzungsverlauf"]["x"])
+        abschnitte = snapshot["Schnittgroessen"]["felder"]
+        assert [a["feld"] for a in abschnitte] == ["kragarm_links", "feld_1", "feld_2"]
+        assert x[[a["start"] for a in abschnitte]] == pytest.approx([0.0, 1.3, 5.6])
+        assert x[-1] == pytest.approx(9.3)
+        assert np.all(np.diff(x) > 0)
+
+    def test_uniform_fallback_without_field_layout(self):
+        x, abschnitte = auswertungsstellen({}, {"feld_1": 4.0, "kragarm_rechts": 1.0}, 11)
+        assert x == pytest.approx(np.linspace(0.0, 5.0, 11))
+        assert [(a["start"], a["ende"]) for a in abschnitte] == [(0, 8), (8, 10)]
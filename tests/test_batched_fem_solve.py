@@ -284,6 +284,8 @@ class TestBatchedEndToEnd:
         slightly from N independent solves. The observed max relative difference
         is platform-dependent (~1e-7 to ~3e-7). This is numerically harmless –
         the absolute difference is < 1 Nmm on moments of ~37 000 Nmm.
+        At the end supports the moment is zero up to rounding of the in-element
+        udl correction, hence the small absolute tolerance.
         """
         seq_gzt, _ = self._run_sequential_reference(SNAPSHOT_2F_GQ)
         bat_gzt, _ = self._run_batched(SNAPSHOT_2F_GQ)
@@ -293,7 +295,7 @@ class TestBatchedEndToEnd:
 
         for i, (bat, seq) in enumerate(zip(bat_gzt, seq_gzt)):
             np.testing.assert_allclose(
-                bat["moment"], seq["moment"], rtol=5e-7,
+                bat["moment"], seq["moment"], rtol=5e-7, atol=1e-3,
                 err_msg=f"GZT[{i}] moment mismatch",
             )
 
@@ -340,7 +342,7 @@ class TestBatchedEndToEnd:
 
         for i, (bat, seq) in enumerate(zip(bat_gzg, seq_gzg)):
             np.testing.assert_allclose(
-                bat["moment"], seq["moment"], rtol=1e-6,
+                bat["moment"], seq["moment"], rtol=1e-6, atol=1e-3,
                 err_msg=f"GZG[{i}] moment mismatch")
             np.testing.assert_allclose(
                 bat["durchbiegung"], seq["durchbiegung"], rtol=1e-6,
@@ -363,3 +365,96 @@ class TestBatchedEndToEnd:
             assert bat["kombination"]["name"] == seq["kombination"]["name"]
             assert bat["belastungsmuster"]    == seq["belastungsmuster"]
             assert bat["muster_id"]           == seq["muster_id"]
+
+
+# ── Load-vector deduplication ────────────────────────────────────────────────
+
+class TestLoadVectorDeduplication:
+    """
+    Tasks with bit-identical load vectors must be solved once and fanned out,
+    without changing any per-task result.
+    """
+
+    def _run(self, snapshot):
+        from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+        calc = FeebbBerechnungEC(snapshot, db=None)
+        calc._extrahiere_systemdaten()
+        calc._generiere_lastkombinationen()
+        calc._berechne_alle_kombinationen()
+        return calc
+
+    def test_g_only_patterns_collapse_to_one_column_per_combination(self):
+        """G-only: every pattern yields the same F → one unique column per combination."""
+        calc = self._run(SNAPSHOT_2F_G)
+        n_kombis = len(calc.kombinationen_gzt) + len(calc.kombinationen_gzg)
+        n_tasks  = len(calc.ergebnisse_gzt) + len(calc.ergebnisse_gzg)
+
+        assert n_tasks == n_kombis * len(calc.belastungsmuster)
+        assert calc._X_matrix.shape[1] == n_kombis
+        assert len(calc._spalten_index) == n_tasks
+
+    def test_deduplicated_results_match_sequential(self):
+        """Fanned-out results must equal the sequential per-task reference."""
+        seq_gzt, seq_gzg = TestBatchedEndToEnd()._run_sequential_reference(SNAPSHOT_2F_G)
+        calc = self._run(SNAPSHOT_2F_G)
+
+        for bat, seq in zip(calc.ergebnisse_gzt + calc.ergebnisse_gzg, seq_gzt + seq_gzg):
+            assert bat["kombination"]["name"] == seq["kombination"]["name"]
+            assert bat["belastungsmuster"]    == seq["belastungsmuster"]
+            np.testing.assert_allclose(bat["moment"], seq["moment"], rtol=1e-6, atol=1e-3)
+            np.testing.assert_allclose(
+                bat["durchbiegung"], seq["durchbiegung"], rtol=1e-6)
+
+    def test_distinct_load_vectors_are_kept(self):
+        """G+Q on two fields: patterns differ, so columns must not be merged across them."""
+        calc = self._run(SNAPSHOT_2F_GQ)
+        spalten = calc._spalten_index
+        n_gzt   = len(calc.ergebnisse_gzt)
+
+        # "nur_g" (first GZT combination) collapses over its patterns ...
+        n_muster = len(calc.belastungsmuster)
+        assert len(set(spalten[:n_muster])) == 1
+        # ... while the G+Q combination keeps one column per pattern.
+        assert len(set(spalten[n_muster:2 * n_muster])) == n_muster
+        assert max(spalten[:n_gzt]) < calc._X_matrix.shape[1]
+
+
+# ── Fast mode: one factorisation for GZT and all GZG actions ────────────────
+
+class TestSchnellmodusBatch:
+    """berechne_feebb_gzt_gzg must match one Beam per load case."""
+
+    def test_interp_batch_matches_interp(self):
+        elements, supports = _make_simple_beam(n_elements=12)
+        beam = Beam(elements, supports)
+        post = Postprocessor(beam, 100)
+        X = np.column_stack([beam.displacement, -0.5 * beam.displacement])
+        for action in ("moment", "shear", "displacement"):
+            batch = post.interp_batch(action, X)
+            np.testing.assert_array_equal(batch[0], post.interp(action))
+            np.testing.assert_allclose(batch[1], -0.5 * np.array(post.interp(action)))
+
+    def test_all_actions_match_individual_beams(self):
+        from backend.calculations.feebb_schnittstelle import berechne_feebb_gzt_gzg
+
+        def _fall(elemente, w):
+            return [{**e, "loads": [{"type": "udl", "magnitude": w}]} for e in elemente]
+
+        basis = [{"length": 250.0, "youngs_mod": 11_000, "moment_of_inertia": 138_240_000}
+                 for _ in range(28)]
+        supports = [0] * 58
+        for knoten in (0, 16, 28):
+            supports[2 * knoten] = -1
+        gzt = {"elements": _fall(basis, 6.1), "supports": supports}
+        gzg = [{"lastfall": lf, "kommentar": "", "elements": _fall(basis, w),
+                "supports": supports} for lf, w in (("g", 2.0), ("p", 3.0), ("s", 0.5))]
+
+        ergebnis = berechne_feebb_gzt_gzg(gzt, gzg)["Schnittgroessen"]
+
+        for fall, soll in zip([gzt] + gzg, [ergebnis["GZT"]] + ergebnis["GZG"]):
+            post = Postprocessor(Beam([Element(e) for e in fall["elements"]], supports), 100)
+            udl = [e["loads"][0]["magnitude"] for e in fall["elements"]]
+            for groesse, action in (("moment", "moment"), ("querkraft", "shear"),
+                                    ("durchbiegung", "displacement")):
+                referenz = post.interp(action) + post.udl_correction(action, udl)[0]
+                np.testing.assert_allclose(soll[groesse], referenz, rtol=1e-9, atol=1e-6)
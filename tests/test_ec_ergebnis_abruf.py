@@ -0,0 +1,149 @@
+"""
+Tests for the lazy LaTeX formulas, compact combination results, envelope
+provenance ids and the maxima-only mode of FeebbBerechnungEC.
+
+compute() must not render formulas unless asked to; latex_formeln() renders
+them on demand from the cached calculation and picks the governing result
+of each combination type.
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+from backend.service.result_cache_service import ErgebnisCache
+
+
+SNAPSHOT = {
+    "querschnitt": {"E": 11_000, "I_y": 138_240_000},
+    "spannweiten": {"feld_1": 4.0, "feld_2": 5.0},
+    "sprungmass": 1.0,
+    "lasten": [
+        {"lastfall": "g", "wert": "3.0", "kommentar": "Eigengewicht"},
+        {"lastfall": "p", "wert": "2.0", "kommentar": "Nutzlast"},
+        {"lastfall": "s", "wert": "1.5", "kommentar": "Schnee"},
+    ],
+}
+
+
+class TestLazyLatexFormeln:
+
+    def test_compute_skips_formulas_by_default(self):
+        calc = FeebbBerechnungEC(SNAPSHOT, db=None)
+        result = calc.compute()
+        assert "LaTeX_Formeln" not in result
+        assert calc._latex_formeln is None
+
+    def test_compute_flag_includes_formulas(self):
+        result = FeebbBerechnungEC(SNAPSHOT, db=None).compute(latex_formeln=True)
+        formeln = result["LaTeX_Formeln"]
+        assert set(formeln) == {"GZT", "GZG"}
+        assert "vollkombination" in formeln["GZT"]
+
+    def test_latex_formeln_is_cached(self):
+        calc = FeebbBerechnungEC(SNAPSHOT, db=None)
+        calc.compute()
+        assert calc.latex_formeln() is calc.latex_formeln()
+
+    def test_quasi_staendig_uses_governing_pattern(self):
+        calc = FeebbBerechnungEC(SNAPSHOT, db=None)
+        calc.compute()
+        quasi = [e for e in calc.ergebnisse_gzg
+                 if e["kombination"]["typ"] == "quasi_staendig"]
+        w_max = max(e["max"]["durchbiegung"] for e in quasi)
+        formel = calc.latex_formeln()["GZG"]["quasi_staendig"]
+        assert formel["max_werte"]["durchbiegung"] == w_max
+
+
+class TestErgebnisCache:
+
+    def test_lru_eviction(self):
+        cache = ErgebnisCache(max_eintraege=2)
+        h1 = cache.ablegen("a")
+        h2 = cache.ablegen("b")
+        assert cache.holen(h1) == "a"      # h1 wird dadurch "frisch"
+        cache.ablegen("c")
+        assert cache.holen(h2) is None
+        assert cache.holen(h1) == "a"
+        assert len(cache) == 2
+
+
+class TestKompakteKombinationsergebnisse:
+
+    def test_einzelergebnisse_carry_no_curves(self):
+        calc = FeebbBerechnungEC(SNAPSHOT, db=None)
+        result = calc.compute()
+        gzt = result["Einzelergebnisse"]["GZT"]
+        assert [e["id"] for e in gzt] == list(range(len(calc.ergebnisse_gzt)))
+        assert all("moment" not in e for e in gzt)
+
+    def test_detail_ids_point_to_governing_result(self):
+        calc = FeebbBerechnungEC(SNAPSHOT, db=None)
+        detail = calc.compute()["Detaillierte_Kombinationen"]["GZT"]["vollkombination"]
+        ids = detail["kombination_ids"]
+        erwartet = max(ids, key=lambda i: calc.ergebnisse_gzt[i]["max"]["moment"])
+        assert detail["massgebende_id"] == erwartet
+
+    def test_kombinationsverlauf_by_id(self):
+        calc = FeebbBerechnungEC(SNAPSHOT, db=None)
+        calc.compute()
+        verlauf = calc.kombinationsverlauf("GZG", 3)
+        assert verlauf["moment"] == calc.ergebnisse_gzg[3]["moment"].tolist()
+        with pytest.raises(KeyError):
+            calc.kombinationsverlauf("GZG", len(calc.ergebnisse_gzg))
+
+    def test_envelope_provenance_is_integer_ids(self):
+        calc = FeebbBerechnungEC(SNAPSHOT, db=None)
+        gzt = calc.compute()["Schnittgroessen"]["GZT"]
+        tabelle = {k["id"]: k for k in gzt["kombinationstabelle"]}
+        kombi_ids = gzt["massgebende_kombinationen"]["moment_max"]
+        masken = gzt["massgebende_muster"]["moment_max"]
+        assert all(isinstance(i, int) for i in kombi_ids + masken)
+
+        # Punkt für Punkt: die referenzierte Kombination liefert den Envelope-Wert
+        for punkt in (0, len(kombi_ids) // 3, len(kombi_ids) // 2):
+            treffer = [e for e in calc.ergebnisse_gzt
+                       if e["kombination"]["name"] == tabelle[kombi_ids[punkt]]["name"]
+                       and e["belastungsmuster"] == masken[punkt]]
+            assert treffer[0]["moment"][punkt] == gzt["envelope"]["moment_max"][punkt]
+
+
+class TestMaximaOnly:
+
+    def test_maxima_match_full_run(self):
+        voll = FeebbBerechnungEC(SNAPSHOT, db=None).compute()
+        calc = FeebbBerechnungEC(SNAPSHOT, db=None)
+        kompakt = calc.compute(maxima_only=True)
+
+        for gz in ("GZT", "GZG"):
+            assert set(kompakt["Schnittgroessen"][gz]) == {"max"}
+            for groesse in ("moment", "querkraft", "durchbiegung"):
+                assert kompakt["Schnittgroessen"][gz]["max"][groesse] == pytest.approx(
+                    voll["Schnittgroessen"][gz]["max"][groesse], rel=1e-12)
+        assert (kompakt["Schnittgroessen"]["GZG"]["max"]["durchbiegung_quasi"]
+                == voll["Schnittgroessen"]["GZG"]["max"]["durchbiegung_quasi"])
+        assert kompakt["Auflagerkraefte"] == voll["Auflagerkraefte"]
+
+    def test_blockwise_reduction_matches_full_run(self, monkeypatch):
+        import backend.calculations.feebb_schnittstelle_ec as modul
+
+        voll = FeebbBerechnungEC(SNAPSHOT, db=None).compute()
+        monkeypatch.setattr(modul, "MAXIMA_BLOCKGROESSE", 3)
+        kompakt = FeebbBerechnungEC(SNAPSHOT, db=None).compute(maxima_only=True)
+
+        for gz in ("GZT", "GZG"):
+            for groesse in ("moment", "querkraft", "durchbiegung"):
+                assert kompakt["Schnittgroessen"][gz]["max"][groesse] == pytest.approx(
+                    voll["Schnittgroessen"][gz]["max"][groesse], rel=1e-12)
+        for schluessel in ("durchbiegung_felder", "durchbiegung_quasi_felder"):
+            assert kompakt["Schnittgroessen"]["GZG"]["max"][schluessel] == pytest.approx(
+                voll["Schnittgroessen"]["GZG"]["max"][schluessel], rel=1e-12)
+        assert kompakt["Auflagerkraefte"] == voll["Auflagerkraefte"]
+
+    def test_no_curves_are_kept(self):
+        calc = FeebbBerechnungEC(SNAPSHOT, db=None)
+        calc.compute(maxima_only=True)
+        assert "moment" not in calc.ergebnisse_gzt[0]
+        assert not hasattr(calc, "_X_matrix")
+        with pytest.raises(KeyError):
+            calc.kombinationsverlauf("GZT", 0)
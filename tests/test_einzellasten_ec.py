@@ -0,0 +1,142 @@
+"""
+Tests for point and partial loads in EC mode.
+
+Point/patch loads enter the superposition as per-field load blocks; the
+deflections must match the element-based sequential reference, and the
+section forces the analytic values (including the local clamped-element
+correction inside loaded elements).
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import copy
+import numpy as np
+import pytest
+import backend.calculations.feebb_schnittstelle_ec as modul
+from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+from backend.calculations.kombinationsmatrix import Kombinationsmatrix
+from backend.service.validation_service import validate_input
+
+
+SNAPSHOT_GEMISCHT = {
+    "querschnitt": {"E": 11_000, "I_y": 138_240_000},
+    "spannweiten": {"feld_1": 4.0, "feld_2": 3.0, "kragarm_rechts": 1.0},
+    "sprungmass": 1.0,
+    "lasten": [
+        {"lastfall": "g", "wert": "2.0"},
+        {"lastfall": "g", "wert": "1.5", "lastart": "teilstrecke", "von": 3.03, "bis": 5.57},
+        {"lastfall": "p", "wert": "10", "lastart": "einzel", "position": 2.03},
+        {"lastfall": "s", "wert": "3", "lastart": "einzel", "position": 7.66},
+    ],
+    "berechnungsmodus": {"ec_modus": True},
+}
+
+
+def _einfeldtraeger(last):
+    return {
+        "querschnitt": {"E": 11_000, "I_y": 138_240_000},
+        "spannweiten": {"feld_1": 5.0},
+        "sprungmass": 1.0,
+        "lasten": [last],
+        "berechnungsmodus": {"ec_modus": True},
+    }
+
+
+@pytest.fixture(autouse=True)
+def leerer_cache(monkeypatch):
+    monkeypatch.setattr(modul, "_geometrie_cache", modul.OrderedDict())
+    monkeypatch.setattr(modul, "_einheitsantworten_cache", modul.OrderedDict())
+    monkeypatch.setattr(modul, "_lastbausteine_cache", modul.OrderedDict())
+
+
+def _berechnet(snapshot):
+    calc = FeebbBerechnungEC(snapshot, db=None)
+    calc._extrahiere_systemdaten()
+    calc._generiere_lastkombinationen()
+    calc._berechne_alle_kombinationen()
+    return calc
+
+
+class TestEinzelUndTeilstreckenlasten:
+
+    def test_point_load_value_in_newton_and_not_in_design_line_load(self):
+        km = Kombinationsmatrix(SNAPSHOT_GEMISCHT["lasten"], 1.0, 1.35, 1.5)
+        assert km.einwirkungen == ["G_SUM", "g", "p", "s"]
+        np.testing.assert_allclose(km.werte, [2.0, 1.5, 10_000.0, 3_000.0])
+        nur_g = km.kombinationen_gzt[0]
+        assert km.bemessungslast(nur_g) == pytest.approx(1.35 * 2.0)
+
+    def test_deflection_matches_element_reference(self):
+        calc = _berechnet(SNAPSHOT_GEMISCHT)
+        for ergebnis in calc.ergebnisse_gzt + calc.ergebnisse_gzg:
+            feebb_dict = calc._erstelle_feebb_dict_fuer_kombination(
+                ergebnis["kombination"], ergebnis["belastungsmuster"])
+            referenz = calc._fuehre_feebb_berechnung_durch(feebb_dict)
+            np.testing.assert_allclose(ergebnis["durchbiegung"], referenz["durchbiegung"],
+                                       rtol=1e-7, atol=1e-9)
+
+    def test_point_load_between_nodes_matches_statics(self):
+        ergebnis = FeebbBerechnungEC(_einfeldtraeger(
+            {"lastfall": "g", "wert": "10", "lastart": "einzel", "position": 2.03}),
+            db=None).compute()
+        P, a, b, L = 1.35 * 10_000, 2030.0, 2970.0, 5000.0
+        gzt = ergebnis["Schnittgroessen"]["GZT"]["max"]
+        # Auswertungspunkte im Abstand ~5 mm: Spitze bis auf V·Δx genau
+        assert gzt["moment"] == pytest.approx(P * a * b / L, rel=1e-3)
+        assert gzt["querkraft"] == pytest.approx(P * b / L, rel=1e-6)
+        np.testing.assert_allclose(ergebnis["Auflagerkraefte"]["gzt_design"],
+                                   [P * b / L, P * a / L], rtol=1e-6)
+
+    def test_full_length_partial_load_is_exact(self):
+        ergebnis = FeebbBerechnungEC(_einfeldtraeger(
+            {"lastfall": "g", "wert": "2", "lastart": "teilstrecke", "von": 0.0, "bis": 5.0}),
+            db=None).compute()
+        w, L = 1.35 * 2.0, 5000.0
+        gzt = ergebnis["Schnittgroessen"]["GZT"]["max"]
+        assert gzt["moment"] == pytest.approx(w * L ** 2 / 8, rel=1e-9)
+        assert gzt["querkraft"] == pytest.approx(w * L / 2, rel=1e-9)
+
+    @pytest.mark.parametrize("von, bis", [(1.03, 1.09), (1.03, 3.47)])
+    def test_partial_load_between_nodes_matches_statics(self, von, bis):
+        ergebnis = FeebbBerechnungEC(_einfeldtraeger(
+            {"lastfall": "g", "wert": "2", "lastart": "teilstrecke", "von": von, "bis": bis}),
+            db=None).compute()
+        w, L = 1.35 * 2.0, 5000.0
+        a, d = (von + bis) / 2 * 1000, (bis - von) * 1000
+        R_A, R_B = w * d * (L - a) / L, w * d * a / L
+        reaktionen = ergebnis["Auflagerkraefte"]["gzt_design"]
+        assert sum(reaktionen) == pytest.approx(w * d, rel=1e-9)
+        np.testing.assert_allclose(reaktionen, [R_A, R_B], rtol=1e-9)
+        # Maximum im Querkraftnullpunkt innerhalb der Teilstrecke
+        x0 = von * 1000 + R_A / w
+        gzt = ergebnis["Schnittgroessen"]["GZT"]["max"]
+        assert gzt["moment"] == pytest.approx(R_A * x0 - w * (x0 - von * 1000) ** 2 / 2, rel=1e-4)
+        assert gzt["querkraft"] == pytest.approx(max(R_A, R_B), rel=1e-9)
+
+    def test_load_value_edit_reuses_cached_blocks(self, monkeypatch):
+        erste = _berechnet(SNAPSHOT_GEMISCHT)
+
+        geaendert = copy.deepcopy(SNAPSHOT_GEMISCHT)
+        geaendert["lasten"][2]["wert"] = "12.5"
+        aufrufe = []
+        original = FeebbBerechnungEC._berechne_lastbausteine
+        monkeypatch.setattr(FeebbBerechnungEC, "_berechne_lastbausteine",
+                            lambda self, orte: aufrufe.append(orte) or original(self, orte))
+        zweite = _berechnet(geaendert)
+
+        assert aufrufe == []
+        assert max(e["max"]["moment"] for e in zweite.ergebnisse_gzt) > \
+            max(e["max"]["moment"] for e in erste.ergebnisse_gzt)
+
+
+class TestValidierungLastart:
+
+    def test_point_load_requires_ec_mode_and_position_on_beam(self):
+        snapshot = copy.deepcopy(SNAPSHOT_GEMISCHT)
+        assert validate_input(snapshot) == []
+
+        snapshot["lasten"][2]["position"] = 9.0
+        assert any("außerhalb" in f for f in validate_input(snapshot))
+
+        snapshot["berechnungsmodus"]["ec_modus"] = False
+        assert any("nur im EC-Modus" in f for f in validate_input(snapshot))
@@ -0,0 +1,117 @@
+"""
+Tests for the deflection checks per span and cantilever.
+
+Spans are checked against l/n, cantilevers against 2·l_k/n. In EC mode the
+per-span deflections are the maxima of the SLS envelope within each span; the
+governing check is the span with the highest utilisation.
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import copy
+import numpy as np
+import pytest
+from backend.calculations.aufloesung import feldmaxima
+from backend.calculations.feebb_schnittstelle import FeebbBerechnung
+from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+from backend.calculations.lastenkombination import MethodeLastkombi
+from backend.calculations.lastkombination_gzg import MethodeLastkombiGZG
+from backend.calculations.nachweis_ec5 import DURCHBIEGUNGSNACHWEISE, MethodeNachweisEC5
+from backend.database.datenbank_holz import datenbank_holz_class
+
+
+SNAPSHOT = {
+    "sprungmass": 1.0,
+    "spannweiten": {"kragarm_links": 1.3, "feld_1": 4.3, "feld_2": 3.7, "kragarm_rechts": 1.6},
+    "lasten": [
+        {"lastfall": "g", "wert": "3.0", "kategorie": "Eigengewicht", "kommentar": "",
+         "nkl": 1, "eigengewicht": True},
+        {"lastfall": "p", "wert": "2.0", "kategorie": "Nutzlast Kat. A: Wohnraum",
+         "kommentar": "", "nkl": 1},
+    ],
+    "querschnitt": {"materialgruppe": "Balken", "typ": "Nadelholz", "festigkeitsklasse": "C24",
+                    "nkl": 1, "breite_qs": 120, "hoehe_qs": 240,
+                    "I_y": 120 * 240**3 / 12, "W_y": 120 * 240**2 / 6, "E": 11_000},
+    "gebrauchstauglichkeit": {"w_inst_grenz": 300, "w_fin_grenz": 200,
+                              "w_net_fin_grenz": 300, "w_c": 0},
+    "berechnungsmodus": {"ec_modus": False, "aufloesung": "entwurf"},
+}
+
+FELDER = ["kragarm_links", "feld_1", "feld_2", "kragarm_rechts"]
+
+
+@pytest.fixture(scope="module")
+def db():
+    return datenbank_holz_class()
+
+
+def _nachweise(db, ec_modus):
+    snapshot = copy.deepcopy(SNAPSHOT)
+    snapshot["berechnungsmodus"]["ec_modus"] = ec_modus
+    snapshot["Lastfallkombinationen"] = MethodeLastkombi(snapshot, db).compute()["Lastfallkombinationen"]
+    snapshot["GZG_Lastfallkombinationen"] = MethodeLastkombiGZG(
+        snapshot, db).compute()["GZG_Lastfallkombinationen"]
+    if ec_modus:
+        ergebnis = FeebbBerechnungEC(snapshot, db).compute()
+    else:
+        ergebnis = FeebbBerechnung(snapshot, db).compute()
+    snapshot["Schnittgroessen"] = ergebnis["Schnittgroessen"]
+    return snapshot, MethodeNachweisEC5(snapshot, db).compute()
+
+
+class TestFeldweiseDurchbiegung:
+
+    def test_cantilever_reference_length(self):
+        felder = MethodeNachweisEC5.durchbiegungsfelder(SNAPSHOT["spannweiten"])
+        assert list(felder) == FELDER
+        assert felder["kragarm_rechts"] == {"laenge": 1600, "bezugslaenge": 3200, "kragarm": True}
+        assert felder["feld_1"]["bezugslaenge"] == felder["feld_1"]["laenge"] == 4300
+        assert MethodeNachweisEC5.durchbiegungsfelder({}) == {
+            "feld_1": {"laenge": 1000, "bezugslaenge": 1000, "kragarm": False}}
+
+    @pytest.mark.parametrize("ec_modus", [False, True])
+    def test_limits_per_span_and_governing_check(self, db, ec_modus):
+        _, nachweise = _nachweise(db, ec_modus)
+        felder = nachweise["durchbiegung_felder"]
+        assert list(felder) == FELDER
+        for feld, bezugslaenge in (("kragarm_links", 2600), ("feld_1", 4300),
+                                   ("feld_2", 3700), ("kragarm_rechts", 3200)):
+            assert felder[feld]["durchbiegung_inst"]["w_grenz"] == pytest.approx(bezugslaenge / 300)
+            assert felder[feld]["durchbiegung_fin"]["w_grenz"] == pytest.approx(bezugslaenge / 200)
+            assert felder[feld]["durchbiegung_inst"]["feld"] == feld
+        for art in DURCHBIEGUNGSNACHWEISE:
+            massgebend = max(f[art]["ausnutzung"] for f in felder.values())
+            assert nachweise[art]["ausnutzung"] == massgebend
+
+    def test_fast_mode_values_are_curve_maxima_per_span(self, db):
+        snapshot, nachweise = _nachweise(db, ec_modus=False)
+        gzg = snapshot["Schnittgroessen"]["GZG"]
+        w = np.sum([e["durchbiegung"] for e in gzg], axis=0)
+        erwartet = feldmaxima(w, snapshot["Schnittgroessen"]["felder"])
+        werte = [nachweise["durchbiegung_felder"][f]["durchbiegung_inst"]["w_max"] for f in FELDER]
+        assert werte == pytest.approx(erwartet)
+        assert nachweise["ausnutzungsverlauf"]["durchbiegung_inst"]["max"] == pytest.approx(
+            nachweise["durchbiegung_inst"]["ausnutzung"], rel=1e-9)
+
+    def test_fast_mode_curves_include_self_weight(self, db):
+        snapshot, _ = _nachweise(db, ec_modus=False)
+        gzg = snapshot["Schnittgroessen"]["GZG"]
+        ohne = FeebbBerechnung(copy.deepcopy(snapshot)).compute()["Schnittgroessen"]["GZG"]
+        assert max(np.abs(gzg[0]["durchbiegung"])) > max(np.abs(ohne[0]["durchbiegung"]))
+        assert gzg[1]["durchbiegung"] == pytest.approx(ohne[1]["durchbiegung"])
+
+    def test_ec_values_are_envelope_maxima_per_span(self, db):
+        snapshot, nachweise = _nachweise(db, ec_modus=True)
+        gzg = snapshot["Schnittgroessen"]["GZG"]
+        env = gzg["envelope"]
+        betrag = np.maximum(np.abs(env["durchbiegung_max"]), np.abs(env["durchbiegung_min"]))
+        erwartet = feldmaxima(betrag, snapshot["Schnittgroessen"]["felder"])
+        assert [gzg["max"]["durchbiegung_felder"][f] for f in FELDER] == pytest.approx(erwartet)
+        assert max(erwartet) == pytest.approx(gzg["max"]["durchbiegung"])
+        werte = [nachweise["durchbiegung_felder"][f]["durchbiegung_inst"]["w_max"] for f in FELDER]
+        assert werte == pytest.approx(erwartet)
+
+    def test_ec_deflection_curve_uses_span_limits(self, db):
+        _, nachweise = _nachweise(db, ec_modus=True)
+        assert nachweise["ausnutzungsverlauf"]["durchbiegung_inst"]["max"] == pytest.approx(
+            nachweise["durchbiegung_inst"]["ausnutzung"], rel=1e-9)
@@ -0,0 +1,113 @@
+"""
+Tests for the geometry-keyed caches of FeebbBerechnungEC.
+
+Load-only edits must reuse the cached field table / element list and the
+cached unit-load responses (no solve); any change of spans or stiffness must
+rebuild them.
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import copy
+import numpy as np
+import pytest
+import backend.calculations.feebb_schnittstelle_ec as modul
+from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+
+
+SNAPSHOT = {
+    "querschnitt": {"E": 11_000, "I_y": 138_240_000},
+    "spannweiten": {"kragarm_links": 1.0, "feld_1": 4.0, "feld_2": 5.0},
+    "sprungmass": 1.0,
+    "lasten": [{"lastfall": "g", "wert": "3.0"}, {"lastfall": "p", "wert": "2.0"}],
+}
+
+
+@pytest.fixture(autouse=True)
+def leerer_cache(monkeypatch):
+    monkeypatch.setattr(modul, "_geometrie_cache", modul.OrderedDict())
+    monkeypatch.setattr(modul, "_einheitsantworten_cache", modul.OrderedDict())
+
+
+def _geometrie(snapshot):
+    calc = FeebbBerechnungEC(snapshot, db=None)
+    calc._extrahiere_systemdaten()
+    return calc
+
+
+class TestGeometrieCache:
+
+    def test_load_only_edit_reuses_geometry(self, monkeypatch):
+        erste = _geometrie(SNAPSHOT)
+
+        geaendert = copy.deepcopy(SNAPSHOT)
+        geaendert["lasten"][1]["wert"] = "4.5"
+        aufrufe = []
+        monkeypatch.setattr(FeebbBerechnungEC, "_baue_systemgeometrie",
+                            lambda self, epm: aufrufe.append(epm))
+        zweite = _geometrie(geaendert)
+
+        assert aufrufe == []
+        assert zweite.felder is erste.felder
+        assert zweite.supports_flat == erste.supports_flat
+
+    def test_span_or_stiffness_change_rebuilds(self):
+        erste = _geometrie(SNAPSHOT)
+
+        laenger = copy.deepcopy(SNAPSHOT)
+        laenger["spannweiten"]["feld_2"] = 6.0
+        steifer = copy.deepcopy(SNAPSHOT)
+        steifer["querschnitt"]["I_y"] = 200_000_000
+
+        assert _geometrie(laenger).felder is not erste.felder
+        assert _geometrie(steifer).gesamt_elemente[0]["moment_of_inertia"] == 200_000_000
+        assert len(modul._geometrie_cache) == 3
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(modul, "GEOMETRIE_CACHE_GROESSE", 2)
+        for laenge in (3.0, 4.0, 5.0):
+            snap = copy.deepcopy(SNAPSHOT)
+            snap["spannweiten"]["feld_1"] = laenge
+            _geometrie(snap)
+        assert len(modul._geometrie_cache) == 2
+
+    def test_cached_geometry_gives_identical_results(self):
+        ohne_cache = FeebbBerechnungEC(SNAPSHOT, db=None).compute()
+        mit_cache = FeebbBerechnungEC(SNAPSHOT, db=None).compute()
+        assert (mit_cache["Schnittgroessen"]["GZT"]["moment"]
+                == ohne_cache["Schnittgroessen"]["GZT"]["moment"])
+        assert (mit_cache["Auflagerkraefte"]["gzt_design"]
+                == ohne_cache["Auflagerkraefte"]["gzt_design"])
+
+
+class TestEinheitsantwortenCache:
+
+    def test_load_only_edit_needs_no_solve(self, monkeypatch):
+        FeebbBerechnungEC(SNAPSHOT, db=None).compute()
+
+        geaendert = copy.deepcopy(SNAPSHOT)
+        geaendert["lasten"][0]["wert"] = "5.0"
+        geaendert["sprungmass"] = 0.8
+
+        def kein_solve(*args, **kwargs):
+            raise AssertionError("np.linalg.solve darf nicht aufgerufen werden")
+        monkeypatch.setattr(modul.np.linalg, "solve", kein_solve)
+        FeebbBerechnungEC(geaendert, db=None).compute()
+
+    def test_superposition_matches_fresh_solve(self, monkeypatch):
+        FeebbBerechnungEC(SNAPSHOT, db=None).compute()
+        geaendert = copy.deepcopy(SNAPSHOT)
+        geaendert["lasten"][1]["wert"] = "3.5"
+        aus_cache = FeebbBerechnungEC(geaendert, db=None).compute()
+
+        monkeypatch.setattr(modul, "_einheitsantworten_cache", modul.OrderedDict())
+        frisch = FeebbBerechnungEC(geaendert, db=None).compute()
+
+        for gz in ("GZT", "GZG"):
+            for groesse in ("moment", "querkraft", "durchbiegung"):
+                np.testing.assert_allclose(
+                    aus_cache["Schnittgroessen"][gz]["envelope"][f"{groesse}_max"],
+                    frisch["Schnittgroessen"][gz]["envelope"][f"{groesse}_max"],
+                    rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(aus_cache["Auflagerkraefte"]["gzt_design"],
+                                   frisch["Auflagerkraefte"]["gzt_design"], rtol=1e-9)
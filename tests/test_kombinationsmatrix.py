@@ -0,0 +1,231 @@
+"""
+Tests for the compiled combination-coefficient matrix.
+
+The matrix (combinations × actions) replaces the per-combination dicts as the
+single source for the FE stage and the LaTeX formulas; coefficients must
+reproduce the EC combination rules and the field loads must follow from it.
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import copy
+import gc
+import weakref
+import numpy as np
+import pytest
+import backend.calculations.kombinationsmatrix as modul
+from backend.calculations.kombinationsmatrix import Kombinationsmatrix, kombinationsmatrix
+from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+from backend.calculations.lastenkombination import MethodeLastkombi
+from backend.calculations.lastkombination_gzg import MethodeLastkombiGZG
+from backend.database.datenbank_holz import datenbank_holz_class
+
+
+LASTEN = [
+    {"lastfall": "g", "wert": "2.0"},
+    {"lastfall": "g", "wert": "1.0"},
+    {"lastfall": "p", "wert": "2.0"},
+    {"lastfall": "s", "wert": "1.5"},
+]
+
+
+@pytest.fixture(scope="module")
+def db():
+    return datenbank_holz_class()
+
+
+class TestKombinationsmatrix:
+
+    def test_coefficients_follow_combination_rules(self):
+        km = Kombinationsmatrix(LASTEN, 0.5, 1.35, 1.5)
+
+        assert km.einwirkungen == ["G_SUM", "p", "s"]
+        np.testing.assert_allclose(km.werte, [1.5, 1.0, 0.75])
+
+        typen = [k["typ"] for k in km.kombinationen_gzt]
+        assert typen == ["nur_g", "g_plus_q", "g_plus_q",
+                         "vollkombination", "vollkombination"]
+        # Vollkombination mit p als Leiteinwirkung: γ_G, γ_Q, ψ0(s)·γ_Q
+        np.testing.assert_allclose(km.gzt[3], [1.35, 1.5, 0.7 * 1.5])
+        assert km.leit_gzt[3].tolist() == [False, True, False]
+
+        # Häufig mit s als Leiteinwirkung: 1, ψ2(p), ψ1(s)
+        haeufig_s = km.kombinationen_gzg[3]
+        assert haeufig_s["typ"] == "haeufig" and haeufig_s["leiteinwirkung"] == "s"
+        np.testing.assert_allclose(km.gzg[3], [1.0, 0.3, 0.2])
+
+    def test_legacy_lasten_dict_matches_matrix(self):
+        km = Kombinationsmatrix(LASTEN, 0.5, 1.35, 1.5)
+        for kombi in km.kombinationen_gzt + km.kombinationen_gzg:
+            assert sum(kombi["lasten"].values()) == pytest.approx(km.bemessungslast(kombi))
+
+    def test_only_permanent_loads_gives_gzg_fallback(self):
+        km = Kombinationsmatrix(LASTEN[:2], 1.0, 1.35, 1.5)
+        assert [k["typ"] for k in km.kombinationen_gzt] == ["nur_g"]
+        assert [k["typ"] for k in km.kombinationen_gzg] == ["nur_g"]
+        assert km.bemessungslast(km.kombinationen_gzg[0]) == pytest.approx(3.0)
+
+
+
+class TestEinwirkungsgruppen:
+
+    LASTEN_KATEGORIEN = [
+        {"lastfall": "g", "wert": "2.0"},
+        {"lastfall": "p", "wert": "2.0", "kategorie": "Nutzlast Kat. A: Wohnraum"},
+        {"lastfall": "p", "wert": "1.0", "kategorie": "Nutzlast Kat. B: Büro"},
+        {"lastfall": "p", "wert": "0.5", "kategorie": "Nutzlast Kat. A: Wohnraum"},
+        {"lastfall": "s", "wert": "1.5"},
+    ]
+
+    def test_same_category_leads_together(self):
+        km = Kombinationsmatrix(self.LASTEN_KATEGORIEN, 1.0, 1.35, 1.5)
+        assert km.gruppen == ["p1", "p2", "s"]
+        assert km.gruppe.tolist() == [-1, 0, 1, 0, 2]
+
+        voll = [k for k in km.kombinationen_gzt if k["typ"] == "vollkombination"]
+        assert [k["leiteinwirkung"] for k in voll] == ["p1", "p2", "s"]
+        # Kat. A führt mit beiden Lasten, Kat. B und s begleiten mit ψ0
+        np.testing.assert_allclose(km.gzt[voll[0]["index"]],
+                                   [1.35, 1.5, 0.7 * 1.5, 1.5, 0.7 * 1.5])
+        assert km.leit_gzt[voll[0]["index"]].tolist() == [False, True, False, True, False]
+
+    def test_blocks_match_per_lead_definition(self):
+        lasten = [{"lastfall": "g", "wert": "1.0"}] + [
+            {"lastfall": "psw"[i % 3], "wert": str(1 + i / 10), "kategorie": f"K{i % 7}"}
+            for i in range(40)]
+        km = Kombinationsmatrix(lasten, 1.0, 1.35, 1.5)
+        q = np.array(km.q_spalten)
+
+        for kombi in km.kombinationen_gzg:
+            if kombi["typ"] != "charakteristisch":
+                continue
+            leit = km.gruppe[q] == km.gruppen.index(kombi["leiteinwirkung"])
+            np.testing.assert_allclose(km.gzg[kombi["index"], q],
+                                       np.where(leit, 1.0, km.psi0[q]))
+        assert sum(k["typ"] == "charakteristisch" for k in km.kombinationen_gzg) == len(km.gruppen)
+
+
+class TestFeldlastenAusMatrix:
+
+    def _berechnung(self):
+        calc = FeebbBerechnungEC({
+            "querschnitt": {"E": 11_000, "I_y": 138_240_000},
+            "spannweiten": {"feld_1": 4.0, "feld_2": 4.0, "kragarm_rechts": 1.0},
+            "sprungmass": 1.0,
+            "lasten": [{"lastfall": "g", "wert": "2.0"}, {"lastfall": "p", "wert": "3.0"}],
+        }, db=None)
+        calc._extrahiere_systemdaten()
+        calc._generiere_lastkombinationen()
+        return calc
+
+    def test_lead_load_follows_pattern_cantilever_always_loaded(self):
+        calc = self._berechnung()
+        g_plus_p = calc.kombinationen_gzt[1]
+        assert calc._feldlasten(g_plus_p, 0b01) == pytest.approx(
+            [1.35 * 2 + 1.5 * 3, 1.35 * 2, 1.35 * 2 + 1.5 * 3])
+
+    def test_quasi_permanent_loads_counted_once(self):
+        calc = self._berechnung()
+        quasi = next(k for k in calc.kombinationen_gzg if k["typ"] == "quasi_staendig")
+        assert calc._feldlasten(quasi, 0b10) == pytest.approx(
+            [2.0, 2.0 + 0.3 * 3, 2.0 + 0.3 * 3])
+
+
+class TestGemeinsameKombinationsmatrix:
+
+    SNAPSHOT = {
+        "querschnitt": {"materialgruppe": "Balken", "typ": "Nadelholz", "festigkeitsklasse": "C24",
+                        "breite_qs": 120, "hoehe_qs": 240, "E": 11_000, "I_y": 138_240_000},
+        "spannweiten": {"feld_1": 4.0, "feld_2": 4.0},
+        "sprungmass": 1.2,
+        "lasten": [
+            {"lastfall": "g", "wert": "2.0", "kategorie": "Eigengewicht", "nkl": 1,
+             "eigengewicht": True},
+            {"lastfall": "p", "wert": "2.0", "kategorie": "Nutzlast Kat. A: Wohnraum", "nkl": 1},
+            {"lastfall": "s", "wert": "1.5", "kategorie": "Schneelast bis 1.000 m", "nkl": 1},
+        ],
+        "berechnungsmodus": {"ec_modus": True},
+    }
+
+    @pytest.fixture(autouse=True)
+    def leerer_cache(self, monkeypatch):
+        monkeypatch.setattr(modul, "_kombinationsmatrix_cache", modul.OrderedDict())
+
+    def test_all_stages_share_one_instance(self, db):
+        snapshot = copy.deepcopy(self.SNAPSHOT)
+        km = kombinationsmatrix(snapshot, db)
+
+        MethodeLastkombi(snapshot, db).compute()
+        MethodeLastkombiGZG(snapshot, db).compute()
+        calc = FeebbBerechnungEC(snapshot, db)
+        calc._extrahiere_systemdaten()
+        calc._generiere_lastkombinationen()
+
+        assert calc.kombinationsmatrix is km
+        assert len(modul._kombinationsmatrix_cache) == 1
+
+    def test_design_values_consistent_across_stages(self, db):
+        snapshot = copy.deepcopy(self.SNAPSHOT)
+        km = kombinationsmatrix(snapshot, db)
+        kombis = MethodeLastkombi(snapshot, db).compute()["Lastfallkombinationen"]
+        gzg = MethodeLastkombiGZG(snapshot, db).compute()["GZG_Lastfallkombinationen"]
+
+        # Eigenlast steckt in G_SUM – für GZT, GZG und die FE-Stufe gleichermaßen
+        assert km.werte[0] > 2.0 * 1.2
+        assert gzg["G_k"]["wert"] == pytest.approx(km.werte[0])
+
+        ed = km.gzt @ km.werte
+        kmod = km.beiwert_je_kombination("GZT")
+        assert sorted(k["Ed"] for k in kombis.values()) == pytest.approx(sorted(ed))
+        assert sorted(k["kmod"] for k in kombis.values()) == pytest.approx(sorted(kmod))
+
+        # ψ2 aus der Datenbank: Schnee bis 1.000 m ist nicht quasi-ständig
+        assert km.psi2[km.gruppen_spalte].tolist() == [0.3, 0.0]
+        assert set(gzg) == {"G_k", r"G_k + \psi_2 \cdot P_k"}
+
+    def test_input_change_builds_new_matrix(self, db):
+        snapshot = copy.deepcopy(self.SNAPSHOT)
+        km = kombinationsmatrix(snapshot, db)
+        snapshot["Lastfallkombinationen"] = {"LK 1": {"Ed": 1.0}}
+        assert kombinationsmatrix(snapshot, db) is km
+
+        snapshot["lasten"][1]["wert"] = "2.5"
+        assert kombinationsmatrix(snapshot, db) is not km
+
+    def test_results_do_not_share_combination_dicts(self, db):
+        snapshot = copy.deepcopy(self.SNAPSHOT)
+        km = kombinationsmatrix(snapshot, db)
+        ergebnis = FeebbBerechnungEC(snapshot, db).compute()
+
+        ergebnis["Kombinationen"]["GZT"][0]["lasten"]["G_SUM"] = -1.0
+        assert km.kombinationen_gzt[0]["lasten"]["G_SUM"] > 0
+        assert FeebbBerechnungEC(snapshot, db).compute()[
+            "Kombinationen"]["GZT"][0]["lasten"]["G_SUM"] > 0
+        with pytest.raises(ValueError):
+            km.werte[0] = 0.0
+
+    def test_database_errors_are_not_masked(self, db):
+        class DefekteDatenbank:
+            def get_bemessungsdaten(self, *args):
+                return db.get_bemessungsdaten(*args)
+
+            def get_si_beiwerte(self, kategorie):
+                raise RuntimeError("Datenbank nicht erreichbar")
+
+        with pytest.raises(RuntimeError):
+            kombinationsmatrix(copy.deepcopy(self.SNAPSHOT), DefekteDatenbank())
+
+    def test_cache_does_not_keep_database_alive(self, db):
+        class Datenbank:
+            def __getattr__(self, name):
+                return getattr(db, name)
+
+        eigene = Datenbank()
+        km = kombinationsmatrix(copy.deepcopy(self.SNAPSHOT), eigene)
+        assert kombinationsmatrix(copy.deepcopy(self.SNAPSHOT), eigene) is km
+        assert kombinationsmatrix(copy.deepcopy(self.SNAPSHOT), db) is not km
+
+        ref = weakref.ref(eigene)
+        del eigene
+        gc.collect()
+        assert ref() is None
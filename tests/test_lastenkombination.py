@@ -0,0 +1,101 @@
+"""
+Tests for the ULS load combinations of MethodeLastkombi.
+
+Database values are looked up once per kategorie and (typ, nkl) by the shared
+combination matrix and the design values of all combinations follow from its
+rows; the result must equal the EC combination rules written out per
+combination.
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import copy
+import pytest
+from backend.calculations.kombinationsmatrix import bemessungsbeiwerte, psi_beiwert, _eigenlast
+from backend.calculations.lastenkombination import MethodeLastkombi
+from backend.database.datenbank_holz import datenbank_holz_class
+
+
+QUERSCHNITT = {"materialgruppe": "Balken", "typ": "Nadelholz", "festigkeitsklasse": "C24",
+               "breite_qs": 120, "hoehe_qs": 240}
+
+LASTEN = [
+    {"lastfall": "g", "wert": "3.0", "kategorie": "Eigengewicht", "nkl": 1, "eigengewicht": True},
+    {"lastfall": "p", "wert": "2.0", "kategorie": "Nutzlast Kat. A: Wohnraum", "nkl": 1},
+    {"lastfall": "s", "wert": "1.5", "kategorie": "Schneelast bis 1.000 m", "nkl": 1},
+    {"lastfall": "w", "wert": "0.8", "kategorie": "Windlast", "nkl": 1},
+]
+
+
+class ZaehlendeDatenbank:
+    """Datenbank-Wrapper, der die Abfragen je Methode zählt."""
+
+    def __init__(self, db):
+        self._db = db
+        self.aufrufe = {}
+
+    def __getattr__(self, name):
+        methode = getattr(self._db, name)
+
+        def gezaehlt(*args):
+            self.aufrufe[name] = self.aufrufe.get(name, 0) + 1
+            return methode(*args)
+        return gezaehlt
+
+
+@pytest.fixture(scope="module")
+def db():
+    return datenbank_holz_class()
+
+
+def _kombinationen(db, lasten, sprungmass=1.0):
+    snapshot = {"lasten": copy.deepcopy(lasten), "sprungmass": sprungmass,
+                "querschnitt": QUERSCHNITT}
+    return MethodeLastkombi(snapshot, db).compute()["Lastfallkombinationen"]
+
+
+class TestMethodeLastkombi:
+
+    def test_leading_combinations_follow_ec_rules(self, db):
+        kombis = _kombinationen(db, LASTEN, sprungmass=1.2)
+        g = 3.0 * 1.2 + _eigenlast(db, "Balken", "Nadelholz", "C24", 1, 120.0, 240.0)
+        q = {l["lastfall"]: (float(l["wert"]) * 1.2, psi_beiwert(db, l, "psi0"),
+                             bemessungsbeiwerte(db, l, "Nadelholz")[1])
+             for l in LASTEN[1:]}
+        kmod_max = max(kmod for _, _, kmod in q.values())
+
+        for leit in "psw":
+            header = next(k for k in kombis if rf"\mathbf{{{leit}}}" in k)
+            erwartet = 1.35 * g + 1.5 * q[leit][0] + sum(
+                psi0 * 1.5 * wert for lf, (wert, psi0, _) in q.items() if lf != leit)
+            assert kombis[header]["Ed"] == pytest.approx(erwartet, rel=1e-12)
+            assert kombis[header]["kmod"] == kmod_max
+        assert sum(k["massgebend"] for k in kombis.values()) == 1
+
+    def test_self_weight_independent_of_load_order(self, db):
+        mit_eigengewicht = dict(LASTEN[0], wert="1.0")
+        ohne = dict(LASTEN[0], eigengewicht=False)
+        vorne = _kombinationen(db, [mit_eigengewicht, ohne] + LASTEN[1:])
+        hinten = _kombinationen(db, [ohne, mit_eigengewicht] + LASTEN[1:])
+        nur_g = r"\gamma_{g} \cdot g"
+        assert vorne[nur_g]["Ed"] == pytest.approx(hinten[nur_g]["Ed"], rel=1e-12)
+
+    def test_database_lookups_once_per_key(self, db):
+        zaehler = ZaehlendeDatenbank(db)
+        lasten = LASTEN + [dict(LASTEN[1], wert=str(w)) for w in (1.0, 1.5, 2.5, 3.0)]
+        _kombinationen(zaehler, lasten)
+
+        # vier verschiedene Kategorien, ein Holztyp in einer Nutzungsklasse
+        assert zaehler.aufrufe == {"get_si_beiwerte": 4, "get_kmod": 1,
+                                   "get_bemessungsdaten": 1}
+
+    def test_loads_sharing_a_lastfall_do_not_collide(self, db):
+        kategorie_a = dict(LASTEN[1], wert="2.5")
+        kategorie_b = dict(LASTEN[1], kategorie="Nutzlast Kat. B: Büro")
+        kombis = _kombinationen(db, [LASTEN[0], kategorie_a, kategorie_b, dict(kategorie_a)])
+
+        # nur G, zwei Einzel- und zwei Leitkombinationen (Kat. A zusammengefasst)
+        assert len(kombis) == 5
+        einzel = kombis[r"\gamma_{g} \cdot g + \gamma_{p} \cdot p_{1}"]
+        nur_g = kombis[r"\gamma_{g} \cdot g"]
+        assert einzel["Ed"] == pytest.approx(nur_g["Ed"] + 1.5 * 5.0)
@@ -0,0 +1,105 @@
+"""
+Tests for the precompiled LaTeX templates and the deferred formula output.
+
+The templates must render the same text as the former f-strings; formulas
+are only rendered when read, and with berechnungsmodus.latex = False the
+orchestrator result carries no formulas but a handle to render them later.
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import copy
+from backend.calculations.latex_vorlagen import (
+    LatexFormel, Vorlage, kombination_gzt, gzg_vollstaendig, GZG_NUR_G,
+    rendere, ohne_formeln, formeln)
+from backend.calculations.nachweis_ec5 import MethodeNachweisEC5
+from backend.service.calculation_service import get_latex_formulas
+from backend.service.orchestrator_service import OrchestratorService
+
+
+SNAPSHOT = {
+    "sprungmass": 1.0,
+    "spannweiten": {"feld_1": 4.0, "feld_2": 5.0},
+    "lasten": [
+        {"lastfall": "g", "wert": "3.0", "kategorie": "Eigengewicht", "kommentar": "",
+         "nkl": 1, "eigengewicht": True},
+        {"lastfall": "p", "wert": "2.0", "kategorie": "Nutzlast Kat. A: Wohnraum",
+         "kommentar": "", "nkl": 1},
+    ],
+    "querschnitt": {"materialgruppe": "Balken", "typ": "Nadelholz", "festigkeitsklasse": "C24",
+                    "nkl": 1, "breite_qs": 120, "hoehe_qs": 240,
+                    "I_y": 120 * 240**3 / 12, "W_y": 120 * 240**2 / 6, "E": 11_000},
+    "gebrauchstauglichkeit": {"w_inst_grenz": 300, "w_fin_grenz": 200,
+                              "w_net_fin_grenz": 300, "w_c": 0},
+    "berechnungsmodus": {"ec_modus": False},
+}
+
+
+def _berechne(latex: bool) -> dict:
+    snapshot = copy.deepcopy(SNAPSHOT)
+    snapshot["berechnungsmodus"]["latex"] = latex
+    kombi_result, gzg_result = OrchestratorService._berechne_lastkombinationen(snapshot)
+    result = OrchestratorService._berechne_schnittgroessen_und_nachweise(
+        snapshot, kombi_result, gzg_result)
+    return OrchestratorService._latex_ausgabe(snapshot, result)
+
+
+class TestVorlagen:
+
+    def test_gzt_template_matches_fstring(self):
+        header, formel_ed = r"\gamma_{g} \cdot g", r"1.35 \cdot g"
+        latex, latex_ed = kombination_gzt(header, formel_ed)
+        assert str(latex.formel(kmod=0.6, wert=6.777)) == (
+            f"${header}: \\quad \\frac{{{formel_ed}}}{{0.60}} = 6.78 \\,\\text{{kN/m}}$")
+        assert str(latex_ed.formel(ed=4.066)) == (
+            f"${header}: \\quad {formel_ed} = 4.07 \\,\\text{{kN/m}}$")
+        assert kombination_gzt(header, formel_ed)[0] is latex
+
+    def test_gzg_templates(self):
+        assert str(GZG_NUR_G.formel(g=3.0)) == r"$G_k: \quad G_k = 3.00 \,\text{kN/m}$"
+        vorlage = gzg_vollstaendig(r"G_k + \Sigma", ("P_k", "S_k"))
+        assert vorlage.felder == {"g", "wert", "psi2_0", "anteil_0", "psi2_1", "anteil_1"}
+        text = vorlage.rendere({"g": 3.0, "wert": 3.6, "psi2_0": 0.3, "anteil_0": 0.6,
+                                "psi2_1": 0.0, "anteil_1": 0.0})
+        assert text == (r"$G_k + \Sigma: \quad G_k = 3.00 + 0.3 \cdot P_k = 0.60 + "
+                        r"0.0 \cdot S_k = 0.00 = 3.60 \,\text{kN/m}$")
+
+    def test_nachweis_formula_is_deferred(self):
+        nachweis = MethodeNachweisEC5(SNAPSHOT, db=None)._nachweis_durchbiegung(
+            10.0, 20.0, 6000.0, symbol=r"\delta_{inst,max}")
+        formel = nachweis["latex"]
+        assert isinstance(formel, LatexFormel) and formel._text is None
+        assert str(formel).endswith(r"\eta = 0.50 \checkmark$")
+        assert formel == str(formel)
+
+
+class TestAufgeschobeneAusgabe:
+
+    def test_helpers_split_and_render(self):
+        formel = Vorlage("{x:.1f}").formel(x=2.0)
+        ergebnis = {"a": {"latex": formel, "wert": 2.0}, "b": [{"latex": formel}], "c": 1}
+        assert rendere(ergebnis) == {"a": {"latex": "2.0", "wert": 2.0},
+                                     "b": [{"latex": "2.0"}], "c": 1}
+        assert ohne_formeln(ergebnis) == {"a": {"wert": 2.0}, "b": [{}], "c": 1}
+        assert formeln(ergebnis) == {"a": {"latex": formel}}
+        assert isinstance(ergebnis["a"]["latex"], LatexFormel)
+
+    def test_default_renders_inline(self):
+        result = _berechne(latex=True)
+        assert "Latex_Handle" not in result
+        assert isinstance(result["EC5_Nachweise"]["biegung"]["latex"], str)
+        assert all(isinstance(k["latex"], str) for k in result["Lastfallkombinationen"].values())
+
+    def test_deferred_formulas_via_handle(self):
+        inline, ohne = _berechne(latex=True), _berechne(latex=False)
+        teile = ("Lastfallkombinationen", "GZG_Lastfallkombinationen", "EC5_Nachweise")
+        assert all("latex" not in nachweis for nachweis in ohne["EC5_Nachweise"].values())
+        assert ohne["Lastfallkombinationen"] == {
+            name: {k: v for k, v in kombi.items() if not k.startswith("latex")}
+            for name, kombi in inline["Lastfallkombinationen"].items()}
+
+        nachgeladen = get_latex_formulas(ohne["Latex_Handle"])
+        for teil in teile:
+            for name, eintrag in inline[teil].items():
+                if "latex" in eintrag:
+                    assert nachgeladen[teil][name]["latex"] == eintrag["latex"]
@@ -0,0 +1,113 @@
+"""
+Tests for the material / strength-class sweep (one FE solve for all variants).
+
+In fast mode each row must equal a full recalculation with that material and
+service class; in EC mode the rows may only be on the safe side.
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import copy
+import pytest
+from backend.calculations.feebb_schnittstelle import FeebbBerechnung
+from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+from backend.calculations.lastenkombination import MethodeLastkombi
+from backend.calculations.lastkombination_gzg import MethodeLastkombiGZG
+from backend.calculations.materialvergleich import MethodeMaterialvergleich
+from backend.calculations.nachweis_ec5 import MethodeNachweisEC5
+from backend.calculations.querschnittsoptimierung import NACHWEISE
+from backend.database.datenbank_holz import datenbank_holz_class
+
+
+SNAPSHOT = {
+    "sprungmass": 1.0,
+    "spannweiten": {"feld_1": 4.3, "feld_2": 3.7, "kragarm_rechts": 1.1},
+    "lasten": [
+        {"lastfall": "g", "wert": "3.0", "kategorie": "Eigengewicht", "kommentar": "",
+         "nkl": 1, "eigengewicht": True},
+        {"lastfall": "p", "wert": "2.0", "kategorie": "Nutzlast Kat. A: Wohnraum",
+         "kommentar": "", "nkl": 1},
+        {"lastfall": "s", "wert": "1.2", "kategorie": "Schneelast bis 1.000 m",
+         "kommentar": "", "nkl": 1},
+    ],
+    "querschnitt": {"materialgruppe": "Balken", "typ": "Nadelholz", "festigkeitsklasse": "C24",
+                    "nkl": 1, "breite_qs": 140, "hoehe_qs": 260,
+                    "I_y": 140 * 260**3 / 12, "W_y": 140 * 260**2 / 6, "E": 11_000},
+    "gebrauchstauglichkeit": {"w_inst_grenz": 300, "w_fin_grenz": 200,
+                              "w_net_fin_grenz": 300, "w_c": 0},
+    "berechnungsmodus": {"ec_modus": False, "aufloesung": "entwurf"},
+}
+
+VARIANTEN = [
+    {"materialgruppe": "Balken", "typ": "Nadelholz", "festigkeitsklasse": "C24", "nkl": 1},
+    {"materialgruppe": "Balken", "typ": "Nadelholz", "festigkeitsklasse": "C24", "nkl": 3},
+    {"materialgruppe": "Balken", "typ": "Brettschichtholz", "festigkeitsklasse": "GL24h", "nkl": 1},
+    {"materialgruppe": "Balken", "typ": "Brettschichtholz", "festigkeitsklasse": "GL28h", "nkl": 2},
+]
+
+
+@pytest.fixture(scope="module")
+def db():
+    return datenbank_holz_class()
+
+
+def _snapshot(ec_modus):
+    snapshot = copy.deepcopy(SNAPSHOT)
+    snapshot["berechnungsmodus"]["ec_modus"] = ec_modus
+    return snapshot
+
+
+def _nachrechnung(db, ec_modus, variante):
+    """Vollständige Berechnung mit der Materialvariante."""
+    snapshot = _snapshot(ec_modus)
+    snapshot["querschnitt"].update(variante)
+    snapshot["querschnitt"]["E"] = db.get_bemessungsdaten(
+        variante["materialgruppe"], variante["typ"], variante["festigkeitsklasse"],
+        variante["nkl"])["E"]
+    for last in snapshot["lasten"]:
+        last["nkl"] = variante["nkl"]
+    snapshot["Lastfallkombinationen"] = MethodeLastkombi(snapshot, db).compute()["Lastfallkombinationen"]
+    snapshot["GZG_Lastfallkombinationen"] = MethodeLastkombiGZG(
+        snapshot, db).compute()["GZG_Lastfallkombinationen"]
+    if ec_modus:
+        ergebnis = FeebbBerechnungEC(snapshot, db).compute(maxima_only=True)
+    else:
+        ergebnis = FeebbBerechnung(snapshot, db).compute()
+    snapshot["Schnittgroessen"] = ergebnis["Schnittgroessen"]
+    nachweise = MethodeNachweisEC5(snapshot, db).compute()
+    return {name: nachweise[name]["ausnutzung"] for name in NACHWEISE}
+
+
+class TestMaterialvergleich:
+
+    def test_fast_mode_matches_full_recalculation(self, db):
+        ergebnis = MethodeMaterialvergleich(_snapshot(False), db).compute(VARIANTEN)
+        tabelle = ergebnis["Varianten"]
+        assert [z["festigkeitsklasse"] for z in tabelle] == ["C24", "C24", "GL24h", "GL28h"]
+        for zeile, variante in zip(tabelle, VARIANTEN):
+            assert zeile["ausnutzung"] == pytest.approx(
+                _nachrechnung(db, False, variante), rel=1e-9)
+        assert ergebnis["Anzahl_erfuellt"] == sum(z["erfuellt"] for z in tabelle)
+
+    def test_service_class_lowers_kmod(self, db):
+        nkl1, nkl3 = MethodeMaterialvergleich(_snapshot(False), db).compute(VARIANTEN[:2])["Varianten"]
+        assert nkl3["kmod"] < nkl1["kmod"]
+        assert nkl3["kdef"] > nkl1["kdef"]
+        assert nkl3["ausnutzung"]["biegung"] > nkl1["ausnutzung"]["biegung"]
+
+    def test_ec_mode_is_conservative(self, db):
+        tabelle = MethodeMaterialvergleich(_snapshot(True), db).compute(VARIANTEN)["Varianten"]
+        for zeile, variante in zip(tabelle, VARIANTEN):
+            erwartet = _nachrechnung(db, True, variante)
+            for name in NACHWEISE:
+                assert zeile["ausnutzung"][name] >= erwartet[name] * (1 - 1e-9)
+                assert zeile["ausnutzung"][name] == pytest.approx(erwartet[name], rel=0.01)
+
+    def test_invalid_variants_raise(self, db):
+        vergleich = MethodeMaterialvergleich(_snapshot(False), db)
+        with pytest.raises(ValueError):
+            vergleich.compute([])
+        with pytest.raises(ValueError):
+            vergleich.compute([{**VARIANTEN[0], "festigkeitsklasse": "X99"}])
+        with pytest.raises(ValueError):
+            vergleich.compute([{"materialgruppe": "Balken", "typ": "Nadelholz", "nkl": 1}])
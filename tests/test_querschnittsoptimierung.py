@@ -0,0 +1,105 @@
+"""
+Tests for the cross-section optimiser (one FE solve, analytic candidates).
+
+In fast mode every candidate must reproduce a full recalculation with that
+section; in EC mode the self-weight is added as an upper bound, so the
+candidate utilisations may only be on the safe side.
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import copy
+import pytest
+from backend.calculations.feebb_schnittstelle import FeebbBerechnung
+from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+from backend.calculations.lastenkombination import MethodeLastkombi
+from backend.calculations.lastkombination_gzg import MethodeLastkombiGZG
+from backend.calculations.nachweis_ec5 import MethodeNachweisEC5
+from backend.calculations.querschnittsoptimierung import MethodeQuerschnittsoptimierung, NACHWEISE
+from backend.database.datenbank_holz import datenbank_holz_class
+
+
+SNAPSHOT = {
+    "sprungmass": 1.0,
+    "spannweiten": {"kragarm_links": 1.3, "feld_1": 4.3, "feld_2": 3.7},
+    "lasten": [
+        {"lastfall": "g", "wert": "3.0", "kategorie": "Eigengewicht", "kommentar": "",
+         "nkl": 1, "eigengewicht": True},
+        {"lastfall": "p", "wert": "2.0", "kategorie": "Nutzlast Kat. A: Wohnraum",
+         "kommentar": "", "nkl": 1},
+    ],
+    "querschnitt": {"materialgruppe": "Balken", "typ": "Nadelholz", "festigkeitsklasse": "C24",
+                    "nkl": 1, "breite_qs": 120, "hoehe_qs": 240,
+                    "I_y": 120 * 240**3 / 12, "W_y": 120 * 240**2 / 6, "E": 11_000},
+    "gebrauchstauglichkeit": {"w_inst_grenz": 300, "w_fin_grenz": 200,
+                              "w_net_fin_grenz": 300, "w_c": 0},
+    "berechnungsmodus": {"ec_modus": False, "aufloesung": "entwurf"},
+}
+
+
+@pytest.fixture(scope="module")
+def db():
+    return datenbank_holz_class()
+
+
+def _snapshot(ec_modus):
+    snapshot = copy.deepcopy(SNAPSHOT)
+    snapshot["berechnungsmodus"]["ec_modus"] = ec_modus
+    return snapshot
+
+
+def _nachrechnung(db, ec_modus, klasse, b, h):
+    """Vollständige Berechnung mit dem Kandidatenquerschnitt."""
+    snapshot = _snapshot(ec_modus)
+    E = db.get_bemessungsdaten("Balken", "Nadelholz", klasse, 1)["E"]
+    snapshot["querschnitt"].update(festigkeitsklasse=klasse, breite_qs=b, hoehe_qs=h,
+                                   I_y=b * h**3 / 12, W_y=b * h**2 / 6, E=E)
+    snapshot["Lastfallkombinationen"] = MethodeLastkombi(snapshot, db).compute()["Lastfallkombinationen"]
+    snapshot["GZG_Lastfallkombinationen"] = MethodeLastkombiGZG(
+        snapshot, db).compute()["GZG_Lastfallkombinationen"]
+    if ec_modus:
+        ergebnis = FeebbBerechnungEC(snapshot, db).compute(maxima_only=True)
+    else:
+        ergebnis = FeebbBerechnung(snapshot, db).compute()
+    snapshot["Schnittgroessen"] = ergebnis["Schnittgroessen"]
+    nachweise = MethodeNachweisEC5(snapshot, db).compute()
+    return {name: nachweise[name]["ausnutzung"] for name in NACHWEISE}
+
+
+class TestQuerschnittsoptimierung:
+
+    def test_fast_mode_matches_full_recalculation(self, db):
+        ergebnis = MethodeQuerschnittsoptimierung(_snapshot(False), db).compute(
+            [100, 140], [200, 260, 320], ["C24", "C30"], anzahl_varianten=20)
+        assert ergebnis["Anzahl_Kandidaten"] == 12
+        assert ergebnis["Anzahl_erfuellt"] == len(ergebnis["Varianten"]) > 0
+        for variante in ergebnis["Varianten"]:
+            erwartet = _nachrechnung(db, False, variante["festigkeitsklasse"],
+                                     variante["breite_qs"], variante["hoehe_qs"])
+            assert variante["ausnutzung"] == pytest.approx(erwartet, rel=1e-9)
+
+    def test_ec_mode_is_conservative(self, db):
+        ergebnis = MethodeQuerschnittsoptimierung(_snapshot(True), db).compute(
+            [140], [260], ["C30"])
+        variante = ergebnis["Optimum"]
+        erwartet = _nachrechnung(db, True, "C30", 140, 260)
+        for name in NACHWEISE:
+            assert variante["ausnutzung"][name] >= erwartet[name] * (1 - 1e-9)
+            assert variante["ausnutzung"][name] == pytest.approx(erwartet[name], rel=0.01)
+
+    def test_optimum_is_lightest_passing_variant(self, db):
+        ergebnis = MethodeQuerschnittsoptimierung(_snapshot(False), db).compute(
+            [80, 100, 120, 140], [200, 240, 280, 320], anzahl_varianten=5)
+        varianten = ergebnis["Varianten"]
+        assert ergebnis["Optimum"] == varianten[0]
+        assert all(v["max_ausnutzung"] <= 1.0 for v in varianten)
+        assert [v["eigenlast"] for v in varianten] == sorted(v["eigenlast"] for v in varianten)
+        assert varianten[0]["massgebend"] in NACHWEISE
+
+    def test_no_passing_candidate(self, db):
+        ergebnis = MethodeQuerschnittsoptimierung(_snapshot(False), db).compute([40], [80], ["C16"])
+        assert ergebnis["Optimum"] is None and ergebnis["Anzahl_erfuellt"] == 0
+
+    def test_unknown_strength_class_raises(self, db):
+        with pytest.raises(ValueError):
+            MethodeQuerschnittsoptimierung(_snapshot(False), db).compute([100], [200], ["X99"])
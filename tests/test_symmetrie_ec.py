@@ -0,0 +1,85 @@
+"""
+Tests for the symmetry shortcut of FeebbBerechnungEC.
+
+On mirror-symmetric systems only the left half of the unit load cases is
+postprocessed; the mirrored ones are derived by array reversal and must match
+the directly computed curves, including the section-force jumps at the nodes.
+"""
+import sys, os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pytest
+import backend.calculations.feebb_schnittstelle_ec as modul
+from backend.calculations.feebb_schnittstelle_ec import FeebbBerechnungEC
+
+
+def _snapshot(spannweiten, lasten=None):
+    return {
+        "querschnitt": {"E": 11_000, "I_y": 138_240_000},
+        "spannweiten": spannweiten,
+        "sprungmass": 1.0,
+        "lasten": lasten or [
+            {"lastfall": "g", "wert": "2.0"},
+            {"lastfall": "p", "wert": "3.0"},
+            {"lastfall": "s", "wert": "1.5"},
+        ],
+    }
+
+
+SYMMETRISCH = _snapshot({"kragarm_links": 1.2, "feld_1": 4.0, "feld_2": 5.0,
+                         "feld_3": 4.0, "kragarm_rechts": 1.2})
+
+
+@pytest.fixture(autouse=True)
+def leerer_cache(monkeypatch):
+    monkeypatch.setattr(modul, "_geometrie_cache", modul.OrderedDict())
+    monkeypatch.setattr(modul, "_einheitsantworten_cache", modul.OrderedDict())
+    monkeypatch.setattr(modul, "_lastbausteine_cache", modul.OrderedDict())
+
+
+def _berechnet(snapshot, symmetrie=True):
+    modul._einheitsantworten_cache.clear()
+    calc = FeebbBerechnungEC(snapshot, db=None)
+    calc._extrahiere_systemdaten()
+    if not symmetrie:
+        calc.spiegel_felder = None
+    calc._generiere_lastkombinationen()
+    calc._berechne_alle_kombinationen()
+    return calc
+
+
+class TestSymmetrie:
+
+    def test_detection(self):
+        assert _berechnet(SYMMETRISCH).spiegel_felder.tolist() == [4, 3, 2, 1, 0]
+        assert _berechnet(_snapshot({"feld_1": 4.0, "feld_2": 5.0})).spiegel_felder is None
+        assert _berechnet(_snapshot({"feld_1": 4.0, "feld_2": 4.0,
+                                     "kragarm_rechts": 1.0})).spiegel_felder is None
+
+    def test_only_left_half_is_postprocessed(self, monkeypatch):
+        spalten = []
+        original = FeebbBerechnungEC._fuehre_postprocessing
+        monkeypatch.setattr(FeebbBerechnungEC, "_fuehre_postprocessing",
+                            lambda self, X, beam: spalten.append(X.shape[1]) or original(self, X, beam))
+        _berechnet(SYMMETRISCH)
+        assert spalten == [3]
+
+    def test_mirrored_results_match_direct_computation(self):
+        gespiegelt = _berechnet(SYMMETRISCH)
+        direkt = _berechnet(SYMMETRISCH, symmetrie=False)
+        for a, b in zip(gespiegelt.ergebnisse_gzt + gespiegelt.ergebnisse_gzg,
+                        direkt.ergebnisse_gzt + direkt.ergebnisse_gzg):
+            for groesse in ("moment", "querkraft", "durchbiegung"):
+                np.testing.assert_allclose(a[groesse], b[groesse], rtol=1e-9,
+                                           atol=1e-9 * np.abs(b[groesse]).max())
+                assert a["max"][groesse] == pytest.approx(b["max"][groesse], rel=1e-9)
+
+    def test_mirrored_pattern_gives_mirrored_curves(self):
+        calc = _berechnet(_snapshot({"feld_1": 4.0, "feld_2": 4.0}))
+        g_plus_p = [e for e in calc.ergebnisse_gzt
+                    if e["kombination"]["typ"] == "g_plus_q"][:3]
+        links, rechts = g_plus_p[0], g_plus_p[1]
+        assert (links["belastungsmuster"], rechts["belastungsmuster"]) == (0b01, 0b10)
+        np.testing.assert_allclose(rechts["durchbiegung"], links["durchbiegung"][::-1],
+                                   rtol=1e-9, atol=1e-12)
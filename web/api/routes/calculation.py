@@ -9,17 +9,30 @@ the result without blocking the event loop.
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import Any
+from typing import Any, AsyncIterator
 
 import numpy as np
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
+from backend.service.validation_service import validate_input
 from web.api.deps import DBDep, OrchestratorDep
+from backend.service.calculation_service import (
+    compare_materials,
+    get_combination_curves,
+    get_latex_formulas,
+    optimize_cross_section,
+)
 from web.api.schemas.calculation import (
     CalculationRequest,
     CalculationResponse,
     DeflectionCheckRequest,
+    MaterialvergleichRequest,
+    MaterialvergleichResponse,
+    QuerschnittsoptimierungRequest,
+    QuerschnittsoptimierungResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -125,6 +138,64 @@ async def _run_orchestrator(
     return result
 
 
+async def _stream_orchestrator(
+    orchestrator,
+    snapshot: dict[str, Any],
+    timeout: float = _CALCULATION_TIMEOUT_S,
+) -> AsyncIterator[str]:
+    """
+    Run OrchestratorService.process_snapshot_progressive() and yield one
+    NDJSON line per stage as soon as the worker thread reports it.
+
+    Lines have the form {"stufe", "final", "ergebnis"} or, on validation or
+    calculation errors, {"stufe", "final": true, "fehler": [...]}.  The
+    timeout applies to each stage separately.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    def callback(stufe=None, result=None, errors=None, final=False):
+        """Called by the orchestrator worker thread once per stage."""
+        if errors:
+            nachricht = {"stufe": stufe, "final": True, "fehler": errors}
+        else:
+            nachricht = {
+                "stufe": stufe,
+                "final": final,
+                "ergebnis": _to_response(_convert_numpy_types(result)).model_dump(),
+            }
+        loop.call_soon_threadsafe(queue.put_nowait, nachricht)
+
+    orchestrator.process_snapshot_progressive(snapshot, callback)
+
+    while True:
+        try:
+            nachricht = await asyncio.wait_for(queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            nachricht = {
+                "stufe": None,
+                "final": True,
+                "fehler": [f"Calculation timed out after {timeout} seconds"],
+            }
+        yield json.dumps(nachricht) + "\n"
+        if nachricht["final"]:
+            return
+
+
+def _to_response(result: dict[str, Any]) -> CalculationResponse:
+    """Build the response model from an orchestrator result dict."""
+    return CalculationResponse(
+        lastfallkombinationen=result.get("Lastfallkombinationen"),
+        gzg_lastfallkombinationen=result.get("GZG_Lastfallkombinationen"),
+        schnittgroessen=result.get("Schnittgroessen"),
+        ec5_nachweise=result.get("EC5_Nachweise"),
+        auflagerkraefte=result.get("Auflagerkraefte"),
+        ergebnis_handle=result.get("Ergebnis_Handle"),
+        kombinationsergebnisse=result.get("Kombinationsergebnisse"),
+        latex_handle=result.get("Latex_Handle"),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
@@ -169,14 +240,93 @@ async def calculate(
     # Convert numpy types to native Python types for JSON serialisation
     result = _convert_numpy_types(result)
 
-    return CalculationResponse(
-        lastfallkombinationen=result.get("Lastfallkombinationen"),
-        gzg_lastfallkombinationen=result.get("GZG_Lastfallkombinationen"),
-        schnittgroessen=result.get("Schnittgroessen"),
-        ec5_nachweise=result.get("EC5_Nachweise"),
-        auflagerkraefte=result.get("Auflagerkraefte"),
+    return _to_response(result)
+
+
+@router.post(
+    "/calculate/progressive",
+    summary="Run a calculation with progressive results",
+    description=(
+        "Streams newline-delimited JSON.  The full-load quick result with its "
+        "EC5 checks arrives first (`stufe` = 'schnell'); in EC mode the "
+        "pattern-load envelope follows as a second line (`stufe` = 'ec').  "
+        "Each `ergebnis` has the shape of the POST /api/calculate response; "
+        "the last line carries `final` = true.  Errors are reported as a "
+        "final line with `fehler` instead of an HTTP status."
+    ),
+)
+async def calculate_progressive(
+    request: CalculationRequest,
+    db: DBDep,
+    orchestrator: OrchestratorDep,
+) -> StreamingResponse:
+    """POST /api/calculate/progressive – quick result first, EC refinement after."""
+    snapshot = request.to_snapshot(db)
+
+    logger.info(
+        "POST /api/calculate/progressive – ec_modus=%s, fields=%d, loads=%d",
+        request.berechnungsmodus.ec_modus,
+        len(request.spannweiten),
+        len(request.lasten),
     )
 
+    return StreamingResponse(
+        _stream_orchestrator(orchestrator, snapshot),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/calculate/results/{handle}/latex-formeln",
+    summary="LaTeX formulas of the governing load combinations",
+    description=(
+        "Lazily renders the LaTeX formulas for a previous calculation.  The "
+        "handle is returned by POST /api/calculate as `ergebnis_handle` (EC "
+        "mode: formulas of the governing load combinations) or as "
+        "`latex_handle` (berechnungsmodus.latex = false: the formulas omitted "
+        "from the load combinations and EC5 checks).  "
+        "Only the most recent calculations are kept; an evicted or unknown "
+        "handle yields 404 and the client has to recalculate."
+    ),
+)
+async def get_latex_formeln(handle: str) -> dict[str, Any]:
+    """GET /api/calculate/results/{handle}/latex-formeln"""
+    formeln = await asyncio.to_thread(get_latex_formulas, handle)
+    if formeln is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown or expired result handle '{handle}'",
+        )
+    return _convert_numpy_types(formeln)
+
+
+@router.get(
+    "/calculate/results/{handle}/kombinationen/{grenzzustand}/{ergebnis_id}",
+    summary="Curves of a single load combination result",
+    description=(
+        "Returns moment, shear and deflection curves of one combination "
+        "result of a previous EC-mode calculation.  `grenzzustand` is 'GZT' "
+        "or 'GZG'; `ergebnis_id` is the id from `kombinationsergebnisse`."
+    ),
+)
+async def get_kombinationsverlauf(
+    handle: str,
+    grenzzustand: str,
+    ergebnis_id: int,
+) -> dict[str, Any]:
+    """GET /api/calculate/results/{handle}/kombinationen/{grenzzustand}/{ergebnis_id}"""
+    verlauf = await asyncio.to_thread(
+        get_combination_curves, handle, grenzzustand, ergebnis_id)
+    if verlauf is None:
+        raise HTTPException(
+            status_code=404,
+            detail=(
+                f"Unknown result handle '{handle}' or combination "
+                f"{grenzzustand}/{ergebnis_id}"
+            ),
+        )
+    return _convert_numpy_types(verlauf)
+
 
 @router.post(
     "/calculate/deflection-only",
@@ -218,4 +368,86 @@ async def calculate_deflection_only(
         schnittgroessen=result.get("Schnittgroessen"),
         ec5_nachweise=result.get("EC5_Nachweise"),
         auflagerkraefte=result.get("Auflagerkraefte"),
+        latex_handle=result.get("Latex_Handle"),
+    )
+
+
+@router.post(
+    "/calculate/querschnittsoptimierung",
+    response_model=QuerschnittsoptimierungResponse,
+    summary="Lightest cross-section that passes all EC5 checks",
+    description=(
+        "Runs the load combinations and the FEM once with the stiffness of "
+        "`base_snapshot` and verifies every candidate (width × height × "
+        "strength class) analytically: section forces do not depend on E·I, "
+        "deflections scale with 1/(E·I).  Self-weight of each candidate is "
+        "included exactly in fast mode and as an upper bound in EC mode."
+    ),
+)
+async def optimize_querschnitt(
+    request: QuerschnittsoptimierungRequest,
+    db: DBDep,
+) -> QuerschnittsoptimierungResponse:
+    """POST /api/calculate/querschnittsoptimierung"""
+    snapshot = request.base_snapshot.to_snapshot(db)
+    errors = validate_input(snapshot)
+    if errors:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+
+    try:
+        result = await asyncio.to_thread(
+            optimize_cross_section,
+            snapshot,
+            request.breiten,
+            request.hoehen,
+            request.festigkeitsklassen,
+            request.anzahl_varianten,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail={"errors": [str(exc)]}) from exc
+
+    result = _convert_numpy_types(result)
+    return QuerschnittsoptimierungResponse(
+        optimum=result["Optimum"],
+        varianten=result["Varianten"],
+        anzahl_kandidaten=result["Anzahl_Kandidaten"],
+        anzahl_erfuellt=result["Anzahl_erfuellt"],
+    )
+
+
+@router.post(
+    "/calculate/materialvergleich",
+    response_model=MaterialvergleichResponse,
+    summary="Utilisation table for several materials and service classes",
+    description=(
+        "Compares material variants (group, type, strength class, service "
+        "class) for the cross-section of `base_snapshot` in one request.  "
+        "The FEM runs once; section forces are reused for every variant and "
+        "deflections are rescaled with E.  kmod, kdef and the self-weight "
+        "follow each variant."
+    ),
+)
+async def compare_materialien(
+    request: MaterialvergleichRequest,
+    db: DBDep,
+) -> MaterialvergleichResponse:
+    """POST /api/calculate/materialvergleich"""
+    snapshot = request.base_snapshot.to_snapshot(db)
+    errors = validate_input(snapshot)
+    if errors:
+        raise HTTPException(status_code=400, detail={"errors": errors})
+
+    try:
+        result = await asyncio.to_thread(
+            compare_materials,
+            snapshot,
+            [variante.model_dump() for variante in request.varianten],
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail={"errors": [str(exc)]}) from exc
+
+    result = _convert_numpy_types(result)
+    return MaterialvergleichResponse(
+        varianten=result["Varianten"],
+        anzahl_erfuellt=result["Anzahl_erfuellt"],
     )
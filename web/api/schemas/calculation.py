@@ -31,6 +31,24 @@ class BerechnungsmodusSchema(BaseModel):
         description="True → EC-pattern load method (slower, more accurate); "
                     "False → full-load quick method"
     )
+    maxima_only: bool = Field(
+        default=False,
+        description="EC mode only: return just the governing design values "
+                    "(max |M|, max |V|, max w, w_quasi) and the support "
+                    "reactions, without curves or envelopes"
+    )
+    aufloesung: str | int = Field(
+        default="standard",
+        description="Mesh density and evaluation points: 'entwurf' (live "
+                    "editing), 'standard', 'bericht' or an explicit target "
+                    "number of evaluation points along the beam"
+    )
+    latex: bool = Field(
+        default=True,
+        description="True → LaTeX formulas inline in the result; False → "
+                    "formulas are omitted (live editing) and rendered on "
+                    "demand via the returned `latex_handle`"
+    )
 
 
 class LastSchema(BaseModel):
@@ -68,6 +86,24 @@ class LastSchema(BaseModel):
         description="True if self-weight of the beam shall be added to this "
                     "permanent load (g-Lastfall only)"
     )
+    lastart: str = Field(
+        default="strecke",
+        description="Load shape: 'strecke' (full length, [kN/m²]), 'einzel' "
+                    "(point load, wert in [kN]) or 'teilstrecke' (partial "
+                    "area load, [kN/m²]). Point and partial loads require EC mode."
+    )
+    position: Optional[float] = Field(
+        default=None,
+        description="Point load position from the left beam end [m] (lastart 'einzel')"
+    )
+    von: Optional[float] = Field(
+        default=None,
+        description="Start of a partial load from the left beam end [m] (lastart 'teilstrecke')"
+    )
+    bis: Optional[float] = Field(
+        default=None,
+        description="End of a partial load from the left beam end [m] (lastart 'teilstrecke')"
+    )
 
 
 class QuerschnittSchema(BaseModel):
@@ -190,14 +226,20 @@ class CalculationRequest(BaseModel):
         # Convert each load – 'wert' MUST be a string (see validation_service)
         lasten_snap = []
         for last in self.lasten:
-            lasten_snap.append({
+            last_snap = {
                 "lastfall": last.lastfall,
                 "wert": str(last.wert),         # STRING – critical!
                 "kategorie": last.kategorie,
                 "kommentar": last.kommentar,
                 "nkl": last.nkl,
                 "eigengewicht": last.eigengewicht,
-            })
+                "lastart": last.lastart,
+            }
+            # Position keys only for point/partial loads (checked by validation_service)
+            for schluessel in ("position", "von", "bis"):
+                if getattr(last, schluessel) is not None:
+                    last_snap[schluessel] = getattr(last, schluessel)
+            lasten_snap.append(last_snap)
 
         # sprungmass is used as a FLOAT multiplier in lastenkombination.py line 75:
         #   wert = float(last["wert"]) * e
@@ -262,6 +304,96 @@ class DeflectionCheckRequest(BaseModel):
         return snapshot
 
 
+# ---------------------------------------------------------------------------
+# Cross-section optimisation request
+# ---------------------------------------------------------------------------
+
+class QuerschnittsoptimierungRequest(BaseModel):
+    """
+    Request for the cross-section optimiser.
+
+    The FEM runs once with the stiffness of `base_snapshot`; every candidate
+    (width × height × strength class) is then verified analytically.
+    Material group, type and service class are taken from the base snapshot.
+    """
+    base_snapshot: CalculationRequest = Field(
+        description="The structural input parameters (same as CalculationRequest)"
+    )
+    breiten: list[float] = Field(
+        min_length=1,
+        description="Candidate widths b [mm]"
+    )
+    hoehen: list[float] = Field(
+        min_length=1,
+        description="Candidate heights h [mm]"
+    )
+    festigkeitsklassen: Optional[list[str]] = Field(
+        default=None,
+        description="Candidate strength classes; null = all classes of the "
+                    "material type in the database"
+    )
+    anzahl_varianten: int = Field(
+        default=10, ge=1, le=100,
+        description="Number of passing variants returned, lightest first"
+    )
+
+
+class QuerschnittsoptimierungResponse(BaseModel):
+    """Response body for POST /api/calculate/querschnittsoptimierung."""
+    optimum: Optional[dict[str, Any]] = Field(
+        default=None,
+        description="Lightest passing variant (null if no candidate passes): "
+                    "festigkeitsklasse, breite_qs, hoehe_qs, eigenlast, "
+                    "ausnutzung per check, max_ausnutzung, massgebend"
+    )
+    varianten: list[dict[str, Any]] = Field(
+        default_factory=list,
+        description="Passing variants sorted by self-weight"
+    )
+    anzahl_kandidaten: int = Field(description="Number of candidates checked")
+    anzahl_erfuellt: int = Field(description="Number of passing candidates")
+
+
+# ---------------------------------------------------------------------------
+# Material / strength-class sweep request
+# ---------------------------------------------------------------------------
+
+class MaterialVarianteSchema(BaseModel):
+    """One material variant of the sweep."""
+    materialgruppe: str = Field(description="Material group, e.g. 'Balken'")
+    typ: str = Field(description="Timber type, e.g. 'Nadelholz' or 'Brettschichtholz'")
+    festigkeitsklasse: str = Field(description="Strength class, e.g. 'C24' or 'GL24h'")
+    nkl: int = Field(description="Nutzungsklasse (service class): 1, 2, or 3")
+
+
+class MaterialvergleichRequest(BaseModel):
+    """
+    Request for the material / strength-class sweep.
+
+    The FEM runs once for `base_snapshot`; every variant is verified with
+    the same section forces and E-scaled deflections.  Width and height are
+    taken from the base snapshot.
+    """
+    base_snapshot: CalculationRequest = Field(
+        description="The structural input parameters (same as CalculationRequest)"
+    )
+    varianten: list[MaterialVarianteSchema] = Field(
+        min_length=1, max_length=200,
+        description="Material variants to compare (the variant's NKL "
+                    "applies to all loads)"
+    )
+
+
+class MaterialvergleichResponse(BaseModel):
+    """Response body for POST /api/calculate/materialvergleich."""
+    varianten: list[dict[str, Any]] = Field(
+        description="One row per variant in request order: material, E, "
+                    "kmod, kdef, eigenlast, ausnutzung per check, "
+                    "max_ausnutzung, massgebend, erfuellt"
+    )
+    anzahl_erfuellt: int = Field(description="Number of passing variants")
+
+
 # ---------------------------------------------------------------------------
 # Response schemas
 # ---------------------------------------------------------------------------
@@ -286,16 +418,47 @@ class CalculationResponse(BaseModel):
     )
     schnittgroessen: Optional[dict[str, Any]] = Field(
         default=None,
-        description="FEM section forces (Schnittgroessen dict)"
+        description="FEM section forces (Schnittgroessen dict); `felder` "
+                    "maps each field and cantilever to its point index range"
     )
     ec5_nachweise: Optional[dict[str, Any]] = Field(
         default=None,
-        description="EC5 design check results (bending, shear, deflection)"
+        description="EC5 design check results (bending, shear, deflection) "
+                    "and the utilisation curves η(x) with maximum and "
+                    "location (`ausnutzungsverlauf`)"
     )
     auflagerkraefte: Optional[dict[str, Any]] = Field(
         default=None,
         description=(
             "Support reactions: labels [A,B,C,...], x_positionen [m], "
-            "gzt_design [N], gzg_charakteristisch [N]"
+            "gzt_design [N], gzg_charakteristisch [N]; in EC mode also the "
+            "minimum envelopes gzt_min / gzg_charakteristisch_min [N] "
+            "(negative → uplift) and the governing result ids (*_id)"
+        )
+    )
+    kombinationsergebnisse: Optional[dict[str, Any]] = Field(
+        default=None,
+        description=(
+            "EC mode only: compact per-combination results without curves. "
+            "Einzelergebnisse.{GZT,GZG} lists (index == id) with name, type, "
+            "load pattern and maxima; Detaillierte_Kombinationen groups the ids "
+            "per combination type with the governing id. Curves are fetched via "
+            "GET /api/calculate/results/{handle}/kombinationen/{grenzzustand}/{id}"
+        )
+    )
+    ergebnis_handle: Optional[str] = Field(
+        default=None,
+        description=(
+            "EC mode only: handle of the cached calculation. LaTeX formulas "
+            "are generated on demand via "
+            "GET /api/calculate/results/{handle}/latex-formeln"
+        )
+    )
+    latex_handle: Optional[str] = Field(
+        default=None,
+        description=(
+            "Only with berechnungsmodus.latex = false: handle of the deferred "
+            "LaTeX formulas of the load combinations and EC5 checks, rendered "
+            "on demand via GET /api/calculate/results/{handle}/latex-formeln"
         )
     )
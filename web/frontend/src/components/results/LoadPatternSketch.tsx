@@ -5,14 +5,14 @@
  * "Schnittkraftverläufe" collapsible section.
  *
  * EC mode:    two layers – permanent load (g, all spans) and variable load
- *             (q/s/w, only spans where moment_muster[i] === true)
+ *             (q/s/w, only spans whose bit i is set in moment_muster)
  * Quick mode: single combined block (g+q) across all spans
  *
  * Combo label rendered below the SVG as plain HTML (KaTeX for quick mode,
  * plain text for EC mode).
  *
  * Data sources (no backend changes needed):
- *   EC mode:    results.schnittgroessen.GZT.max.moment_muster  (boolean[])
+ *   EC mode:    results.schnittgroessen.GZT.max.moment_muster  (bitmask, bit i = feld_{i+1})
  *               results.schnittgroessen.GZT.max.moment_kombi   (string)
  *   Quick mode: results.lastfallkombinationen entry where massgebend===true
  */
@@ -36,6 +36,12 @@ interface Props {
   lastfallkombinationen?: Record<string, unknown> | null;
 }
 
+/** Decode a backend load-pattern bitmask into one flag per inner field. */
+function decodeMuster(mask: number | undefined, feldanzahl: number): boolean[] {
+  if (mask === undefined) return [];
+  return Array.from({ length: feldanzahl }, (_, i) => ((mask >> i) & 1) === 1);
+}
+
 interface KombinationEntry {
   latex?: string;
   Ed?: number;
@@ -207,7 +213,7 @@ function SketchSvg({
     return { x0, x1, span: s };
   });
 
-  // moment_muster from the backend is indexed by inner field order (feld_1=0, feld_2=1, …).
+  // muster (decoded from the backend bitmask) is indexed by inner field order (feld_1=0, feld_2=1, …).
   // Filtering cantilevers out of spanRanges preserves this exact indexing – do not change
   // the filter or sort order without updating the backend mapping.
   const innerFields = spanRanges.filter((r) => !r.span.isCantilever);
@@ -470,8 +476,8 @@ export function LoadPatternSketch({
   // ── Extract load-pattern data ────────────────────────────────────────────
 
   const gzt = (schnittgroessen as Record<string, unknown> | undefined)
-    ?.GZT as { max?: { moment_muster?: boolean[]; moment_kombi?: string } } | undefined;
-  const muster: boolean[]  = gzt?.max?.moment_muster ?? [];
+    ?.GZT as { max?: { moment_muster?: number; moment_kombi?: string } } | undefined;
+  const muster: boolean[]  = decodeMuster(gzt?.max?.moment_muster, feldanzahl);
   const kombiName: string  = gzt?.max?.moment_kombi  ?? "";
 
   const governingEntry = useMemo((): KombinationEntry | null => {
@@ -488,9 +494,9 @@ export function LoadPatternSketch({
   // GZG deflection pattern (EC mode only – in quick mode GZG is an array, not an object)
   const gzgObj = isEcMode
     ? ((schnittgroessen as Record<string, unknown> | undefined)
-        ?.GZG as { max?: { durchbiegung_muster?: boolean[]; durchbiegung_kombi?: string } } | undefined)
+        ?.GZG as { max?: { durchbiegung_muster?: number; durchbiegung_kombi?: string } } | undefined)
     : undefined;
-  const deflMuster: boolean[] = gzgObj?.max?.durchbiegung_muster ?? [];
+  const deflMuster: boolean[] = decodeMuster(gzgObj?.max?.durchbiegung_muster, feldanzahl);
   const deflKombi: string     = gzgObj?.max?.durchbiegung_kombi  ?? "";
 
   if (totalLength(spans) <= 0) return null;
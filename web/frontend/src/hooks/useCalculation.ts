@@ -9,13 +9,16 @@
  *    drilling.
  *  - The request body is read lazily from the store at mutation time (not at
  *    hook call time) so it always reflects the current form state.
+ *  - Progressive results: the quick full-load result is shown as soon as it
+ *    arrives; in EC mode the pattern-load envelope replaces it when ready.
+ *    isCalculating stays true until the final message.
  */
 
 import { useRef, useCallback } from "react";
 import { useMutation } from "@tanstack/react-query";
 import { api } from "@/lib/api";
 import { useBeamStore } from "@/stores/useBeamStore";
-import type { CalculationRequest, CalculationResponse } from "@/types/beam";
+import type { CalculationRequest, ProgressiveMessage } from "@/types/beam";
 
 /** Debounce delay in milliseconds before the API call is fired */
 const DEBOUNCE_MS = 600;
@@ -25,7 +28,14 @@ export function useCalculation() {
 
   const mutation = useMutation({
     mutationFn: (request: CalculationRequest) =>
-      api.post<CalculationResponse>("/api/calculate", request),
+      api.postStream<ProgressiveMessage>(
+        "/api/calculate/progressive",
+        request,
+        (message) => {
+          if (message.fehler) throw new Error(message.fehler.join("\n"));
+          if (message.ergebnis) useBeamStore.getState().setResults(message.ergebnis);
+        },
+      ),
 
     onMutate: () => {
       // Clear previous results and mark as loading before the request starts
@@ -33,8 +43,7 @@ export function useCalculation() {
       useBeamStore.getState().setCalculationError(null);
     },
 
-    onSuccess: (data) => {
-      useBeamStore.getState().setResults(data);
+    onSuccess: () => {
       useBeamStore.getState().setIsCalculating(false);
     },
 
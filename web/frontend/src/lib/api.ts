@@ -42,6 +42,42 @@ async function request<T>(
   return res.json();
 }
 
+/**
+ * POST returning newline-delimited JSON; `onMessage` is called once per line
+ * as soon as it arrives.  Resolves when the stream ends.
+ */
+async function postStream<T>(
+  path: string,
+  body: unknown,
+  onMessage: (message: T) => void,
+): Promise<void> {
+  const res = await fetch(`${BASE_URL}${path}`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(body),
+  });
+
+  if (!res.ok || !res.body) {
+    const errorBody = await res.json().catch(() => null);
+    throw new ApiError(res.status, res.statusText, errorBody);
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  for (;;) {
+    const { done, value } = await reader.read();
+    buffer += decoder.decode(value, { stream: !done });
+    const lines = buffer.split("\n");
+    buffer = lines.pop() ?? "";
+    for (const line of lines) {
+      if (line.trim()) onMessage(JSON.parse(line) as T);
+    }
+    if (done) break;
+  }
+  if (buffer.trim()) onMessage(JSON.parse(buffer) as T);
+}
+
 export const api = {
   get: <T>(path: string) => request<T>(path),
   post: <T>(path: string, body: unknown) =>
@@ -66,4 +102,5 @@ export const api = {
   /** Alias for delete (avoids reserved-word conflicts at call sites) */
   del: <T>(path: string) =>
     request<T>(path, { method: "DELETE" }),
+  postStream,
 };
@@ -26,8 +26,21 @@ export interface LoadCase {
   nkl: number;
   /** True if self-weight of the beam shall be added to this permanent load (g-Lastfall only) */
   eigengewicht: boolean;
+  /**
+   * Load shape (EC mode only for "einzel"/"teilstrecke"):
+   * "strecke" – full length [kN/m²], "einzel" – point load [kN],
+   * "teilstrecke" – partial area load [kN/m²]. Defaults to "strecke".
+   */
+  lastart?: LoadShape;
+  /** Point load position from the left beam end [m] (lastart "einzel") */
+  position?: number;
+  /** Start / end of a partial load from the left beam end [m] (lastart "teilstrecke") */
+  von?: number;
+  bis?: number;
 }
 
+export type LoadShape = "strecke" | "einzel" | "teilstrecke";
+
 // ---------------------------------------------------------------------------
 // Cross-section variant
 // ---------------------------------------------------------------------------
@@ -135,6 +148,12 @@ export interface CalculationRequest {
   berechnungsmodus: {
     /** True → EC pattern-load method; False → full-load quick method */
     ec_modus: boolean;
+    /** EC mode only: governing design values + reactions, no curves */
+    maxima_only?: boolean;
+    /** Mesh density preset or target number of evaluation points (default "standard") */
+    aufloesung?: "entwurf" | "standard" | "bericht" | number;
+    /** False → omit LaTeX formulas from the result, fetch them via latex_handle (default true) */
+    latex?: boolean;
   };
 }
 
@@ -151,6 +170,15 @@ export interface AuflagerKraefte {
   gzt_design: number[];
   /** Max SLS characteristic reactions per support [N] – convert to kN for display */
   gzg_charakteristisch: number[];
+  /** EC mode only: min ULS reactions per support [N] – negative means uplift */
+  gzt_min?: number[];
+  /** EC mode only: min SLS characteristic reactions per support [N] */
+  gzg_charakteristisch_min?: number[];
+  /** EC mode only: ids of the governing results for the envelopes above */
+  gzt_design_id?: (number | null)[];
+  gzt_min_id?: (number | null)[];
+  gzg_charakteristisch_id?: (number | null)[];
+  gzg_charakteristisch_min_id?: (number | null)[];
 }
 
 // ---------------------------------------------------------------------------
@@ -168,6 +196,21 @@ export interface CalculationResponse {
   ec5_nachweise: Record<string, unknown> | null;
   /** Support reactions (Auflagerkräfte) – null when not computed (e.g. deflection-only mode) */
   auflagerkraefte: AuflagerKraefte | null;
+  /** Handle for the deferred LaTeX formulas (only with berechnungsmodus.latex = false) */
+  latex_handle?: string | null;
+}
+
+/**
+ * One line of POST /api/calculate/progressive (newline-delimited JSON).
+ * "schnell" = full-load quick result, "ec" = EC pattern-load envelope.
+ */
+export interface ProgressiveMessage {
+  stufe: "schnell" | "ec" | null;
+  /** True on the last line of the stream */
+  final: boolean;
+  ergebnis?: CalculationResponse;
+  /** Validation or calculation errors (always on a final line) */
+  fehler?: string[];
 }
 
 // ---------------------------------------------------------------------------
@@ -183,3 +226,107 @@ export interface EC5Nachweis {
   ausnutzung: number;
   [key: string]: unknown;
 }
+
+/** Utilisation η(x) of one check along the beam (ec5_nachweise.ausnutzungsverlauf) */
+export interface AusnutzungsVerlauf {
+  /** η per evaluation point (same order as ausnutzungsverlauf.x) */
+  eta: number[];
+  /** Maximum utilisation */
+  max: number;
+  /** Position of the maximum from the left beam end [m] */
+  x_max: number;
+}
+
+export interface AusnutzungsVerlaeufe {
+  /** Evaluation point positions from the left beam end [m] */
+  x: number[];
+  biegung: AusnutzungsVerlauf;
+  schub: AusnutzungsVerlauf;
+  /** w_inst(x) / w_inst,limit (limit of the span the point lies in) */
+  durchbiegung_inst?: AusnutzungsVerlauf;
+}
+
+/**
+ * Deflection checks per span and cantilever (ec5_nachweise.durchbiegung_felder),
+ * keyed by span ("feld_1", "kragarm_links", …). Spans use l, cantilevers 2·l_k
+ * as reference length; ec5_nachweise.durchbiegung_* is the governing entry.
+ */
+export type DurchbiegungFelder = Record<
+  string,
+  {
+    durchbiegung_inst: EC5Nachweis;
+    durchbiegung_fin: EC5Nachweis;
+    durchbiegung_net_fin: EC5Nachweis;
+  }
+>;
+
+/** Request body for POST /api/calculate/querschnittsoptimierung */
+export interface QuerschnittsoptimierungRequest {
+  base_snapshot: CalculationRequest;
+  /** Candidate widths b [mm] */
+  breiten: number[];
+  /** Candidate heights h [mm] */
+  hoehen: number[];
+  /** Candidate strength classes; omitted = all classes of the material type */
+  festigkeitsklassen?: string[];
+  /** Number of passing variants returned (default 10) */
+  anzahl_varianten?: number;
+}
+
+export interface QuerschnittsVariante {
+  festigkeitsklasse: string;
+  breite_qs: number;
+  hoehe_qs: number;
+  /** Self-weight per self-weight load [kN/m] */
+  eigenlast: number;
+  /** η per EC5 check (biegung, schub, durchbiegung_inst/_fin/_net_fin) */
+  ausnutzung: Record<string, number>;
+  max_ausnutzung: number;
+  /** Name of the governing check */
+  massgebend: string;
+}
+
+export interface QuerschnittsoptimierungResponse {
+  /** Lightest passing variant, null if no candidate passes */
+  optimum: QuerschnittsVariante | null;
+  /** Passing variants, lightest first */
+  varianten: QuerschnittsVariante[];
+  anzahl_kandidaten: number;
+  anzahl_erfuellt: number;
+}
+
+/** One material variant of POST /api/calculate/materialvergleich */
+export interface MaterialVariante {
+  materialgruppe: string;
+  typ: string;
+  festigkeitsklasse: string;
+  /** Service class 1–3 (applies to all loads) */
+  nkl: number;
+}
+
+export interface MaterialvergleichRequest {
+  base_snapshot: CalculationRequest;
+  varianten: MaterialVariante[];
+}
+
+export interface MaterialvergleichZeile extends MaterialVariante {
+  /** Mean modulus of elasticity [N/mm²] */
+  E: number;
+  /** kmod of the governing ULS combination */
+  kmod: number;
+  kdef: number;
+  /** Self-weight per self-weight load [kN/m] */
+  eigenlast: number;
+  /** η per EC5 check (biegung, schub, durchbiegung_inst/_fin/_net_fin) */
+  ausnutzung: Record<string, number>;
+  max_ausnutzung: number;
+  /** Name of the governing check */
+  massgebend: string;
+  erfuellt: boolean;
+}
+
+export interface MaterialvergleichResponse {
+  /** One row per variant, in request order */
+  varianten: MaterialvergleichZeile[];
+  anzahl_erfuellt: number;
+}